@@ -0,0 +1,20 @@
+import { getPlayerSuggestions } from '@/lib/nba-data'
+
+const names = (query: string) => getPlayerSuggestions(query).map(p => p.name)
+
+describe('getPlayerSuggestions', () => {
+  it('ranks prefix matches by fame', () => {
+    expect(names('curr').slice(0, 2)).toEqual(['Stephen Curry', 'Seth Curry'])
+  })
+
+  it('keeps typo matches to players who also match the earlier words', () => {
+    expect(names('Stephen Cury')).toEqual(['Stephen Curry'])
+    expect(names('steph cury')).toEqual(['Stephen Curry'])
+    expect(names('kobe bryan')).toEqual(['Kobe Bryant'])
+  })
+
+  it('does not pad a full-name match with other players sharing a name part', () => {
+    expect(names('michael jordan')).toEqual(['Michael Jordan'])
+    expect(names('jordan')).toContain('DeAndre Jordan')
+  })
+})
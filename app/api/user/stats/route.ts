@@ -25,6 +25,13 @@ export async function GET(request: Request) {
       throw error
     }
 
+    // Career XP/rank/stats row materialized by scripts/user_summaries.py (null until the job has seen the user)
+    const { data: summary } = await supabase
+      .from('user_summaries')
+      .select('*')
+      .eq('user_id', targetUserId)
+      .maybeSingle()
+
     return NextResponse.json({ 
         stats: stats || {
             total_matches: 0,
@@ -33,7 +40,8 @@ export async function GET(request: Request) {
             draws: 0,
             current_streak: 0,
             max_streak: 0
-        }
+        },
+        summary: summary || null
     })
 
   } catch (error: any) {
@@ -208,7 +208,7 @@ export default function StatsPage() {
                 </div>
 
                 <div className="flex-1 flex items-center justify-center relative">
-                    {stats?.modeData && rawHistory.length > 0 ? (
+                    {stats?.modeData?.length ? (
                         <div className="w-full h-[200px]">
                             <ResponsiveContainer width="100%" height="100%">
                                 <PieChart>
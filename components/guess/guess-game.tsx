@@ -1,7 +1,7 @@
 "use client"
 
 import { useState, useEffect } from "react"
-import { NBAPlayer, getRandomNotablePlayer, getPlayerSuggestions } from "@/lib/nba-data"
+import { NBAPlayer, getRandomNotablePlayer, getPlayerSuggestions, getGuessCloseness } from "@/lib/nba-data"
 import { TeamLogo } from "@/components/common/team-logo"
 import { PlayerPhoto } from "@/components/common/player-photo"
 import { Button } from "@/components/ui/button"
@@ -21,6 +21,8 @@ export function GuessGame() {
   const [streak, setStreak] = useState(0)
   const [mounted, setMounted] = useState(false)
   const [errorMessage, setErrorMessage] = useState<string | null>(null)
+  // Closeness (0-100) of the previous wrong guess, for warmer/colder feedback
+  const [lastCloseness, setLastCloseness] = useState<number | null>(null)
 
   // Initialization - GUESS mode is casual, streak is session-only
   useEffect(() => {
@@ -57,6 +59,7 @@ export function GuessGame() {
     setGuess("")
     setSuggestions([])
     setStatus("playing")
+    setLastCloseness(null)
   }
 
   const handleSearchChange = (e: React.ChangeEvent<HTMLInputElement>) => {
@@ -78,7 +81,13 @@ export function GuessGame() {
       setErrorMessage(null)
       saveToLocalStorage(100, 1, 1) // 100 pts for win, 1/1 correct
     } else {
-      setErrorMessage(t('gest.error_incorrect').replace('{name}', player.name))
+      const { closeness, rank } = getGuessCloseness(targetPlayer, player)
+      const hint = rank !== null && rank <= 5 ? t('gest.hint_hot')
+        : closeness === 0 ? t('gest.hint_cold')
+        : lastCloseness !== null && closeness < lastCloseness ? t('gest.hint_colder')
+        : t('gest.hint_warmer')
+      setLastCloseness(closeness)
+      setErrorMessage(`${t('gest.error_incorrect').replace('{name}', player.name)} ${hint}`)
       setGuess("")
       setSuggestions([])
       setTimeout(() => setErrorMessage(null), 2000)
@@ -20,21 +20,46 @@ export interface GameHistoryItem {
     targetPlayer?: string
 }
 
+// Row of user_summaries (scripts/user_summaries.py): career totals over every match, not just the last 200
+interface UserSummary {
+    xp: number
+    games: number
+    avg_score: number
+    best_score: number | null
+    accuracy: number
+    win_rate: number
+    ovr: number
+    current_streak: number
+    rated_wins: number
+    max_streak: number
+    modes: string | Record<string, { games: number }> // { SWISH | BATTLE | GUESS: { games, wins, draws, losses, xp } }
+}
+
+// With a summary row, history is only fetched for the score chart, not replayed for career stats
+const CHART_WINDOW = 50
+const REPLAY_WINDOW = 200
+
 export function useUserStats() {
     const { user } = useAuth()
     const [isLoading, setIsLoading] = useState(true)
     const [rawHistory, setRawHistory] = useState<any[]>([])
+    const [summary, setSummary] = useState<UserSummary | null>(null)
 
     useEffect(() => {
         async function loadStats() {
             setIsLoading(true)
             let historyData: any[] = []
+            let summaryData: UserSummary | null = null
 
             if (user) {
                 try {
-                    // Increased limit to ensuring better accuracy for "Career" stats
-                    // Ideally this should be an aggregate query on DB, but for now we fetch recent history.
-                    const res = await fetch('/api/user/matches?limit=200') 
+                    const res = await fetch('/api/user/stats')
+                    const data = await res.json()
+                    summaryData = data.summary || null
+                } catch (e) { console.error("Summary fetch failed", e) }
+                try {
+                    // Without a summary row the career stats are replayed from the recent history
+                    const res = await fetch(`/api/user/matches?limit=${summaryData ? CHART_WINDOW : REPLAY_WINDOW}`)
                     const data = await res.json()
                     if (data.history) {
                          historyData = data.history.map((h: any) => ({
@@ -51,7 +76,7 @@ export function useUserStats() {
             } 
             
             // Fallback: Merge LocalStorage if DB is empty (Legacy support)
-            if (historyData.length === 0) {
+            if (historyData.length === 0 && !summaryData) {
                 const saved = localStorage.getItem("nba-ttt-history")
                 if (saved) {
                     try {
@@ -67,6 +92,7 @@ export function useUserStats() {
             }
 
             setRawHistory(historyData)
+            setSummary(summaryData)
             setIsLoading(false)
         }
         
@@ -74,6 +100,31 @@ export function useUserStats() {
     }, [user])
 
     const stats = useMemo(() => {
+        // Prefer the materialized career row over the replay of recent history when the batch job has one,
+        // even when the history call returned nothing
+        if (summary) {
+            const modes = typeof summary.modes === 'string' ? JSON.parse(summary.modes) : summary.modes
+            return {
+                gamesPlayed: summary.games,
+                avgScore: summary.avg_score,
+                bestScore: summary.best_score ?? 0,
+                accuracy: summary.accuracy,
+                winRate: summary.win_rate,
+                currentStreak: summary.current_streak,
+                maxStreak: summary.max_streak,
+                ratedWins: summary.rated_wins,
+                modeData: [
+                    { name: `Swish (x${XP_MULTIPLIERS.SWISH})`, value: modes.SWISH?.games ?? 0, color: '#3b82f6' },
+                    { name: 'Guess (casual)', value: modes.GUESS?.games ?? 0, color: '#8b5cf6' },
+                    { name: `Battle (x${XP_MULTIPLIERS.BATTLE})`, value: modes.BATTLE?.games ?? 0, color: '#f59e0b' }
+                ].filter(d => d.value > 0),
+                xp: summary.xp,
+                rankData: { ...getRank(summary.xp), ovr: summary.ovr },
+                rawHistory
+            }
+        }
+
+
         if (!rawHistory.length) return null
 
         // 1. Categorization
@@ -152,7 +203,7 @@ export function useUserStats() {
             rankData,
             rawHistory // Expose for charts if needed
         }
-    }, [rawHistory])
+    }, [rawHistory, summary])
 
     return { stats, isLoading }
 }
@@ -1,13 +1,13 @@
 // Additional NBA Players (Auto-generated)
-// Total: 500 players
+// Total: 459 players
 
 import type { NBAPlayer } from './nba-data'
 
 export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
   {
-    id: "jalen-brunson",
-    name: "Jalen Brunson",
-    teams: ["NYK"],
+    id: "aaron-brooks",
+    name: "Aaron Brooks",
+    teams: ["HOU","PHX","SAC","DEN","CHI","IND","MIN"],
     awards: [],
     allStar: false,
     champion: false,
@@ -17,42 +17,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Villanova",
+    college: "Oregon",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 28.7,
-    rpgCareer: 3.6,
-    apgCareer: 6.7,
-    position: "SG",
-    nbaId: "1628973"
+    decades: ["2000s"],
+    ppgCareer: 9.7,
+    rpgCareer: 1.7,
+    apgCareer: 3,
+    position: "PG",
+    nbaId: "201166"
   },
 
   {
-    id: "anthony-edwards",
-    name: "Anthony Edwards",
-    teams: ["MIN"],
-    awards: [],
+    id: "aaron-gordon",
+    name: "Aaron Gordon",
+    teams: ["ORL","DEN"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2022"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Georgia",
+    college: "Arizona",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 25.9,
-    rpgCareer: 5.4,
-    apgCareer: 5.1,
-    position: "SG",
-    nbaId: "1630162"
+    decades: ["2010s"],
+    ppgCareer: 13.7,
+    rpgCareer: 6.2,
+    apgCareer: 2.7,
+    position: "PF",
+    nbaId: "203932"
   },
+
   {
-    id: "tyrese-maxey",
-    name: "Tyrese Maxey",
-    teams: ["PHI"],
+    id: "aaron-jackson",
+    name: "Aaron Jackson",
+    teams: ["HOU"],
     awards: [],
     allStar: false,
     champion: false,
@@ -62,19 +63,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Kentucky",
+    college: "Duquesne",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 25.9,
-    rpgCareer: 3.7,
-    apgCareer: 6.2,
+    decades: ["2010s"],
+    ppgCareer: 8,
+    rpgCareer: 3,
+    apgCareer: 1,
     position: "SG",
-    nbaId: "1630178"
+    nbaId: "1628935"
   },
+
   {
-    id: "domantas-sabonis",
-    name: "Domantas Sabonis",
-    teams: ["SAC"],
+    id: "aaron-nesmith",
+    name: "Aaron Nesmith",
+    teams: ["BOS","IND"],
     awards: [],
     allStar: false,
     champion: false,
@@ -84,19 +86,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Gonzaga",
-    country: "Lithuania",
-    decades: ["2010s","2020s"],
-    ppgCareer: 19.4,
-    rpgCareer: 13.7,
-    apgCareer: 8.2,
-    position: "SF",
-    nbaId: "1627734"
+    college: "Vanderbilt",
+    country: "USA",
+    decades: ["2020s"],
+    ppgCareer: 9.6,
+    rpgCareer: 3.4,
+    apgCareer: 1.2,
+    position: "SG-SF",
+    nbaId: "1630174"
   },
+
   {
-    id: "cade-cunningham",
-    name: "Cade Cunningham",
-    teams: ["DET"],
+    id: "ace-bailey",
+    name: "Ace Bailey",
+    teams: ["UTA"],
     awards: [],
     allStar: false,
     champion: false,
@@ -106,42 +109,66 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Oklahoma State",
+    college: "Rutgers",
     country: "USA",
     decades: ["2020s"],
-    ppgCareer: 22.7,
-    rpgCareer: 4.3,
-    apgCareer: 7.5,
-    position: "SG",
-    nbaId: "1630595"
+    ppgCareer: 13.8,
+    rpgCareer: 4.2,
+    apgCareer: 1.8,
+    position: "SG-SF",
+    nbaId: "1642846"
   },
+
   {
-    id: "tyrese-haliburton",
-    name: "Tyrese Haliburton",
-    teams: ["IND"],
-    awards: [],
+    id: "ajay-mitchell",
+    name: "Ajay Mitchell",
+    teams: ["OKC"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2024"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Iowa State",
-    country: "USA",
+    college: "California-Santa Barbara",
+    country: "Belgium",
     decades: ["2020s"],
-    ppgCareer: 20.1,
-    rpgCareer: 3.9,
-    apgCareer: 10.9,
-    position: "SG",
-    nbaId: "1630169"
+    ppgCareer: 10.8,
+    rpgCareer: 2.8,
+    apgCareer: 2.9,
+    position: "PG",
+    nbaId: "1642349"
   },
 
   {
-    id: "desmond-bane",
-    name: "Desmond Bane",
-    teams: ["MEM"],
+    id: "al-horford",
+    name: "Al Horford",
+    teams: ["ATL","BOS","PHI","OKC","GSW"],
+    awards: ["Champion","All-Star"],
+    allStar: true,
+    champion: true,
+    championYears: ["2023"],
+    mvp: false,
+    dpoy: false,
+    roy: false,
+    allNBA: true,
+    allDefensive: true,
+    college: "Florida",
+    country: "Dominican Republic",
+    decades: ["2000s"],
+    ppgCareer: 12.7,
+    rpgCareer: 7.7,
+    apgCareer: 3.2,
+    position: "C-F",
+    nbaId: "201143"
+  },
+
+  {
+    id: "al-jefferson",
+    name: "Al Jefferson",
+    teams: ["BOS","MIN","UTA","CHA","IND"],
     awards: [],
     allStar: false,
     champion: false,
@@ -149,21 +176,22 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     mvp: false,
     dpoy: false,
     roy: false,
-    allNBA: false,
+    allNBA: true,
     allDefensive: false,
-    college: "TCU",
+    college: "No College",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 23.7,
-    rpgCareer: 4.4,
-    apgCareer: 5.5,
-    position: "SG",
-    nbaId: "1630217"
+    decades: ["2000s"],
+    ppgCareer: 15.7,
+    rpgCareer: 8.4,
+    apgCareer: 1.5,
+    position: "C-F",
+    nbaId: "2744"
   },
+
   {
-    id: "dejounte-murray",
-    name: "Dejounte Murray",
-    teams: ["ATL"],
+    id: "al-farouq-aminu",
+    name: "Al-Farouq Aminu",
+    teams: ["LAC","NOP","DAL","POR","ORL","CHI"],
     awards: [],
     allStar: false,
     champion: false,
@@ -173,19 +201,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Washington",
+    college: "Wake Forest",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 22.5,
-    rpgCareer: 5.3,
-    apgCareer: 6.4,
-    position: "SG",
-    nbaId: "1627749"
+    decades: ["2010s"],
+    ppgCareer: 7.5,
+    rpgCareer: 6,
+    apgCareer: 1.2,
+    position: "SF",
+    nbaId: "202329"
   },
+
   {
-    id: "alperen-sengun",
-    name: "Alperen Sengun",
-    teams: ["HOU"],
+    id: "alec-burks",
+    name: "Alec Burks",
+    teams: ["UTA","CLE","SAC","GSW","PHI","NYK","DET","MIA"],
     awards: [],
     allStar: false,
     champion: false,
@@ -195,41 +224,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Besiktas",
-    country: "Turkey",
-    decades: ["2020s"],
-    ppgCareer: 21.1,
-    rpgCareer: 9.3,
-    apgCareer: 5.0,
-    position: "C",
-    nbaId: "1630578"
+    college: "Colorado",
+    country: "USA",
+    decades: ["2010s"],
+    ppgCareer: 10.6,
+    rpgCareer: 3.3,
+    apgCareer: 1.9,
+    position: "SG",
+    nbaId: "202692"
   },
+
   {
-    id: "lauri-markkanen",
-    name: "Lauri Markkanen",
-    teams: ["UTA"],
-    awards: [],
+    id: "alex-caruso",
+    name: "Alex Caruso",
+    teams: ["LAL","CHI","OKC"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2019","2024"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
-    allDefensive: false,
-    college: "Arizona",
-    country: "Finland",
-    decades: ["2010s","2020s"],
-    ppgCareer: 23.2,
-    rpgCareer: 8.2,
-    apgCareer: 2.0,
-    position: "SF",
-    nbaId: "1628374"
+    allDefensive: true,
+    college: "Texas A&M",
+    country: "USA",
+    decades: ["2010s"],
+    ppgCareer: 6.8,
+    rpgCareer: 2.9,
+    apgCareer: 2.7,
+    position: "SG",
+    nbaId: "1627936"
   },
+
   {
-    id: "scottie-barnes",
-    name: "Scottie Barnes",
-    teams: ["TOR"],
+    id: "alex-sarr",
+    name: "Alex Sarr",
+    teams: ["WAS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -239,19 +270,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Florida State",
-    country: "USA",
+    college: "Washington Wizards",
+    country: "France",
     decades: ["2020s"],
-    ppgCareer: 19.9,
-    rpgCareer: 8.2,
-    apgCareer: 6.1,
-    position: "SG",
-    nbaId: "1630567"
+    ppgCareer: 14.4,
+    rpgCareer: 6.9,
+    apgCareer: 2.5,
+    position: "C",
+    nbaId: "1642259"
   },
+
   {
-    id: "anfernee-simons",
-    name: "Anfernee Simons",
-    teams: ["POR"],
+    id: "allen-crabbe",
+    name: "Allen Crabbe",
+    teams: ["POR","BKN","ATL","MIN"],
     awards: [],
     allStar: false,
     champion: false,
@@ -261,19 +293,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Edgewater HS (FL)",
+    college: "California",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 22.6,
-    rpgCareer: 3.6,
-    apgCareer: 5.5,
+    decades: ["2010s"],
+    ppgCareer: 9.1,
+    rpgCareer: 2.8,
+    apgCareer: 1.1,
     position: "SG",
-    nbaId: "1629014"
+    nbaId: "203459"
   },
+
   {
-    id: "jaylen-brown",
-    name: "Jaylen Brown",
-    teams: ["BOS"],
+    id: "allonzo-trier",
+    name: "Allonzo Trier",
+    teams: ["NYK"],
     awards: [],
     allStar: false,
     champion: false,
@@ -283,21 +316,22 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "California",
+    college: "Arizona",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 23.0,
-    rpgCareer: 5.5,
-    apgCareer: 3.6,
+    decades: ["2010s"],
+    ppgCareer: 9.7,
+    rpgCareer: 2.6,
+    apgCareer: 1.7,
     position: "SG",
-    nbaId: "1627759"
+    nbaId: "1629019"
   },
+
   {
-    id: "jamal-murray",
-    name: "Jamal Murray",
-    teams: ["DEN"],
-    awards: [],
-    allStar: false,
+    id: "alperen-sengun",
+    name: "Alperen Sengun",
+    teams: ["HOU"],
+    awards: ["All-Star"],
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
@@ -305,41 +339,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Kentucky",
-    country: "Canada",
-    decades: ["2010s","2020s"],
-    ppgCareer: 21.2,
-    rpgCareer: 4.1,
-    apgCareer: 6.5,
-    position: "SG",
-    nbaId: "1627750"
+    college: "Besiktas",
+    country: "Turkey",
+    decades: ["2020s"],
+    ppgCareer: 16.9,
+    rpgCareer: 8.6,
+    apgCareer: 4.5,
+    position: "C-F",
+    nbaId: "1630578"
   },
+
   {
-    id: "john-wall",
-    name: "John Wall",
-    teams: ["LAC"],
-    awards: [],
-    allStar: false,
+    id: "amare-stoudemire",
+    name: "Amar'e Stoudemire",
+    teams: ["PHX"],
+    awards: ["ROY","All-Star"],
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
     dpoy: false,
-    roy: false,
-    allNBA: false,
+    roy: true,
+    allNBA: true,
     allDefensive: false,
-    college: "Kentucky",
+    college: "Cypress Creek HS (FL)",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 18.7,
-    rpgCareer: 4.2,
-    apgCareer: 8.9,
-    position: "SG",
-    nbaId: "202322"
+    decades: ["2000s"],
+    ppgCareer: 18.91,
+    rpgCareer: 7.84,
+    apgCareer: 1.2,
+    position: "PF",
+    nbaId: "2405"
   },
+
   {
-    id: "miles-bridges",
-    name: "Miles Bridges",
-    teams: ["CHA"],
+    id: "amen-thompson",
+    name: "Amen Thompson",
+    teams: ["HOU"],
     awards: [],
     allStar: false,
     champion: false,
@@ -348,20 +384,21 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     dpoy: false,
     roy: false,
     allNBA: false,
-    allDefensive: false,
-    college: "Michigan State",
+    allDefensive: true,
+    college: "Overtime Elite",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 21.0,
-    rpgCareer: 7.3,
-    apgCareer: 3.3,
-    position: "SF",
-    nbaId: "1628970"
+    decades: ["2020s"],
+    ppgCareer: 14.3,
+    rpgCareer: 7.6,
+    apgCareer: 4,
+    position: "PG-SF",
+    nbaId: "1641708"
   },
+
   {
-    id: "jaren-jackson-jr-",
-    name: "Jaren Jackson Jr.",
-    teams: ["MEM","UTA"],
+    id: "amir-johnson",
+    name: "Amir Johnson",
+    teams: ["TOR","PHI","BOS","DET"],
     awards: [],
     allStar: false,
     champion: false,
@@ -371,19 +408,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Michigan State",
+    college: "Westchester HS (CA)",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 22.5,
-    rpgCareer: 5.5,
-    apgCareer: 2.3,
-    position: "SF",
-    nbaId: "1628991"
+    decades: ["2000s"],
+    ppgCareer: 7,
+    rpgCareer: 5.4,
+    apgCareer: 1.2,
+    position: "PF",
+    nbaId: "101161"
   },
+
   {
-    id: "demarcus-cousins",
-    name: "DeMarcus Cousins",
-    teams: ["DEN"],
+    id: "anderson-varejao",
+    name: "Anderson Varejao",
+    teams: ["CLE","GSW"],
     awards: [],
     allStar: false,
     champion: false,
@@ -392,20 +430,44 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     dpoy: false,
     roy: false,
     allNBA: false,
+    allDefensive: true,
+    college: "FC Barcelona",
+    country: "Brazil",
+    decades: ["2000s"],
+    ppgCareer: 7.2,
+    rpgCareer: 7.17,
+    apgCareer: 1.2,
+    position: "F-C",
+    nbaId: "2760"
+  },
+
+  {
+    id: "andre-drummond",
+    name: "Andre Drummond",
+    teams: ["DET","CLE","LAL","PHI","BKN","CHI"],
+    awards: ["All-Star"],
+    allStar: true,
+    champion: false,
+    championYears: [],
+    mvp: false,
+    dpoy: false,
+    roy: false,
+    allNBA: true,
     allDefensive: false,
-    college: "Kentucky",
+    college: "Connecticut",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 19.6,
-    rpgCareer: 10.2,
-    apgCareer: 3.0,
+    decades: ["2010s"],
+    ppgCareer: 12.1,
+    rpgCareer: 11.9,
+    apgCareer: 1.2,
     position: "C",
-    nbaId: "202326"
+    nbaId: "203083"
   },
+
   {
-    id: "tyler-herro",
-    name: "Tyler Herro",
-    teams: ["MIA"],
+    id: "andre-miller",
+    name: "Andre Miller",
+    teams: ["CLE","LAC","DEN","PHI","POR","WAS","SAC","MIN","SAS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -415,19 +477,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Kentucky",
+    college: "Utah",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 20.8,
-    rpgCareer: 5.3,
-    apgCareer: 4.5,
-    position: "SG",
-    nbaId: "1629639"
+    decades: ["1990s"],
+    ppgCareer: 12.5,
+    rpgCareer: 3.7,
+    apgCareer: 6.54,
+    position: "PG",
+    nbaId: "1889"
   },
+
   {
-    id: "cam-thomas",
-    name: "Cam Thomas",
-    teams: ["BKN"],
+    id: "andrea-bargnani",
+    name: "Andrea Bargnani",
+    teams: ["TOR","NYK","BKN"],
     awards: [],
     allStar: false,
     champion: false,
@@ -437,41 +500,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Louisiana State",
-    country: "Japan",
-    decades: ["2020s"],
-    ppgCareer: 22.5,
-    rpgCareer: 3.2,
-    apgCareer: 2.9,
-    position: "SG",
-    nbaId: "1630560"
+    college: "Benetton Treviso",
+    country: "Italy",
+    decades: ["2000s"],
+    ppgCareer: 14.3,
+    rpgCareer: 4.6,
+    apgCareer: 1.2,
+    position: "PF",
+    nbaId: "200745"
   },
+
   {
-    id: "nikola-vu-evi-",
-    name: "Nikola Vučević",
-    teams: ["CHI"],
-    awards: [],
+    id: "andrew-bogut",
+    name: "Andrew Bogut",
+    teams: ["MIL","GSW","DAL","CLE","LAL"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2014"],
     mvp: false,
     dpoy: false,
     roy: false,
-    allNBA: false,
-    allDefensive: false,
-    college: "Southern California",
-    country: "Montenegro",
-    decades: ["2010s","2020s"],
-    ppgCareer: 18.0,
-    rpgCareer: 10.5,
-    apgCareer: 3.3,
+    allNBA: true,
+    allDefensive: true,
+    college: "Utah",
+    country: "Australia",
+    decades: ["2000s"],
+    ppgCareer: 9.6,
+    rpgCareer: 8.66,
+    apgCareer: 2.2,
     position: "C",
-    nbaId: "202696"
+    nbaId: "101106"
   },
+
   {
-    id: "cj-mccollum",
-    name: "CJ McCollum",
-    teams: ["NOP"],
+    id: "andrew-harrison",
+    name: "Andrew Harrison",
+    teams: ["MEM","CLE","NOP"],
     awards: [],
     allStar: false,
     champion: false,
@@ -481,21 +546,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Lehigh",
+    college: "Kentucky",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 20.0,
-    rpgCareer: 4.3,
-    apgCareer: 4.6,
-    position: "SG",
-    nbaId: "203468"
+    decades: ["2010s"],
+    ppgCareer: 7,
+    rpgCareer: 2,
+    apgCareer: 2.8,
+    position: "PG",
+    nbaId: "1626150"
   },
 
-
   {
-    id: "kemba-walker",
-    name: "Kemba Walker",
-    teams: ["DAL"],
+    id: "andrew-nembhard",
+    name: "Andrew Nembhard",
+    teams: ["IND"],
     awards: [],
     allStar: false,
     champion: false,
@@ -505,19 +569,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Connecticut",
-    country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 19.3,
-    rpgCareer: 3.8,
-    apgCareer: 5.3,
-    position: "SG",
-    nbaId: "202689"
+    college: "Gonzaga",
+    country: "Canada",
+    decades: ["2020s"],
+    ppgCareer: 11.1,
+    rpgCareer: 2.7,
+    apgCareer: 5.2,
+    position: "PG-SF",
+    nbaId: "1629614"
   },
+
   {
-    id: "coby-white",
-    name: "Coby White",
-    teams: ["CHI"],
+    id: "anfernee-simons",
+    name: "Anfernee Simons",
+    teams: ["POR","BOS","CHI"],
     awards: [],
     allStar: false,
     champion: false,
@@ -527,41 +592,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "North Carolina",
+    college: "Edgewater HS (FL)",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 19.1,
-    rpgCareer: 4.5,
-    apgCareer: 5.1,
+    decades: ["2010s"],
+    ppgCareer: 14.9,
+    rpgCareer: 2.5,
+    apgCareer: 3.2,
     position: "SG",
-    nbaId: "1629632"
+    nbaId: "1629014"
   },
+
   {
-    id: "franz-wagner",
-    name: "Franz Wagner",
-    teams: ["ORL"],
-    awards: [],
-    allStar: false,
+    id: "anthony-edwards",
+    name: "Anthony Edwards",
+    teams: ["MIN"],
+    awards: ["All-Star"],
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
     dpoy: false,
     roy: false,
-    allNBA: false,
+    allNBA: true,
     allDefensive: false,
-    college: "Michigan",
-    country: "Germany",
+    college: "Georgia",
+    country: "USA",
     decades: ["2020s"],
-    ppgCareer: 19.7,
-    rpgCareer: 5.3,
-    apgCareer: 3.7,
-    position: "SF",
-    nbaId: "1630532"
+    ppgCareer: 24.6,
+    rpgCareer: 5.2,
+    apgCareer: 4.1,
+    position: "PG-SF",
+    nbaId: "1630162"
   },
+
   {
-    id: "cooper-flagg",
-    name: "Cooper Flagg",
-    teams: ["DAL"],
+    id: "anthony-morrow",
+    name: "Anthony Morrow",
+    teams: ["DAL","NOP","OKC","ATL","CHI","GSW","BKN"],
     awards: [],
     allStar: false,
     champion: false,
@@ -571,19 +638,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Duke",
+    college: "Georgia Tech",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 18.8,
-    rpgCareer: 6.3,
-    apgCareer: 4.1,
-    position: "SF",
-    nbaId: "1642843"
+    decades: ["2000s"],
+    ppgCareer: 9.4,
+    rpgCareer: 2.2,
+    apgCareer: 0.9,
+    position: "SG",
+    nbaId: "201627"
   },
+
   {
-    id: "zach-lavine",
-    name: "Zach LaVine",
-    teams: ["CHI"],
+    id: "arron-afflalo",
+    name: "Arron Afflalo",
+    teams: ["DEN","DET","NYK","ORL","POR","SAC"],
     awards: [],
     allStar: false,
     champion: false,
@@ -595,17 +663,18 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     allDefensive: false,
     college: "UCLA",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 19.5,
-    rpgCareer: 5.2,
-    apgCareer: 3.9,
+    decades: ["2000s"],
+    ppgCareer: 10.8,
+    rpgCareer: 2.9,
+    apgCareer: 1.8,
     position: "SG",
-    nbaId: "203897"
+    nbaId: "201167"
   },
+
   {
-    id: "chris-bosh",
-    name: "Chris Bosh",
-    teams: ["MIA"],
+    id: "ausar-thompson",
+    name: "Ausar Thompson",
+    teams: ["DET"],
     awards: [],
     allStar: false,
     champion: false,
@@ -614,20 +683,21 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     dpoy: false,
     roy: false,
     allNBA: false,
-    allDefensive: false,
-    college: "Georgia Tech",
+    allDefensive: true,
+    college: "Overtime Elite",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 19.2,
-    rpgCareer: 8.5,
-    apgCareer: 2.0,
-    position: "SF",
-    nbaId: "2547"
-  },
+    decades: ["2020s"],
+    ppgCareer: 9.6,
+    rpgCareer: 5.8,
+    apgCareer: 2.5,
+    position: "SG-SF",
+    nbaId: "1641709"
+  },
+
   {
-    id: "jerami-grant",
-    name: "Jerami Grant",
-    teams: ["POR"],
+    id: "austin-reaves",
+    name: "Austin Reaves",
+    teams: ["LAL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -637,19 +707,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Syracuse",
+    college: "Oklahoma",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 21.0,
-    rpgCareer: 3.5,
-    apgCareer: 2.8,
-    position: "SF",
-    nbaId: "203924"
+    decades: ["2020s"],
+    ppgCareer: 15.8,
+    rpgCareer: 3.9,
+    apgCareer: 4.5,
+    position: "PG",
+    nbaId: "1630559"
   },
+
   {
-    id: "jalen-green",
-    name: "Jalen Green",
-    teams: ["HOU"],
+    id: "austin-rivers",
+    name: "Austin Rivers",
+    teams: ["NOP","LAC","WAS","HOU","NYK","DEN","MIN"],
     awards: [],
     allStar: false,
     champion: false,
@@ -659,19 +730,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "NBA G League Ignite",
+    college: "Duke",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 19.6,
-    rpgCareer: 5.2,
-    apgCareer: 3.5,
+    decades: ["2010s"],
+    ppgCareer: 8.5,
+    rpgCareer: 2,
+    apgCareer: 2.1,
     position: "SG",
-    nbaId: "1630224"
+    nbaId: "203085"
   },
+
   {
-    id: "lamarcus-aldridge",
-    name: "LaMarcus Aldridge",
-    teams: ["BKN"],
+    id: "avery-bradley",
+    name: "Avery Bradley",
+    teams: ["BOS","DET","LAC","MEM","LAL","MIA","HOU"],
     awards: [],
     allStar: false,
     champion: false,
@@ -680,20 +752,21 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     dpoy: false,
     roy: false,
     allNBA: false,
-    allDefensive: false,
+    allDefensive: true,
     college: "University of Texas at Austin",
     country: "USA",
-    decades: ["2000s","2010s","2020s"],
-    ppgCareer: 19.1,
-    rpgCareer: 8.1,
-    apgCareer: 1.9,
-    position: "SF",
-    nbaId: "200746"
+    decades: ["2010s"],
+    ppgCareer: 11,
+    rpgCareer: 2.8,
+    apgCareer: 1.7,
+    position: "PG",
+    nbaId: "202340"
   },
+
   {
-    id: "mikal-bridges",
-    name: "Mikal Bridges",
-    teams: ["BKN"],
+    id: "ayo-dosunmu",
+    name: "Ayo Dosunmu",
+    teams: ["CHI","MIN"],
     awards: [],
     allStar: false,
     champion: false,
@@ -703,19 +776,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Villanova",
+    college: "Illinois",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 19.6,
-    rpgCareer: 4.5,
-    apgCareer: 3.6,
-    position: "SG",
-    nbaId: "1628969"
+    decades: ["2020s"],
+    ppgCareer: 11.1,
+    rpgCareer: 3,
+    apgCareer: 3.3,
+    position: "PG",
+    nbaId: "1630245"
   },
+
   {
-    id: "devin-vassell",
-    name: "Devin Vassell",
-    teams: ["SAS"],
+    id: "ben-mclemore",
+    name: "Ben McLemore",
+    teams: ["SAC","MEM","HOU","LAL","POR"],
     awards: [],
     allStar: false,
     champion: false,
@@ -725,19 +799,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Florida State",
+    college: "Kansas",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 19.5,
-    rpgCareer: 3.8,
-    apgCareer: 4.1,
+    decades: ["2010s"],
+    ppgCareer: 9,
+    rpgCareer: 2.3,
+    apgCareer: 1,
     position: "SG",
-    nbaId: "1630170"
+    nbaId: "203463"
   },
+
   {
-    id: "jalen-williams",
-    name: "Jalen Williams",
-    teams: ["OKC"],
+    id: "bennedict-mathurin",
+    name: "Bennedict Mathurin",
+    teams: ["IND","LAC"],
     awards: [],
     allStar: false,
     champion: false,
@@ -747,42 +822,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Santa Clara",
-    country: "USA",
+    college: "Arizona",
+    country: "Canada",
     decades: ["2020s"],
-    ppgCareer: 19.1,
-    rpgCareer: 4.0,
-    apgCareer: 4.5,
-    position: "SG",
-    nbaId: "1631114"
+    ppgCareer: 16.2,
+    rpgCareer: 4.7,
+    apgCareer: 1.9,
+    position: "SG-SF",
+    nbaId: "1631097"
   },
+
   {
-    id: "kon-knueppel",
-    name: "Kon Knueppel",
-    teams: ["CHA"],
-    awards: [],
+    id: "beno-udrih",
+    name: "Beno Udrih",
+    teams: ["SAC"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2004","2006"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Duke",
-    country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 19.0,
-    rpgCareer: 5.3,
-    apgCareer: 3.5,
-    position: "SG",
-    nbaId: "1642851"
+    college: "Olimpia Milano",
+    country: "Slovenia",
+    decades: ["2000s"],
+    ppgCareer: 8.4,
+    rpgCareer: 2.1,
+    apgCareer: 3.4,
+    position: "PG",
+    nbaId: "2757"
   },
 
   {
-    id: "darius-garland",
-    name: "Darius Garland",
-    teams: ["CLE"],
+    id: "bilal-coulibaly",
+    name: "Bilal Coulibaly",
+    teams: ["WAS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -792,41 +868,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Vanderbilt",
-    country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 18.0,
-    rpgCareer: 2.7,
-    apgCareer: 6.5,
-    position: "SG",
-    nbaId: "1629636"
+    college: "Metropolitans 92",
+    country: "France",
+    decades: ["2020s"],
+    ppgCareer: 10.8,
+    rpgCareer: 4.5,
+    apgCareer: 2.6,
+    position: "PG",
+    nbaId: "1641731"
   },
+
   {
-    id: "pau-gasol",
-    name: "Pau Gasol",
-    teams: ["LAL"],
-    awards: [],
+    id: "bobby-portis",
+    name: "Bobby Portis",
+    teams: ["CHI","WAS","NYK","MIL"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2020"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "FC Barcelona",
-    country: "Spain",
-    decades: ["2000s","2010s"],
-    ppgCareer: 17.0,
-    rpgCareer: 9.2,
-    apgCareer: 3.2,
-    position: "SF",
-    nbaId: "2200"
+    college: "Arkansas",
+    country: "USA",
+    decades: ["2010s"],
+    ppgCareer: 12.04,
+    rpgCareer: 7.13,
+    apgCareer: 1.3,
+    position: "PF",
+    nbaId: "1626171"
   },
+
   {
-    id: "jarrett-allen",
-    name: "Jarrett Allen",
-    teams: ["CLE"],
+    id: "bogdan-bogdanović",
+    name: "Bogdan Bogdanović",
+    teams: ["SAC","ATL","LAC"],
     awards: [],
     allStar: false,
     champion: false,
@@ -836,19 +914,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Texas",
-    country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 16.5,
-    rpgCareer: 10.5,
-    apgCareer: 2.7,
-    position: "C",
-    nbaId: "1628386"
+    college: "Fenerbahce",
+    country: "Serbia",
+    decades: ["2010s"],
+    ppgCareer: 14,
+    rpgCareer: 3.3,
+    apgCareer: 3.2,
+    position: "PG",
+    nbaId: "203992"
   },
+
   {
-    id: "amar-e-stoudemire",
-    name: "Amar'e Stoudemire",
-    teams: ["PHX"],
+    id: "bojan-bogdanovic",
+    name: "Bojan Bogdanovic",
+    teams: ["BKN","WAS","IND","UTA","DET","NYK"],
     awards: [],
     allStar: false,
     champion: false,
@@ -858,42 +937,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Cypress Creek HS (FL)",
-    country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 18.9,
-    rpgCareer: 7.8,
-    apgCareer: 1.2,
+    college: "Fenerbahce",
+    country: "Croatia",
+    decades: ["2010s"],
+    ppgCareer: 15.6,
+    rpgCareer: 3.6,
+    apgCareer: 1.7,
     position: "SF",
-    nbaId: "2405"
+    nbaId: "202711"
   },
+
   {
-    id: "collin-sexton",
-    name: "Collin Sexton",
-    teams: ["UTA"],
-    awards: [],
+    id: "boris-diaw",
+    name: "Boris Diaw",
+    teams: ["ATL","PHX","CHA","SAS","UTA"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2013"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Alabama",
-    country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 18.7,
-    rpgCareer: 2.6,
-    apgCareer: 4.9,
-    position: "SG",
-    nbaId: "1629012"
+    college: "Pau Orthez",
+    country: "France",
+    decades: ["2000s"],
+    ppgCareer: 8.6,
+    rpgCareer: 4.4,
+    apgCareer: 3.5,
+    position: "PF",
+    nbaId: "2564"
   },
 
   {
-    id: "jalen-johnson",
-    name: "Jalen Johnson",
-    teams: ["ATL"],
+    id: "brandin-podziemski",
+    name: "Brandin Podziemski",
+    teams: ["GSW"],
     awards: [],
     allStar: false,
     champion: false,
@@ -903,19 +983,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Duke",
+    college: "Santa Clara",
     country: "USA",
     decades: ["2020s"],
-    ppgCareer: 16.0,
-    rpgCareer: 8.7,
+    ppgCareer: 11.6,
+    rpgCareer: 5.3,
     apgCareer: 3.6,
-    position: "SF",
-    nbaId: "1630552"
+    position: "PG",
+    nbaId: "1641764"
   },
+
   {
-    id: "monta-ellis",
-    name: "Monta Ellis",
-    teams: ["GSW"],
+    id: "brandon-bass",
+    name: "Brandon Bass",
+    teams: ["DAL","NOP","LAL","ORL","BOS","LAC"],
     awards: [],
     allStar: false,
     champion: false,
@@ -925,19 +1006,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Lanier HS (MS)",
+    college: "Louisiana State",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 17.8,
-    rpgCareer: 3.5,
-    apgCareer: 4.6,
-    position: "SG",
-    nbaId: "101145"
+    decades: ["2000s"],
+    ppgCareer: 8.7,
+    rpgCareer: 4.5,
+    apgCareer: 0.8,
+    position: "PF",
+    nbaId: "101138"
   },
+
   {
-    id: "evan-mobley",
-    name: "Evan Mobley",
-    teams: ["CLE"],
+    id: "brandon-clarke",
+    name: "Brandon Clarke",
+    teams: ["MEM"],
     awards: [],
     allStar: false,
     champion: false,
@@ -947,20 +1029,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Southern California",
-    country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 15.7,
-    rpgCareer: 9.4,
-    apgCareer: 3.2,
-    position: "C",
-    nbaId: "1630596"
+    college: "Gonzaga",
+    country: "Canada",
+    decades: ["2010s"],
+    ppgCareer: 10.2,
+    rpgCareer: 5.5,
+    apgCareer: 1.3,
+    position: "PF",
+    nbaId: "1629634"
   },
 
   {
-    id: "jordan-clarkson",
-    name: "Jordan Clarkson",
-    teams: ["UTA"],
+    id: "brandon-jennings",
+    name: "Brandon Jennings",
+    teams: ["NYK","MIL","ORL","DET","WAS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -970,19 +1052,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Missouri",
+    college: "Virtus Roma",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 17.1,
-    rpgCareer: 3.4,
-    apgCareer: 5.0,
-    position: "SG",
-    nbaId: "203903"
+    decades: ["2000s"],
+    ppgCareer: 14.1,
+    rpgCareer: 3,
+    apgCareer: 5.68,
+    position: "PG",
+    nbaId: "201943"
   },
+
   {
-    id: "zach-randolph",
-    name: "Zach Randolph",
-    teams: ["MEM"],
+    id: "brandon-knight",
+    name: "Brandon Knight",
+    teams: ["DET","MIL","PHX","HOU","CLE","DAL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -992,19 +1075,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Michigan State",
+    college: "Kentucky",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 16.6,
-    rpgCareer: 9.1,
-    apgCareer: 1.8,
-    position: "SF",
-    nbaId: "2216"
+    decades: ["2010s"],
+    ppgCareer: 14,
+    rpgCareer: 3.1,
+    apgCareer: 3.94,
+    position: "PG",
+    nbaId: "202688"
   },
+
   {
-    id: "chet-holmgren",
-    name: "Chet Holmgren",
-    teams: ["OKC"],
+    id: "brandon-miller",
+    name: "Brandon Miller",
+    teams: ["CHA"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1014,19 +1098,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Gonzaga",
+    college: "Alabama",
     country: "USA",
     decades: ["2020s"],
-    ppgCareer: 16.5,
-    rpgCareer: 7.9,
-    apgCareer: 2.4,
-    position: "SF",
-    nbaId: "1631096"
+    ppgCareer: 18.9,
+    rpgCareer: 4.5,
+    apgCareer: 2.9,
+    position: "PF-SG",
+    nbaId: "1641706"
   },
+
   {
-    id: "austin-reaves",
-    name: "Austin Reaves",
-    teams: ["LAL"],
+    id: "brice-sensabaugh",
+    name: "Brice Sensabaugh",
+    teams: ["UTA"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1036,44 +1121,66 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Oklahoma",
+    college: "Ohio State",
     country: "USA",
     decades: ["2020s"],
-    ppgCareer: 15.9,
-    rpgCareer: 4.3,
-    apgCareer: 5.5,
-    position: "SG",
-    nbaId: "1630559"
+    ppgCareer: 12,
+    rpgCareer: 3.1,
+    apgCareer: 1.7,
+    position: "SF",
+    nbaId: "1641729"
   },
 
+  {
+    id: "brook-lopez",
+    name: "Brook Lopez",
+    teams: ["BKN","LAL","MIL","LAC"],
+    awards: ["Champion","All-Star"],
+    allStar: true,
+    champion: true,
+    championYears: ["2020"],
+    mvp: false,
+    dpoy: false,
+    roy: false,
+    allNBA: false,
+    allDefensive: true,
+    college: "Stanford",
+    country: "USA",
+    decades: ["2000s"],
+    ppgCareer: 15.4,
+    rpgCareer: 5.9,
+    apgCareer: 1.5,
+    position: "C",
+    nbaId: "201572"
+  },
 
   {
-    id: "elton-brand",
-    name: "Elton Brand",
-    teams: ["LAC"],
-    awards: [],
+    id: "bryn-forbes",
+    name: "Bryn Forbes",
+    teams: ["SAS","MIL","DEN","MIN"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2020"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Duke",
+    college: "Michigan State",
     country: "USA",
-    decades: ["1990s","2000s","2010s"],
-    ppgCareer: 15.9,
-    rpgCareer: 8.5,
-    apgCareer: 2.1,
-    position: "SF",
-    nbaId: "1882"
+    decades: ["2010s"],
+    ppgCareer: 8.8,
+    rpgCareer: 1.7,
+    apgCareer: 1.2,
+    position: "SG",
+    nbaId: "1627854"
   },
 
   {
-    id: "tyreke-evans",
-    name: "Tyreke Evans",
-    teams: ["SAC"],
+    id: "bub-carrington",
+    name: "Bub Carrington",
+    teams: ["WAS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1083,19 +1190,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Memphis",
+    college: "Pittsburgh",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 15.7,
-    rpgCareer: 4.6,
-    apgCareer: 4.8,
-    position: "SG",
-    nbaId: "201936"
+    decades: ["2020s"],
+    ppgCareer: 10.3,
+    rpgCareer: 3.8,
+    apgCareer: 4.5,
+    position: "PG",
+    nbaId: "1642267"
   },
+
   {
-    id: "myles-turner",
-    name: "Myles Turner",
-    teams: ["IND"],
+    id: "cj-watson",
+    name: "C.J. Watson",
+    teams: ["GSW"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1105,19 +1213,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Texas",
+    college: "Tennessee",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 17.1,
-    rpgCareer: 6.9,
-    apgCareer: 1.3,
-    position: "SF",
-    nbaId: "1626167"
+    decades: ["2000s"],
+    ppgCareer: 7.2,
+    rpgCareer: 1.9,
+    apgCareer: 2.5,
+    position: "PG",
+    nbaId: "201228"
   },
+
   {
-    id: "vj-edgecombe",
-    name: "VJ Edgecombe",
-    teams: ["PHI"],
+    id: "cj-mccollum",
+    name: "CJ McCollum",
+    teams: ["POR","NOP","WAS","ATL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1127,20 +1236,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Baylor",
+    college: "Lehigh",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 15.6,
-    rpgCareer: 5.3,
-    apgCareer: 4.3,
-    position: "SG",
-    nbaId: "1642845"
+    decades: ["2010s"],
+    ppgCareer: 19.5,
+    rpgCareer: 3.6,
+    apgCareer: 3.8,
+    position: "PG",
+    nbaId: "203468"
   },
 
   {
-    id: "jalen-duren",
-    name: "Jalen Duren",
-    teams: ["DET"],
+    id: "cj-miles",
+    name: "CJ Miles",
+    teams: ["UTA","CLE","IND","TOR","MEM","WAS","BOS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1150,42 +1259,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Memphis",
+    college: "Skyline HS (TX)",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 13.8,
-    rpgCareer: 11.6,
-    apgCareer: 2.4,
-    position: "C",
-    nbaId: "1631105"
+    decades: ["2000s"],
+    ppgCareer: 9.6,
+    rpgCareer: 2.4,
+    apgCareer: 1.1,
+    position: "SG-SF",
+    nbaId: "101139"
   },
 
   {
-    id: "elijah-bryant",
-    name: "Elijah Bryant",
-    teams: ["MIL"],
-    awards: [],
-    allStar: false,
+    id: "cade-cunningham",
+    name: "Cade Cunningham",
+    teams: ["DET"],
+    awards: ["All-Star"],
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
     dpoy: false,
     roy: false,
-    allNBA: false,
+    allNBA: true,
     allDefensive: false,
-    college: "Brigham Young",
+    college: "Oklahoma State",
     country: "USA",
     decades: ["2020s"],
-    ppgCareer: 16.0,
-    rpgCareer: 6.0,
-    apgCareer: 3.0,
-    position: "SG",
-    nbaId: "1629091"
+    ppgCareer: 22.6,
+    rpgCareer: 5.4,
+    apgCareer: 7.8,
+    position: "PG",
+    nbaId: "1630595"
   },
+
   {
-    id: "brandon-miller",
-    name: "Brandon Miller",
-    teams: ["CHA"],
+    id: "caleb-love",
+    name: "Caleb Love",
+    teams: ["POR"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1195,19 +1305,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Alabama",
+    college: "Arizona",
     country: "USA",
     decades: ["2020s"],
-    ppgCareer: 17.3,
-    rpgCareer: 4.3,
-    apgCareer: 2.4,
-    position: "SF",
-    nbaId: "1641706"
+    ppgCareer: 10.4,
+    rpgCareer: 2.3,
+    apgCareer: 2.5,
+    position: "PG",
+    nbaId: "1631126"
   },
+
   {
-    id: "derrick-white",
-    name: "Derrick White",
-    teams: ["BOS"],
+    id: "caleb-martin",
+    name: "Caleb Martin",
+    teams: ["CHA","MIA","PHI","DAL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1217,20 +1328,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Colorado",
+    college: "Nevada",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 15.2,
-    rpgCareer: 4.2,
-    apgCareer: 5.2,
-    position: "SG",
-    nbaId: "1628401"
+    decades: ["2010s"],
+    ppgCareer: 10,
+    rpgCareer: 4.4,
+    apgCareer: 2.2,
+    position: "PF",
+    nbaId: "1628997"
   },
 
   {
-    id: "stephon-castle",
-    name: "Stephon Castle",
-    teams: ["SAS"],
+    id: "cam-spencer",
+    name: "Cam Spencer",
+    teams: ["MEM"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1243,16 +1354,17 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     college: "Connecticut",
     country: "USA",
     decades: ["2020s"],
-    ppgCareer: 15.4,
-    rpgCareer: 4.0,
-    apgCareer: 5.0,
-    position: "SG",
-    nbaId: "1642264"
+    ppgCareer: 8.9,
+    rpgCareer: 2.1,
+    apgCareer: 3.9,
+    position: "PG",
+    nbaId: "1642285"
   },
+
   {
-    id: "al-jefferson",
-    name: "Al Jefferson",
-    teams: ["UTA"],
+    id: "cam-thomas",
+    name: "Cam Thomas",
+    teams: ["BKN"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1262,19 +1374,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "No College",
-    country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 15.7,
-    rpgCareer: 8.4,
-    apgCareer: 1.5,
-    position: "C",
-    nbaId: "2744"
+    college: "Louisiana State",
+    country: "Japan",
+    decades: ["2020s"],
+    ppgCareer: 14.9,
+    rpgCareer: 2.4,
+    apgCareer: 2.1,
+    position: "PG",
+    nbaId: "1630560"
   },
+
   {
-    id: "bogdan-bogdanovi-",
-    name: "Bogdan Bogdanović",
-    teams: ["ATL"],
+    id: "cam-whitmore",
+    name: "Cam Whitmore",
+    teams: ["HOU","WAS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1284,19 +1397,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Fenerbahce",
-    country: "Serbia",
-    decades: ["2010s","2020s"],
-    ppgCareer: 16.9,
-    rpgCareer: 3.4,
-    apgCareer: 3.1,
-    position: "SG",
-    nbaId: "203992"
+    college: "Villanova",
+    country: "USA",
+    decades: ["2020s"],
+    ppgCareer: 10.5,
+    rpgCareer: 3.3,
+    apgCareer: 0.8,
+    position: "PF",
+    nbaId: "1641715"
   },
+
   {
-    id: "joe-johnson",
-    name: "Joe Johnson",
-    teams: ["BOS"],
+    id: "cameron-johnson",
+    name: "Cameron Johnson",
+    teams: ["PHX","BKN","DEN"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1306,19 +1420,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Arkansas",
+    college: "North Carolina",
     country: "USA",
-    decades: ["2000s","2010s","2020s"],
-    ppgCareer: 16.0,
-    rpgCareer: 4.0,
-    apgCareer: 3.9,
-    position: "SG",
-    nbaId: "2207"
+    decades: ["2010s"],
+    ppgCareer: 12.8,
+    rpgCareer: 3.9,
+    apgCareer: 2,
+    position: "PF",
+    nbaId: "1629661"
   },
+
   {
-    id: "malik-monk",
-    name: "Malik Monk",
-    teams: ["SAC"],
+    id: "cameron-oliver",
+    name: "Cameron Oliver",
+    teams: ["ATL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1328,19 +1443,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Kentucky",
+    college: "Nevada",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 15.4,
-    rpgCareer: 2.9,
-    apgCareer: 5.1,
-    position: "SG",
-    nbaId: "1628370"
+    decades: ["2020s"],
+    ppgCareer: 11,
+    rpgCareer: 4.5,
+    apgCareer: 1.3,
+    position: "PF",
+    nbaId: "1628419"
   },
+
   {
-    id: "shaedon-sharpe",
-    name: "Shaedon Sharpe",
-    teams: ["POR"],
+    id: "cameron-payne",
+    name: "Cameron Payne",
+    teams: ["OKC","CHI","CLE","PHX","MIL","PHI","NYK"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1350,19 +1466,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Kentucky",
-    country: "Canada",
-    decades: ["2020s"],
-    ppgCareer: 15.9,
-    rpgCareer: 5.0,
-    apgCareer: 2.9,
-    position: "SG",
-    nbaId: "1631101"
+    college: "Murray State",
+    country: "USA",
+    decades: ["2010s"],
+    ppgCareer: 7.7,
+    rpgCareer: 2,
+    apgCareer: 3.2,
+    position: "PG",
+    nbaId: "1626166"
   },
+
   {
-    id: "keldon-johnson",
-    name: "Keldon Johnson",
-    teams: ["SAS"],
+    id: "caris-levert",
+    name: "Caris LeVert",
+    teams: ["BKN","IND","CLE","ATL","DET"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1372,19 +1489,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Kentucky",
+    college: "Michigan",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 15.7,
-    rpgCareer: 5.5,
-    apgCareer: 2.8,
-    position: "SG",
-    nbaId: "1629640"
+    decades: ["2010s"],
+    ppgCareer: 13.55,
+    rpgCareer: 4.1,
+    apgCareer: 3.95,
+    position: "SF",
+    nbaId: "1627747"
   },
+
   {
-    id: "josh-smith",
-    name: "Josh Smith",
-    teams: ["ATL"],
+    id: "carl-landry",
+    name: "Carl Landry",
+    teams: ["HOU","SAC","GSW","PHI","NOP"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1394,21 +1512,22 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Oak Hill Academy (VA)",
+    college: "Purdue",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 14.5,
-    rpgCareer: 7.4,
-    apgCareer: 3.1,
-    position: "SF",
-    nbaId: "2746"
+    decades: ["2000s"],
+    ppgCareer: 10.8,
+    rpgCareer: 4.9,
+    apgCareer: 0.7,
+    position: "PF",
+    nbaId: "201171"
   },
+
   {
-    id: "kevin-martin",
-    name: "Kevin Martin",
-    teams: ["SAC"],
-    awards: [],
-    allStar: false,
+    id: "caron-butler",
+    name: "Caron Butler",
+    teams: ["MIA","LAL","WAS","DAL","LAC","MIL","OKC","DET","SAC"],
+    awards: ["All-Star"],
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
@@ -1416,18 +1535,19 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Western Carolina",
+    college: "Connecticut",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 17.4,
-    rpgCareer: 3.2,
-    apgCareer: 1.9,
-    position: "SG",
-    nbaId: "2755"
+    decades: ["2000s"],
+    ppgCareer: 14.1,
+    rpgCareer: 5,
+    apgCareer: 2.3,
+    position: "SF",
+    nbaId: "2406"
   },
+
   {
-    id: "marc-gasol",
-    name: "Marc Gasol",
+    id: "cedric-coward",
+    name: "Cedric Coward",
     teams: ["MEM"],
     awards: [],
     allStar: false,
@@ -1438,19 +1558,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "FC Barcelona",
-    country: "Spain",
-    decades: ["2000s","2010s","2020s"],
-    ppgCareer: 14.0,
-    rpgCareer: 7.4,
-    apgCareer: 3.4,
-    position: "C",
-    nbaId: "201188"
+    college: "Washington State",
+    country: "USA",
+    decades: ["2020s"],
+    ppgCareer: 13.6,
+    rpgCareer: 5.9,
+    apgCareer: 2.8,
+    position: "PF-SG",
+    nbaId: "1642907"
   },
+
   {
-    id: "jonathan-kuminga",
-    name: "Jonathan Kuminga",
-    teams: ["GSW"],
+    id: "chandler-parsons",
+    name: "Chandler Parsons",
+    teams: ["ATL","HOU","DAL","MEM"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1460,41 +1581,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "NBA G League Ignite",
-    country: "DRC",
-    decades: ["2020s"],
-    ppgCareer: 16.1,
-    rpgCareer: 4.8,
-    apgCareer: 2.2,
+    college: "Florida",
+    country: "USA",
+    decades: ["2010s"],
+    ppgCareer: 12.7,
+    rpgCareer: 4.5,
+    apgCareer: 2.7,
     position: "SF",
-    nbaId: "1630228"
+    nbaId: "202718"
   },
+
   {
-    id: "rudy-gay",
-    name: "Rudy Gay",
-    teams: ["GSW"],
-    awards: [],
+    id: "channing-frye",
+    name: "Channing Frye",
+    teams: ["POR","NYK","CLE","PHX","LAL","ORL"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2015"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Connecticut",
+    college: "Arizona",
     country: "USA",
-    decades: ["2000s","2010s","2020s"],
-    ppgCareer: 15.8,
-    rpgCareer: 5.6,
-    apgCareer: 2.0,
-    position: "SG",
-    nbaId: "200752"
+    decades: ["2000s"],
+    ppgCareer: 8.7,
+    rpgCareer: 4.5,
+    apgCareer: 1,
+    position: "PF",
+    nbaId: "101112"
   },
+
   {
-    id: "dennis-schr-der",
-    name: "Dennis Schröder",
-    teams: ["BKN"],
+    id: "charlie-villanueva",
+    name: "Charlie Villanueva",
+    teams: ["DET"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1504,19 +1627,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Braunschweig",
-    country: "Germany",
-    decades: ["2010s","2020s"],
-    ppgCareer: 14.0,
-    rpgCareer: 3.0,
-    apgCareer: 6.1,
-    position: "SG",
-    nbaId: "203471"
+    college: "Connecticut",
+    country: "USA",
+    decades: ["2000s"],
+    ppgCareer: 10.4,
+    rpgCareer: 4.6,
+    apgCareer: 0.8,
+    position: "PF",
+    nbaId: "101111"
   },
+
   {
-    id: "jaden-ivey",
-    name: "Jaden Ivey",
-    teams: ["DET"],
+    id: "chase-budinger",
+    name: "Chase Budinger",
+    teams: ["HOU","MIN","IND","PHX"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1526,65 +1650,68 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Purdue",
+    college: "Arizona",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 15.4,
-    rpgCareer: 3.4,
-    apgCareer: 3.8,
-    position: "SG",
-    nbaId: "1631093"
+    decades: ["2000s"],
+    ppgCareer: 7.9,
+    rpgCareer: 3,
+    apgCareer: 1.2,
+    position: "SF",
+    nbaId: "201978"
   },
+
   {
-    id: "kevin-porter-jr-",
-    name: "Kevin Porter Jr.",
-    teams: ["MIL"],
-    awards: [],
-    allStar: false,
-    champion: false,
-    championYears: [],
+    id: "chet-holmgren",
+    name: "Chet Holmgren",
+    teams: ["OKC"],
+    awards: ["Champion"],
+    allStar: true,
+    champion: true,
+    championYears: ["2024"],
     mvp: false,
     dpoy: false,
     roy: false,
-    allNBA: false,
-    allDefensive: false,
-    college: "Southern California",
+    allNBA: true,
+    allDefensive: true,
+    college: "Gonzaga",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 14.2,
-    rpgCareer: 4.2,
-    apgCareer: 4.8,
-    position: "SG",
-    nbaId: "1629645"
+    decades: ["2020s"],
+    ppgCareer: 16.5,
+    rpgCareer: 8.3,
+    apgCareer: 2.1,
+    position: "F-C",
+    nbaId: "1631096"
   },
+
   {
-    id: "brandon-jennings",
-    name: "Brandon Jennings",
-    teams: ["MIL"],
-    awards: [],
-    allStar: false,
-    champion: false,
-    championYears: [],
+    id: "chris-bosh",
+    name: "Chris Bosh",
+    teams: ["TOR","MIA"],
+    awards: ["All-Star","Champion"],
+    allStar: true,
+    champion: true,
+    championYears: ["2011","2012"],
     mvp: false,
     dpoy: false,
     roy: false,
-    allNBA: false,
+    allNBA: true,
     allDefensive: false,
-    college: "Virtus Roma",
+    college: "Georgia Tech",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 14.1,
-    rpgCareer: 3.0,
-    apgCareer: 5.7,
-    position: "SG",
-    nbaId: "201943"
+    decades: ["2000s"],
+    ppgCareer: 19.2,
+    rpgCareer: 8.5,
+    apgCareer: 2,
+    position: "F-C",
+    nbaId: "2547"
   },
+
   {
-    id: "caris-levert",
-    name: "Caris LeVert",
-    teams: ["CLE"],
-    awards: [],
-    allStar: false,
+    id: "chris-kaman",
+    name: "Chris Kaman",
+    teams: ["DAL","NOP","POR","LAL","LAC"],
+    awards: ["All-Star"],
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
@@ -1592,41 +1719,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Michigan",
+    college: "Central Michigan",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 14.0,
-    rpgCareer: 4.1,
-    apgCareer: 5.1,
-    position: "SG",
-    nbaId: "1627747"
+    decades: ["2000s"],
+    ppgCareer: 11.2,
+    rpgCareer: 7.59,
+    apgCareer: 1.3,
+    position: "C",
+    nbaId: "2549"
   },
+
   {
-    id: "aaron-gordon",
-    name: "Aaron Gordon",
+    id: "christian-braun",
+    name: "Christian Braun",
     teams: ["DEN"],
-    awards: [],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2022"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Arizona",
+    college: "Kansas",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 13.9,
-    rpgCareer: 6.5,
-    apgCareer: 3.5,
-    position: "SF",
-    nbaId: "203932"
+    decades: ["2020s"],
+    ppgCareer: 9.6,
+    rpgCareer: 3.9,
+    apgCareer: 1.8,
+    position: "SG",
+    nbaId: "1631128"
   },
+
   {
-    id: "alex-sarr",
-    name: "Alex Sarr",
-    teams: ["WAS"],
+    id: "clint-capela",
+    name: "Clint Capela",
+    teams: ["HOU","ATL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1636,19 +1765,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Washington Wizards",
-    country: "France",
-    decades: ["2020s"],
-    ppgCareer: 14.4,
-    rpgCareer: 6.8,
-    apgCareer: 2.5,
+    college: "Elan Chalon",
+    country: "Switzerland",
+    decades: ["2010s"],
+    ppgCareer: 11.1,
+    rpgCareer: 9.9,
+    apgCareer: 1,
     position: "C",
-    nbaId: "1642259"
+    nbaId: "203991"
   },
+
   {
-    id: "scoot-henderson",
-    name: "Scoot Henderson",
-    teams: ["POR"],
+    id: "coby-white",
+    name: "Coby White",
+    teams: ["CHI","CHA"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1658,19 +1788,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "NBA G League Ignite",
+    college: "North Carolina",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 14.0,
-    rpgCareer: 3.1,
-    apgCareer: 5.4,
-    position: "SG",
-    nbaId: "1630703"
+    decades: ["2010s"],
+    ppgCareer: 15.4,
+    rpgCareer: 3.6,
+    apgCareer: 3.9,
+    position: "PG",
+    nbaId: "1629632"
   },
+
   {
-    id: "luol-deng",
-    name: "Luol Deng",
-    teams: ["CHI"],
+    id: "cody-martin",
+    name: "Cody Martin",
+    teams: ["CHA","PHX","IND"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1680,19 +1811,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Duke",
-    country: "United Kingdom",
-    decades: ["2000s","2010s"],
-    ppgCareer: 14.8,
-    rpgCareer: 6.1,
-    apgCareer: 2.3,
-    position: "SF",
-    nbaId: "2736"
+    college: "Nevada",
+    country: "USA",
+    decades: ["2010s"],
+    ppgCareer: 6.1,
+    rpgCareer: 3.7,
+    apgCareer: 2.2,
+    position: "PG-SF",
+    nbaId: "1628998"
   },
+
   {
-    id: "derik-queen",
-    name: "Derik Queen",
-    teams: ["NOP"],
+    id: "cole-anthony",
+    name: "Cole Anthony",
+    teams: ["ORL","MIL","PHX"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1702,19 +1834,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Maryland",
+    college: "North Carolina",
     country: "USA",
     decades: ["2020s"],
-    ppgCareer: 12.6,
-    rpgCareer: 7.5,
-    apgCareer: 4.3,
-    position: "C",
-    nbaId: "1642852"
+    ppgCareer: 12,
+    rpgCareer: 4.1,
+    apgCareer: 3.8,
+    position: "PG",
+    nbaId: "1630175"
   },
+
   {
-    id: "david-lee",
-    name: "David Lee",
-    teams: ["NYK"],
+    id: "collin-murray-boyles",
+    name: "Collin Murray-Boyles",
+    teams: ["TOR"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1724,19 +1857,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Florida",
+    college: "South Carolina",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 13.5,
-    rpgCareer: 8.8,
-    apgCareer: 2.2,
-    position: "SF",
-    nbaId: "101135"
+    decades: ["2020s"],
+    ppgCareer: 7.8,
+    rpgCareer: 5.1,
+    apgCareer: 2,
+    position: "PF",
+    nbaId: "1642867"
   },
+
   {
-    id: "cedric-coward",
-    name: "Cedric Coward",
-    teams: ["MEM"],
+    id: "collin-sexton",
+    name: "Collin Sexton",
+    teams: ["CLE","UTA","CHA","CHI"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1746,63 +1880,66 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Washington State",
+    college: "Alabama",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 14.0,
-    rpgCareer: 6.5,
-    apgCareer: 2.9,
-    position: "SG",
-    nbaId: "1642907"
+    decades: ["2010s"],
+    ppgCareer: 18.38,
+    rpgCareer: 2.6,
+    apgCareer: 3.7,
+    position: "PG",
+    nbaId: "1629012"
   },
+
   {
-    id: "jusuf-nurki-",
-    name: "Jusuf Nurkić",
-    teams: ["PHX"],
+    id: "cooper-flagg",
+    name: "Cooper Flagg",
+    teams: ["DAL"],
     awards: [],
     allStar: false,
     champion: false,
     championYears: [],
     mvp: false,
     dpoy: false,
-    roy: false,
+    roy: true,
     allNBA: false,
     allDefensive: false,
-    college: "Cedevita",
-    country: "Bosnia and Herzegovina",
-    decades: ["2010s","2020s"],
-    ppgCareer: 10.9,
-    rpgCareer: 11.0,
-    apgCareer: 4.0,
-    position: "C",
-    nbaId: "203994"
+    college: "Duke",
+    country: "USA",
+    decades: ["2020s"],
+    ppgCareer: 21,
+    rpgCareer: 6.7,
+    apgCareer: 4.5,
+    position: "PF-SG",
+    nbaId: "1642843"
   },
+
   {
-    id: "donte-divincenzo",
-    name: "Donte DiVincenzo",
-    teams: ["NYK"],
-    awards: [],
+    id: "corey-brewer",
+    name: "Corey Brewer",
+    teams: ["MIN","DAL","DEN","HOU","LAL","OKC","PHI","SAC"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2010"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Villanova",
+    college: "Florida",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 15.5,
-    rpgCareer: 3.7,
-    apgCareer: 2.7,
-    position: "SG",
-    nbaId: "1628978"
+    decades: ["2000s"],
+    ppgCareer: 8.7,
+    rpgCareer: 2.8,
+    apgCareer: 1.5,
+    position: "SF",
+    nbaId: "201147"
   },
+
   {
-    id: "andre-miller",
-    name: "Andre Miller",
-    teams: ["DEN"],
+    id: "corey-kispert",
+    name: "Corey Kispert",
+    teams: ["WAS","ATL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1812,19 +1949,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Utah",
+    college: "Gonzaga",
     country: "USA",
-    decades: ["1990s","2000s","2010s"],
-    ppgCareer: 12.5,
-    rpgCareer: 3.7,
-    apgCareer: 6.5,
-    position: "SG",
-    nbaId: "1889"
+    decades: ["2020s"],
+    ppgCareer: 10.7,
+    rpgCareer: 2.7,
+    apgCareer: 1.5,
+    position: "SG-SF",
+    nbaId: "1630557"
   },
+
   {
-    id: "keegan-murray",
-    name: "Keegan Murray",
-    teams: ["SAC"],
+    id: "courtney-lee",
+    name: "Courtney Lee",
+    teams: ["NYK","DAL","CHA","MEM","HOU","ORL","BOS","BKN"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1834,19 +1972,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Iowa",
+    college: "Western Kentucky",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 15.2,
-    rpgCareer: 5.5,
+    decades: ["2000s"],
+    ppgCareer: 9.6,
+    rpgCareer: 2.6,
     apgCareer: 1.7,
-    position: "SF",
-    nbaId: "1631099"
+    position: "SG",
+    nbaId: "201584"
   },
+
   {
-    id: "eric-bledsoe",
-    name: "Eric Bledsoe",
-    teams: ["POR"],
+    id: "dj-augustin",
+    name: "D.J. Augustin",
+    teams: ["CHA","IND","TOR","CHI","DET","OKC","DEN","ORL","MIL","HOU","LAL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1856,19 +1995,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Kentucky",
+    college: "Texas",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 13.7,
-    rpgCareer: 3.9,
-    apgCareer: 4.7,
-    position: "SG",
-    nbaId: "202339"
+    decades: ["2000s"],
+    ppgCareer: 9.5,
+    rpgCareer: 1.8,
+    apgCareer: 3.9,
+    position: "PG",
+    nbaId: "201571"
   },
+
   {
-    id: "josh-giddey",
-    name: "Josh Giddey",
-    teams: ["OKC"],
+    id: "dalano-banton",
+    name: "Dalano Banton",
+    teams: ["TOR","BOS","POR"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1878,19 +2018,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "NBA Global Academy",
-    country: "Australia",
+    college: "Nebraska",
+    country: "Canada",
     decades: ["2020s"],
-    ppgCareer: 12.3,
-    rpgCareer: 6.4,
-    apgCareer: 4.8,
-    position: "SG",
-    nbaId: "1630581"
+    ppgCareer: 6.6,
+    rpgCareer: 2.2,
+    apgCareer: 2,
+    position: "SG-SF",
+    nbaId: "1630625"
   },
+
   {
-    id: "jabari-smith-jr-",
-    name: "Jabari Smith Jr.",
-    teams: ["HOU"],
+    id: "damion-baugh",
+    name: "Damion Baugh",
+    teams: ["CHA"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1900,41 +2041,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Auburn",
+    college: "TCU",
     country: "USA",
     decades: ["2020s"],
-    ppgCareer: 13.7,
-    rpgCareer: 8.1,
-    apgCareer: 1.6,
-    position: "SF",
-    nbaId: "1631095"
+    ppgCareer: 7.3,
+    rpgCareer: 3.3,
+    apgCareer: 3.7,
+    position: "PG",
+    nbaId: "1641878"
   },
+
   {
-    id: "trey-murphy-iii",
-    name: "Trey Murphy III",
-    teams: ["NOP"],
-    awards: [],
+    id: "damion-lee",
+    name: "Damion Lee",
+    teams: ["ATL","GSW","PHX"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2021"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Virginia",
+    college: "Drexel",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 14.8,
-    rpgCareer: 4.9,
-    apgCareer: 2.2,
-    position: "SF",
-    nbaId: "1630530"
+    decades: ["2010s"],
+    ppgCareer: 7.8,
+    rpgCareer: 3.2,
+    apgCareer: 1.3,
+    position: "SG-SF",
+    nbaId: "1627814"
   },
+
   {
-    id: "tyus-jones",
-    name: "Tyus Jones",
-    teams: ["WAS"],
+    id: "damyean-dotson",
+    name: "Damyean Dotson",
+    teams: ["NYK","CLE"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1944,19 +2087,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Duke",
+    college: "Houston",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 12.0,
-    rpgCareer: 2.7,
-    apgCareer: 7.3,
+    decades: ["2010s"],
+    ppgCareer: 7.5,
+    rpgCareer: 2.5,
+    apgCareer: 1.5,
     position: "SG",
-    nbaId: "1626145"
+    nbaId: "1628422"
   },
+
   {
-    id: "de-andre-hunter",
-    name: "De'Andre Hunter",
-    teams: ["ATL"],
+    id: "danny-wolf",
+    name: "Danny Wolf",
+    teams: ["BKN"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1966,19 +2110,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Virginia",
+    college: "Michigan",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 15.6,
-    rpgCareer: 3.9,
-    apgCareer: 1.5,
-    position: "SG",
-    nbaId: "1629631"
+    decades: ["2020s"],
+    ppgCareer: 8.9,
+    rpgCareer: 4.9,
+    apgCareer: 2.2,
+    position: "F-C",
+    nbaId: "1642874"
   },
+
   {
-    id: "greg-monroe",
-    name: "Greg Monroe",
-    teams: ["MIN"],
+    id: "danté-exum",
+    name: "Danté Exum",
+    teams: ["UTA","CLE","DAL","WAS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -1988,19 +2133,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Georgetown",
-    country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 13.0,
-    rpgCareer: 8.2,
-    apgCareer: 2.1,
-    position: "SF",
-    nbaId: "202328"
+    college: "Australian Institute of Sport",
+    country: "Australia",
+    decades: ["2010s"],
+    ppgCareer: 6.2,
+    rpgCareer: 1.9,
+    apgCareer: 2.3,
+    position: "PG",
+    nbaId: "203957"
   },
+
   {
-    id: "paul-millsap",
-    name: "Paul Millsap",
-    teams: ["PHI"],
+    id: "dario-šarić",
+    name: "Dario Šarić",
+    teams: ["PHI","MIN","PHX","OKC","GSW","DEN","SAC","CHI","DET"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2010,21 +2156,22 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Louisiana Tech",
-    country: "USA",
-    decades: ["2000s","2010s","2020s"],
-    ppgCareer: 13.4,
-    rpgCareer: 7.1,
-    apgCareer: 2.2,
-    position: "SF",
-    nbaId: "200794"
+    college: "Anadolu Efes",
+    country: "Croatia",
+    decades: ["2010s"],
+    ppgCareer: 8,
+    rpgCareer: 5.29,
+    apgCareer: 2.3,
+    position: "F-C",
+    nbaId: "203967"
   },
+
   {
-    id: "ty-lawson",
-    name: "Ty Lawson",
-    teams: ["DEN"],
-    awards: [],
-    allStar: false,
+    id: "darius-garland",
+    name: "Darius Garland",
+    teams: ["CLE","LAC"],
+    awards: ["All-Star"],
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
@@ -2032,19 +2179,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "North Carolina",
+    college: "Vanderbilt",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 12.7,
-    rpgCareer: 2.7,
-    apgCareer: 6.0,
-    position: "SG",
-    nbaId: "201951"
+    decades: ["2010s"],
+    ppgCareer: 18.9,
+    rpgCareer: 2.6,
+    apgCareer: 6.7,
+    position: "PG",
+    nbaId: "1629636"
   },
+
   {
-    id: "brandon-knight",
-    name: "Brandon Knight",
-    teams: ["DAL"],
+    id: "darren-collison",
+    name: "Darren Collison",
+    teams: ["NOH","IND","DAL","LAC","SAC","LAL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2054,45 +2202,47 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Kentucky",
+    college: "UCLA",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 14.0,
-    rpgCareer: 3.1,
-    apgCareer: 3.9,
-    position: "SG",
-    nbaId: "202688"
+    decades: ["2000s"],
+    ppgCareer: 12.5,
+    rpgCareer: 2.7,
+    apgCareer: 4.99,
+    position: "PG",
+    nbaId: "201954"
   },
+
   {
-    id: "bobby-portis",
-    name: "Bobby Portis",
-    teams: ["MIL"],
-    awards: [],
-    allStar: false,
-    champion: false,
-    championYears: [],
+    id: "david-lee",
+    name: "David Lee",
+    teams: ["NYK","GSW","DAL","SAS","BOS"],
+    awards: ["All-Star","Champion"],
+    allStar: true,
+    champion: true,
+    championYears: ["2014"],
     mvp: false,
     dpoy: false,
     roy: false,
-    allNBA: false,
+    allNBA: true,
     allDefensive: false,
-    college: "Arkansas",
+    college: "Florida",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 13.8,
-    rpgCareer: 7.4,
-    apgCareer: 1.3,
-    position: "SF",
-    nbaId: "1626171"
+    decades: ["2000s"],
+    ppgCareer: 13.5,
+    rpgCareer: 8.83,
+    apgCareer: 2.2,
+    position: "F-C",
+    nbaId: "101135"
   },
+
   {
     id: "david-west",
     name: "David West",
     teams: ["NOP"],
-    awards: [],
-    allStar: false,
-    champion: false,
-    championYears: [],
+    awards: ["All-Star","Champion"],
+    allStar: true,
+    champion: true,
+    championYears: ["2016","2017"],
     mvp: false,
     dpoy: false,
     roy: false,
@@ -2100,17 +2250,18 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     allDefensive: false,
     college: "Xavier",
     country: "USA",
-    decades: ["2000s","2010s"],
+    decades: ["2000s"],
     ppgCareer: 13.6,
     rpgCareer: 6.4,
     apgCareer: 2.2,
-    position: "SF",
+    position: "PF",
     nbaId: "2561"
   },
+
   {
-    id: "hassan-whiteside",
-    name: "Hassan Whiteside",
-    teams: ["UTA"],
+    id: "dayron-sharpe",
+    name: "Day'Ron Sharpe",
+    teams: ["BKN"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2120,19 +2271,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Marshall",
+    college: "North Carolina",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 12.6,
-    rpgCareer: 10.8,
-    apgCareer: 0.6,
+    decades: ["2020s"],
+    ppgCareer: 6.8,
+    rpgCareer: 6.4,
+    apgCareer: 1.4,
     position: "C",
-    nbaId: "202355"
+    nbaId: "1630549"
   },
+
   {
-    id: "ricky-rubio",
-    name: "Ricky Rubio",
-    teams: ["CLE"],
+    id: "deandre-hunter",
+    name: "De'Andre Hunter",
+    teams: ["ATL","CLE","SAC"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2142,19 +2294,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "FC Barcelona",
-    country: "Spain",
-    decades: ["2010s","2020s"],
-    ppgCareer: 10.8,
+    college: "Virginia",
+    country: "USA",
+    decades: ["2010s"],
+    ppgCareer: 14.7,
     rpgCareer: 4.1,
-    apgCareer: 7.4,
-    position: "SG",
-    nbaId: "201937"
+    apgCareer: 1.6,
+    position: "PF-SG",
+    nbaId: "1629631"
   },
+
   {
-    id: "jabari-parker",
-    name: "Jabari Parker",
-    teams: ["BOS"],
+    id: "deanthony-melton",
+    name: "De'Anthony Melton",
+    teams: ["PHX","MEM","PHI","GSW"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2164,19 +2317,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Duke",
+    college: "Southern California",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 14.1,
-    rpgCareer: 5.5,
-    apgCareer: 2.0,
-    position: "SF",
-    nbaId: "203953"
+    decades: ["2010s"],
+    ppgCareer: 9.5,
+    rpgCareer: 3.6,
+    apgCareer: 2.7,
+    position: "PG",
+    nbaId: "1629001"
   },
+
   {
-    id: "caron-butler",
-    name: "Caron Butler",
-    teams: ["WAS"],
+    id: "dejuan-blair",
+    name: "DeJuan Blair",
+    teams: ["SAS","DAL","WAS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2186,41 +2340,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Connecticut",
+    college: "Pittsburgh",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 14.1,
-    rpgCareer: 5.0,
-    apgCareer: 2.3,
-    position: "SF",
-    nbaId: "2406"
+    decades: ["2000s"],
+    ppgCareer: 6.8,
+    rpgCareer: 5.1,
+    apgCareer: 0.8,
+    position: "PF",
+    nbaId: "201971"
   },
+
   {
-    id: "nic-claxton",
-    name: "Nic Claxton",
-    teams: ["BKN"],
-    awards: [],
-    allStar: false,
+    id: "demarcus-cousins",
+    name: "DeMarcus Cousins",
+    teams: ["SAC","NOP","GSW","HOU","LAC","MIL","DEN"],
+    awards: ["All-Star"],
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
     dpoy: false,
     roy: false,
-    allNBA: false,
+    allNBA: true,
     allDefensive: false,
-    college: "Georgia",
+    college: "Kentucky",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 11.8,
-    rpgCareer: 9.9,
-    apgCareer: 2.1,
-    position: "C",
-    nbaId: "1629651"
+    decades: ["2010s"],
+    ppgCareer: 19.57,
+    rpgCareer: 10.19,
+    apgCareer: 3,
+    position: "C-F",
+    nbaId: "202326"
   },
+
   {
-    id: "goran-dragic",
-    name: "Goran Dragic",
-    teams: ["MIL"],
+    id: "demarre-carroll",
+    name: "DeMarre Carroll",
+    teams: ["MEM","HOU","DEN","UTA","ATL","TOR","BKN","SAS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2230,41 +2386,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Union Olimpija",
-    country: "Slovenia",
-    decades: ["2000s","2010s","2020s"],
-    ppgCareer: 13.3,
-    rpgCareer: 3.0,
-    apgCareer: 4.7,
-    position: "SG",
-    nbaId: "201609"
+    college: "Missouri",
+    country: "USA",
+    decades: ["2000s"],
+    ppgCareer: 8.9,
+    rpgCareer: 4.2,
+    apgCareer: 1.3,
+    position: "SF",
+    nbaId: "201960"
   },
+
   {
-    id: "mo-williams",
-    name: "Mo Williams",
-    teams: ["MIL"],
-    awards: [],
-    allStar: false,
+    id: "dejounte-murray",
+    name: "Dejounte Murray",
+    teams: ["SAS","ATL","NOP"],
+    awards: ["All-Star"],
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
-    allDefensive: false,
-    college: "Alabama",
+    allDefensive: true,
+    college: "Washington",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 13.2,
-    rpgCareer: 2.8,
-    apgCareer: 4.9,
-    position: "SG",
-    nbaId: "2590"
+    decades: ["2010s"],
+    ppgCareer: 15.5,
+    rpgCareer: 5.8,
+    apgCareer: 5.4,
+    position: "PG",
+    nbaId: "1627749"
   },
+
   {
-    id: "jamal-crawford",
-    name: "Jamal Crawford",
-    teams: ["LAC"],
+    id: "dennis-schröder",
+    name: "Dennis Schröder",
+    teams: ["ATL","OKC","LAL","BOS","HOU","TOR","BKN","GSW","DET","SAC","CLE"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2274,19 +2432,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Michigan",
-    country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 14.6,
-    rpgCareer: 2.2,
-    apgCareer: 3.4,
-    position: "SG",
-    nbaId: "2037"
+    college: "Braunschweig",
+    country: "Germany",
+    decades: ["2010s"],
+    ppgCareer: 13.89,
+    rpgCareer: 3,
+    apgCareer: 4.88,
+    position: "PG",
+    nbaId: "203471"
   },
+
   {
-    id: "jeremiah-fears",
-    name: "Jeremiah Fears",
-    teams: ["NOP"],
+    id: "dennis-smith-jr",
+    name: "Dennis Smith Jr.",
+    teams: ["DAL","NYK","DET","POR","CHA","BKN"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2296,19 +2455,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Oklahoma",
+    college: "North Carolina State",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 13.9,
-    rpgCareer: 3.7,
-    apgCareer: 3.2,
-    position: "SG",
-    nbaId: "1642847"
+    decades: ["2010s"],
+    ppgCareer: 9.7,
+    rpgCareer: 3,
+    apgCareer: 4.2,
+    position: "PG",
+    nbaId: "1628372"
   },
+
   {
-    id: "saddiq-bey",
-    name: "Saddiq Bey",
-    teams: ["ATL"],
+    id: "denzel-valentine",
+    name: "Denzel Valentine",
+    teams: ["CHI","CLE","UTA"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2318,19 +2478,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Villanova",
+    college: "Michigan State",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 13.7,
-    rpgCareer: 6.5,
-    apgCareer: 1.5,
+    decades: ["2010s"],
+    ppgCareer: 7,
+    rpgCareer: 3.3,
+    apgCareer: 1.8,
     position: "SG",
-    nbaId: "1630180"
+    nbaId: "1627756"
   },
+
   {
-    id: "scotty-pippen-jr-",
-    name: "Scotty Pippen Jr.",
-    teams: ["MEM"],
+    id: "dereck-lively-ii",
+    name: "Dereck Lively II",
+    teams: ["DAL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2340,19 +2501,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Vanderbilt",
+    college: "Duke",
     country: "USA",
     decades: ["2020s"],
-    ppgCareer: 12.9,
-    rpgCareer: 3.2,
-    apgCareer: 4.7,
-    position: "SG",
-    nbaId: "1630590"
+    ppgCareer: 8.4,
+    rpgCareer: 7,
+    apgCareer: 1.6,
+    position: "C",
+    nbaId: "1641726"
   },
+
   {
-    id: "bennedict-mathurin",
-    name: "Bennedict Mathurin",
-    teams: ["IND"],
+    id: "derik-queen",
+    name: "Derik Queen",
+    teams: ["NOP"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2362,19 +2524,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Arizona",
-    country: "Canada",
+    college: "Maryland",
+    country: "USA",
     decades: ["2020s"],
-    ppgCareer: 14.5,
-    rpgCareer: 4.0,
-    apgCareer: 2.0,
-    position: "SG",
-    nbaId: "1631097"
+    ppgCareer: 11.7,
+    rpgCareer: 7.1,
+    apgCareer: 3.7,
+    position: "F-C",
+    nbaId: "1642852"
   },
+
   {
-    id: "rajon-rondo",
-    name: "Rajon Rondo",
-    teams: ["CLE"],
+    id: "derrick-favors",
+    name: "Derrick Favors",
+    teams: ["NJN","UTA","NOP","OKC"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2384,19 +2547,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Kentucky",
+    college: "Georgia Tech",
     country: "USA",
-    decades: ["2000s","2010s","2020s"],
-    ppgCareer: 9.8,
-    rpgCareer: 4.5,
-    apgCareer: 7.9,
-    position: "SG",
-    nbaId: "200765"
+    decades: ["2010s"],
+    ppgCareer: 10.6,
+    rpgCareer: 7.1,
+    apgCareer: 1.1,
+    position: "PF",
+    nbaId: "202324"
   },
+
   {
-    id: "bojan-bogdanovic",
-    name: "Bojan Bogdanovic",
-    teams: ["NYK"],
+    id: "derrick-jones-jr",
+    name: "Derrick Jones Jr.",
+    teams: ["PHX","MIA","POR","CHI","DAL","LAC"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2406,41 +2570,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Fenerbahce",
-    country: "Croatia",
-    decades: ["2010s","2020s"],
-    ppgCareer: 15.2,
-    rpgCareer: 2.7,
-    apgCareer: 1.7,
+    college: "UNLV",
+    country: "USA",
+    decades: ["2010s"],
+    ppgCareer: 7.5,
+    rpgCareer: 3.3,
+    apgCareer: 0.8,
     position: "SF",
-    nbaId: "202711"
+    nbaId: "1627884"
   },
+
   {
-    id: "lonzo-ball",
-    name: "Lonzo Ball",
-    teams: ["CHI"],
-    awards: [],
+    id: "derrick-white",
+    name: "Derrick White",
+    teams: ["SAS","BOS"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2023"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
-    allDefensive: false,
-    college: "UCLA",
+    allDefensive: true,
+    college: "Colorado",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 10.8,
-    rpgCareer: 5.3,
-    apgCareer: 5.7,
-    position: "SG",
-    nbaId: "1628366"
+    decades: ["2010s"],
+    ppgCareer: 13.4,
+    rpgCareer: 3.8,
+    apgCareer: 4.3,
+    position: "PG",
+    nbaId: "1628401"
   },
+
   {
-    id: "grayson-allen",
-    name: "Grayson Allen",
-    teams: ["PHX"],
+    id: "derrick-williams",
+    name: "Derrick Williams",
+    teams: ["MIN"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2450,19 +2616,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Duke",
+    college: "Arizona",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 13.5,
-    rpgCareer: 3.9,
-    apgCareer: 3.0,
-    position: "SG",
-    nbaId: "1628960"
+    decades: ["2010s"],
+    ppgCareer: 8.9,
+    rpgCareer: 4,
+    apgCareer: 0.7,
+    position: "PF",
+    nbaId: "202682"
   },
+
   {
-    id: "clint-capela",
-    name: "Clint Capela",
-    teams: ["ATL"],
+    id: "desmond-bane",
+    name: "Desmond Bane",
+    teams: ["MEM","ORL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2472,21 +2639,22 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Elan Chalon",
-    country: "Switzerland",
-    decades: ["2010s","2020s"],
-    ppgCareer: 11.5,
-    rpgCareer: 10.6,
-    apgCareer: 1.2,
-    position: "C",
-    nbaId: "203991"
+    college: "TCU",
+    country: "USA",
+    decades: ["2020s"],
+    ppgCareer: 18.3,
+    rpgCareer: 4.5,
+    apgCareer: 3.8,
+    position: "PG",
+    nbaId: "1630217"
   },
+
   {
-    id: "keyonte-george",
-    name: "Keyonte George",
-    teams: ["UTA"],
-    awards: [],
-    allStar: false,
+    id: "devin-harris",
+    name: "Devin Harris",
+    teams: ["DAL","NJN","UTA","ATL","DEN"],
+    awards: ["All-Star"],
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
@@ -2494,19 +2662,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Baylor",
+    college: "Wisconsin",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 13.0,
-    rpgCareer: 2.8,
-    apgCareer: 4.4,
-    position: "SG",
-    nbaId: "1641718"
+    decades: ["2000s"],
+    ppgCareer: 10.8,
+    rpgCareer: 2.2,
+    apgCareer: 3.93,
+    position: "PG",
+    nbaId: "2734"
   },
+
   {
-    id: "darren-collison",
-    name: "Darren Collison",
-    teams: ["LAL"],
+    id: "devin-vassell",
+    name: "Devin Vassell",
+    teams: ["SAS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2516,41 +2685,66 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "UCLA",
+    college: "Florida State",
     country: "USA",
-    decades: ["2000s","2010s","2020s"],
-    ppgCareer: 12.5,
-    rpgCareer: 2.7,
-    apgCareer: 5.0,
-    position: "SG",
-    nbaId: "201954"
+    decades: ["2020s"],
+    ppgCareer: 14.1,
+    rpgCareer: 3.8,
+    apgCareer: 2.6,
+    position: "PG-SF",
+    nbaId: "1630170"
   },
+
   {
-    id: "jeff-teague",
-    name: "Jeff Teague",
-    teams: ["ATL"],
-    awards: [],
+    id: "dion-waiters",
+    name: "Dion Waiters",
+    teams: ["CLE"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2019"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Wake Forest",
+    college: "Syracuse",
     country: "USA",
-    decades: ["2000s","2010s","2020s"],
-    ppgCareer: 12.2,
-    rpgCareer: 2.4,
-    apgCareer: 5.6,
+    decades: ["2010s"],
+    ppgCareer: 13.1,
+    rpgCareer: 2.6,
+    apgCareer: 2.8,
     position: "SG",
-    nbaId: "201952"
+    nbaId: "203079"
   },
+
   {
-    id: "gg-jackson",
-    name: "GG Jackson",
-    teams: ["MEM"],
+    id: "domantas-sabonis",
+    name: "Domantas Sabonis",
+    teams: ["OKC","IND","SAC"],
+    awards: ["All-Star"],
+    allStar: true,
+    champion: false,
+    championYears: [],
+    mvp: false,
+    dpoy: false,
+    roy: false,
+    allNBA: true,
+    allDefensive: false,
+    college: "Gonzaga",
+    country: "Lithuania",
+    decades: ["2010s"],
+    ppgCareer: 16.1,
+    rpgCareer: 10.7,
+    apgCareer: 4.9,
+    position: "PF",
+    nbaId: "1627734"
+  },
+
+  {
+    id: "donatas-motiejunas",
+    name: "Donatas Motiejunas",
+    teams: ["HOU","NOP","SAS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2560,19 +2754,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "South Carolina",
-    country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 14.6,
-    rpgCareer: 4.1,
-    apgCareer: 1.2,
-    position: "SF",
-    nbaId: "1641713"
+    college: "Lithuania",
+    country: "Lithuania",
+    decades: ["2010s"],
+    ppgCareer: 7.3,
+    rpgCareer: 3.8,
+    apgCareer: 1.1,
+    position: "PF",
+    nbaId: "202700"
   },
+
   {
-    id: "lou-williams",
-    name: "Lou Williams",
-    teams: ["ATL"],
+    id: "donovan-clingan",
+    name: "Donovan Clingan",
+    teams: ["POR"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2582,41 +2777,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "South Gwinnett HS (GA)",
+    college: "Connecticut",
     country: "USA",
-    decades: ["2000s","2010s","2020s"],
-    ppgCareer: 13.9,
-    rpgCareer: 2.2,
-    apgCareer: 3.4,
-    position: "SG",
-    nbaId: "101150"
+    decades: ["2020s"],
+    ppgCareer: 9.5,
+    rpgCareer: 9.9,
+    apgCareer: 1.7,
+    position: "C",
+    nbaId: "1642270"
   },
+
   {
-    id: "o-j-mayo",
-    name: "O.J. Mayo",
-    teams: ["MEM"],
-    awards: [],
+    id: "donte-divincenzo",
+    name: "Donte DiVincenzo",
+    teams: ["MIL","SAC","GSW","NYK","MIN"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2020"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Southern California",
+    college: "Villanova",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 13.8,
-    rpgCareer: 3.1,
-    apgCareer: 2.9,
-    position: "SG",
-    nbaId: "201564"
+    decades: ["2010s"],
+    ppgCareer: 11,
+    rpgCareer: 4.3,
+    apgCareer: 3,
+    position: "PG",
+    nbaId: "1628978"
   },
+
   {
-    id: "andrea-bargnani",
-    name: "Andrea Bargnani",
-    teams: ["TOR"],
+    id: "dorell-wright",
+    name: "Dorell Wright",
+    teams: ["MIA"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2626,19 +2823,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Benetton Treviso",
-    country: "Italy",
-    decades: ["2000s","2010s"],
-    ppgCareer: 14.3,
-    rpgCareer: 4.6,
-    apgCareer: 1.2,
+    college: "South Kent HS (CT)",
+    country: "USA",
+    decades: ["2000s"],
+    ppgCareer: 8.4,
+    rpgCareer: 3.8,
+    apgCareer: 1.5,
     position: "SF",
-    nbaId: "200745"
+    nbaId: "2748"
   },
+
   {
-    id: "metta-world-peace",
-    name: "Metta World Peace",
-    teams: ["LAL"],
+    id: "dorian-finney-smith",
+    name: "Dorian Finney-Smith",
+    teams: ["DAL","BKN","LAL","HOU"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2648,19 +2846,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "St. John's (NY)",
+    college: "Florida",
     country: "USA",
-    decades: ["1990s","2000s","2010s"],
-    ppgCareer: 13.2,
-    rpgCareer: 4.5,
-    apgCareer: 2.7,
-    position: "SF",
-    nbaId: "1897"
+    decades: ["2010s"],
+    ppgCareer: 8,
+    rpgCareer: 4.4,
+    apgCareer: 1.4,
+    position: "PF",
+    nbaId: "1627827"
   },
+
   {
-    id: "emeka-okafor",
-    name: "Emeka Okafor",
-    teams: ["CHA"],
+    id: "drew-gooden",
+    name: "Drew Gooden",
+    teams: ["CLE","DAL","MEM","CHI","SAC","MIL","ORL","SAS","WAS","LAC"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2670,19 +2869,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Connecticut",
+    college: "Kansas",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 12.0,
-    rpgCareer: 9.7,
-    apgCareer: 0.8,
-    position: "C",
-    nbaId: "2731"
+    decades: ["2000s"],
+    ppgCareer: 11,
+    rpgCareer: 7.11,
+    apgCareer: 1.1,
+    position: "PF",
+    nbaId: "2400"
   },
+
   {
-    id: "jason-terry",
-    name: "Jason Terry",
-    teams: ["DAL"],
+    id: "drew-timme",
+    name: "Drew Timme",
+    teams: ["BKN","LAL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2692,19 +2892,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Arizona",
+    college: "Gonzaga",
     country: "USA",
-    decades: ["1990s","2000s","2010s"],
-    ppgCareer: 13.4,
-    rpgCareer: 2.3,
-    apgCareer: 3.8,
-    position: "SG",
-    nbaId: "1891"
+    decades: ["2020s"],
+    ppgCareer: 5.6,
+    rpgCareer: 2.7,
+    apgCareer: 1.2,
+    position: "PF",
+    nbaId: "1631166"
   },
+
   {
-    id: "tim-hardaway-jr-",
-    name: "Tim Hardaway Jr.",
-    teams: ["DAL"],
+    id: "duane-washington-jr",
+    name: "Duane Washington Jr.",
+    teams: ["IND","PHX"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2714,19 +2915,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Michigan",
-    country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 14.4,
-    rpgCareer: 3.2,
-    apgCareer: 1.8,
+    college: "Ohio State",
+    country: "Germany",
+    decades: ["2020s"],
+    ppgCareer: 9.1,
+    rpgCareer: 1.5,
+    apgCareer: 1.9,
     position: "SG",
-    nbaId: "203501"
+    nbaId: "1630613"
   },
+
   {
-    id: "cameron-johnson",
-    name: "Cameron Johnson",
-    teams: ["BKN"],
+    id: "duncan-robinson",
+    name: "Duncan Robinson",
+    teams: ["MIA","DET"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2736,19 +2938,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "North Carolina",
+    college: "Michigan",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 13.4,
-    rpgCareer: 4.3,
-    apgCareer: 2.4,
-    position: "SF",
-    nbaId: "1629661"
+    decades: ["2010s"],
+    ppgCareer: 11.5,
+    rpgCareer: 2.6,
+    apgCareer: 1.9,
+    position: "SG-SF",
+    nbaId: "1629130"
   },
+
   {
-    id: "jeremy-sochan",
-    name: "Jeremy Sochan",
-    teams: ["SAS"],
+    id: "duop-reath",
+    name: "Duop Reath",
+    teams: ["POR","ATL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2758,19 +2961,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Baylor",
-    country: "Poland",
+    college: "Louisiana State",
+    country: "South Sudan",
     decades: ["2020s"],
-    ppgCareer: 11.6,
-    rpgCareer: 6.4,
-    apgCareer: 3.4,
-    position: "SF",
-    nbaId: "1631110"
+    ppgCareer: 6.2,
+    rpgCareer: 2.6,
+    apgCareer: 0.7,
+    position: "C",
+    nbaId: "1641871"
   },
+
   {
-    id: "ivica-zubac",
-    name: "Ivica Zubac",
-    teams: ["LAC"],
+    id: "dylan-harper",
+    name: "Dylan Harper",
+    teams: ["SAS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2780,19 +2984,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Mega Basket",
-    country: "Croatia",
-    decades: ["2010s","2020s"],
-    ppgCareer: 11.7,
-    rpgCareer: 9.2,
-    apgCareer: 1.4,
-    position: "C",
-    nbaId: "1627826"
+    college: "Rutgers",
+    country: "USA",
+    decades: ["2020s"],
+    ppgCareer: 11.8,
+    rpgCareer: 3.4,
+    apgCareer: 3.9,
+    position: "PG",
+    nbaId: "1642844"
   },
+
   {
-    id: "mike-conley",
-    name: "Mike Conley",
-    teams: ["MIN"],
+    id: "dyson-daniels",
+    name: "Dyson Daniels",
+    teams: ["NOP","ATL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2801,20 +3006,21 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     dpoy: false,
     roy: false,
     allNBA: false,
-    allDefensive: false,
-    college: "Ohio State",
-    country: "USA",
-    decades: ["2000s","2010s","2020s"],
-    ppgCareer: 11.4,
-    rpgCareer: 2.9,
-    apgCareer: 5.9,
-    position: "SG",
-    nbaId: "201144"
+    allDefensive: true,
+    college: "NBA G League Ignite",
+    country: "Australia",
+    decades: ["2020s"],
+    ppgCareer: 9.4,
+    rpgCareer: 5.1,
+    apgCareer: 4,
+    position: "PG",
+    nbaId: "1630700"
   },
+
   {
-    id: "jakob-poeltl",
-    name: "Jakob Poeltl",
-    teams: ["TOR"],
+    id: "etwaun-moore",
+    name: "E'Twaun Moore",
+    teams: ["BOS","ORL","CHI","NOP","PHX"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2824,19 +3030,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Utah",
-    country: "Austria",
-    decades: ["2010s","2020s"],
-    ppgCareer: 11.1,
-    rpgCareer: 8.6,
-    apgCareer: 2.5,
-    position: "C",
-    nbaId: "1627751"
+    college: "Purdue",
+    country: "USA",
+    decades: ["2010s"],
+    ppgCareer: 7.9,
+    rpgCareer: 2,
+    apgCareer: 1.8,
+    position: "SG",
+    nbaId: "202734"
   },
+
   {
-    id: "p-j-washington",
-    name: "P.J. Washington",
-    teams: ["DAL"],
+    id: "egor-dëmin",
+    name: "Egor Dëmin",
+    teams: ["BKN"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2846,19 +3053,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Kentucky",
-    country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 12.9,
-    rpgCareer: 5.6,
-    apgCareer: 1.9,
-    position: "SF",
-    nbaId: "1629023"
+    college: "Brigham Young",
+    country: "Russia",
+    decades: ["2020s"],
+    ppgCareer: 10.3,
+    rpgCareer: 3.2,
+    apgCareer: 3.3,
+    position: "PG",
+    nbaId: "1642856"
   },
+
   {
-    id: "naz-reid",
-    name: "Naz Reid",
-    teams: ["MIN"],
+    id: "elfrid-payton",
+    name: "Elfrid Payton",
+    teams: ["ORL","PHX","NOP","NYK","CHA"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2868,85 +3076,89 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Louisiana State",
+    college: "Louisana-Lafayette",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 13.5,
-    rpgCareer: 5.2,
-    apgCareer: 1.3,
-    position: "SF",
-    nbaId: "1629675"
+    decades: ["2010s"],
+    ppgCareer: 9.8,
+    rpgCareer: 3.98,
+    apgCareer: 5.79,
+    position: "PG",
+    nbaId: "203901"
   },
+
   {
-    id: "chandler-parsons",
-    name: "Chandler Parsons",
-    teams: ["HOU"],
-    awards: [],
+    id: "elijah-bryant",
+    name: "Elijah Bryant",
+    teams: ["MIL"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2020"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Florida",
+    college: "Brigham Young",
     country: "USA",
-    decades: ["2010s"],
-    ppgCareer: 12.7,
-    rpgCareer: 4.5,
-    apgCareer: 2.7,
-    position: "SF",
-    nbaId: "202718"
+    decades: ["2020s"],
+    ppgCareer: 16,
+    rpgCareer: 6,
+    apgCareer: 3,
+    position: "PG",
+    nbaId: "1629091"
   },
+
   {
-    id: "rodney-stuckey",
-    name: "Rodney Stuckey",
-    teams: ["DET"],
-    awards: [],
-    allStar: false,
+    id: "elton-brand",
+    name: "Elton Brand",
+    teams: ["CHI","LAC","PHI","DAL","ATL"],
+    awards: ["ROY","All-Star"],
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
     dpoy: false,
-    roy: false,
-    allNBA: false,
+    roy: true,
+    allNBA: true,
     allDefensive: false,
-    college: "Eastern Washington",
+    college: "Duke",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 12.6,
-    rpgCareer: 2.9,
-    apgCareer: 3.6,
-    position: "SG",
-    nbaId: "201155"
+    decades: ["1990s"],
+    ppgCareer: 15.9,
+    rpgCareer: 8.54,
+    apgCareer: 2.1,
+    position: "PF",
+    nbaId: "1882"
   },
+
   {
-    id: "rui-hachimura",
-    name: "Rui Hachimura",
-    teams: ["LAL"],
-    awards: [],
+    id: "emeka-okafor",
+    name: "Emeka Okafor",
+    teams: ["CHA","NOP","WAS"],
+    awards: ["ROY"],
     allStar: false,
     champion: false,
     championYears: [],
     mvp: false,
     dpoy: false,
-    roy: false,
+    roy: true,
     allNBA: false,
     allDefensive: false,
-    college: "Gonzaga",
-    country: "Japan",
-    decades: ["2010s","2020s"],
-    ppgCareer: 13.6,
-    rpgCareer: 4.3,
-    apgCareer: 1.2,
-    position: "SF",
-    nbaId: "1629060"
+    college: "Connecticut",
+    country: "USA",
+    decades: ["2000s"],
+    ppgCareer: 12,
+    rpgCareer: 9.69,
+    apgCareer: 0.8,
+    position: "C-F",
+    nbaId: "2731"
   },
+
   {
-    id: "josh-hart",
-    name: "Josh Hart",
-    teams: ["NYK"],
+    id: "emmanuel-mudiay",
+    name: "Emmanuel Mudiay",
+    teams: ["DEN","NYK","UTA","SAC"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2956,19 +3168,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Villanova",
-    country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 9.4,
-    rpgCareer: 8.3,
-    apgCareer: 4.1,
-    position: "SG",
-    nbaId: "1628404"
+    college: "Guangdong",
+    country: "Democratic Republic of the Congo",
+    decades: ["2010s"],
+    ppgCareer: 10.9,
+    rpgCareer: 2.9,
+    apgCareer: 3.8,
+    position: "PG",
+    nbaId: "1626144"
   },
+
   {
-    id: "jameer-nelson",
-    name: "Jameer Nelson",
-    teams: ["ORL"],
+    id: "enes-freedom",
+    name: "Enes Freedom",
+    teams: ["UTA","OKC","NYK","POR","BOS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2978,19 +3191,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "St. Joseph's (PA)",
-    country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 11.3,
-    rpgCareer: 3.0,
-    apgCareer: 5.1,
-    position: "SG",
-    nbaId: "2749"
+    college: "Fenerbahce",
+    country: "Turkey",
+    decades: ["2010s"],
+    ppgCareer: 11.2,
+    rpgCareer: 7.78,
+    apgCareer: 0.9,
+    position: "C",
+    nbaId: "202683"
   },
+
   {
-    id: "raymond-felton",
-    name: "Raymond Felton",
-    teams: ["CHA"],
+    id: "eric-bledsoe",
+    name: "Eric Bledsoe",
+    teams: ["LAC","PHX","MIL","NOP"],
     awards: [],
     allStar: false,
     champion: false,
@@ -2999,20 +3213,21 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     dpoy: false,
     roy: false,
     allNBA: false,
-    allDefensive: false,
-    college: "North Carolina",
+    allDefensive: true,
+    college: "Kentucky",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 11.2,
-    rpgCareer: 3.0,
-    apgCareer: 5.2,
-    position: "SG",
-    nbaId: "101109"
+    decades: ["2010s"],
+    ppgCareer: 13.7,
+    rpgCareer: 3.9,
+    apgCareer: 4.69,
+    position: "PG",
+    nbaId: "202339"
   },
+
   {
-    id: "tre-jones",
-    name: "Tre Jones",
-    teams: ["SAS"],
+    id: "eric-gordon",
+    name: "Eric Gordon",
+    teams: ["LAC","NOP","HOU","PHX","PHI","MEM"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3022,19 +3237,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Duke",
+    college: "Indiana",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 10.0,
-    rpgCareer: 3.8,
-    apgCareer: 6.2,
+    decades: ["2000s"],
+    ppgCareer: 15.2,
+    rpgCareer: 2.3,
+    apgCareer: 2.7,
     position: "SG",
-    nbaId: "1630200"
+    nbaId: "201569"
   },
+
   {
-    id: "luis-scola",
-    name: "Luis Scola",
-    teams: ["HOU"],
+    id: "eric-paschall",
+    name: "Eric Paschall",
+    teams: ["GSW","UTA"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3044,19 +3260,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Tau Ceramica",
-    country: "Argentina",
-    decades: ["2000s","2010s"],
-    ppgCareer: 12.0,
-    rpgCareer: 6.7,
-    apgCareer: 1.6,
+    college: "Villanova",
+    country: "USA",
+    decades: ["2010s"],
+    ppgCareer: 9.8,
+    rpgCareer: 3.2,
+    apgCareer: 1.4,
     position: "SF",
-    nbaId: "2449"
+    nbaId: "1629672"
   },
+
   {
-    id: "wilson-chandler",
-    name: "Wilson Chandler",
-    teams: ["DEN"],
+    id: "ersan-ilyasova",
+    name: "Ersan Ilyasova",
+    teams: ["MIL","DET","ORL","OKC","PHI","ATL","UTA"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3066,19 +3283,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "DePaul",
-    country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 12.5,
-    rpgCareer: 5.3,
-    apgCareer: 1.8,
-    position: "SF",
-    nbaId: "201163"
+    college: "FC Barcelona",
+    country: "Turkey",
+    decades: ["2000s"],
+    ppgCareer: 10.1,
+    rpgCareer: 5.6,
+    apgCareer: 1.1,
+    position: "PF",
+    nbaId: "101141"
   },
+
   {
-    id: "dion-waiters",
-    name: "Dion Waiters",
+    id: "evan-mobley",
+    name: "Evan Mobley",
     teams: ["CLE"],
+    awards: ["All-Star","DPOY"],
+    allStar: true,
+    champion: false,
+    championYears: [],
+    mvp: false,
+    dpoy: true,
+    roy: false,
+    allNBA: true,
+    allDefensive: true,
+    college: "Southern California",
+    country: "USA",
+    decades: ["2020s"],
+    ppgCareer: 16.7,
+    rpgCareer: 9,
+    apgCareer: 3,
+    position: "F-C",
+    nbaId: "1630596"
+  },
+
+  {
+    id: "evan-turner",
+    name: "Evan Turner",
+    teams: ["PHI"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3088,19 +3329,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Syracuse",
+    college: "Ohio State",
     country: "USA",
     decades: ["2010s"],
-    ppgCareer: 13.1,
-    rpgCareer: 2.6,
-    apgCareer: 2.8,
-    position: "SG",
-    nbaId: "203079"
+    ppgCareer: 9.7,
+    rpgCareer: 4.6,
+    apgCareer: 3.5,
+    position: "SF",
+    nbaId: "202323"
   },
+
   {
-    id: "nikola-pekovic",
-    name: "Nikola Pekovic",
-    teams: ["MIN"],
+    id: "frank-jackson",
+    name: "Frank Jackson",
+    teams: ["NOP","DET","UTA"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3110,19 +3352,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Panathinaikos",
-    country: "Montenegro",
+    college: "Duke",
+    country: "USA",
     decades: ["2010s"],
-    ppgCareer: 12.6,
-    rpgCareer: 6.7,
-    apgCareer: 0.7,
-    position: "C",
-    nbaId: "201593"
+    ppgCareer: 8.5,
+    rpgCareer: 1.8,
+    apgCareer: 1,
+    position: "SG",
+    nbaId: "1628402"
   },
+
   {
-    id: "javonte-green",
-    name: "Javonte Green",
-    teams: ["CHI"],
+    id: "frank-kaminsky",
+    name: "Frank Kaminsky",
+    teams: ["CHA","PHX","ATL","HOU"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3132,19 +3375,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Radford",
+    college: "Wisconsin",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 12.2,
-    rpgCareer: 7.4,
-    apgCareer: 0.6,
-    position: "SG",
-    nbaId: "1629750"
+    decades: ["2010s"],
+    ppgCareer: 8.8,
+    rpgCareer: 3.8,
+    apgCareer: 1.6,
+    position: "F-C",
+    nbaId: "1626163"
   },
+
   {
-    id: "corey-kispert",
-    name: "Corey Kispert",
-    teams: ["WAS"],
+    id: "franz-wagner",
+    name: "Franz Wagner",
+    teams: ["ORL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3154,19 +3398,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Gonzaga",
+    college: "Michigan",
+    country: "Germany",
+    decades: ["2020s"],
+    ppgCareer: 19.2,
+    rpgCareer: 4.9,
+    apgCareer: 3.6,
+    position: "PG-SF",
+    nbaId: "1630532"
+  },
+
+  {
+    id: "gg-jackson",
+    name: "GG Jackson",
+    teams: ["MEM"],
+    awards: [],
+    allStar: false,
+    champion: false,
+    championYears: [],
+    mvp: false,
+    dpoy: false,
+    roy: false,
+    allNBA: false,
+    allDefensive: false,
+    college: "South Carolina",
     country: "USA",
     decades: ["2020s"],
-    ppgCareer: 13.4,
-    rpgCareer: 2.8,
-    apgCareer: 2.0,
-    position: "SF",
-    nbaId: "1630557"
+    ppgCareer: 12.1,
+    rpgCareer: 4,
+    apgCareer: 1.3,
+    position: "PF",
+    nbaId: "1641713"
   },
+
   {
-    id: "brook-lopez",
-    name: "Brook Lopez",
-    teams: ["MIL"],
+    id: "gary-neal",
+    name: "Gary Neal",
+    teams: ["SAS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3176,19 +3444,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Stanford",
+    college: "Towson",
     country: "USA",
-    decades: ["2000s","2010s","2020s"],
-    ppgCareer: 12.5,
-    rpgCareer: 5.2,
+    decades: ["2010s"],
+    ppgCareer: 9.9,
+    rpgCareer: 2.2,
     apgCareer: 1.6,
-    position: "C",
-    nbaId: "201572"
+    position: "SG",
+    nbaId: "202390"
   },
+
   {
-    id: "gary-trent-jr-",
+    id: "gary-trent-jr",
     name: "Gary Trent Jr.",
-    teams: ["TOR"],
+    teams: ["POR","TOR","MIL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3200,17 +3469,18 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     allDefensive: false,
     college: "Duke",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 13.7,
-    rpgCareer: 2.6,
-    apgCareer: 1.7,
+    decades: ["2010s"],
+    ppgCareer: 13,
+    rpgCareer: 2.2,
+    apgCareer: 1.4,
     position: "SG",
     nbaId: "1629018"
   },
+
   {
-    id: "duncan-robinson",
-    name: "Duncan Robinson",
-    teams: ["MIA"],
+    id: "george-hill",
+    name: "George Hill",
+    teams: ["SAS","IND","UTA","SAC","CLE","MIL","OKC","PHI"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3220,19 +3490,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Michigan",
+    college: "Indiana-Purdue Indianapolis",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 12.9,
-    rpgCareer: 2.5,
-    apgCareer: 2.8,
-    position: "SF",
-    nbaId: "1629130"
+    decades: ["2000s"],
+    ppgCareer: 10.4,
+    rpgCareer: 3,
+    apgCareer: 3.1,
+    position: "PG",
+    nbaId: "201588"
   },
+
   {
-    id: "jeremy-lin",
-    name: "Jeremy Lin",
-    teams: ["HOU"],
+    id: "georges-niang",
+    name: "Georges Niang",
+    teams: ["IND","UTA","PHI","CLE","ATL","MEM"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3242,19 +3513,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Harvard",
+    college: "Iowa State",
     country: "USA",
     decades: ["2010s"],
-    ppgCareer: 11.6,
-    rpgCareer: 2.8,
-    apgCareer: 4.3,
-    position: "SG",
-    nbaId: "202391"
+    ppgCareer: 7.4,
+    rpgCareer: 2.5,
+    apgCareer: 1,
+    position: "PF",
+    nbaId: "1627777"
   },
+
   {
-    id: "nikola-mirotic",
-    name: "Nikola Mirotic",
-    teams: ["CHI"],
+    id: "gerald-green",
+    name: "Gerald Green",
+    teams: ["DAL","IND","MIA","HOU","MIN","PHX","BKN","BOS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3264,63 +3536,66 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Real Madrid",
-    country: "Montenegro",
-    decades: ["2010s"],
-    ppgCareer: 12.3,
-    rpgCareer: 5.9,
-    apgCareer: 1.3,
-    position: "SF",
-    nbaId: "202703"
+    college: "No College",
+    country: "USA",
+    decades: ["2000s"],
+    ppgCareer: 9.7,
+    rpgCareer: 2.5,
+    apgCareer: 0.9,
+    position: "SG",
+    nbaId: "101123"
   },
+
   {
-    id: "kenneth-faried",
-    name: "Kenneth Faried",
-    teams: ["DEN"],
-    awards: [],
+    id: "gerald-henderson",
+    name: "Gerald Henderson",
+    teams: ["BOS","CHA","DET","HOU","MIL","NYK","OKC","PHI","PHL","POR"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["1980","1983","1989"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Morehead State",
+    college: "Virginia Commonwealth",
     country: "USA",
-    decades: ["2010s"],
-    ppgCareer: 11.4,
-    rpgCareer: 8.1,
-    apgCareer: 1.0,
-    position: "SF",
-    nbaId: "202702"
+    decades: ["1970s"],
+    ppgCareer: 8.9,
+    rpgCareer: 1.7,
+    apgCareer: 3.6,
+    position: "PG",
+    nbaId: "76993"
   },
+
   {
-    id: "jalen-suggs",
-    name: "Jalen Suggs",
-    teams: ["ORL"],
-    awards: [],
-    allStar: false,
+    id: "goran-dragic",
+    name: "Goran Dragic",
+    teams: ["PHX","HOU","MIA","TOR","BKN","CHI","MIL"],
+    awards: ["All-Star"],
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
     dpoy: false,
     roy: false,
-    allNBA: false,
+    allNBA: true,
     allDefensive: false,
-    college: "Gonzaga",
-    country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 12.6,
-    rpgCareer: 3.1,
-    apgCareer: 2.7,
-    position: "SG",
-    nbaId: "1630591"
+    college: "Union Olimpija",
+    country: "Slovenia",
+    decades: ["2000s"],
+    ppgCareer: 13.3,
+    rpgCareer: 3,
+    apgCareer: 4.66,
+    position: "PG",
+    nbaId: "201609"
   },
+
   {
-    id: "serge-ibaka",
-    name: "Serge Ibaka",
-    teams: ["MIL"],
+    id: "gorgui-dieng",
+    name: "Gorgui Dieng",
+    teams: ["MIN","MEM","SAS","ATL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3330,19 +3605,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Ricoh Manresa",
-    country: "Democratic Republic of the Congo",
-    decades: ["2000s","2010s","2020s"],
-    ppgCareer: 12.0,
-    rpgCareer: 7.1,
-    apgCareer: 0.8,
-    position: "SF",
-    nbaId: "201586"
+    college: "Louisville",
+    country: "Senegal",
+    decades: ["2010s"],
+    ppgCareer: 7.3,
+    rpgCareer: 5.6,
+    apgCareer: 1.3,
+    position: "C",
+    nbaId: "203476"
   },
+
   {
-    id: "elfrid-payton",
-    name: "Elfrid Payton",
-    teams: ["NOP"],
+    id: "gradey-dick",
+    name: "Gradey Dick",
+    teams: ["TOR"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3352,19 +3628,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Louisana-Lafayette",
+    college: "Kansas",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 9.8,
-    rpgCareer: 4.0,
-    apgCareer: 5.8,
-    position: "SG",
-    nbaId: "203901"
+    decades: ["2020s"],
+    ppgCareer: 9.2,
+    rpgCareer: 2.5,
+    apgCareer: 1.1,
+    position: "SG-SF",
+    nbaId: "1641711"
   },
+
   {
-    id: "richard-jefferson",
-    name: "Richard Jefferson",
-    teams: ["BKN"],
+    id: "grayson-allen",
+    name: "Grayson Allen",
+    teams: ["UTA","MEM","MIL","PHX"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3374,19 +3651,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Arizona",
+    college: "Duke",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 12.6,
-    rpgCareer: 4.0,
-    apgCareer: 2.0,
-    position: "SF",
-    nbaId: "2210"
+    decades: ["2010s"],
+    ppgCareer: 11.2,
+    rpgCareer: 3,
+    apgCareer: 2.2,
+    position: "SG",
+    nbaId: "1628960"
   },
+
   {
-    id: "norman-powell",
-    name: "Norman Powell",
-    teams: ["LAC"],
+    id: "greg-monroe",
+    name: "Greg Monroe",
+    teams: ["DET","MIL","PHX","BOS","TOR","PHI","WAS","UTA","MIN"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3396,19 +3674,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "UCLA",
+    college: "Georgetown",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 13.9,
-    rpgCareer: 2.6,
-    apgCareer: 1.1,
-    position: "SG",
-    nbaId: "1626181"
+    decades: ["2010s"],
+    ppgCareer: 13,
+    rpgCareer: 8.19,
+    apgCareer: 2.1,
+    position: "C-F",
+    nbaId: "202328"
   },
+
   {
-    id: "zach-collins",
-    name: "Zach Collins",
-    teams: ["SAS"],
+    id: "greivis-vasquez",
+    name: "Greivis Vasquez",
+    teams: ["NOP"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3418,41 +3697,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Gonzaga",
-    country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 11.2,
-    rpgCareer: 5.4,
-    apgCareer: 2.8,
-    position: "SF",
-    nbaId: "1628380"
+    college: "Maryland",
+    country: "Venezuela",
+    decades: ["2010s"],
+    ppgCareer: 9,
+    rpgCareer: 2.5,
+    apgCareer: 4.83,
+    position: "PG",
+    nbaId: "202349"
   },
+
   {
-    id: "ayo-dosunmu",
-    name: "Ayo Dosunmu",
-    teams: ["CHI"],
-    awards: [],
+    id: "harrison-barnes",
+    name: "Harrison Barnes",
+    teams: ["GSW","DAL","SAC","SAS"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2014"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Illinois",
+    college: "North Carolina",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 12.2,
-    rpgCareer: 2.8,
-    apgCareer: 3.2,
-    position: "SG",
-    nbaId: "1630245"
+    decades: ["2010s"],
+    ppgCareer: 13.6,
+    rpgCareer: 4.6,
+    apgCareer: 1.8,
+    position: "SF",
+    nbaId: "203084"
   },
+
   {
-    id: "chris-kaman",
-    name: "Chris Kaman",
-    teams: ["LAC"],
+    id: "hassan-whiteside",
+    name: "Hassan Whiteside",
+    teams: ["SAC","MIA","POR","UTA"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3461,20 +3742,21 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     dpoy: false,
     roy: false,
     allNBA: false,
-    allDefensive: false,
-    college: "Central Michigan",
+    allDefensive: true,
+    college: "Marshall",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 11.2,
-    rpgCareer: 7.6,
-    apgCareer: 1.3,
+    decades: ["2010s"],
+    ppgCareer: 12.6,
+    rpgCareer: 10.81,
+    apgCareer: 0.6,
     position: "C",
-    nbaId: "2549"
+    nbaId: "202355"
   },
+
   {
-    id: "kirk-hinrich",
-    name: "Kirk Hinrich",
-    teams: ["CHI"],
+    id: "henry-sims",
+    name: "Henry Sims",
+    teams: ["PHI"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3484,19 +3766,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Kansas",
+    college: "Georgetown",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 10.9,
-    rpgCareer: 2.9,
-    apgCareer: 4.8,
-    position: "SG",
-    nbaId: "2550"
+    decades: ["2010s"],
+    ppgCareer: 7.6,
+    rpgCareer: 5,
+    apgCareer: 1,
+    position: "C",
+    nbaId: "203156"
   },
+
   {
-    id: "jared-sullinger",
-    name: "Jared Sullinger",
-    teams: ["BOS"],
+    id: "herbert-jones",
+    name: "Herbert Jones",
+    teams: ["NOP"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3505,20 +3788,21 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     dpoy: false,
     roy: false,
     allNBA: false,
-    allDefensive: false,
-    college: "Ohio State",
+    allDefensive: true,
+    college: "Alabama",
     country: "USA",
-    decades: ["2010s"],
-    ppgCareer: 10.8,
-    rpgCareer: 7.5,
-    apgCareer: 1.8,
-    position: "SF",
-    nbaId: "203096"
+    decades: ["2020s"],
+    ppgCareer: 9.9,
+    rpgCareer: 3.7,
+    apgCareer: 2.5,
+    position: "PF",
+    nbaId: "1630529"
   },
+
   {
-    id: "jordan-crawford",
-    name: "Jordan Crawford",
-    teams: ["WAS"],
+    id: "hollis-thompson",
+    name: "Hollis Thompson",
+    teams: ["PHI"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3528,41 +3812,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Xavier",
+    college: "Georgetown",
     country: "USA",
     decades: ["2010s"],
-    ppgCareer: 12.2,
-    rpgCareer: 2.5,
-    apgCareer: 3.1,
+    ppgCareer: 7.7,
+    rpgCareer: 3.1,
+    apgCareer: 1.1,
     position: "SG",
-    nbaId: "202348"
+    nbaId: "203138"
   },
+
   {
-    id: "enes-freedom",
-    name: "Enes Freedom",
-    teams: ["BOS"],
-    awards: [],
+    id: "iman-shumpert",
+    name: "Iman Shumpert",
+    teams: ["NYK","CLE","SAC","HOU","BKN"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2015"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Fenerbahce",
-    country: "Turkey",
-    decades: ["2010s","2020s"],
-    ppgCareer: 11.2,
-    rpgCareer: 7.8,
-    apgCareer: 0.9,
-    position: "C",
-    nbaId: "202683"
+    college: "Georgia Tech",
+    country: "USA",
+    decades: ["2010s"],
+    ppgCareer: 7.2,
+    rpgCareer: 3.3,
+    apgCareer: 1.8,
+    position: "SG",
+    nbaId: "202697"
   },
+
   {
-    id: "jaime-jaquez-jr-",
-    name: "Jaime Jaquez Jr.",
-    teams: ["MIA"],
+    id: "isaac-okoro",
+    name: "Isaac Okoro",
+    teams: ["CLE","CHI"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3572,19 +3858,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "UCLA",
+    college: "Auburn",
     country: "USA",
     decades: ["2020s"],
-    ppgCareer: 11.9,
-    rpgCareer: 3.8,
-    apgCareer: 2.6,
-    position: "SG",
-    nbaId: "1631170"
+    ppgCareer: 8.3,
+    rpgCareer: 2.8,
+    apgCareer: 1.6,
+    position: "SG-SF",
+    nbaId: "1630171"
   },
+
   {
-    id: "kelly-olynyk",
-    name: "Kelly Olynyk",
-    teams: ["TOR"],
+    id: "isaiah-canaan",
+    name: "Isaiah Canaan",
+    teams: ["HOU","PHI","CHI","PHX","MIN","MIL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3594,19 +3881,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Gonzaga",
-    country: "Canada",
-    decades: ["2010s","2020s"],
-    ppgCareer: 9.8,
-    rpgCareer: 5.3,
-    apgCareer: 4.4,
-    position: "SF",
-    nbaId: "203482"
+    college: "Murray State",
+    country: "USA",
+    decades: ["2010s"],
+    ppgCareer: 8.1,
+    rpgCareer: 1.9,
+    apgCareer: 1.9,
+    position: "PG",
+    nbaId: "203477"
   },
+
   {
-    id: "michael-beasley",
-    name: "Michael Beasley",
-    teams: ["MIA"],
+    id: "isaiah-collier",
+    name: "Isaiah Collier",
+    teams: ["UTA"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3616,63 +3904,66 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Kansas State",
+    college: "Southern California",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 12.4,
-    rpgCareer: 4.7,
-    apgCareer: 1.3,
-    position: "SF",
-    nbaId: "201563"
+    decades: ["2020s"],
+    ppgCareer: 10,
+    rpgCareer: 3,
+    apgCareer: 6.7,
+    position: "PG",
+    nbaId: "1642268"
   },
+
   {
-    id: "wendell-carter-jr-",
-    name: "Wendell Carter Jr.",
-    teams: ["ORL"],
-    awards: [],
+    id: "isaiah-hartenstein",
+    name: "Isaiah Hartenstein",
+    teams: ["HOU","DEN","CLE","LAC","NYK","OKC"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2024"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Duke",
-    country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 11.0,
-    rpgCareer: 6.9,
-    apgCareer: 1.7,
-    position: "SF",
-    nbaId: "1628976"
+    college: "Zalgiris",
+    country: "Germany",
+    decades: ["2010s"],
+    ppgCareer: 7.1,
+    rpgCareer: 6.7,
+    apgCareer: 2.2,
+    position: "C-F",
+    nbaId: "1628392"
   },
+
   {
-    id: "jarrett-jack",
-    name: "Jarrett Jack",
-    teams: ["POR"],
-    awards: [],
+    id: "isaiah-joe",
+    name: "Isaiah Joe",
+    teams: ["PHI","OKC"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2024"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Georgia Tech",
+    college: "Arkansas",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 10.8,
-    rpgCareer: 2.9,
-    apgCareer: 4.6,
+    decades: ["2020s"],
+    ppgCareer: 8.2,
+    rpgCareer: 2.1,
+    apgCareer: 1.2,
     position: "SG",
-    nbaId: "101127"
+    nbaId: "1630198"
   },
+
   {
-    id: "cole-anthony",
-    name: "Cole Anthony",
-    teams: ["ORL"],
+    id: "isaiah-roby",
+    name: "Isaiah Roby",
+    teams: ["OKC","SAS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3682,19 +3973,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "North Carolina",
+    college: "Nebraska",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 11.6,
-    rpgCareer: 3.8,
-    apgCareer: 2.9,
-    position: "SG",
-    nbaId: "1630175"
+    decades: ["2010s"],
+    ppgCareer: 7.7,
+    rpgCareer: 4.4,
+    apgCareer: 1.4,
+    position: "PF",
+    nbaId: "1629676"
   },
+
   {
-    id: "kyshawn-george",
-    name: "Kyshawn George",
-    teams: ["WAS"],
+    id: "isaiah-stewart",
+    name: "Isaiah Stewart",
+    teams: ["DET"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3704,19 +3996,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Miami",
-    country: "Switzerland",
+    college: "Washington",
+    country: "USA",
     decades: ["2020s"],
-    ppgCareer: 10.9,
-    rpgCareer: 4.6,
-    apgCareer: 3.3,
-    position: "SF",
-    nbaId: "1642273"
+    ppgCareer: 8.8,
+    rpgCareer: 6.8,
+    apgCareer: 1.3,
+    position: "F-C",
+    nbaId: "1630191"
   },
+
   {
-    id: "t-j-mcconnell",
-    name: "T.J. McConnell",
-    teams: ["IND"],
+    id: "isaiah-whitehead",
+    name: "Isaiah Whitehead",
+    teams: ["BKN"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3726,19 +4019,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Arizona",
+    college: "Seton Hall",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 10.2,
-    rpgCareer: 2.7,
-    apgCareer: 5.5,
-    position: "SG",
-    nbaId: "204456"
+    decades: ["2010s"],
+    ppgCareer: 7.2,
+    rpgCareer: 2.4,
+    apgCareer: 2.4,
+    position: "PG",
+    nbaId: "1627785"
   },
+
   {
-    id: "nene",
-    name: "Nene",
-    teams: ["DEN"],
+    id: "ivica-zubac",
+    name: "Ivica Zubac",
+    teams: ["LAL","LAC","IND"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3747,20 +4041,44 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     dpoy: false,
     roy: false,
     allNBA: false,
+    allDefensive: true,
+    college: "Mega Basket",
+    country: "Croatia",
+    decades: ["2010s"],
+    ppgCareer: 10.5,
+    rpgCareer: 8.3,
+    apgCareer: 1.4,
+    position: "C",
+    nbaId: "1627826"
+  },
+
+  {
+    id: "jj-barea",
+    name: "J.J. Barea",
+    teams: ["DAL","MIN"],
+    awards: ["Champion"],
+    allStar: false,
+    champion: true,
+    championYears: ["2010"],
+    mvp: false,
+    dpoy: false,
+    roy: false,
+    allNBA: false,
     allDefensive: false,
-    college: "Vasco de Gama",
-    country: "Brazil",
-    decades: ["2000s","2010s"],
-    ppgCareer: 11.3,
-    rpgCareer: 6.0,
-    apgCareer: 1.8,
-    position: "SF",
-    nbaId: "2403"
+    college: "Northeastern",
+    country: "Puerto Rico",
+    decades: ["2000s"],
+    ppgCareer: 8.9,
+    rpgCareer: 2.1,
+    apgCareer: 3.94,
+    position: "PG",
+    nbaId: "200826"
   },
+
   {
-    id: "ryan-anderson",
-    name: "Ryan Anderson",
-    teams: ["NOP"],
+    id: "jj-hickson",
+    name: "JJ Hickson",
+    teams: ["CLE","SAC","POR","DEN","WAS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3770,19 +4088,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "California",
+    college: "North Carolina State",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 12.3,
-    rpgCareer: 5.3,
-    apgCareer: 0.9,
-    position: "SF",
-    nbaId: "201583"
+    decades: ["2000s"],
+    ppgCareer: 9.5,
+    rpgCareer: 6.8,
+    apgCareer: 0.8,
+    position: "F-C",
+    nbaId: "201581"
   },
+
   {
-    id: "marvin-bagley-iii",
-    name: "Marvin Bagley III",
-    teams: ["WAS"],
+    id: "jj-redick",
+    name: "JJ Redick",
+    teams: ["ORL","MIL","LAC","PHI","NOP","DAL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3794,39 +4113,41 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     allDefensive: false,
     college: "Duke",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 11.7,
-    rpgCareer: 6.2,
-    apgCareer: 1.1,
-    position: "SF",
-    nbaId: "1628963"
+    decades: ["2000s"],
+    ppgCareer: 12.8,
+    rpgCareer: 2,
+    apgCareer: 2,
+    position: "SG",
+    nbaId: "200755"
   },
+
   {
-    id: "andrew-bogut",
-    name: "Andrew Bogut",
-    teams: ["MIL"],
-    awards: [],
+    id: "jr-smith",
+    name: "JR Smith",
+    teams: ["DEN"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2015","2019"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Utah",
-    country: "Australia",
-    decades: ["2000s","2010s"],
-    ppgCareer: 9.6,
-    rpgCareer: 8.7,
-    apgCareer: 2.2,
-    position: "C",
-    nbaId: "101106"
+    college: "No College",
+    country: "USA",
+    decades: ["2000s"],
+    ppgCareer: 12.4,
+    rpgCareer: 3.1,
+    apgCareer: 2.1,
+    position: "SG-SF",
+    nbaId: "2747"
   },
+
   {
-    id: "michael-carter-williams",
-    name: "Michael Carter-Williams",
-    teams: ["ORL"],
+    id: "jakobe-walter",
+    name: "Ja'Kobe Walter",
+    teams: ["TOR"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3836,19 +4157,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Syracuse",
+    college: "Baylor",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 10.2,
-    rpgCareer: 4.3,
-    apgCareer: 4.3,
+    decades: ["2020s"],
+    ppgCareer: 8,
+    rpgCareer: 2.8,
+    apgCareer: 1.3,
     position: "SG",
-    nbaId: "203487"
+    nbaId: "1642266"
   },
+
   {
-    id: "montrezl-harrell",
-    name: "Montrezl Harrell",
-    teams: ["PHI"],
+    id: "jamychal-green",
+    name: "JaMychal Green",
+    teams: ["SAS","MEM","LAC","DEN","GSW"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3858,19 +4180,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Louisville",
+    college: "Alabama",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 12.1,
-    rpgCareer: 5.0,
-    apgCareer: 1.3,
-    position: "SF",
-    nbaId: "1626149"
+    decades: ["2010s"],
+    ppgCareer: 7.7,
+    rpgCareer: 5.5,
+    apgCareer: 0.9,
+    position: "PF",
+    nbaId: "203210"
   },
+
   {
-    id: "jr-smith",
-    name: "JR Smith",
-    teams: ["DEN"],
+    id: "jabari-parker",
+    name: "Jabari Parker",
+    teams: ["MIL","CHI","WAS","ATL","SAC","BOS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3880,19 +4203,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "No College",
+    college: "Duke",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 12.4,
-    rpgCareer: 3.1,
-    apgCareer: 2.1,
-    position: "SG",
-    nbaId: "2747"
+    decades: ["2010s"],
+    ppgCareer: 14.1,
+    rpgCareer: 5.5,
+    apgCareer: 2,
+    position: "PF",
+    nbaId: "203953"
   },
+
   {
-    id: "joakim-noah",
-    name: "Joakim Noah",
-    teams: ["CHI"],
+    id: "jabari-smith-jr",
+    name: "Jabari Smith Jr.",
+    teams: ["HOU"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3902,19 +4226,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Florida",
+    college: "Auburn",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 8.8,
-    rpgCareer: 9.0,
-    apgCareer: 2.8,
-    position: "SF",
-    nbaId: "201149"
+    decades: ["2020s"],
+    ppgCareer: 13.7,
+    rpgCareer: 7.3,
+    apgCareer: 1.5,
+    position: "F-C",
+    nbaId: "1631095"
   },
+
   {
-    id: "isaiah-stewart",
-    name: "Isaiah Stewart",
-    teams: ["DET"],
+    id: "jabari-walker",
+    name: "Jabari Walker",
+    teams: ["POR","PHI"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3924,19 +4249,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Washington",
+    college: "Colorado",
     country: "USA",
     decades: ["2020s"],
-    ppgCareer: 10.9,
-    rpgCareer: 6.6,
-    apgCareer: 1.6,
-    position: "SF",
-    nbaId: "1630191"
+    ppgCareer: 5.7,
+    rpgCareer: 4.1,
+    apgCareer: 0.7,
+    position: "F-C",
+    nbaId: "1631133"
   },
+
   {
-    id: "spencer-dinwiddie",
-    name: "Spencer Dinwiddie",
-    teams: ["LAL"],
+    id: "jaden-ivey",
+    name: "Jaden Ivey",
+    teams: ["DET","CHI"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3946,19 +4272,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Colorado",
+    college: "Purdue",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 10.5,
-    rpgCareer: 2.7,
-    apgCareer: 4.7,
-    position: "SG",
-    nbaId: "203915"
+    decades: ["2020s"],
+    ppgCareer: 14.8,
+    rpgCareer: 3.5,
+    apgCareer: 4,
+    position: "PG",
+    nbaId: "1631093"
   },
+
   {
-    id: "drew-gooden",
-    name: "Drew Gooden",
-    teams: ["CLE"],
+    id: "jaden-mcdaniels",
+    name: "Jaden McDaniels",
+    teams: ["MIN"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3967,20 +4294,21 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     dpoy: false,
     roy: false,
     allNBA: false,
-    allDefensive: false,
-    college: "Kansas",
+    allDefensive: true,
+    college: "Washington",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 11.0,
-    rpgCareer: 7.1,
-    apgCareer: 1.1,
-    position: "SF",
-    nbaId: "2400"
+    decades: ["2020s"],
+    ppgCareer: 11.1,
+    rpgCareer: 4.2,
+    apgCareer: 1.7,
+    position: "PF",
+    nbaId: "1630183"
   },
+
   {
-    id: "vince-williams-jr-",
-    name: "Vince Williams Jr.",
-    teams: ["MEM"],
+    id: "jahlil-okafor",
+    name: "Jahlil Okafor",
+    teams: ["PHI","BKN","NOP","DET","IND"],
     awards: [],
     allStar: false,
     champion: false,
@@ -3990,19 +4318,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Virginia Commonwealth",
+    college: "Duke",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 10.0,
-    rpgCareer: 5.6,
-    apgCareer: 3.4,
-    position: "SG",
-    nbaId: "1631246"
+    decades: ["2010s"],
+    ppgCareer: 10.3,
+    rpgCareer: 4.7,
+    apgCareer: 0.9,
+    position: "C-F",
+    nbaId: "1626143"
   },
+
   {
-    id: "santi-aldama",
-    name: "Santi Aldama",
-    teams: ["MEM"],
+    id: "jaime-jaquez-jr",
+    name: "Jaime Jaquez Jr.",
+    teams: ["MIA"],
     awards: [],
     allStar: false,
     champion: false,
@@ -4012,19 +4341,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Loyola-Maryland",
-    country: "Spain",
+    college: "UCLA",
+    country: "USA",
     decades: ["2020s"],
-    ppgCareer: 10.7,
-    rpgCareer: 5.8,
-    apgCareer: 2.3,
-    position: "SF",
-    nbaId: "1630583"
+    ppgCareer: 12.1,
+    rpgCareer: 4.4,
+    apgCareer: 3.3,
+    position: "SG-SF",
+    nbaId: "1631170"
   },
+
   {
-    id: "tre-johnson",
-    name: "Tre Johnson",
-    teams: ["WAS"],
+    id: "jake-laravia",
+    name: "Jake LaRavia",
+    teams: ["MEM","SAC","LAL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -4034,19 +4364,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Texas",
+    college: "Wake Forest",
     country: "USA",
     decades: ["2020s"],
-    ppgCareer: 12.4,
-    rpgCareer: 2.8,
-    apgCareer: 2.0,
-    position: "SG",
-    nbaId: "1642848"
+    ppgCareer: 7.4,
+    rpgCareer: 3.6,
+    apgCareer: 1.8,
+    position: "PF",
+    nbaId: "1631222"
   },
+
   {
-    id: "jj-redick",
-    name: "JJ Redick",
-    teams: ["PHI"],
+    id: "jakob-poeltl",
+    name: "Jakob Poeltl",
+    teams: ["TOR","SAS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -4056,41 +4387,66 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Duke",
+    college: "Utah",
+    country: "Austria",
+    decades: ["2010s"],
+    ppgCareer: 9.1,
+    rpgCareer: 7,
+    apgCareer: 1.8,
+    position: "C",
+    nbaId: "1627751"
+  },
+
+  {
+    id: "jalen-brunson",
+    name: "Jalen Brunson",
+    teams: ["DAL","NYK"],
+    awards: ["All-Star"],
+    allStar: true,
+    champion: true,
+    championYears: ["2025"],
+    mvp: false,
+    dpoy: false,
+    roy: false,
+    allNBA: true,
+    allDefensive: false,
+    college: "Villanova",
     country: "USA",
-    decades: ["2000s","2010s","2020s"],
-    ppgCareer: 12.8,
-    rpgCareer: 2.0,
-    apgCareer: 2.0,
-    position: "SG",
-    nbaId: "200755"
+    decades: ["2010s"],
+    ppgCareer: 19.2,
+    rpgCareer: 3.2,
+    apgCareer: 5.3,
+    position: "PG",
+    nbaId: "1628973"
   },
+
   {
-    id: "will-barton",
-    name: "Will Barton",
-    teams: ["TOR"],
+    id: "jalen-duren",
+    name: "Jalen Duren",
+    teams: ["DET"],
     awards: [],
-    allStar: false,
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
     dpoy: false,
     roy: false,
-    allNBA: false,
+    allNBA: true,
     allDefensive: false,
     college: "Memphis",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 11.2,
-    rpgCareer: 4.1,
-    apgCareer: 2.7,
-    position: "SG",
-    nbaId: "203115"
+    decades: ["2020s"],
+    ppgCareer: 13.5,
+    rpgCareer: 10.3,
+    apgCareer: 2.1,
+    position: "C",
+    nbaId: "1631105"
   },
+
   {
-    id: "bub-carrington",
-    name: "Bub Carrington",
-    teams: ["WAS"],
+    id: "jalen-green",
+    name: "Jalen Green",
+    teams: ["HOU","PHX"],
     awards: [],
     allStar: false,
     champion: false,
@@ -4100,41 +4456,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Pittsburgh",
+    college: "NBA G League Ignite",
     country: "USA",
     decades: ["2020s"],
-    ppgCareer: 9.8,
-    rpgCareer: 4.1,
-    apgCareer: 4.5,
-    position: "SG",
-    nbaId: "1642267"
+    ppgCareer: 19.9,
+    rpgCareer: 4.2,
+    apgCareer: 3.3,
+    position: "PG",
+    nbaId: "1630224"
   },
+
   {
-    id: "aaron-nesmith",
-    name: "Aaron Nesmith",
-    teams: ["IND"],
+    id: "jalen-johnson",
+    name: "Jalen Johnson",
+    teams: ["ATL"],
     awards: [],
-    allStar: false,
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
     dpoy: false,
     roy: false,
-    allNBA: false,
+    allNBA: true,
     allDefensive: false,
-    college: "Vanderbilt",
+    college: "Duke",
     country: "USA",
     decades: ["2020s"],
-    ppgCareer: 12.2,
-    rpgCareer: 3.8,
-    apgCareer: 1.5,
-    position: "SG",
-    nbaId: "1630174"
+    ppgCareer: 14.2,
+    rpgCareer: 7.4,
+    apgCareer: 4,
+    position: "PF-C",
+    nbaId: "1630552"
   },
+
   {
-    id: "de-anthony-melton",
-    name: "De'Anthony Melton",
-    teams: ["PHI"],
+    id: "jalen-smith",
+    name: "Jalen Smith",
+    teams: ["PHX","IND","CHI"],
     awards: [],
     allStar: false,
     champion: false,
@@ -4144,19 +4502,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Southern California",
+    college: "Maryland",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 11.1,
-    rpgCareer: 3.7,
-    apgCareer: 3.0,
-    position: "SG",
-    nbaId: "1629001"
+    decades: ["2020s"],
+    ppgCareer: 8.7,
+    rpgCareer: 5.5,
+    apgCareer: 0.9,
+    position: "F-C",
+    nbaId: "1630188"
   },
+
   {
-    id: "emmanuel-mudiay",
-    name: "Emmanuel Mudiay",
-    teams: ["SAC"],
+    id: "jalen-suggs",
+    name: "Jalen Suggs",
+    teams: ["ORL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -4165,42 +4524,44 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     dpoy: false,
     roy: false,
     allNBA: false,
-    allDefensive: false,
-    college: "Guangdong",
-    country: "Democratic Republic of the Congo",
-    decades: ["2010s","2020s"],
-    ppgCareer: 10.9,
-    rpgCareer: 2.9,
+    allDefensive: true,
+    college: "Gonzaga",
+    country: "USA",
+    decades: ["2020s"],
+    ppgCareer: 12.6,
+    rpgCareer: 3.4,
     apgCareer: 3.8,
-    position: "SG",
-    nbaId: "1626144"
+    position: "PG",
+    nbaId: "1630591"
   },
+
   {
-    id: "kendrick-nunn",
-    name: "Kendrick Nunn",
-    teams: ["WAS"],
-    awards: [],
-    allStar: false,
-    champion: false,
-    championYears: [],
+    id: "jalen-williams",
+    name: "Jalen Williams",
+    teams: ["OKC"],
+    awards: ["Champion","All-Star"],
+    allStar: true,
+    champion: true,
+    championYears: ["2024"],
     mvp: false,
     dpoy: false,
     roy: false,
-    allNBA: false,
-    allDefensive: false,
-    college: "Oakland",
+    allNBA: true,
+    allDefensive: true,
+    college: "Santa Clara",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 12.1,
-    rpgCareer: 2.4,
-    apgCareer: 2.4,
-    position: "SG",
-    nbaId: "1629134"
+    decades: ["2020s"],
+    ppgCareer: 18,
+    rpgCareer: 4.6,
+    apgCareer: 4.5,
+    position: "PG-SF",
+    nbaId: "1631114"
   },
+
   {
-    id: "brandon-clarke",
-    name: "Brandon Clarke",
-    teams: ["MEM"],
+    id: "jamal-crawford",
+    name: "Jamal Crawford",
+    teams: ["CHI","NYK","GSW","ATL","POR","LAC","MIN","PHX","BKN"],
     awards: [],
     allStar: false,
     champion: false,
@@ -4210,41 +4571,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Gonzaga",
-    country: "Canada",
-    decades: ["2010s","2020s"],
-    ppgCareer: 11.3,
-    rpgCareer: 5.3,
-    apgCareer: 1.5,
-    position: "SF",
-    nbaId: "1629634"
+    college: "Michigan",
+    country: "USA",
+    decades: ["2000s"],
+    ppgCareer: 14.6,
+    rpgCareer: 2.2,
+    apgCareer: 3.4,
+    position: "SG",
+    nbaId: "2037"
   },
+
   {
-    id: "luke-kennard",
-    name: "Luke Kennard",
-    teams: ["MEM"],
-    awards: [],
-    allStar: false,
-    champion: false,
-    championYears: [],
+    id: "jamal-murray",
+    name: "Jamal Murray",
+    teams: ["DEN"],
+    awards: ["Champion"],
+    allStar: true,
+    champion: true,
+    championYears: ["2022"],
     mvp: false,
     dpoy: false,
     roy: false,
-    allNBA: false,
+    allNBA: true,
     allDefensive: false,
-    college: "Duke",
-    country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 11.0,
-    rpgCareer: 2.9,
-    apgCareer: 3.5,
+    college: "Kentucky",
+    country: "Canada",
+    decades: ["2010s"],
+    ppgCareer: 18.9,
+    rpgCareer: 3.8,
+    apgCareer: 5,
     position: "SG",
-    nbaId: "1628379"
+    nbaId: "1627750"
   },
+
   {
-    id: "tayshaun-prince",
-    name: "Tayshaun Prince",
-    teams: ["DET"],
+    id: "jamal-shead",
+    name: "Jamal Shead",
+    teams: ["TOR"],
     awards: [],
     allStar: false,
     champion: false,
@@ -4254,21 +4617,22 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Kentucky",
+    college: "Houston",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 11.1,
-    rpgCareer: 4.3,
-    apgCareer: 2.4,
-    position: "SF",
-    nbaId: "2419"
+    decades: ["2020s"],
+    ppgCareer: 6.9,
+    rpgCareer: 1.6,
+    apgCareer: 4.8,
+    position: "PG",
+    nbaId: "1642347"
   },
+
   {
-    id: "isaiah-collier",
-    name: "Isaiah Collier",
-    teams: ["UTA"],
-    awards: [],
-    allStar: false,
+    id: "jameer-nelson",
+    name: "Jameer Nelson",
+    teams: ["ORL"],
+    awards: ["All-Star"],
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
@@ -4276,19 +4640,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Southern California",
+    college: "St. Joseph's (PA)",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 8.7,
-    rpgCareer: 3.0,
-    apgCareer: 6.4,
-    position: "SG",
-    nbaId: "1642268"
+    decades: ["2000s"],
+    ppgCareer: 11.3,
+    rpgCareer: 3,
+    apgCareer: 5.13,
+    position: "PG",
+    nbaId: "2749"
   },
+
   {
-    id: "mike-dunleavy",
-    name: "Mike Dunleavy",
-    teams: ["GSW"],
+    id: "james-wiseman",
+    name: "James Wiseman",
+    teams: ["GSW","DET","IND"],
     awards: [],
     allStar: false,
     champion: false,
@@ -4298,41 +4663,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Duke",
+    college: "Memphis",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 11.2,
-    rpgCareer: 4.3,
-    apgCareer: 2.2,
-    position: "SG",
-    nbaId: "2399"
+    decades: ["2020s"],
+    ppgCareer: 9,
+    rpgCareer: 5.5,
+    apgCareer: 0.7,
+    position: "C",
+    nbaId: "1630164"
   },
+
   {
-    id: "zach-edey",
-    name: "Zach Edey",
-    teams: ["MEM"],
-    awards: [],
+    id: "jared-dudley",
+    name: "Jared Dudley",
+    teams: ["CHA","PHX","LAC","MIL","WAS","BKN","LAL"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2019"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Purdue",
-    country: "Canada",
-    decades: ["2020s"],
-    ppgCareer: 9.9,
-    rpgCareer: 8.7,
-    apgCareer: 1.0,
-    position: "C",
-    nbaId: "1641744"
+    college: "Boston College",
+    country: "USA",
+    decades: ["2000s"],
+    ppgCareer: 7.3,
+    rpgCareer: 3.2,
+    apgCareer: 1.5,
+    position: "SF",
+    nbaId: "201162"
   },
+
   {
-    id: "derrick-favors",
-    name: "Derrick Favors",
-    teams: ["HOU"],
+    id: "jared-mccain",
+    name: "Jared McCain",
+    teams: ["PHI","OKC"],
     awards: [],
     allStar: false,
     champion: false,
@@ -4342,19 +4709,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Georgia Tech",
+    college: "Duke",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 10.6,
-    rpgCareer: 7.1,
-    apgCareer: 1.1,
-    position: "SF",
-    nbaId: "202324"
+    decades: ["2020s"],
+    ppgCareer: 10.1,
+    rpgCareer: 2.1,
+    apgCareer: 1.7,
+    position: "SG",
+    nbaId: "1642272"
   },
+
   {
-    id: "kel-el-ware",
-    name: "Kel'el Ware",
-    teams: ["MIA"],
+    id: "jared-sullinger",
+    name: "Jared Sullinger",
+    teams: ["BOS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -4364,43 +4732,45 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Indiana",
+    college: "Ohio State",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 10.2,
-    rpgCareer: 8.3,
-    apgCareer: 0.8,
-    position: "C",
-    nbaId: "1642276"
+    decades: ["2010s"],
+    ppgCareer: 10.8,
+    rpgCareer: 7.5,
+    apgCareer: 1.8,
+    position: "PF",
+    nbaId: "203096"
   },
+
   {
-    id: "brandin-podziemski",
-    name: "Brandin Podziemski",
-    teams: ["GSW"],
-    awards: [],
-    allStar: false,
+    id: "jaren-jackson-jr",
+    name: "Jaren Jackson Jr.",
+    teams: ["MEM","UTA"],
+    awards: ["All-Star","DPOY"],
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
-    dpoy: false,
+    dpoy: true,
     roy: false,
     allNBA: false,
-    allDefensive: false,
-    college: "Santa Clara",
+    allDefensive: true,
+    college: "Michigan State",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 9.2,
-    rpgCareer: 5.8,
-    apgCareer: 3.7,
-    position: "SG",
-    nbaId: "1641764"
+    decades: ["2010s"],
+    ppgCareer: 18.6,
+    rpgCareer: 5.6,
+    apgCareer: 1.5,
+    position: "F-C",
+    nbaId: "1628991"
   },
+
   {
-    id: "dylan-harper",
-    name: "Dylan Harper",
-    teams: ["SAS"],
-    awards: [],
-    allStar: false,
+    id: "jarrett-allen",
+    name: "Jarrett Allen",
+    teams: ["BKN","CLE"],
+    awards: ["All-Star"],
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
@@ -4408,19 +4778,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Rutgers",
+    college: "Texas",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 10.6,
-    rpgCareer: 3.2,
-    apgCareer: 3.5,
-    position: "SG",
-    nbaId: "1642844"
+    decades: ["2010s"],
+    ppgCareer: 13.1,
+    rpgCareer: 9.2,
+    apgCareer: 1.7,
+    position: "C-F",
+    nbaId: "1628386"
   },
+
   {
-    id: "devin-harris",
-    name: "Devin Harris",
-    teams: ["DAL"],
+    id: "jarrett-jack",
+    name: "Jarrett Jack",
+    teams: ["POR","IND","TOR","NOP","GSW","CLE","BKN","NYK"],
     awards: [],
     allStar: false,
     champion: false,
@@ -4430,41 +4801,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Wisconsin",
+    college: "Georgia Tech",
     country: "USA",
-    decades: ["2000s","2010s"],
+    decades: ["2000s"],
     ppgCareer: 10.8,
-    rpgCareer: 2.2,
-    apgCareer: 3.9,
-    position: "SG",
-    nbaId: "2734"
+    rpgCareer: 2.9,
+    apgCareer: 4.56,
+    position: "PG",
+    nbaId: "101127"
   },
+
   {
-    id: "zaccharie-risacher",
-    name: "Zaccharie Risacher",
-    teams: ["ATL"],
-    awards: [],
+    id: "jason-terry",
+    name: "Jason Terry",
+    teams: ["DAL"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2010"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "JL Bourg-en-Bresse",
-    country: "France",
-    decades: ["2020s"],
-    ppgCareer: 12.1,
-    rpgCareer: 3.5,
-    apgCareer: 1.3,
-    position: "SF",
-    nbaId: "1642258"
+    college: "Arizona",
+    country: "USA",
+    decades: ["1990s"],
+    ppgCareer: 13.4,
+    rpgCareer: 2.3,
+    apgCareer: 3.8,
+    position: "SG",
+    nbaId: "1891"
   },
+
   {
-    id: "herbert-jones",
-    name: "Herbert Jones",
-    teams: ["NOP"],
+    id: "jason-thompson",
+    name: "Jason Thompson",
+    teams: ["SAC"],
     awards: [],
     allStar: false,
     champion: false,
@@ -4474,19 +4847,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Alabama",
+    college: "Rider University",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 11.0,
-    rpgCareer: 3.6,
-    apgCareer: 2.6,
-    position: "SF",
-    nbaId: "1630529"
+    decades: ["2000s"],
+    ppgCareer: 8.9,
+    rpgCareer: 6.6,
+    apgCareer: 1.1,
+    position: "PF",
+    nbaId: "201574"
   },
+
   {
-    id: "amen-thompson",
-    name: "Amen Thompson",
-    teams: ["HOU"],
+    id: "javon-freeman-liberty",
+    name: "Javon Freeman-Liberty",
+    teams: ["TOR"],
     awards: [],
     allStar: false,
     champion: false,
@@ -4496,19 +4870,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Overtime Elite",
+    college: "DePaul",
     country: "USA",
     decades: ["2020s"],
-    ppgCareer: 9.5,
-    rpgCareer: 6.6,
-    apgCareer: 2.6,
+    ppgCareer: 7,
+    rpgCareer: 3.2,
+    apgCareer: 1.8,
     position: "SG",
-    nbaId: "1641708"
+    nbaId: "1631241"
   },
+
   {
-    id: "ramon-sessions",
-    name: "Ramon Sessions",
-    teams: ["CHA"],
+    id: "javonte-green",
+    name: "Javonte Green",
+    teams: ["BOS","CHI","NOP","CLE","DET"],
     awards: [],
     allStar: false,
     champion: false,
@@ -4518,41 +4893,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Nevada-Reno",
+    college: "Radford",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 10.3,
-    rpgCareer: 2.7,
-    apgCareer: 4.1,
+    decades: ["2010s"],
+    ppgCareer: 5.7,
+    rpgCareer: 3,
+    apgCareer: 0.7,
     position: "SG",
-    nbaId: "201196"
+    nbaId: "1629750"
   },
+
   {
-    id: "cam-whitmore",
-    name: "Cam Whitmore",
-    teams: ["HOU"],
-    awards: [],
-    allStar: false,
-    champion: false,
-    championYears: [],
+    id: "jaylen-brown",
+    name: "Jaylen Brown",
+    teams: ["BOS"],
+    awards: ["Champion","All-Star","MVP"],
+    allStar: true,
+    champion: true,
+    championYears: ["2023"],
     mvp: false,
     dpoy: false,
     roy: false,
-    allNBA: false,
+    allNBA: true,
     allDefensive: false,
-    college: "Villanova",
+    college: "California",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 12.3,
-    rpgCareer: 3.8,
-    apgCareer: 0.7,
+    decades: ["2010s"],
+    ppgCareer: 20,
+    rpgCareer: 5.5,
+    apgCareer: 2.9,
     position: "SF",
-    nbaId: "1641715"
+    nbaId: "1627759"
   },
+
   {
-    id: "marcin-gortat",
-    name: "Marcin Gortat",
-    teams: ["WAS"],
+    id: "jaylen-hoard",
+    name: "Jaylen Hoard",
+    teams: ["POR","OKC"],
     awards: [],
     allStar: false,
     champion: false,
@@ -4562,19 +4939,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "RheinEnergie Cologne",
-    country: "Poland",
-    decades: ["2000s","2010s"],
-    ppgCareer: 9.9,
-    rpgCareer: 7.9,
-    apgCareer: 1.1,
-    position: "C",
-    nbaId: "101162"
+    college: "Wake Forest",
+    country: "France",
+    decades: ["2010s"],
+    ppgCareer: 6.6,
+    rpgCareer: 4.6,
+    apgCareer: 1.2,
+    position: "PF",
+    nbaId: "1629658"
   },
+
   {
-    id: "josh-jackson",
-    name: "Josh Jackson",
-    teams: ["TOR"],
+    id: "jaylen-wells",
+    name: "Jaylen Wells",
+    teams: ["MEM"],
     awards: [],
     allStar: false,
     champion: false,
@@ -4584,19 +4962,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Kansas",
+    college: "Washington State",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 11.3,
-    rpgCareer: 4.0,
-    apgCareer: 1.8,
-    position: "SG",
-    nbaId: "1628367"
+    decades: ["2020s"],
+    ppgCareer: 11.4,
+    rpgCareer: 3.3,
+    apgCareer: 1.7,
+    position: "SF",
+    nbaId: "1642377"
   },
+
   {
-    id: "mike-miller",
-    name: "Mike Miller",
-    teams: ["MEM"],
+    id: "jaylon-tyson",
+    name: "Jaylon Tyson",
+    teams: ["CLE"],
     awards: [],
     allStar: false,
     champion: false,
@@ -4606,41 +4985,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Florida",
+    college: "California",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 10.6,
-    rpgCareer: 4.2,
-    apgCareer: 2.6,
-    position: "SG",
-    nbaId: "2034"
+    decades: ["2020s"],
+    ppgCareer: 9.2,
+    rpgCareer: 3.8,
+    apgCareer: 1.7,
+    position: "SG-SF",
+    nbaId: "1642281"
   },
+
   {
-    id: "alex-caruso",
-    name: "Alex Caruso",
-    teams: ["CHI"],
-    awards: [],
-    allStar: false,
-    champion: false,
-    championYears: [],
+    id: "jeff-teague",
+    name: "Jeff Teague",
+    teams: ["ATL","IND","MIN","BOS","MIL"],
+    awards: ["Champion","All-Star"],
+    allStar: true,
+    champion: true,
+    championYears: ["2020"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Texas A&M",
+    college: "Wake Forest",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 10.1,
-    rpgCareer: 3.8,
-    apgCareer: 3.5,
-    position: "SG",
-    nbaId: "1627936"
+    decades: ["2000s"],
+    ppgCareer: 12.2,
+    rpgCareer: 2.4,
+    apgCareer: 5.55,
+    position: "PG",
+    nbaId: "201952"
   },
+
   {
-    id: "evan-turner",
-    name: "Evan Turner",
-    teams: ["PHI"],
+    id: "jerami-grant",
+    name: "Jerami Grant",
+    teams: ["PHI","OKC","DEN","DET","POR"],
     awards: [],
     allStar: false,
     champion: false,
@@ -4650,19 +5031,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Ohio State",
+    college: "Syracuse",
     country: "USA",
     decades: ["2010s"],
-    ppgCareer: 9.7,
-    rpgCareer: 4.6,
-    apgCareer: 3.5,
-    position: "SG",
-    nbaId: "202323"
+    ppgCareer: 13.5,
+    rpgCareer: 3.9,
+    apgCareer: 1.6,
+    position: "SF",
+    nbaId: "203924"
   },
+
   {
-    id: "harrison-barnes",
-    name: "Harrison Barnes",
-    teams: ["SAC"],
+    id: "jeremiah-fears",
+    name: "Jeremiah Fears",
+    teams: ["NOP"],
     awards: [],
     allStar: false,
     champion: false,
@@ -4672,19 +5054,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "North Carolina",
+    college: "Oklahoma",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 12.2,
-    rpgCareer: 3.0,
-    apgCareer: 1.2,
-    position: "SF",
-    nbaId: "203084"
+    decades: ["2020s"],
+    ppgCareer: 14.3,
+    rpgCareer: 3.7,
+    apgCareer: 3.4,
+    position: "PG",
+    nbaId: "1642847"
   },
+
   {
-    id: "tony-wroten",
-    name: "Tony Wroten",
-    teams: ["PHI"],
+    id: "jeremy-lamb",
+    name: "Jeremy Lamb",
+    teams: ["OKC","CHA","IND","SAC"],
     awards: [],
     allStar: false,
     champion: false,
@@ -4694,63 +5077,66 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Washington",
+    college: "Connecticut",
     country: "USA",
     decades: ["2010s"],
-    ppgCareer: 11.1,
-    rpgCareer: 2.5,
-    apgCareer: 3.0,
+    ppgCareer: 10.1,
+    rpgCareer: 3.6,
+    apgCareer: 1.6,
     position: "SG",
-    nbaId: "203100"
+    nbaId: "203087"
   },
+
   {
-    id: "onyeka-okongwu",
-    name: "Onyeka Okongwu",
-    teams: ["ATL"],
-    awards: [],
+    id: "jeremy-lin",
+    name: "Jeremy Lin",
+    teams: ["GSW","NYK","HOU","LAL","CHA","BKN","ATL","TOR"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2018"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Southern California",
+    college: "Harvard",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 10.2,
-    rpgCareer: 6.8,
-    apgCareer: 1.3,
-    position: "SF",
-    nbaId: "1630168"
+    decades: ["2010s"],
+    ppgCareer: 11.6,
+    rpgCareer: 2.8,
+    apgCareer: 4.25,
+    position: "PG",
+    nbaId: "202391"
   },
+
   {
-    id: "jose-calderon",
-    name: "Jose Calderon",
-    teams: ["TOR"],
+    id: "jeremy-sochan",
+    name: "Jeremy Sochan",
+    teams: ["SAS"],
     awards: [],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2025"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Tau Ceramica",
-    country: "Spain",
-    decades: ["2000s","2010s"],
-    ppgCareer: 8.9,
-    rpgCareer: 2.4,
-    apgCareer: 5.8,
-    position: "SG",
-    nbaId: "101181"
+    college: "Baylor",
+    country: "Poland",
+    decades: ["2020s"],
+    ppgCareer: 9.9,
+    rpgCareer: 5.4,
+    apgCareer: 2.5,
+    position: "PF-SG",
+    nbaId: "1631110"
   },
+
   {
-    id: "egor-d-min",
-    name: "Egor Dëmin",
-    teams: ["BKN"],
+    id: "jerryd-bayless",
+    name: "Jerryd Bayless",
+    teams: ["TOR","NOP","MEM","POR","MIN","PHI","MIL","BOS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -4760,63 +5146,89 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Brigham Young",
-    country: "Russia",
-    decades: ["2020s"],
-    ppgCareer: 10.4,
-    rpgCareer: 3.0,
-    apgCareer: 3.4,
-    position: "SG",
-    nbaId: "1642856"
+    college: "Arizona",
+    country: "USA",
+    decades: ["2000s"],
+    ppgCareer: 8.4,
+    rpgCareer: 2.1,
+    apgCareer: 2.9,
+    position: "PG",
+    nbaId: "201573"
   },
+
   {
-    id: "caleb-love",
-    name: "Caleb Love",
-    teams: ["POR"],
-    awards: [],
-    allStar: false,
+    id: "joakim-noah",
+    name: "Joakim Noah",
+    teams: ["NYK","CHI","MEM","LAC"],
+    awards: ["DPOY","All-Star"],
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
+    dpoy: true,
+    roy: false,
+    allNBA: true,
+    allDefensive: true,
+    college: "Florida",
+    country: "USA",
+    decades: ["2000s"],
+    ppgCareer: 8.8,
+    rpgCareer: 9.01,
+    apgCareer: 2.8,
+    position: "C",
+    nbaId: "201149"
+  },
+
+  {
+    id: "jodie-meeks",
+    name: "Jodie Meeks",
+    teams: ["MIL","PHI","LAL","DET","ORL","WAS","TOR"],
+    awards: ["Champion"],
+    allStar: false,
+    champion: true,
+    championYears: ["2018"],
+    mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Arizona",
+    college: "Kentucky",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 11.1,
-    rpgCareer: 2.7,
-    apgCareer: 2.6,
+    decades: ["2000s"],
+    ppgCareer: 9.3,
+    rpgCareer: 2.1,
+    apgCareer: 1.1,
     position: "SG",
-    nbaId: "1631126"
+    nbaId: "201975"
   },
+
   {
-    id: "nate-robinson",
-    name: "Nate Robinson",
-    teams: ["NYK"],
-    awards: [],
-    allStar: false,
+    id: "joe-johnson",
+    name: "Joe Johnson",
+    teams: ["BOS","PHX","ATL","BKN","MIA","UTA","HOU"],
+    awards: ["All-Star"],
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
     dpoy: false,
     roy: false,
-    allNBA: false,
+    allNBA: true,
     allDefensive: false,
-    college: "Washington",
+    college: "Arkansas",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 11.0,
-    rpgCareer: 2.3,
-    apgCareer: 3.0,
+    decades: ["2000s"],
+    ppgCareer: 16,
+    rpgCareer: 4,
+    apgCareer: 3.9,
     position: "SG",
-    nbaId: "101126"
+    nbaId: "2207"
   },
+
   {
-    id: "trevor-ariza",
-    name: "Trevor Ariza",
-    teams: ["LAL"],
+    id: "john-henson",
+    name: "John Henson",
+    teams: ["MIL","CLE","DET"],
     awards: [],
     allStar: false,
     champion: false,
@@ -4826,63 +5238,66 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "UCLA",
+    college: "North Carolina",
     country: "USA",
-    decades: ["2000s","2010s","2020s"],
-    ppgCareer: 10.4,
-    rpgCareer: 4.8,
-    apgCareer: 2.1,
-    position: "SF",
-    nbaId: "2772"
+    decades: ["2010s"],
+    ppgCareer: 7.6,
+    rpgCareer: 5.3,
+    apgCareer: 1.1,
+    position: "C-F",
+    nbaId: "203089"
   },
+
   {
-    id: "marcus-thornton",
-    name: "Marcus Thornton",
-    teams: ["SAC"],
-    awards: [],
-    allStar: false,
+    id: "john-wall",
+    name: "John Wall",
+    teams: ["WAS","HOU","LAC"],
+    awards: ["All-Star"],
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
     dpoy: false,
     roy: false,
-    allNBA: false,
-    allDefensive: false,
-    college: "Louisiana State",
+    allNBA: true,
+    allDefensive: true,
+    college: "Kentucky",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 11.9,
-    rpgCareer: 2.8,
-    apgCareer: 1.4,
-    position: "SG",
-    nbaId: "201977"
+    decades: ["2010s"],
+    ppgCareer: 18.68,
+    rpgCareer: 4.2,
+    apgCareer: 8.86,
+    position: "PG",
+    nbaId: "202322"
   },
+
   {
-    id: "nick-richards",
-    name: "Nick Richards",
-    teams: ["CHA"],
-    awards: [],
+    id: "jonathan-kuminga",
+    name: "Jonathan Kuminga",
+    teams: ["GSW","ATL"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2021"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Kentucky",
-    country: "Jamaica",
+    college: "NBA G League Ignite",
+    country: "DRC",
     decades: ["2020s"],
-    ppgCareer: 9.7,
-    rpgCareer: 8.0,
-    apgCareer: 0.8,
-    position: "C",
-    nbaId: "1630208"
+    ppgCareer: 12.5,
+    rpgCareer: 4.2,
+    apgCareer: 1.8,
+    position: "PF",
+    nbaId: "1630228"
   },
+
   {
-    id: "maxime-raynaud",
-    name: "Maxime Raynaud",
-    teams: ["SAC"],
+    id: "jonathon-simmons",
+    name: "Jonathon Simmons",
+    teams: ["SAS","PHI","ORL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -4892,41 +5307,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Stanford",
-    country: "France",
-    decades: ["2020s"],
-    ppgCareer: 10.1,
-    rpgCareer: 6.5,
-    apgCareer: 1.2,
-    position: "C",
-    nbaId: "1642875"
+    college: "Houston",
+    country: "USA",
+    decades: ["2010s"],
+    ppgCareer: 8.3,
+    rpgCareer: 2.4,
+    apgCareer: 1.9,
+    position: "SG",
+    nbaId: "203613"
   },
+
   {
-    id: "gerald-henderson",
-    name: "Gerald Henderson",
-    teams: ["CHA"],
+    id: "jordan-clarkson",
+    name: "Jordan Clarkson",
+    teams: ["LAL","CLE","UTA","NYK"],
     awards: [],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2025"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Duke",
+    college: "Missouri",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 11.2,
+    decades: ["2010s"],
+    ppgCareer: 15.3,
     rpgCareer: 3.2,
-    apgCareer: 1.9,
+    apgCareer: 2.8,
     position: "SG",
-    nbaId: "201945"
+    nbaId: "203903"
   },
+
   {
-    id: "george-hill",
-    name: "George Hill",
-    teams: ["IND"],
+    id: "jordan-crawford",
+    name: "Jordan Crawford",
+    teams: ["ATL","WAS","BOS","GSW","NOP"],
     awards: [],
     allStar: false,
     champion: false,
@@ -4936,41 +5353,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Indiana-Purdue Indianapolis",
+    college: "Xavier",
     country: "USA",
-    decades: ["2000s","2010s","2020s"],
-    ppgCareer: 10.4,
-    rpgCareer: 3.0,
+    decades: ["2010s"],
+    ppgCareer: 12.2,
+    rpgCareer: 2.5,
     apgCareer: 3.1,
     position: "SG",
-    nbaId: "201588"
+    nbaId: "202348"
   },
+
   {
-    id: "cameron-oliver",
-    name: "Cameron Oliver",
-    teams: ["ATL"],
-    awards: [],
+    id: "jordan-farmar",
+    name: "Jordan Farmar",
+    teams: ["MEM","LAL","SAC","BKN","LAC"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2008","2009"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Nevada",
+    college: "UCLA",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 11.0,
-    rpgCareer: 4.5,
-    apgCareer: 1.3,
-    position: "SF",
-    nbaId: "1628419"
+    decades: ["2000s"],
+    ppgCareer: 7.7,
+    rpgCareer: 1.9,
+    apgCareer: 2.9,
+    position: "PG",
+    nbaId: "200770"
   },
+
   {
-    id: "malik-beasley",
-    name: "Malik Beasley",
-    teams: ["MIL"],
+    id: "jordan-goodwin",
+    name: "Jordan Goodwin",
+    teams: ["WAS","PHX","MEM","LAL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -4980,19 +5399,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Florida State",
+    college: "St. Louis",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 11.3,
-    rpgCareer: 3.7,
-    apgCareer: 1.4,
-    position: "SG",
-    nbaId: "1627736"
+    decades: ["2020s"],
+    ppgCareer: 7,
+    rpgCareer: 4.1,
+    apgCareer: 2.3,
+    position: "PG",
+    nbaId: "1630692"
   },
+
   {
-    id: "tari-eason",
-    name: "Tari Eason",
-    teams: ["HOU"],
+    id: "jordan-hill",
+    name: "Jordan Hill",
+    teams: ["NYK","HOU","LAL","IND","MIN"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5002,41 +5422,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Louisiana State",
+    college: "Arizona",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 9.8,
-    rpgCareer: 7.0,
-    apgCareer: 1.2,
-    position: "SF",
-    nbaId: "1631106"
+    decades: ["2000s"],
+    ppgCareer: 7.9,
+    rpgCareer: 5.8,
+    apgCareer: 0.8,
+    position: "C-F",
+    nbaId: "201941"
   },
+
   {
-    id: "roy-hibbert",
-    name: "Roy Hibbert",
-    teams: ["IND"],
+    id: "jose-alvarado",
+    name: "Jose Alvarado",
+    teams: ["NOP","NYK"],
     awards: [],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2025"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Georgetown",
+    college: "Georgia Tech",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 10.0,
-    rpgCareer: 6.3,
-    apgCareer: 1.3,
-    position: "C",
-    nbaId: "201579"
+    decades: ["2020s"],
+    ppgCareer: 8,
+    rpgCareer: 2.3,
+    apgCareer: 3.2,
+    position: "SG",
+    nbaId: "1630631"
   },
+
   {
-    id: "tre-mann",
-    name: "Tre Mann",
-    teams: ["CHA"],
+    id: "jose-calderon",
+    name: "Jose Calderon",
+    teams: ["TOR","DET","DAL","NYK","LAL","ATL","CLE"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5046,19 +5468,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Florida",
-    country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 9.3,
-    rpgCareer: 3.6,
-    apgCareer: 4.0,
-    position: "SG",
-    nbaId: "1630544"
+    college: "Tau Ceramica",
+    country: "Spain",
+    decades: ["2000s"],
+    ppgCareer: 8.9,
+    rpgCareer: 2.4,
+    apgCareer: 5.75,
+    position: "PG",
+    nbaId: "101181"
   },
+
   {
-    id: "kyle-filipowski",
-    name: "Kyle Filipowski",
-    teams: ["UTA"],
+    id: "josh-giddey",
+    name: "Josh Giddey",
+    teams: ["OKC","CHI"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5068,19 +5491,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Duke",
-    country: "USA",
+    college: "NBA Global Academy",
+    country: "Australia",
     decades: ["2020s"],
-    ppgCareer: 9.5,
-    rpgCareer: 6.1,
-    apgCareer: 2.0,
-    position: "C",
-    nbaId: "1642271"
+    ppgCareer: 14.6,
+    rpgCareer: 7.6,
+    apgCareer: 6.6,
+    position: "PG",
+    nbaId: "1630581"
   },
+
   {
-    id: "reggie-jackson",
-    name: "Reggie Jackson",
-    teams: ["DEN"],
+    id: "josh-green",
+    name: "Josh Green",
+    teams: ["DAL","CHA"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5090,41 +5514,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Boston College",
-    country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 10.2,
-    rpgCareer: 1.9,
-    apgCareer: 3.8,
-    position: "SG",
-    nbaId: "202704"
+    college: "Arizona",
+    country: "Australia",
+    decades: ["2020s"],
+    ppgCareer: 6.3,
+    rpgCareer: 2.5,
+    apgCareer: 1.4,
+    position: "SG-SF",
+    nbaId: "1630182"
   },
+
   {
-    id: "terrence-jones",
-    name: "Terrence Jones",
-    teams: ["HOU"],
+    id: "josh-hart",
+    name: "Josh Hart",
+    teams: ["LAL","NOP","POR","NYK"],
     awards: [],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2025"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Kentucky",
+    college: "Villanova",
     country: "USA",
     decades: ["2010s"],
-    ppgCareer: 10.4,
-    rpgCareer: 5.7,
-    apgCareer: 1.0,
-    position: "SF",
-    nbaId: "203093"
+    ppgCareer: 10.5,
+    rpgCareer: 7,
+    apgCareer: 3.4,
+    position: "PG",
+    nbaId: "1628404"
   },
+
   {
-    id: "ajay-mitchell",
-    name: "Ajay Mitchell",
-    teams: ["OKC"],
+    id: "josh-jackson",
+    name: "Josh Jackson",
+    teams: ["PHX","MEM","DET","SAC"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5134,19 +5560,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "California-Santa Barbara",
-    country: "Belgium",
-    decades: ["2020s"],
-    ppgCareer: 10.5,
-    rpgCareer: 2.7,
-    apgCareer: 2.8,
-    position: "SG",
-    nbaId: "1642349"
+    college: "Kansas",
+    country: "USA",
+    decades: ["2010s"],
+    ppgCareer: 11.3,
+    rpgCareer: 4,
+    apgCareer: 1.8,
+    position: "PF-SG",
+    nbaId: "1628367"
   },
+
   {
-    id: "moritz-wagner",
-    name: "Moritz Wagner",
-    teams: ["ORL"],
+    id: "josh-richardson",
+    name: "Josh Richardson",
+    teams: ["MIA","PHI","DAL","BOS","SAS","NOP"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5156,19 +5583,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Michigan",
-    country: "Germany",
-    decades: ["2010s","2020s"],
-    ppgCareer: 10.9,
-    rpgCareer: 4.3,
-    apgCareer: 1.2,
-    position: "SF",
-    nbaId: "1629021"
+    college: "Tennessee",
+    country: "USA",
+    decades: ["2010s"],
+    ppgCareer: 11.5,
+    rpgCareer: 3,
+    apgCareer: 2.6,
+    position: "SG",
+    nbaId: "1626196"
   },
+
   {
-    id: "talen-horton-tucker",
-    name: "Talen Horton-Tucker",
-    teams: ["UTA"],
+    id: "josh-smith",
+    name: "Josh Smith",
+    teams: ["ATL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5177,20 +5605,21 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     dpoy: false,
     roy: false,
     allNBA: false,
-    allDefensive: false,
-    college: "Iowa State",
+    allDefensive: true,
+    college: "Oak Hill Academy (VA)",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 10.1,
-    rpgCareer: 2.4,
-    apgCareer: 3.5,
-    position: "SG",
-    nbaId: "1629659"
+    decades: ["2000s"],
+    ppgCareer: 14.5,
+    rpgCareer: 7.44,
+    apgCareer: 3.1,
+    position: "PF",
+    nbaId: "2746"
   },
+
   {
-    id: "jake-laravia",
-    name: "Jake LaRavia",
-    teams: ["MEM"],
+    id: "justin-edwards",
+    name: "Justin Edwards",
+    teams: ["PHI"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5200,19 +5629,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Wake Forest",
+    college: "Kentucky",
     country: "USA",
     decades: ["2020s"],
-    ppgCareer: 10.8,
-    rpgCareer: 3.7,
-    apgCareer: 1.7,
+    ppgCareer: 7.7,
+    rpgCareer: 2.2,
+    apgCareer: 1.4,
     position: "SF",
-    nbaId: "1631222"
+    nbaId: "1642348"
   },
+
   {
-    id: "kevin-huerter",
-    name: "Kevin Huerter",
-    teams: ["SAC"],
+    id: "justise-winslow",
+    name: "Justise Winslow",
+    teams: ["MIA","MEM","LAC","POR"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5222,19 +5652,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Maryland",
+    college: "Duke",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 10.2,
-    rpgCareer: 3.5,
+    decades: ["2010s"],
+    ppgCareer: 8.2,
+    rpgCareer: 5.1,
     apgCareer: 2.6,
-    position: "SG",
-    nbaId: "1628989"
+    position: "SF",
+    nbaId: "1626159"
   },
+
   {
-    id: "jaylen-wells",
-    name: "Jaylen Wells",
-    teams: ["MEM"],
+    id: "jusuf-nurkić",
+    name: "Jusuf Nurkić",
+    teams: ["DEN","POR","PHX","CHA","UTA"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5244,19 +5675,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Washington State",
-    country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 10.9,
-    rpgCareer: 3.4,
-    apgCareer: 1.7,
-    position: "SF",
-    nbaId: "1642377"
+    college: "Cedevita",
+    country: "Bosnia and Herzegovina",
+    decades: ["2010s"],
+    ppgCareer: 11.8,
+    rpgCareer: 8.9,
+    apgCareer: 2.6,
+    position: "C",
+    nbaId: "203994"
   },
+
   {
-    id: "donovan-clingan",
-    name: "Donovan Clingan",
-    teams: ["POR"],
+    id: "kj-simpson",
+    name: "KJ Simpson",
+    teams: ["CHA"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5266,19 +5698,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Connecticut",
+    college: "Colorado",
     country: "USA",
     decades: ["2020s"],
-    ppgCareer: 8.3,
-    rpgCareer: 9.0,
-    apgCareer: 1.4,
-    position: "C",
-    nbaId: "1642270"
+    ppgCareer: 6.7,
+    rpgCareer: 2.6,
+    apgCareer: 2.8,
+    position: "PG",
+    nbaId: "1642354"
   },
+
   {
-    id: "caleb-martin",
-    name: "Caleb Martin",
-    teams: ["MIA"],
+    id: "keegan-murray",
+    name: "Keegan Murray",
+    teams: ["SAC"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5288,18 +5721,19 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Nevada",
+    college: "Iowa",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 10.0,
-    rpgCareer: 4.4,
-    apgCareer: 2.2,
-    position: "SF",
-    nbaId: "1628997"
+    decades: ["2020s"],
+    ppgCareer: 13.3,
+    rpgCareer: 5.6,
+    apgCareer: 1.5,
+    position: "PF",
+    nbaId: "1631099"
   },
+
   {
-    id: "greivis-vasquez",
-    name: "Greivis Vasquez",
+    id: "keion-brooks-jr",
+    name: "Keion Brooks Jr.",
     teams: ["NOP"],
     awards: [],
     allStar: false,
@@ -5310,19 +5744,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Maryland",
-    country: "Venezuela",
-    decades: ["2010s"],
-    ppgCareer: 9.0,
-    rpgCareer: 2.5,
-    apgCareer: 4.8,
-    position: "SG",
-    nbaId: "202349"
+    college: "Washington",
+    country: "USA",
+    decades: ["2020s"],
+    ppgCareer: 10.1,
+    rpgCareer: 4.1,
+    apgCareer: 0.9,
+    position: "PF",
+    nbaId: "1631232"
   },
+
   {
-    id: "steven-adams",
-    name: "Steven Adams",
-    teams: ["HOU"],
+    id: "kelel-ware",
+    name: "Kel'el Ware",
+    teams: ["MIA"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5332,19 +5767,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Pittsburgh",
-    country: "New Zealand",
-    decades: ["2010s","2020s"],
-    ppgCareer: 8.7,
-    rpgCareer: 8.0,
-    apgCareer: 1.5,
+    college: "Indiana",
+    country: "USA",
+    decades: ["2020s"],
+    ppgCareer: 10.3,
+    rpgCareer: 8.3,
+    apgCareer: 0.8,
     position: "C",
-    nbaId: "203500"
+    nbaId: "1642276"
   },
+
   {
-    id: "isaiah-hartenstein",
-    name: "Isaiah Hartenstein",
-    teams: ["NYK"],
+    id: "keldon-johnson",
+    name: "Keldon Johnson",
+    teams: ["SAS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5354,19 +5790,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Zalgiris",
-    country: "Germany",
-    decades: ["2010s","2020s"],
-    ppgCareer: 7.8,
-    rpgCareer: 8.3,
-    apgCareer: 2.5,
-    position: "SF",
-    nbaId: "1628392"
+    college: "Kentucky",
+    country: "USA",
+    decades: ["2010s"],
+    ppgCareer: 15.1,
+    rpgCareer: 5.4,
+    apgCareer: 2,
+    position: "PF-SG",
+    nbaId: "1629640"
   },
+
   {
-    id: "carl-landry",
-    name: "Carl Landry",
-    teams: ["SAC"],
+    id: "kelly-olynyk",
+    name: "Kelly Olynyk",
+    teams: ["BOS","MIA","HOU","DET","UTA","TOR","NOP","SAS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5376,41 +5813,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Purdue",
-    country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 10.8,
-    rpgCareer: 4.9,
-    apgCareer: 0.7,
-    position: "SF",
-    nbaId: "201171"
+    college: "Gonzaga",
+    country: "Canada",
+    decades: ["2010s"],
+    ppgCareer: 9.8,
+    rpgCareer: 5,
+    apgCareer: 2.4,
+    position: "C-F",
+    nbaId: "203482"
   },
+
   {
-    id: "marvin-williams",
-    name: "Marvin Williams",
-    teams: ["ATL"],
-    awards: [],
-    allStar: false,
+    id: "kemba-walker",
+    name: "Kemba Walker",
+    teams: ["CHA","BOS","NYK","DAL"],
+    awards: ["All-Star"],
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
     dpoy: false,
     roy: false,
-    allNBA: false,
+    allNBA: true,
     allDefensive: false,
-    college: "North Carolina",
+    college: "Connecticut",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 10.2,
-    rpgCareer: 5.2,
-    apgCareer: 1.3,
-    position: "SF",
-    nbaId: "101107"
+    decades: ["2010s"],
+    ppgCareer: 19.31,
+    rpgCareer: 3.8,
+    apgCareer: 5.25,
+    position: "PG",
+    nbaId: "202689"
   },
+
   {
-    id: "dalano-banton",
-    name: "Dalano Banton",
-    teams: ["POR"],
+    id: "kendrick-nunn",
+    name: "Kendrick Nunn",
+    teams: ["MIA","LAL","WAS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5420,19 +5859,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Nebraska",
-    country: "Canada",
-    decades: ["2020s"],
-    ppgCareer: 10.3,
-    rpgCareer: 3.3,
+    college: "Oakland",
+    country: "USA",
+    decades: ["2010s"],
+    ppgCareer: 12.1,
+    rpgCareer: 2.4,
     apgCareer: 2.4,
-    position: "SF",
-    nbaId: "1630625"
+    position: "PG",
+    nbaId: "1629134"
   },
+
   {
-    id: "luguentz-dort",
-    name: "Luguentz Dort",
-    teams: ["OKC"],
+    id: "kenneth-faried",
+    name: "Kenneth Faried",
+    teams: ["DEN","BKN","HOU"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5442,19 +5882,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Arizona State",
-    country: "Canada",
-    decades: ["2010s","2020s"],
-    ppgCareer: 10.9,
-    rpgCareer: 3.6,
-    apgCareer: 1.4,
-    position: "SG",
-    nbaId: "1629652"
+    college: "Morehead State",
+    country: "USA",
+    decades: ["2010s"],
+    ppgCareer: 11.4,
+    rpgCareer: 8.13,
+    apgCareer: 1,
+    position: "PF",
+    nbaId: "202702"
   },
+
   {
-    id: "al-horford",
-    name: "Al Horford",
-    teams: ["BOS"],
+    id: "kent-bazemore",
+    name: "Kent Bazemore",
+    teams: ["GSW","LAL","ATL","POR","SAC"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5464,19 +5905,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Florida",
-    country: "Dominican Republic",
-    decades: ["2000s","2010s","2020s"],
-    ppgCareer: 8.6,
-    rpgCareer: 6.4,
-    apgCareer: 2.6,
-    position: "SF",
-    nbaId: "201143"
+    college: "Old Dominion",
+    country: "USA",
+    decades: ["2010s"],
+    ppgCareer: 8.2,
+    rpgCareer: 3.2,
+    apgCareer: 1.8,
+    position: "SG",
+    nbaId: "203145"
   },
+
   {
-    id: "payton-pritchard",
-    name: "Payton Pritchard",
-    teams: ["BOS"],
+    id: "kevin-huerter",
+    name: "Kevin Huerter",
+    teams: ["ATL","SAC","CHI","DET"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5486,41 +5928,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Oregon",
+    college: "Maryland",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 9.6,
-    rpgCareer: 3.2,
-    apgCareer: 3.4,
-    position: "SG",
-    nbaId: "1630202"
+    decades: ["2010s"],
+    ppgCareer: 11.4,
+    rpgCareer: 3.4,
+    apgCareer: 2.9,
+    position: "SG-SF",
+    nbaId: "1628989"
   },
+
   {
-    id: "matas-buzelis",
-    name: "Matas Buzelis",
-    teams: ["CHI"],
-    awards: [],
-    allStar: false,
-    champion: false,
-    championYears: [],
+    id: "kevin-love",
+    name: "Kevin Love",
+    teams: ["MIN","CLE","MIA","UTA"],
+    awards: ["Champion","All-Star"],
+    allStar: true,
+    champion: true,
+    championYears: ["2015"],
     mvp: false,
     dpoy: false,
     roy: false,
-    allNBA: false,
+    allNBA: true,
     allDefensive: false,
-    college: "NBA G League Ignite",
+    college: "UCLA",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 10.7,
-    rpgCareer: 4.1,
-    apgCareer: 1.3,
-    position: "SF",
-    nbaId: "1641824"
+    decades: ["2000s"],
+    ppgCareer: 15.8,
+    rpgCareer: 9.8,
+    apgCareer: 2.3,
+    position: "PF",
+    nbaId: "201567"
   },
+
   {
-    id: "ersan-ilyasova",
-    name: "Ersan Ilyasova",
-    teams: ["MIL"],
+    id: "kevin-martin",
+    name: "Kevin Martin",
+    teams: ["SAC","HOU","OKC","MIN","SAS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5530,19 +5974,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "FC Barcelona",
-    country: "Turkey",
-    decades: ["2000s","2010s","2020s"],
-    ppgCareer: 10.1,
-    rpgCareer: 5.6,
-    apgCareer: 1.1,
-    position: "SF",
-    nbaId: "101141"
+    college: "Western Carolina",
+    country: "USA",
+    decades: ["2000s"],
+    ppgCareer: 17.36,
+    rpgCareer: 3.2,
+    apgCareer: 1.9,
+    position: "SG",
+    nbaId: "2755"
   },
+
   {
-    id: "avery-bradley",
-    name: "Avery Bradley",
-    teams: ["LAL"],
+    id: "kevin-porter-jr",
+    name: "Kevin Porter Jr.",
+    teams: ["CLE","HOU","LAC","MIL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5552,19 +5997,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "University of Texas at Austin",
+    college: "Southern California",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 11.0,
-    rpgCareer: 2.8,
-    apgCareer: 1.7,
-    position: "SG",
-    nbaId: "202340"
+    decades: ["2010s"],
+    ppgCareer: 14.4,
+    rpgCareer: 4.3,
+    apgCareer: 4.9,
+    position: "PG-SF",
+    nbaId: "1629645"
   },
+
   {
-    id: "arron-afflalo",
-    name: "Arron Afflalo",
-    teams: ["DEN"],
+    id: "keyonte-george",
+    name: "Keyonte George",
+    teams: ["UTA"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5574,19 +6020,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "UCLA",
+    college: "Baylor",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 10.8,
-    rpgCareer: 2.9,
-    apgCareer: 1.8,
-    position: "SG",
-    nbaId: "201167"
+    decades: ["2020s"],
+    ppgCareer: 17.2,
+    rpgCareer: 3.4,
+    apgCareer: 5.3,
+    position: "PG",
+    nbaId: "1641718"
   },
+
   {
-    id: "randy-foye",
-    name: "Randy Foye",
-    teams: ["MIN"],
+    id: "killian-hayes",
+    name: "Killian Hayes",
+    teams: ["DET","BKN"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5596,19 +6043,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Villanova",
-    country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 10.3,
-    rpgCareer: 2.2,
-    apgCareer: 2.8,
-    position: "SG",
-    nbaId: "200751"
+    college: "Ratiopharm Ulm",
+    country: "France",
+    decades: ["2020s"],
+    ppgCareer: 7.9,
+    rpgCareer: 2.9,
+    apgCareer: 5,
+    position: "PG",
+    nbaId: "1630165"
   },
+
   {
-    id: "jj-hickson",
-    name: "JJ Hickson",
-    teams: ["CLE"],
+    id: "kirk-hinrich",
+    name: "Kirk Hinrich",
+    teams: ["CHI","WAS","ATL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5617,20 +6065,21 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     dpoy: false,
     roy: false,
     allNBA: false,
-    allDefensive: false,
-    college: "North Carolina State",
+    allDefensive: true,
+    college: "Kansas",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 9.5,
-    rpgCareer: 6.8,
-    apgCareer: 0.8,
-    position: "SF",
-    nbaId: "201581"
+    decades: ["2000s"],
+    ppgCareer: 10.9,
+    rpgCareer: 2.9,
+    apgCareer: 4.83,
+    position: "PG",
+    nbaId: "2550"
   },
+
   {
-    id: "simone-fontecchio",
-    name: "Simone Fontecchio",
-    teams: ["DET"],
+    id: "kon-knueppel",
+    name: "Kon Knueppel",
+    teams: ["CHA"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5640,19 +6089,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Baskonia",
-    country: "Italy",
+    college: "Duke",
+    country: "USA",
     decades: ["2020s"],
-    ppgCareer: 10.5,
-    rpgCareer: 3.7,
-    apgCareer: 1.5,
-    position: "SF",
-    nbaId: "1631323"
+    ppgCareer: 18.5,
+    rpgCareer: 5.3,
+    apgCareer: 3.4,
+    position: "PG-SF",
+    nbaId: "1642851"
   },
+
   {
-    id: "obi-toppin",
-    name: "Obi Toppin",
-    teams: ["IND"],
+    id: "kris-humphries",
+    name: "Kris Humphries",
+    teams: ["UTA","TOR","DAL","BKN","BOS","WAS","PHX","ATL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5662,19 +6112,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Dayton",
+    college: "Minnesota",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 10.3,
-    rpgCareer: 3.9,
-    apgCareer: 1.6,
-    position: "SF",
-    nbaId: "1630167"
+    decades: ["2000s"],
+    ppgCareer: 6.7,
+    rpgCareer: 5.4,
+    apgCareer: 0.7,
+    position: "PF",
+    nbaId: "2743"
   },
+
   {
-    id: "boris-diaw",
-    name: "Boris Diaw",
-    teams: ["SAS"],
+    id: "ky-bowman",
+    name: "Ky Bowman",
+    teams: ["GSW"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5684,19 +6135,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Pau Orthez",
-    country: "France",
-    decades: ["2000s","2010s"],
-    ppgCareer: 8.6,
-    rpgCareer: 4.4,
-    apgCareer: 3.5,
-    position: "SF",
-    nbaId: "2564"
+    college: "Boston College",
+    country: "USA",
+    decades: ["2010s"],
+    ppgCareer: 7.4,
+    rpgCareer: 2.7,
+    apgCareer: 2.9,
+    position: "PG",
+    nbaId: "1629065"
   },
+
   {
-    id: "kevin-love",
-    name: "Kevin Love",
-    teams: ["MIA"],
+    id: "kyle-anderson",
+    name: "Kyle Anderson",
+    teams: ["SAS","MEM","MIN","GSW","MIA","UTA","MEM"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5708,17 +6160,18 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     allDefensive: false,
     college: "UCLA",
     country: "USA",
-    decades: ["2000s","2010s","2020s"],
-    ppgCareer: 8.8,
-    rpgCareer: 6.1,
-    apgCareer: 2.1,
+    decades: ["2010s"],
+    ppgCareer: 6.8,
+    rpgCareer: 4.2,
+    apgCareer: 2.8,
     position: "SF",
-    nbaId: "201567"
+    nbaId: "203937"
   },
+
   {
-    id: "ausar-thompson",
-    name: "Ausar Thompson",
-    teams: ["DET"],
+    id: "kyle-filipowski",
+    name: "Kyle Filipowski",
+    teams: ["UTA"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5728,21 +6181,22 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Overtime Elite",
+    college: "Duke",
     country: "USA",
     decades: ["2020s"],
-    ppgCareer: 8.8,
-    rpgCareer: 6.4,
-    apgCareer: 1.9,
-    position: "SG",
-    nbaId: "1641709"
+    ppgCareer: 10.5,
+    rpgCareer: 6.7,
+    apgCareer: 2.3,
+    position: "F-C",
+    nbaId: "1642271"
   },
+
   {
-    id: "eric-gordon",
-    name: "Eric Gordon",
-    teams: ["PHX"],
-    awards: [],
-    allStar: false,
+    id: "kyle-korver",
+    name: "Kyle Korver",
+    teams: ["ATL","CLE","CHI","PHI","MIL","UTA"],
+    awards: ["All-Star"],
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
@@ -5750,19 +6204,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Indiana",
+    college: "Creighton",
     country: "USA",
-    decades: ["2000s","2010s","2020s"],
-    ppgCareer: 11.0,
-    rpgCareer: 1.8,
-    apgCareer: 2.0,
+    decades: ["2000s"],
+    ppgCareer: 9.7,
+    rpgCareer: 3,
+    apgCareer: 1.7,
     position: "SG",
-    nbaId: "201569"
+    nbaId: "2594"
   },
+
   {
-    id: "jalen-smith",
-    name: "Jalen Smith",
-    teams: ["IND"],
+    id: "kyshawn-george",
+    name: "Kyshawn George",
+    teams: ["WAS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5772,41 +6227,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Maryland",
-    country: "USA",
+    college: "Miami",
+    country: "Switzerland",
     decades: ["2020s"],
-    ppgCareer: 9.9,
-    rpgCareer: 5.5,
-    apgCareer: 1.0,
-    position: "SF",
-    nbaId: "1630188"
+    ppgCareer: 11.2,
+    rpgCareer: 4.6,
+    apgCareer: 3.3,
+    position: "PF",
+    nbaId: "1642273"
   },
+
   {
-    id: "terrence-ross",
-    name: "Terrence Ross",
-    teams: ["PHX"],
-    awards: [],
-    allStar: false,
+    id: "lamarcus-aldridge",
+    name: "LaMarcus Aldridge",
+    teams: ["POR","SAS","BKN"],
+    awards: ["All-Star"],
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
     dpoy: false,
     roy: false,
-    allNBA: false,
+    allNBA: true,
     allDefensive: false,
-    college: "Washington",
+    college: "University of Texas at Austin",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 11.0,
-    rpgCareer: 2.8,
-    apgCareer: 1.3,
-    position: "SG",
-    nbaId: "203082"
+    decades: ["2000s"],
+    ppgCareer: 19.11,
+    rpgCareer: 8.12,
+    apgCareer: 1.9,
+    position: "PF",
+    nbaId: "200746"
   },
+
   {
-    id: "d-j-augustin",
-    name: "D.J. Augustin",
-    teams: ["LAL"],
+    id: "lance-stephenson",
+    name: "Lance Stephenson",
+    teams: ["IND","CHA","LAC","MEM","NOP","MIN","LAL","ATL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5816,19 +6273,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Texas",
+    college: "Cincinnati",
     country: "USA",
-    decades: ["2000s","2010s","2020s"],
-    ppgCareer: 9.5,
-    rpgCareer: 1.8,
-    apgCareer: 3.9,
+    decades: ["2010s"],
+    ppgCareer: 8.6,
+    rpgCareer: 4.1,
+    apgCareer: 2.9,
     position: "SG",
-    nbaId: "201571"
+    nbaId: "202362"
   },
+
   {
-    id: "andrew-nembhard",
-    name: "Andrew Nembhard",
-    teams: ["IND"],
+    id: "langston-galloway",
+    name: "Langston Galloway",
+    teams: ["NYK","NOP","SAC","DET","PHX","BKN","MIL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5838,19 +6296,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Gonzaga",
-    country: "Canada",
-    decades: ["2020s"],
-    ppgCareer: 9.2,
-    rpgCareer: 2.1,
-    apgCareer: 4.1,
-    position: "SG",
-    nbaId: "1629614"
+    college: "St. Joseph's (PA)",
+    country: "USA",
+    decades: ["2010s"],
+    ppgCareer: 8.1,
+    rpgCareer: 2.4,
+    apgCareer: 1.6,
+    position: "PG",
+    nbaId: "204038"
   },
+
   {
-    id: "jahlil-okafor",
-    name: "Jahlil Okafor",
-    teams: ["IND"],
+    id: "larry-sanders",
+    name: "Larry Sanders",
+    teams: ["CLE","MIL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5860,21 +6319,22 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Duke",
+    college: "Va Commonwealth",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 10.3,
-    rpgCareer: 4.7,
-    apgCareer: 0.9,
-    position: "SF",
-    nbaId: "1626143"
+    decades: ["2010s"],
+    ppgCareer: 6.4,
+    rpgCareer: 5.7,
+    apgCareer: 0.7,
+    position: "C-F",
+    nbaId: "202336"
   },
+
   {
-    id: "tyson-chandler",
-    name: "Tyson Chandler",
-    teams: ["NYK"],
-    awards: [],
-    allStar: false,
+    id: "lauri-markkanen",
+    name: "Lauri Markkanen",
+    teams: ["CHI","CLE","UTA"],
+    awards: ["All-Star"],
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
@@ -5882,41 +6342,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Dominguez HS (CA)",
-    country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 8.2,
-    rpgCareer: 9.0,
-    apgCareer: 0.8,
-    position: "C",
-    nbaId: "2199"
+    college: "Arizona",
+    country: "Finland",
+    decades: ["2010s"],
+    ppgCareer: 18.9,
+    rpgCareer: 7.1,
+    apgCareer: 1.5,
+    position: "F-C",
+    nbaId: "1628374"
   },
+
   {
-    id: "charlie-villanueva",
-    name: "Charlie Villanueva",
-    teams: ["DET"],
-    awards: [],
+    id: "leandro-barbosa",
+    name: "Leandro Barbosa",
+    teams: ["PHX","TOR","IND","BOS","GSW"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2014"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Connecticut",
-    country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 10.4,
-    rpgCareer: 4.6,
-    apgCareer: 0.8,
-    position: "SF",
-    nbaId: "101111"
+    college: "Bauru",
+    country: "Brazil",
+    decades: ["2000s"],
+    ppgCareer: 10.6,
+    rpgCareer: 2,
+    apgCareer: 2.1,
+    position: "SG",
+    nbaId: "2571"
   },
+
   {
-    id: "andre-drummond",
-    name: "Andre Drummond",
-    teams: ["CHI"],
+    id: "lonnie-walker-iv",
+    name: "Lonnie Walker IV",
+    teams: ["SAS","LAL","BKN","PHI"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5926,19 +6388,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Connecticut",
+    college: "Miami",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 8.4,
-    rpgCareer: 9.0,
-    apgCareer: 0.5,
-    position: "C",
-    nbaId: "203083"
+    decades: ["2010s"],
+    ppgCareer: 10,
+    rpgCareer: 2.3,
+    apgCareer: 1.5,
+    position: "SG-SF",
+    nbaId: "1629022"
   },
+
   {
-    id: "jabari-walker",
-    name: "Jabari Walker",
-    teams: ["POR"],
+    id: "lonzo-ball",
+    name: "Lonzo Ball",
+    teams: ["LAL","NOP","CHI","CLE","UTA"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5948,19 +6411,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Colorado",
+    college: "UCLA",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 8.9,
-    rpgCareer: 7.1,
-    apgCareer: 1.0,
-    position: "SF",
-    nbaId: "1631133"
+    decades: ["2010s"],
+    ppgCareer: 10.6,
+    rpgCareer: 5.3,
+    apgCareer: 5.6,
+    position: "PG",
+    nbaId: "1628366"
   },
+
   {
-    id: "leandro-barbosa",
-    name: "Leandro Barbosa",
-    teams: ["PHX"],
+    id: "lou-williams",
+    name: "Lou Williams",
+    teams: ["PHI","ATL","TOR","LAL","HOU","LAC"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5970,19 +6434,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Bauru",
-    country: "Brazil",
-    decades: ["2000s","2010s"],
-    ppgCareer: 10.6,
-    rpgCareer: 2.0,
-    apgCareer: 2.1,
+    college: "South Gwinnett HS (GA)",
+    country: "USA",
+    decades: ["2000s"],
+    ppgCareer: 13.9,
+    rpgCareer: 2.2,
+    apgCareer: 3.4,
+    position: "PG",
+    nbaId: "101150"
+  },
+
+  {
+    id: "luguentz-dort",
+    name: "Luguentz Dort",
+    teams: ["OKC"],
+    awards: ["Champion"],
+    allStar: false,
+    champion: true,
+    championYears: ["2024"],
+    mvp: false,
+    dpoy: false,
+    roy: false,
+    allNBA: false,
+    allDefensive: true,
+    college: "Arizona State",
+    country: "Canada",
+    decades: ["2010s"],
+    ppgCareer: 11.6,
+    rpgCareer: 3.8,
+    apgCareer: 1.6,
     position: "SG",
-    nbaId: "2571"
+    nbaId: "1629652"
   },
+
   {
-    id: "rondae-hollis-jefferson",
-    name: "Rondae Hollis-Jefferson",
-    teams: ["BKN"],
+    id: "luis-scola",
+    name: "Luis Scola",
+    teams: ["TOR","HOU","IND","PHX","BKN"],
     awards: [],
     allStar: false,
     champion: false,
@@ -5992,19 +6480,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Arizona",
-    country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 9.0,
-    rpgCareer: 5.5,
-    apgCareer: 1.9,
-    position: "SF",
-    nbaId: "1626178"
+    college: "Tau Ceramica",
+    country: "Argentina",
+    decades: ["2000s"],
+    ppgCareer: 12,
+    rpgCareer: 6.7,
+    apgCareer: 1.6,
+    position: "PF",
+    nbaId: "2449"
   },
+
   {
-    id: "nick-young",
-    name: "Nick Young",
-    teams: ["WAS"],
+    id: "luke-kennard",
+    name: "Luke Kennard",
+    teams: ["DET","LAC","MEM","ATL","LAL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -6014,41 +6503,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Southern California",
+    college: "Duke",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 11.4,
-    rpgCareer: 2.0,
-    apgCareer: 1.0,
+    decades: ["2010s"],
+    ppgCareer: 9.6,
+    rpgCareer: 2.8,
+    apgCareer: 2.3,
     position: "SG",
-    nbaId: "201156"
+    nbaId: "1628379"
   },
+
   {
-    id: "jeremy-lamb",
-    name: "Jeremy Lamb",
-    teams: ["SAC"],
-    awards: [],
-    allStar: false,
+    id: "luol-deng",
+    name: "Luol Deng",
+    teams: ["CHI","CLE","MIA","LAL","MIN"],
+    awards: ["All-Star"],
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
-    allDefensive: false,
-    college: "Connecticut",
-    country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 10.1,
-    rpgCareer: 3.6,
-    apgCareer: 1.6,
-    position: "SG",
-    nbaId: "203087"
+    allDefensive: true,
+    college: "Duke",
+    country: "United Kingdom",
+    decades: ["2000s"],
+    ppgCareer: 14.8,
+    rpgCareer: 6.1,
+    apgCareer: 2.3,
+    position: "SF",
+    nbaId: "2736"
   },
+
   {
-    id: "walt-lemon-jr-",
-    name: "Walt Lemon Jr.",
-    teams: ["CHI"],
+    id: "malaki-branham",
+    name: "Malaki Branham",
+    teams: ["SAS","WAS","CHA","DAL","CHA","DAL","CHA","DAL","CHA","DAL","CHA"],
     awards: [],
     allStar: false,
     champion: false,
@@ -6058,19 +6549,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Bradley",
+    college: "Ohio State",
     country: "USA",
-    decades: ["2010s"],
-    ppgCareer: 9.4,
-    rpgCareer: 2.6,
-    apgCareer: 3.2,
-    position: "SG",
-    nbaId: "1627215"
+    decades: ["2020s"],
+    ppgCareer: 8,
+    rpgCareer: 2,
+    apgCareer: 1.6,
+    position: "SF",
+    nbaId: "1631103"
   },
+
   {
-    id: "jaden-mcdaniels",
-    name: "Jaden McDaniels",
-    teams: ["MIN"],
+    id: "malik-beasley",
+    name: "Malik Beasley",
+    teams: ["DEN","MIN","UTA","LAL","MIL","DET"],
     awards: [],
     allStar: false,
     champion: false,
@@ -6080,19 +6572,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Washington",
+    college: "Florida State",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 10.5,
-    rpgCareer: 3.1,
+    decades: ["2010s"],
+    ppgCareer: 11.7,
+    rpgCareer: 2.8,
     apgCareer: 1.4,
-    position: "SF",
-    nbaId: "1630183"
+    position: "SG",
+    nbaId: "1627736"
   },
+
   {
-    id: "josh-richardson",
-    name: "Josh Richardson",
-    teams: ["MIA"],
+    id: "malik-monk",
+    name: "Malik Monk",
+    teams: ["CHA","LAL","SAC"],
     awards: [],
     allStar: false,
     champion: false,
@@ -6102,19 +6595,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Tennessee",
+    college: "Kentucky",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 9.9,
-    rpgCareer: 2.8,
-    apgCareer: 2.4,
-    position: "SG",
-    nbaId: "1626196"
+    decades: ["2010s"],
+    ppgCareer: 12.3,
+    rpgCareer: 2.6,
+    apgCareer: 3.1,
+    position: "PG",
+    nbaId: "1628370"
   },
+
   {
-    id: "ace-bailey",
-    name: "Ace Bailey",
-    teams: ["UTA"],
+    id: "maozinha-pereira",
+    name: "Maozinha Pereira",
+    teams: ["MEM"],
     awards: [],
     allStar: false,
     champion: false,
@@ -6124,19 +6618,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Rutgers",
-    country: "USA",
+    college: "Corinthians (Brazil)",
+    country: "Brazil",
     decades: ["2020s"],
-    ppgCareer: 10.2,
-    rpgCareer: 3.4,
-    apgCareer: 1.6,
-    position: "SF",
-    nbaId: "1642846"
+    ppgCareer: 6.9,
+    rpgCareer: 5.3,
+    apgCareer: 0.3,
+    position: "PF",
+    nbaId: "1641970"
   },
+
   {
-    id: "dereck-lively-ii",
-    name: "Dereck Lively II",
-    teams: ["DAL"],
+    id: "marshon-brooks",
+    name: "MarShon Brooks",
+    teams: ["BKN","BOS","GSW","LAL","MEM"],
     awards: [],
     allStar: false,
     champion: false,
@@ -6146,19 +6641,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Duke",
+    college: "Providence",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 8.8,
-    rpgCareer: 6.9,
-    apgCareer: 1.1,
+    decades: ["2010s"],
+    ppgCareer: 8,
+    rpgCareer: 2.1,
+    apgCareer: 1.4,
+    position: "SG",
+    nbaId: "202705"
+  },
+
+  {
+    id: "marc-gasol",
+    name: "Marc Gasol",
+    teams: ["MEM","TOR","LAL"],
+    awards: ["Champion","All-Star","DPOY"],
+    allStar: true,
+    champion: true,
+    championYears: ["2018"],
+    mvp: false,
+    dpoy: true,
+    roy: false,
+    allNBA: true,
+    allDefensive: true,
+    college: "FC Barcelona",
+    country: "Spain",
+    decades: ["2000s"],
+    ppgCareer: 14,
+    rpgCareer: 7.41,
+    apgCareer: 3.4,
     position: "C",
-    nbaId: "1641726"
+    nbaId: "201188"
   },
+
   {
-    id: "patrick-williams",
-    name: "Patrick Williams",
-    teams: ["CHI"],
+    id: "marcin-gortat",
+    name: "Marcin Gortat",
+    teams: ["ORL","PHX","WAS","LAC"],
     awards: [],
     allStar: false,
     champion: false,
@@ -6168,19 +6687,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Florida State",
-    country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 10.0,
-    rpgCareer: 3.9,
-    apgCareer: 1.5,
-    position: "SF",
-    nbaId: "1630172"
+    college: "RheinEnergie Cologne",
+    country: "Poland",
+    decades: ["2000s"],
+    ppgCareer: 9.9,
+    rpgCareer: 7.95,
+    apgCareer: 1.1,
+    position: "C-F",
+    nbaId: "101162"
   },
+
   {
-    id: "tyler-johnson",
-    name: "Tyler Johnson",
-    teams: ["SAS"],
+    id: "marco-belinelli",
+    name: "Marco Belinelli",
+    teams: ["TOR","NOP","CHA","ATL","CHI","GSW","SAC","PHI","SAS"],
+    awards: ["Champion"],
+    allStar: false,
+    champion: true,
+    championYears: ["2013"],
+    mvp: false,
+    dpoy: false,
+    roy: false,
+    allNBA: false,
+    allDefensive: false,
+    college: "Fortitudo Bologna",
+    country: "Italy",
+    decades: ["2000s"],
+    ppgCareer: 9.7,
+    rpgCareer: 2.1,
+    apgCareer: 1.7,
+    position: "SG",
+    nbaId: "201158"
+  },
+
+  {
+    id: "marcus-bagley",
+    name: "Marcus Bagley",
+    teams: ["PHI"],
     awards: [],
     allStar: false,
     champion: false,
@@ -6190,19 +6733,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Fresno State",
+    college: "Arizona State",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 9.8,
-    rpgCareer: 3.0,
-    apgCareer: 2.3,
-    position: "SG",
-    nbaId: "204020"
+    decades: ["2020s"],
+    ppgCareer: 6.7,
+    rpgCareer: 7,
+    apgCareer: 1,
+    position: "PF-C",
+    nbaId: "1630542"
   },
+
   {
-    id: "jason-thompson",
-    name: "Jason Thompson",
-    teams: ["SAC"],
+    id: "marcus-sasser",
+    name: "Marcus Sasser",
+    teams: ["DET"],
     awards: [],
     allStar: false,
     champion: false,
@@ -6212,19 +6756,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Rider University",
+    college: "Houston",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 8.9,
-    rpgCareer: 6.6,
-    apgCareer: 1.1,
-    position: "SF",
-    nbaId: "201574"
+    decades: ["2020s"],
+    ppgCareer: 7,
+    rpgCareer: 1.4,
+    apgCareer: 2.7,
+    position: "PG",
+    nbaId: "1631204"
   },
+
   {
-    id: "spencer-hawes",
-    name: "Spencer Hawes",
-    teams: ["PHI"],
+    id: "marcus-thornton",
+    name: "Marcus Thornton",
+    teams: ["SAC"],
     awards: [],
     allStar: false,
     champion: false,
@@ -6234,23 +6779,24 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Washington",
+    college: "Louisiana State",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 8.7,
-    rpgCareer: 5.7,
-    apgCareer: 1.9,
-    position: "SF",
-    nbaId: "201150"
+    decades: ["2000s"],
+    ppgCareer: 11.9,
+    rpgCareer: 2.8,
+    apgCareer: 1.4,
+    position: "SG",
+    nbaId: "201977"
   },
+
   {
     id: "mario-chalmers",
     name: "Mario Chalmers",
-    teams: ["MIA"],
-    awards: [],
+    teams: ["MIA","MEM"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2011","2012"],
     mvp: false,
     dpoy: false,
     roy: false,
@@ -6258,17 +6804,18 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     allDefensive: false,
     college: "Kansas",
     country: "USA",
-    decades: ["2000s","2010s"],
+    decades: ["2000s"],
     ppgCareer: 8.9,
     rpgCareer: 2.5,
     apgCareer: 3.7,
-    position: "SG",
+    position: "PG",
     nbaId: "201596"
   },
+
   {
-    id: "mike-james",
-    name: "Mike James",
-    teams: ["PHX"],
+    id: "markelle-fultz",
+    name: "Markelle Fultz",
+    teams: ["PHI","ORL","SAC"],
     awards: [],
     allStar: false,
     champion: false,
@@ -6278,19 +6825,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Lamar",
+    college: "Washington",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 8.9,
-    rpgCareer: 2.5,
-    apgCareer: 3.7,
-    position: "SG",
-    nbaId: "1628455"
+    decades: ["2010s"],
+    ppgCareer: 10.2,
+    rpgCareer: 3.1,
+    apgCareer: 4.3,
+    position: "PG",
+    nbaId: "1628365"
   },
+
   {
-    id: "rodney-hood",
-    name: "Rodney Hood",
-    teams: ["LAC"],
+    id: "marquese-chriss",
+    name: "Marquese Chriss",
+    teams: ["PHX","HOU","CLE","GSW","DAL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -6300,41 +6848,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Duke",
+    college: "Washington",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 10.4,
-    rpgCareer: 2.6,
-    apgCareer: 1.6,
-    position: "SG",
-    nbaId: "203918"
+    decades: ["2010s"],
+    ppgCareer: 7.6,
+    rpgCareer: 4.7,
+    apgCareer: 1,
+    position: "PF",
+    nbaId: "1627737"
   },
+
   {
-    id: "j-j-barea",
-    name: "J.J. Barea",
-    teams: ["DAL"],
-    awards: [],
+    id: "marreese-speights",
+    name: "Marreese Speights",
+    teams: ["GSW"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2014"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Northeastern",
-    country: "Puerto Rico",
-    decades: ["2000s","2010s"],
-    ppgCareer: 8.9,
-    rpgCareer: 2.1,
-    apgCareer: 3.9,
-    position: "SG",
-    nbaId: "200826"
+    college: "Florida",
+    country: "USA",
+    decades: ["2000s"],
+    ppgCareer: 7.9,
+    rpgCareer: 4.1,
+    apgCareer: 0.7,
+    position: "C-F",
+    nbaId: "201578"
   },
+
   {
-    id: "cam-spencer",
-    name: "Cam Spencer",
-    teams: ["MEM"],
+    id: "marvin-bagley-iii",
+    name: "Marvin Bagley III",
+    teams: ["SAC","DET","WAS","MEM","DAL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -6344,19 +6894,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Connecticut",
+    college: "Duke",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 8.9,
-    rpgCareer: 2.1,
-    apgCareer: 3.9,
-    position: "SG",
-    nbaId: "1642285"
+    decades: ["2010s"],
+    ppgCareer: 11.8,
+    rpgCareer: 6.5,
+    apgCareer: 1,
+    position: "F-C",
+    nbaId: "1628963"
   },
+
   {
-    id: "keion-brooks-jr-",
-    name: "Keion Brooks Jr.",
-    teams: ["NOP"],
+    id: "marvin-williams",
+    name: "Marvin Williams",
+    teams: ["ATL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -6366,19 +6917,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Washington",
+    college: "North Carolina",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 10.1,
-    rpgCareer: 4.1,
-    apgCareer: 0.9,
-    position: "SF",
-    nbaId: "1631232"
+    decades: ["2000s"],
+    ppgCareer: 10.2,
+    rpgCareer: 5.2,
+    apgCareer: 1.3,
+    position: "PF",
+    nbaId: "101107"
   },
+
   {
-    id: "trey-burke",
-    name: "Trey Burke",
-    teams: ["DAL"],
+    id: "matas-buzelis",
+    name: "Matas Buzelis",
+    teams: ["CHI"],
     awards: [],
     allStar: false,
     champion: false,
@@ -6388,41 +6940,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Michigan",
+    college: "NBA G League Ignite",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 9.6,
-    rpgCareer: 1.8,
-    apgCareer: 3.1,
-    position: "SG",
-    nbaId: "203504"
+    decades: ["2020s"],
+    ppgCareer: 12.4,
+    rpgCareer: 4.6,
+    apgCareer: 1.5,
+    position: "PF",
+    nbaId: "1641824"
   },
+
   {
-    id: "lance-stephenson",
-    name: "Lance Stephenson",
-    teams: ["IND"],
-    awards: [],
+    id: "matt-barnes",
+    name: "Matt Barnes",
+    teams: ["LAC","SAC","NYK","PHI","GSW","PHX","ORL","LAL","MEM"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2016"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Cincinnati",
+    college: "UCLA",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 8.6,
-    rpgCareer: 4.1,
-    apgCareer: 2.9,
+    decades: ["2000s"],
+    ppgCareer: 8.2,
+    rpgCareer: 4.6,
+    apgCareer: 1.8,
     position: "SF",
-    nbaId: "202362"
+    nbaId: "2440"
   },
+
   {
-    id: "aaron-brooks",
-    name: "Aaron Brooks",
-    teams: ["HOU"],
+    id: "maxime-raynaud",
+    name: "Maxime Raynaud",
+    teams: ["SAC"],
     awards: [],
     allStar: false,
     champion: false,
@@ -6432,41 +6986,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Oregon",
-    country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 9.7,
-    rpgCareer: 1.7,
-    apgCareer: 3.0,
-    position: "SG",
-    nbaId: "201166"
+    college: "Stanford",
+    country: "France",
+    decades: ["2020s"],
+    ppgCareer: 12.5,
+    rpgCareer: 7.5,
+    apgCareer: 1.4,
+    position: "C",
+    nbaId: "1642875"
   },
+
   {
-    id: "sean-kilpatrick",
-    name: "Sean Kilpatrick",
-    teams: ["BKN"],
-    awards: [],
-    allStar: false,
-    champion: false,
-    championYears: [],
+    id: "metta-world-peace",
+    name: "Metta World Peace",
+    teams: ["LAL"],
+    awards: ["DPOY","All-Star","Champion"],
+    allStar: true,
+    champion: true,
+    championYears: ["2009"],
     mvp: false,
-    dpoy: false,
+    dpoy: true,
     roy: false,
-    allNBA: false,
-    allDefensive: false,
-    college: "Cincinnati",
+    allNBA: true,
+    allDefensive: true,
+    college: "St. John's (NY)",
     country: "USA",
-    decades: ["2010s"],
-    ppgCareer: 10.3,
-    rpgCareer: 2.7,
-    apgCareer: 1.5,
-    position: "SG",
-    nbaId: "203930"
+    decades: ["1990s"],
+    ppgCareer: 13.2,
+    rpgCareer: 4.5,
+    apgCareer: 2.7,
+    position: "PF",
+    nbaId: "1897"
   },
+
   {
-    id: "willie-cauley-stein",
-    name: "Willie Cauley-Stein",
-    teams: ["PHI"],
+    id: "michael-beasley",
+    name: "Michael Beasley",
+    teams: ["MIA","MIN","PHX","HOU","MIL","NYK","LAL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -6476,41 +7032,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Kentucky",
+    college: "Kansas State",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 8.7,
-    rpgCareer: 5.9,
-    apgCareer: 1.4,
-    position: "C",
-    nbaId: "1626161"
+    decades: ["2000s"],
+    ppgCareer: 12.4,
+    rpgCareer: 4.7,
+    apgCareer: 1.3,
+    position: "PF",
+    nbaId: "201563"
   },
+
   {
-    id: "justise-winslow",
-    name: "Justise Winslow",
-    teams: ["POR"],
-    awards: [],
+    id: "michael-carter-williams",
+    name: "Michael Carter-Williams",
+    teams: ["PHI","MIL","CHI","CHA","HOU","ORL"],
+    awards: ["ROY"],
     allStar: false,
     champion: false,
     championYears: [],
     mvp: false,
     dpoy: false,
-    roy: false,
+    roy: true,
     allNBA: false,
     allDefensive: false,
-    college: "Duke",
+    college: "Syracuse",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 8.2,
-    rpgCareer: 5.1,
-    apgCareer: 2.6,
-    position: "SG",
-    nbaId: "1626159"
+    decades: ["2010s"],
+    ppgCareer: 10.2,
+    rpgCareer: 4.3,
+    apgCareer: 4.3,
+    position: "PG",
+    nbaId: "203487"
   },
+
   {
-    id: "jared-mccain",
-    name: "Jared McCain",
-    teams: ["PHI"],
+    id: "michael-kidd-gilchrist",
+    name: "Michael Kidd-Gilchrist",
+    teams: ["CHA","DAL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -6520,63 +7078,66 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Duke",
+    college: "Kentucky",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 10.0,
-    rpgCareer: 2.3,
-    apgCareer: 2.0,
-    position: "SG",
-    nbaId: "1642272"
+    decades: ["2010s"],
+    ppgCareer: 8.4,
+    rpgCareer: 5.4,
+    apgCareer: 1.2,
+    position: "SF",
+    nbaId: "203077"
   },
+
   {
-    id: "alec-burks",
-    name: "Alec Burks",
-    teams: ["NYK"],
+    id: "mikal-bridges",
+    name: "Mikal Bridges",
+    teams: ["PHX","BKN","NYK"],
     awards: [],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2025"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
-    allDefensive: false,
-    college: "Colorado",
+    allDefensive: true,
+    college: "Villanova",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 10.4,
-    rpgCareer: 2.3,
-    apgCareer: 1.3,
-    position: "SG",
-    nbaId: "202692"
+    decades: ["2010s"],
+    ppgCareer: 14.7,
+    rpgCareer: 3.9,
+    apgCareer: 2.9,
+    position: "PF-SG",
+    nbaId: "1628969"
   },
+
   {
-    id: "walker-kessler",
-    name: "Walker Kessler",
-    teams: ["UTA"],
-    awards: [],
-    allStar: false,
+    id: "mike-conley",
+    name: "Mike Conley",
+    teams: ["MEM","UTA","MIN","CHI","CHA","CHI","CHA","CHI","CHA","CHI","CHA"],
+    awards: ["All-Star"],
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
-    allDefensive: false,
-    college: "Auburn",
+    allDefensive: true,
+    college: "Ohio State",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 8.1,
-    rpgCareer: 7.5,
-    apgCareer: 0.9,
-    position: "C",
-    nbaId: "1631117"
+    decades: ["2000s"],
+    ppgCareer: 13.6,
+    rpgCareer: 2.9,
+    apgCareer: 5.5,
+    position: "PG",
+    nbaId: "201144"
   },
+
   {
-    id: "yves-missi",
-    name: "Yves Missi",
-    teams: ["NOP"],
+    id: "mike-dunleavy",
+    name: "Mike Dunleavy",
+    teams: ["ATL","CHI","CLE","GSW","HOU","IND","MIL","PHI","SAS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -6586,19 +7147,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Baylor",
-    country: "Cameroon",
-    decades: ["2020s"],
-    ppgCareer: 7.9,
-    rpgCareer: 7.3,
-    apgCareer: 1.3,
-    position: "C",
-    nbaId: "1642274"
+    college: "Duke",
+    country: "USA",
+    decades: ["2000s"],
+    ppgCareer: 11.2,
+    rpgCareer: 4.3,
+    apgCareer: 3.93,
+    position: "PF-SG",
+    nbaId: "2399"
   },
+
   {
-    id: "kyle-korver",
-    name: "Kyle Korver",
-    teams: ["PHI"],
+    id: "mike-james",
+    name: "Mike James",
+    teams: ["PHX","NOP","BKN"],
     awards: [],
     allStar: false,
     champion: false,
@@ -6608,40 +7170,42 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Creighton",
+    college: "Duquesne",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 9.7,
-    rpgCareer: 3.0,
-    apgCareer: 1.7,
-    position: "SG",
-    nbaId: "2594"
+    decades: ["2010s"],
+    ppgCareer: 9.9,
+    rpgCareer: 2.2,
+    apgCareer: 3.5,
+    position: "PG",
+    nbaId: "1628455"
   },
+
   {
-    id: "eric-paschall",
-    name: "Eric Paschall",
-    teams: ["MIN"],
-    awards: [],
+    id: "mike-miller",
+    name: "Mike Miller",
+    teams: ["ORL","MEM","MIN","WAS","MIA","CLE","DEN"],
+    awards: ["ROY","Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2011","2012"],
     mvp: false,
     dpoy: false,
-    roy: false,
+    roy: true,
     allNBA: false,
     allDefensive: false,
-    college: "Villanova",
+    college: "Florida",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 9.8,
-    rpgCareer: 3.2,
-    apgCareer: 1.4,
+    decades: ["2000s"],
+    ppgCareer: 10.6,
+    rpgCareer: 4.2,
+    apgCareer: 2.6,
     position: "SF",
-    nbaId: "1629672"
+    nbaId: "2034"
   },
+
   {
-    id: "ryan-kalkbrenner",
-    name: "Ryan Kalkbrenner",
+    id: "miles-bridges",
+    name: "Miles Bridges",
     teams: ["CHA"],
     awards: [],
     allStar: false,
@@ -6652,147 +7216,39 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Creighton",
+    college: "Michigan State",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 8.7,
-    rpgCareer: 6.3,
-    apgCareer: 0.7,
-    position: "C",
-    nbaId: "1641750"
-  },
-  {
-    id: "ryan-nembhard",
-    name: "Ryan Nembhard",
-    teams: ["DAL"],
-    awards: [],
-    allStar: false,
-    champion: false,
-    championYears: [],
-    mvp: false,
-    dpoy: false,
-    roy: false,
-    allNBA: false,
-    allDefensive: false,
-    college: "Gonzaga",
-    country: "Canada",
-    decades: ["2020s"],
-    ppgCareer: 7.5,
-    rpgCareer: 1.9,
-    apgCareer: 5.2,
-    position: "SG",
-    nbaId: "1642948"
+    decades: ["2010s"],
+    ppgCareer: 15.9,
+    rpgCareer: 6.1,
+    apgCareer: 2.8,
+    position: "SG-SF",
+    nbaId: "1628970"
   },
+
   {
-    id: "isaac-okoro",
-    name: "Isaac Okoro",
-    teams: ["CLE"],
+    id: "miles-mcbride",
+    name: "Miles McBride",
+    teams: ["NYK"],
     awards: [],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2025"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Auburn",
+    college: "West Virginia",
     country: "USA",
     decades: ["2020s"],
-    ppgCareer: 9.4,
-    rpgCareer: 3.0,
+    ppgCareer: 7.1,
+    rpgCareer: 1.6,
     apgCareer: 1.9,
     position: "SG",
-    nbaId: "1630171"
-  },
-  {
-    id: "allonzo-trier",
-    name: "Allonzo Trier",
-    teams: ["NYK"],
-    awards: [],
-    allStar: false,
-    champion: false,
-    championYears: [],
-    mvp: false,
-    dpoy: false,
-    roy: false,
-    allNBA: false,
-    allDefensive: false,
-    college: "Arizona",
-    country: "USA",
-    decades: ["2010s"],
-    ppgCareer: 9.7,
-    rpgCareer: 2.6,
-    apgCareer: 1.7,
-    position: "SG",
-    nbaId: "1629019"
-  },
-  {
-    id: "cody-martin",
-    name: "Cody Martin",
-    teams: ["CHA"],
-    awards: [],
-    allStar: false,
-    champion: false,
-    championYears: [],
-    mvp: false,
-    dpoy: false,
-    roy: false,
-    allNBA: false,
-    allDefensive: false,
-    college: "Nevada",
-    country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 7.5,
-    rpgCareer: 3.9,
-    apgCareer: 3.7,
-    position: "SF",
-    nbaId: "1628998"
-  },
-  {
-    id: "gary-neal",
-    name: "Gary Neal",
-    teams: ["SAS"],
-    awards: [],
-    allStar: false,
-    champion: false,
-    championYears: [],
-    mvp: false,
-    dpoy: false,
-    roy: false,
-    allNBA: false,
-    allDefensive: false,
-    college: "Towson",
-    country: "USA",
-    decades: ["2010s"],
-    ppgCareer: 9.9,
-    rpgCareer: 2.2,
-    apgCareer: 1.6,
-    position: "SG",
-    nbaId: "202390"
-  },
-  {
-    id: "royce-o-neale",
-    name: "Royce O'Neale",
-    teams: ["PHX"],
-    awards: [],
-    allStar: false,
-    champion: false,
-    championYears: [],
-    mvp: false,
-    dpoy: false,
-    roy: false,
-    allNBA: false,
-    allDefensive: false,
-    college: "Baylor",
-    country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 7.7,
-    rpgCareer: 4.8,
-    apgCareer: 2.8,
-    position: "SF",
-    nbaId: "1626220"
+    nbaId: "1630540"
   },
+
   {
     id: "milos-teodosic",
     name: "Milos Teodosic",
@@ -6809,368 +7265,17 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     college: "CSKA Moscow",
     country: "Serbia",
     decades: ["2010s"],
-    ppgCareer: 8.0,
+    ppgCareer: 8,
     rpgCareer: 2.4,
-    apgCareer: 4.0,
-    position: "SG",
+    apgCareer: 4,
+    position: "PG",
     nbaId: "1628462"
   },
-  {
-    id: "courtney-lee",
-    name: "Courtney Lee",
-    teams: ["MEM"],
-    awards: [],
-    allStar: false,
-    champion: false,
-    championYears: [],
-    mvp: false,
-    dpoy: false,
-    roy: false,
-    allNBA: false,
-    allDefensive: false,
-    college: "Western Kentucky",
-    country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 9.6,
-    rpgCareer: 2.6,
-    apgCareer: 1.7,
-    position: "SG",
-    nbaId: "201584"
-  },
-  {
-    id: "dorian-finney-smith",
-    name: "Dorian Finney-Smith",
-    teams: ["BKN"],
-    awards: [],
-    allStar: false,
-    champion: false,
-    championYears: [],
-    mvp: false,
-    dpoy: false,
-    roy: false,
-    allNBA: false,
-    allDefensive: false,
-    college: "Florida",
-    country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 8.5,
-    rpgCareer: 4.7,
-    apgCareer: 1.6,
-    position: "SF",
-    nbaId: "1627827"
-  },
-  {
-    id: "marco-belinelli",
-    name: "Marco Belinelli",
-    teams: ["SAS"],
-    awards: [],
-    allStar: false,
-    champion: false,
-    championYears: [],
-    mvp: false,
-    dpoy: false,
-    roy: false,
-    allNBA: false,
-    allDefensive: false,
-    college: "Fortitudo Bologna",
-    country: "Italy",
-    decades: ["2000s","2010s"],
-    ppgCareer: 9.7,
-    rpgCareer: 2.1,
-    apgCareer: 1.7,
-    position: "SG",
-    nbaId: "201158"
-  },
-  {
-    id: "michael-kidd-gilchrist",
-    name: "Michael Kidd-Gilchrist",
-    teams: ["CHA"],
-    awards: [],
-    allStar: false,
-    champion: false,
-    championYears: [],
-    mvp: false,
-    dpoy: false,
-    roy: false,
-    allNBA: false,
-    allDefensive: false,
-    college: "Kentucky",
-    country: "USA",
-    decades: ["2010s"],
-    ppgCareer: 8.4,
-    rpgCareer: 5.4,
-    apgCareer: 1.2,
-    position: "SF",
-    nbaId: "203077"
-  },
-  {
-    id: "georges-niang",
-    name: "Georges Niang",
-    teams: ["CLE"],
-    awards: [],
-    allStar: false,
-    champion: false,
-    championYears: [],
-    mvp: false,
-    dpoy: false,
-    roy: false,
-    allNBA: false,
-    allDefensive: false,
-    college: "Iowa State",
-    country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 9.4,
-    rpgCareer: 3.4,
-    apgCareer: 1.2,
-    position: "SF",
-    nbaId: "1627777"
-  },
-  {
-    id: "beno-udrih",
-    name: "Beno Udrih",
-    teams: ["SAC"],
-    awards: [],
-    allStar: false,
-    champion: false,
-    championYears: [],
-    mvp: false,
-    dpoy: false,
-    roy: false,
-    allNBA: false,
-    allDefensive: false,
-    college: "Olimpia Milano",
-    country: "Slovenia",
-    decades: ["2000s","2010s"],
-    ppgCareer: 8.4,
-    rpgCareer: 2.1,
-    apgCareer: 3.4,
-    position: "SG",
-    nbaId: "2757"
-  },
-  {
-    id: "demarre-carroll",
-    name: "DeMarre Carroll",
-    teams: ["ATL"],
-    awards: [],
-    allStar: false,
-    champion: false,
-    championYears: [],
-    mvp: false,
-    dpoy: false,
-    roy: false,
-    allNBA: false,
-    allDefensive: false,
-    college: "Missouri",
-    country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 8.9,
-    rpgCareer: 4.2,
-    apgCareer: 1.3,
-    position: "SF",
-    nbaId: "201960"
-  },
-  {
-    id: "killian-hayes",
-    name: "Killian Hayes",
-    teams: ["CLE"],
-    awards: [],
-    allStar: false,
-    champion: false,
-    championYears: [],
-    mvp: false,
-    dpoy: false,
-    roy: false,
-    allNBA: false,
-    allDefensive: false,
-    college: "Ratiopharm Ulm",
-    country: "France",
-    decades: ["2020s"],
-    ppgCareer: 6.9,
-    rpgCareer: 2.8,
-    apgCareer: 4.9,
-    position: "SG",
-    nbaId: "1630165"
-  },
-  {
-    id: "dario-ari-",
-    name: "Dario Šarić",
-    teams: ["GSW"],
-    awards: [],
-    allStar: false,
-    champion: false,
-    championYears: [],
-    mvp: false,
-    dpoy: false,
-    roy: false,
-    allNBA: false,
-    allDefensive: false,
-    college: "Anadolu Efes",
-    country: "Croatia",
-    decades: ["2010s","2020s"],
-    ppgCareer: 8.0,
-    rpgCareer: 4.4,
-    apgCareer: 2.3,
-    position: "SF",
-    nbaId: "203967"
-  },
-  {
-    id: "frank-kaminsky",
-    name: "Frank Kaminsky",
-    teams: ["PHX"],
-    awards: [],
-    allStar: false,
-    champion: false,
-    championYears: [],
-    mvp: false,
-    dpoy: false,
-    roy: false,
-    allNBA: false,
-    allDefensive: false,
-    college: "Wisconsin",
-    country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 8.8,
-    rpgCareer: 3.8,
-    apgCareer: 1.6,
-    position: "SF",
-    nbaId: "1626163"
-  },
-  {
-    id: "precious-achiuwa",
-    name: "Precious Achiuwa",
-    teams: ["NYK"],
-    awards: [],
-    allStar: false,
-    champion: false,
-    championYears: [],
-    mvp: false,
-    dpoy: false,
-    roy: false,
-    allNBA: false,
-    allDefensive: false,
-    college: "Memphis",
-    country: "Nigeria",
-    decades: ["2020s"],
-    ppgCareer: 7.6,
-    rpgCareer: 6.6,
-    apgCareer: 1.3,
-    position: "SF",
-    nbaId: "1630173"
-  },
-  {
-    id: "matt-barnes",
-    name: "Matt Barnes",
-    teams: ["LAC"],
-    awards: [],
-    allStar: false,
-    champion: false,
-    championYears: [],
-    mvp: false,
-    dpoy: false,
-    roy: false,
-    allNBA: false,
-    allDefensive: false,
-    college: "UCLA",
-    country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 8.2,
-    rpgCareer: 4.6,
-    apgCareer: 1.8,
-    position: "SF",
-    nbaId: "2440"
-  },
-  {
-    id: "collin-murray-boyles",
-    name: "Collin Murray-Boyles",
-    teams: ["TOR"],
-    awards: [],
-    allStar: false,
-    champion: false,
-    championYears: [],
-    mvp: false,
-    dpoy: false,
-    roy: false,
-    allNBA: false,
-    allDefensive: false,
-    college: "South Carolina",
-    country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 7.8,
-    rpgCareer: 5.1,
-    apgCareer: 2.0,
-    position: "SF",
-    nbaId: "1642867"
-  },
-  {
-    id: "malaki-branham",
-    name: "Malaki Branham",
-    teams: ["SAS"],
-    awards: [],
-    allStar: false,
-    champion: false,
-    championYears: [],
-    mvp: false,
-    dpoy: false,
-    roy: false,
-    allNBA: false,
-    allDefensive: false,
-    college: "Ohio State",
-    country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 9.2,
-    rpgCareer: 2.0,
-    apgCareer: 2.1,
-    position: "SF",
-    nbaId: "1631103"
-  },
-  {
-    id: "lonnie-walker-iv",
-    name: "Lonnie Walker IV",
-    teams: ["BKN"],
-    awards: [],
-    allStar: false,
-    champion: false,
-    championYears: [],
-    mvp: false,
-    dpoy: false,
-    roy: false,
-    allNBA: false,
-    allDefensive: false,
-    college: "Miami",
-    country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 9.7,
-    rpgCareer: 2.2,
-    apgCareer: 1.3,
-    position: "SG",
-    nbaId: "1629022"
-  },
-  {
-    id: "damion-baugh",
-    name: "Damion Baugh",
-    teams: ["CHA"],
-    awards: [],
-    allStar: false,
-    champion: false,
-    championYears: [],
-    mvp: false,
-    dpoy: false,
-    roy: false,
-    allNBA: false,
-    allDefensive: false,
-    college: "TCU",
-    country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 7.3,
-    rpgCareer: 3.3,
-    apgCareer: 3.7,
-    position: "SG",
-    nbaId: "1641878"
-  },
-  {
-    id: "bilal-coulibaly",
-    name: "Bilal Coulibaly",
-    teams: ["WAS"],
+
+  {
+    id: "mirza-teletovic",
+    name: "Mirza Teletovic",
+    teams: ["BKN"],
     awards: [],
     allStar: false,
     champion: false,
@@ -7180,41 +7285,66 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Metropolitans 92",
-    country: "France",
-    decades: ["2020s"],
-    ppgCareer: 8.4,
-    rpgCareer: 4.1,
-    apgCareer: 1.7,
-    position: "SG",
-    nbaId: "1641731"
+    college: "Baskonia",
+    country: "Bosnia and Herzegovina",
+    decades: ["2010s"],
+    ppgCareer: 8.1,
+    rpgCareer: 3.2,
+    apgCareer: 0.8,
+    position: "PF",
+    nbaId: "203141"
   },
+
   {
-    id: "channing-frye",
-    name: "Channing Frye",
-    teams: ["PHX"],
+    id: "mitchell-robinson",
+    name: "Mitchell Robinson",
+    teams: ["NYK"],
     awards: [],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2025"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Arizona",
+    college: "Western Kentucky",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 8.7,
-    rpgCareer: 4.5,
-    apgCareer: 1.0,
-    position: "SF",
-    nbaId: "101112"
+    decades: ["2010s"],
+    ppgCareer: 7.5,
+    rpgCareer: 8,
+    apgCareer: 0.7,
+    position: "C",
+    nbaId: "1629011"
   },
+
   {
-    id: "terance-mann",
-    name: "Terance Mann",
-    teams: ["LAC"],
+    id: "mo-williams",
+    name: "Mo Williams",
+    teams: ["MIL"],
+    awards: ["All-Star","Champion"],
+    allStar: true,
+    champion: true,
+    championYears: ["2015"],
+    mvp: false,
+    dpoy: false,
+    roy: false,
+    allNBA: false,
+    allDefensive: false,
+    college: "Alabama",
+    country: "USA",
+    decades: ["2000s"],
+    ppgCareer: 13.2,
+    rpgCareer: 2.8,
+    apgCareer: 4.88,
+    position: "PG",
+    nbaId: "2590"
+  },
+
+  {
+    id: "monta-ellis",
+    name: "Monta Ellis",
+    teams: ["GSW","MIL","DAL","IND"],
     awards: [],
     allStar: false,
     champion: false,
@@ -7224,19 +7354,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Florida State",
+    college: "Lanier HS (MS)",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 8.8,
-    rpgCareer: 3.4,
-    apgCareer: 1.6,
+    decades: ["2000s"],
+    ppgCareer: 17.84,
+    rpgCareer: 3.5,
+    apgCareer: 4.63,
     position: "SG",
-    nbaId: "1629611"
+    nbaId: "101145"
   },
+
   {
-    id: "duop-reath",
-    name: "Duop Reath",
-    teams: ["POR"],
+    id: "montrezl-harrell",
+    name: "Montrezl Harrell",
+    teams: ["HOU","LAC","LAL","WAS","CHA","PHI"],
     awards: [],
     allStar: false,
     champion: false,
@@ -7246,19 +7377,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Louisiana State",
-    country: "South Sudan",
-    decades: ["2020s"],
-    ppgCareer: 9.1,
-    rpgCareer: 3.7,
-    apgCareer: 1.0,
-    position: "C",
-    nbaId: "1641871"
+    college: "Louisville",
+    country: "USA",
+    decades: ["2010s"],
+    ppgCareer: 12.1,
+    rpgCareer: 5,
+    apgCareer: 1.3,
+    position: "PF",
+    nbaId: "1626149"
   },
+
   {
-    id: "anderson-varejao",
-    name: "Anderson Varejao",
-    teams: ["CLE"],
+    id: "moritz-wagner",
+    name: "Moritz Wagner",
+    teams: ["LAL","WAS","BOS","ORL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -7268,41 +7400,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "FC Barcelona",
-    country: "Brazil",
-    decades: ["2000s","2010s","2020s"],
-    ppgCareer: 7.2,
-    rpgCareer: 7.2,
+    college: "Michigan",
+    country: "Germany",
+    decades: ["2010s"],
+    ppgCareer: 9,
+    rpgCareer: 3.9,
     apgCareer: 1.2,
-    position: "SF",
-    nbaId: "2760"
+    position: "F-C",
+    nbaId: "1629021"
   },
+
   {
-    id: "marcus-sasser",
-    name: "Marcus Sasser",
-    teams: ["DET"],
-    awards: [],
+    id: "moses-moody",
+    name: "Moses Moody",
+    teams: ["GSW"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2021"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Houston",
+    college: "Arkansas",
     country: "USA",
     decades: ["2020s"],
-    ppgCareer: 8.3,
-    rpgCareer: 1.8,
-    apgCareer: 3.3,
+    ppgCareer: 8,
+    rpgCareer: 2.4,
+    apgCareer: 1,
     position: "SG",
-    nbaId: "1631204"
+    nbaId: "1630541"
   },
+
   {
-    id: "jerryd-bayless",
-    name: "Jerryd Bayless",
-    teams: ["MIL"],
+    id: "myles-turner",
+    name: "Myles Turner",
+    teams: ["IND","MIL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -7312,19 +7446,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Arizona",
+    college: "Texas",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 8.4,
-    rpgCareer: 2.1,
-    apgCareer: 2.9,
-    position: "SG",
-    nbaId: "201573"
+    decades: ["2010s"],
+    ppgCareer: 13.9,
+    rpgCareer: 6.6,
+    apgCareer: 1.3,
+    position: "C-F",
+    nbaId: "1626167"
   },
+
   {
-    id: "gerald-green",
-    name: "Gerald Green",
-    teams: ["BOS"],
+    id: "naji-marshall",
+    name: "Naji Marshall",
+    teams: ["NOP","DAL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -7334,19 +7469,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "No College",
+    college: "Xavier",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 9.7,
-    rpgCareer: 2.5,
-    apgCareer: 0.9,
-    position: "SG",
-    nbaId: "101123"
+    decades: ["2020s"],
+    ppgCareer: 10.1,
+    rpgCareer: 4,
+    apgCareer: 2.5,
+    position: "PF",
+    nbaId: "1630230"
   },
+
   {
-    id: "cj-miles",
-    name: "CJ Miles",
-    teams: ["BOS"],
+    id: "nate-robinson",
+    name: "Nate Robinson",
+    teams: ["CHI","NYK","DEN","GSW","OKC","BOS","LAC","NOP"],
     awards: [],
     allStar: false,
     champion: false,
@@ -7356,19 +7492,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Skyline HS (TX)",
+    college: "Washington",
     country: "USA",
-    decades: ["2000s","2010s","2020s"],
-    ppgCareer: 9.6,
-    rpgCareer: 2.4,
-    apgCareer: 1.1,
-    position: "SG",
-    nbaId: "101139"
+    decades: ["2000s"],
+    ppgCareer: 11,
+    rpgCareer: 2.3,
+    apgCareer: 3,
+    position: "PG",
+    nbaId: "101126"
   },
+
   {
-    id: "drew-timme",
-    name: "Drew Timme",
-    teams: ["LAL"],
+    id: "naz-reid",
+    name: "Naz Reid",
+    teams: ["MIN"],
     awards: [],
     allStar: false,
     champion: false,
@@ -7378,19 +7515,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Gonzaga",
+    college: "Louisiana State",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 8.1,
-    rpgCareer: 4.4,
-    apgCareer: 1.7,
-    position: "SF",
-    nbaId: "1631166"
+    decades: ["2010s"],
+    ppgCareer: 11.9,
+    rpgCareer: 5.1,
+    apgCareer: 1.5,
+    position: "C-F",
+    nbaId: "1629675"
   },
+
   {
-    id: "brandon-bass",
-    name: "Brandon Bass",
-    teams: ["BOS"],
+    id: "nemanja-bjelica",
+    name: "Nemanja Bjelica",
+    teams: ["MIN","SAC","MIA","GSW"],
+    awards: ["Champion"],
+    allStar: false,
+    champion: true,
+    championYears: ["2021"],
+    mvp: false,
+    dpoy: false,
+    roy: false,
+    allNBA: false,
+    allDefensive: false,
+    college: "Fenerbahce",
+    country: "Serbia",
+    decades: ["2010s"],
+    ppgCareer: 7.6,
+    rpgCareer: 4.6,
+    apgCareer: 1.8,
+    position: "PF",
+    nbaId: "202357"
+  },
+
+  {
+    id: "-nene",
+    name: "Nene",
+    teams: ["DEN","HOU","WAS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -7400,19 +7561,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Louisiana State",
-    country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 8.7,
-    rpgCareer: 4.5,
-    apgCareer: 0.8,
-    position: "SF",
-    nbaId: "101138"
+    college: "Vasco de Gama",
+    country: "Brazil",
+    decades: ["2000s"],
+    ppgCareer: 11.3,
+    rpgCareer: 6,
+    apgCareer: 1.8,
+    position: "F-C",
+    nbaId: "2403"
   },
+
   {
-    id: "josh-green",
-    name: "Josh Green",
-    teams: ["DAL"],
+    id: "nerlens-noel",
+    name: "Nerlens Noel",
+    teams: ["PHI","DAL","OKC","NYK","DET","BKN"],
     awards: [],
     allStar: false,
     champion: false,
@@ -7422,19 +7584,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Arizona",
-    country: "Australia",
-    decades: ["2020s"],
-    ppgCareer: 8.2,
-    rpgCareer: 3.2,
-    apgCareer: 2.3,
-    position: "SG",
-    nbaId: "1630182"
+    college: "Kentucky",
+    country: "USA",
+    decades: ["2010s"],
+    ppgCareer: 7.1,
+    rpgCareer: 6.1,
+    apgCareer: 1.1,
+    position: "C-F",
+    nbaId: "203457"
   },
+
   {
-    id: "markelle-fultz",
-    name: "Markelle Fultz",
-    teams: ["ORL"],
+    id: "nic-claxton",
+    name: "Nic Claxton",
+    teams: ["BKN"],
     awards: [],
     allStar: false,
     champion: false,
@@ -7444,19 +7607,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Washington",
+    college: "Georgia",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 7.8,
-    rpgCareer: 3.2,
-    apgCareer: 2.8,
-    position: "SG",
-    nbaId: "1628365"
+    decades: ["2010s"],
+    ppgCareer: 10.6,
+    rpgCareer: 7.6,
+    apgCareer: 2.1,
+    position: "C",
+    nbaId: "1629651"
   },
+
   {
-    id: "sam-hauser",
-    name: "Sam Hauser",
-    teams: ["BOS"],
+    id: "nick-richards",
+    name: "Nick Richards",
+    teams: ["CHA","PHX","CHI"],
     awards: [],
     allStar: false,
     champion: false,
@@ -7466,41 +7630,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Virginia",
-    country: "USA",
+    college: "Kentucky",
+    country: "Jamaica",
     decades: ["2020s"],
-    ppgCareer: 9.0,
-    rpgCareer: 3.5,
-    apgCareer: 1.0,
-    position: "SF",
-    nbaId: "1630573"
+    ppgCareer: 7.1,
+    rpgCareer: 5.8,
+    apgCareer: 0.6,
+    position: "F-C",
+    nbaId: "1630208"
   },
+
   {
-    id: "taurean-prince",
-    name: "Taurean Prince",
-    teams: ["LAL"],
-    awards: [],
+    id: "nick-young",
+    name: "Nick Young",
+    teams: ["WAS"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2017"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Baylor",
+    college: "Southern California",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 8.9,
-    rpgCareer: 2.9,
-    apgCareer: 1.5,
-    position: "SF",
-    nbaId: "1627752"
+    decades: ["2000s"],
+    ppgCareer: 11.4,
+    rpgCareer: 2,
+    apgCareer: 1,
+    position: "SG",
+    nbaId: "201156"
   },
+
   {
-    id: "tomas-satoransky",
-    name: "Tomas Satoransky",
-    teams: ["WAS"],
+    id: "nickeil-alexander-walker",
+    name: "Nickeil Alexander-Walker",
+    teams: ["NOP","UTA","MIN","ATL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -7510,19 +7676,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "FC Barcelona",
-    country: "Czech Republic",
-    decades: ["2010s","2020s"],
-    ppgCareer: 6.9,
-    rpgCareer: 2.9,
-    apgCareer: 4.1,
-    position: "SG",
-    nbaId: "203107"
+    college: "Virginia Tech",
+    country: "Canada",
+    decades: ["2010s"],
+    ppgCareer: 10.6,
+    rpgCareer: 2.6,
+    apgCareer: 2.5,
+    position: "PG",
+    nbaId: "1629638"
   },
+
   {
-    id: "jamal-shead",
-    name: "Jamal Shead",
-    teams: ["TOR"],
+    id: "nikola-jović",
+    name: "Nikola Jović",
+    teams: ["MIA"],
     awards: [],
     allStar: false,
     champion: false,
@@ -7532,19 +7699,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Houston",
-    country: "USA",
+    college: "Mega Basket",
+    country: "Serbia",
     decades: ["2020s"],
-    ppgCareer: 7.1,
-    rpgCareer: 1.6,
-    apgCareer: 4.7,
-    position: "SG",
-    nbaId: "1642347"
+    ppgCareer: 8.3,
+    rpgCareer: 3.6,
+    apgCareer: 2.2,
+    position: "SG-SF",
+    nbaId: "1631107"
   },
+
   {
-    id: "derrick-williams",
-    name: "Derrick Williams",
-    teams: ["MIN"],
+    id: "nikola-mirotic",
+    name: "Nikola Mirotic",
+    teams: ["NOP","CHI","MIL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -7554,19 +7722,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Arizona",
-    country: "USA",
+    college: "Real Madrid",
+    country: "Montenegro",
     decades: ["2010s"],
-    ppgCareer: 8.9,
-    rpgCareer: 4.0,
-    apgCareer: 0.7,
-    position: "SF",
-    nbaId: "202682"
+    ppgCareer: 12.3,
+    rpgCareer: 5.9,
+    apgCareer: 1.3,
+    position: "PF",
+    nbaId: "202703"
   },
+
   {
-    id: "dorell-wright",
-    name: "Dorell Wright",
-    teams: ["MIA"],
+    id: "nikola-pekovic",
+    name: "Nikola Pekovic",
+    teams: ["MIN"],
     awards: [],
     allStar: false,
     champion: false,
@@ -7576,21 +7745,22 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "South Kent HS (CT)",
-    country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 8.4,
-    rpgCareer: 3.8,
-    apgCareer: 1.5,
-    position: "SG",
-    nbaId: "2748"
+    college: "Panathinaikos",
+    country: "Montenegro",
+    decades: ["2010s"],
+    ppgCareer: 12.6,
+    rpgCareer: 6.7,
+    apgCareer: 0.7,
+    position: "C",
+    nbaId: "201593"
   },
+
   {
-    id: "al-farouq-aminu",
-    name: "Al-Farouq Aminu",
-    teams: ["POR"],
-    awards: [],
-    allStar: false,
+    id: "nikola-vučević",
+    name: "Nikola Vučević",
+    teams: ["PHI","ORL","CHI","BOS"],
+    awards: ["All-Star"],
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
@@ -7598,63 +7768,66 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Wake Forest",
-    country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 7.5,
-    rpgCareer: 6.0,
-    apgCareer: 1.2,
-    position: "SF",
-    nbaId: "202329"
+    college: "Southern California",
+    country: "Montenegro",
+    decades: ["2010s"],
+    ppgCareer: 17.1,
+    rpgCareer: 10.3,
+    apgCareer: 2.9,
+    position: "C",
+    nbaId: "202696"
   },
+
   {
-    id: "udonis-haslem",
-    name: "Udonis Haslem",
-    teams: ["MIA"],
-    awards: [],
-    allStar: false,
-    champion: false,
-    championYears: [],
+    id: "norman-powell",
+    name: "Norman Powell",
+    teams: ["TOR","POR","LAC","MIA"],
+    awards: ["Champion"],
+    allStar: true,
+    champion: true,
+    championYears: ["2018"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Florida",
+    college: "UCLA",
     country: "USA",
-    decades: ["2000s","2010s","2020s"],
-    ppgCareer: 7.5,
-    rpgCareer: 6.6,
-    apgCareer: 0.8,
-    position: "SF",
-    nbaId: "2617"
+    decades: ["2010s"],
+    ppgCareer: 14,
+    rpgCareer: 2.7,
+    apgCareer: 1.6,
+    position: "SG",
+    nbaId: "1626181"
   },
+
   {
-    id: "jordan-hill",
-    name: "Jordan Hill",
-    teams: ["LAL"],
-    awards: [],
+    id: "norris-cole",
+    name: "Norris Cole",
+    teams: ["MIA","NOP","OKC"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2011","2012"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Arizona",
+    college: "Cleveland State",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 7.9,
-    rpgCareer: 5.8,
-    apgCareer: 0.8,
-    position: "SF",
-    nbaId: "201941"
+    decades: ["2010s"],
+    ppgCareer: 7,
+    rpgCareer: 2,
+    apgCareer: 2.7,
+    position: "PG",
+    nbaId: "202708"
   },
+
   {
-    id: "tyler-ulis",
-    name: "Tyler Ulis",
-    teams: ["PHX"],
+    id: "oj-mayo",
+    name: "O.J. Mayo",
+    teams: ["MEM","DAL","MIL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -7664,19 +7837,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Kentucky",
+    college: "Southern California",
     country: "USA",
-    decades: ["2010s"],
-    ppgCareer: 7.5,
-    rpgCareer: 1.7,
-    apgCareer: 4.0,
+    decades: ["2000s"],
+    ppgCareer: 13.8,
+    rpgCareer: 3.1,
+    apgCareer: 2.9,
     position: "SG",
-    nbaId: "1627755"
+    nbaId: "201564"
   },
+
   {
-    id: "danny-wolf",
-    name: "Danny Wolf",
-    teams: ["BKN"],
+    id: "obi-toppin",
+    name: "Obi Toppin",
+    teams: ["NYK","IND"],
     awards: [],
     allStar: false,
     champion: false,
@@ -7686,19 +7860,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Michigan",
+    college: "Dayton",
     country: "USA",
     decades: ["2020s"],
-    ppgCareer: 7.9,
-    rpgCareer: 4.2,
-    apgCareer: 1.8,
-    position: "SF",
-    nbaId: "1642874"
+    ppgCareer: 8.7,
+    rpgCareer: 3.5,
+    apgCareer: 1.3,
+    position: "PF",
+    nbaId: "1630167"
   },
+
   {
-    id: "allen-crabbe",
-    name: "Allen Crabbe",
-    teams: ["POR"],
+    id: "omri-casspi",
+    name: "Omri Casspi",
+    teams: ["SAC","CLE","HOU","NOP","MIN","GSW","MEM"],
     awards: [],
     allStar: false,
     champion: false,
@@ -7708,19 +7883,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "California",
-    country: "USA",
-    decades: ["2010s"],
-    ppgCareer: 9.1,
-    rpgCareer: 2.8,
+    college: "Maccabi Tel Aviv",
+    country: "Israel",
+    decades: ["2000s"],
+    ppgCareer: 7.9,
+    rpgCareer: 4,
     apgCareer: 1.1,
-    position: "SG",
-    nbaId: "203459"
+    position: "SF",
+    nbaId: "201956"
   },
+
   {
-    id: "dant-exum",
-    name: "Danté Exum",
-    teams: ["DAL"],
+    id: "onyeka-okongwu",
+    name: "Onyeka Okongwu",
+    teams: ["ATL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -7730,19 +7906,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Australian Institute of Sport",
-    country: "Australia",
-    decades: ["2010s","2020s"],
-    ppgCareer: 7.8,
-    rpgCareer: 2.7,
-    apgCareer: 2.9,
-    position: "SG",
-    nbaId: "203957"
+    college: "Southern California",
+    country: "USA",
+    decades: ["2020s"],
+    ppgCareer: 10.7,
+    rpgCareer: 6.9,
+    apgCareer: 1.6,
+    position: "C-F",
+    nbaId: "1630168"
   },
+
   {
-    id: "kyle-anderson",
-    name: "Kyle Anderson",
-    teams: ["MIN"],
+    id: "pj-washington",
+    name: "P.J. Washington",
+    teams: ["CHA","DAL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -7752,19 +7929,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "UCLA",
+    college: "Kentucky",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 6.4,
-    rpgCareer: 3.5,
-    apgCareer: 4.2,
-    position: "SG",
-    nbaId: "203937"
+    decades: ["2010s"],
+    ppgCareer: 13.3,
+    rpgCareer: 6,
+    apgCareer: 2.2,
+    position: "PF",
+    nbaId: "1629023"
   },
+
   {
-    id: "trayce-jackson-davis",
-    name: "Trayce Jackson-Davis",
-    teams: ["GSW"],
+    id: "patrick-beverley",
+    name: "Patrick Beverley",
+    teams: ["HOU","LAC","MIN","LAL","CHI","PHI","MIL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -7773,20 +7951,21 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     dpoy: false,
     roy: false,
     allNBA: false,
-    allDefensive: false,
-    college: "Indiana",
+    allDefensive: true,
+    college: "Arkansas",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 7.9,
-    rpgCareer: 5.0,
-    apgCareer: 1.2,
-    position: "SF",
-    nbaId: "1631218"
+    decades: ["2010s"],
+    ppgCareer: 8.3,
+    rpgCareer: 4.1,
+    apgCareer: 3.4,
+    position: "PG",
+    nbaId: "201976"
   },
+
   {
-    id: "nikola-jovi-",
-    name: "Nikola Jović",
-    teams: ["MIA"],
+    id: "patrick-williams",
+    name: "Patrick Williams",
+    teams: ["CHI"],
     awards: [],
     allStar: false,
     champion: false,
@@ -7796,41 +7975,66 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Mega Basket",
-    country: "Serbia",
+    college: "Florida State",
+    country: "USA",
     decades: ["2020s"],
-    ppgCareer: 7.7,
-    rpgCareer: 4.2,
-    apgCareer: 2.0,
-    position: "SF",
-    nbaId: "1631107"
+    ppgCareer: 9,
+    rpgCareer: 3.9,
+    apgCareer: 1.5,
+    position: "PF",
+    nbaId: "1630172"
   },
+
   {
-    id: "tiago-splitter",
-    name: "Tiago Splitter",
-    teams: ["SAS"],
-    awards: [],
-    allStar: false,
+    id: "pau-gasol",
+    name: "Pau Gasol",
+    teams: ["LAL"],
+    awards: ["ROY","All-Star","Champion"],
+    allStar: true,
+    champion: true,
+    championYears: ["2008","2009"],
+    mvp: false,
+    dpoy: false,
+    roy: true,
+    allNBA: true,
+    allDefensive: false,
+    college: "FC Barcelona",
+    country: "Spain",
+    decades: ["2000s"],
+    ppgCareer: 17,
+    rpgCareer: 9.2,
+    apgCareer: 3.2,
+    position: "C-F",
+    nbaId: "2200"
+  },
+
+  {
+    id: "paul-millsap",
+    name: "Paul Millsap",
+    teams: ["UTA","ATL","DEN","BKN","PHI"],
+    awards: ["All-Star"],
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
-    allDefensive: false,
-    college: "Bilbao",
-    country: "Brazil",
-    decades: ["2010s"],
-    ppgCareer: 7.9,
-    rpgCareer: 5.0,
-    apgCareer: 1.2,
-    position: "SF",
-    nbaId: "201168"
+    allDefensive: true,
+    college: "Louisiana Tech",
+    country: "USA",
+    decades: ["2000s"],
+    ppgCareer: 13.4,
+    rpgCareer: 7.1,
+    apgCareer: 2.2,
+    position: "PF",
+    nbaId: "200794"
   },
+
   {
     id: "paul-reed",
     name: "Paul Reed",
-    teams: ["PHI"],
+    teams: ["PHI","DET"],
     awards: [],
     allStar: false,
     champion: false,
@@ -7843,38 +8047,40 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     college: "DePaul",
     country: "USA",
     decades: ["2020s"],
-    ppgCareer: 7.3,
-    rpgCareer: 6.0,
-    apgCareer: 1.3,
-    position: "SF",
+    ppgCareer: 5.5,
+    rpgCareer: 4.1,
+    apgCareer: 0.9,
+    position: "C-F",
     nbaId: "1630194"
   },
+
   {
-    id: "tristan-vukcevic",
-    name: "Tristan Vukcevic",
-    teams: ["WAS"],
-    awards: [],
+    id: "payton-pritchard",
+    name: "Payton Pritchard",
+    teams: ["BOS"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2023"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Real Madrid",
-    country: "Italy",
+    college: "Oregon",
+    country: "USA",
     decades: ["2020s"],
-    ppgCareer: 8.5,
-    rpgCareer: 3.6,
-    apgCareer: 1.3,
-    position: "SF",
-    nbaId: "1641774"
+    ppgCareer: 10.6,
+    rpgCareer: 3,
+    apgCareer: 3,
+    position: "PG",
+    nbaId: "1630202"
   },
+
   {
-    id: "duane-washington-jr-",
-    name: "Duane Washington Jr.",
-    teams: ["NYK"],
+    id: "precious-achiuwa",
+    name: "Precious Achiuwa",
+    teams: ["MIA","TOR","NYK","SAC"],
     awards: [],
     allStar: false,
     champion: false,
@@ -7884,18 +8090,19 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Ohio State",
-    country: "Germany",
+    college: "Memphis",
+    country: "Nigeria",
     decades: ["2020s"],
-    ppgCareer: 9.1,
-    rpgCareer: 1.5,
-    apgCareer: 1.9,
-    position: "SG",
-    nbaId: "1630613"
+    ppgCareer: 8,
+    rpgCareer: 5.9,
+    apgCareer: 1.1,
+    position: "PF",
+    nbaId: "1630173"
   },
+
   {
-    id: "nemanja-bjelica",
-    name: "Nemanja Bjelica",
+    id: "quinten-post",
+    name: "Quinten Post",
     teams: ["GSW"],
     awards: [],
     allStar: false,
@@ -7906,19 +8113,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Fenerbahce",
-    country: "Serbia",
-    decades: ["2010s","2020s"],
-    ppgCareer: 7.6,
-    rpgCareer: 4.6,
-    apgCareer: 1.8,
-    position: "SF",
-    nbaId: "202357"
+    college: "Boston College",
+    country: "Netherlands",
+    decades: ["2020s"],
+    ppgCareer: 7.8,
+    rpgCareer: 3.8,
+    apgCareer: 1.4,
+    position: "C",
+    nbaId: "1642366"
   },
+
   {
-    id: "corey-brewer",
-    name: "Corey Brewer",
-    teams: ["MIN"],
+    id: "raiquan-gray",
+    name: "RaiQuan Gray",
+    teams: ["BKN","SAS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -7928,19 +8136,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Florida",
+    college: "Florida State",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 8.7,
-    rpgCareer: 2.8,
-    apgCareer: 1.5,
-    position: "SG",
-    nbaId: "201147"
+    decades: ["2020s"],
+    ppgCareer: 9.8,
+    rpgCareer: 4,
+    apgCareer: 3.3,
+    position: "SF",
+    nbaId: "1630564"
   },
+
   {
-    id: "jodie-meeks",
-    name: "Jodie Meeks",
-    teams: ["PHI"],
+    id: "rajon-rondo",
+    name: "Rajon Rondo",
+    teams: ["BOS","DAL","SAC","CHI","NOP","LAL","ATL","LAC","CLE"],
+    awards: ["Champion","All-Star"],
+    allStar: true,
+    champion: true,
+    championYears: ["2007","2019"],
+    mvp: false,
+    dpoy: false,
+    roy: false,
+    allNBA: true,
+    allDefensive: true,
+    college: "Kentucky",
+    country: "USA",
+    decades: ["2000s"],
+    ppgCareer: 9.8,
+    rpgCareer: 4.5,
+    apgCareer: 7.92,
+    position: "PG",
+    nbaId: "200765"
+  },
+
+  {
+    id: "ramon-sessions",
+    name: "Ramon Sessions",
+    teams: ["NYK","LAL","SAC","CLE","WAS","MIN","CHA","MIL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -7950,19 +8182,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Kentucky",
+    college: "Nevada-Reno",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 9.3,
-    rpgCareer: 2.1,
-    apgCareer: 1.1,
-    position: "SG",
-    nbaId: "201975"
+    decades: ["2000s"],
+    ppgCareer: 10.3,
+    rpgCareer: 2.7,
+    apgCareer: 4.06,
+    position: "PG",
+    nbaId: "201196"
   },
+
   {
-    id: "anthony-morrow",
-    name: "Anthony Morrow",
-    teams: ["OKC"],
+    id: "randy-foye",
+    name: "Randy Foye",
+    teams: ["UTA","DEN","MIN","OKC","BKN","WAS","LAC"],
     awards: [],
     allStar: false,
     champion: false,
@@ -7972,19 +8205,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Georgia Tech",
+    college: "Villanova",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 9.4,
+    decades: ["2000s"],
+    ppgCareer: 10.3,
     rpgCareer: 2.2,
-    apgCareer: 0.9,
+    apgCareer: 2.8,
     position: "SG",
-    nbaId: "201627"
+    nbaId: "200751"
   },
+
   {
-    id: "kent-bazemore",
-    name: "Kent Bazemore",
-    teams: ["SAC"],
+    id: "raymond-felton",
+    name: "Raymond Felton",
+    teams: ["CHA","NYK","DEN","POR","DAL","LAC","OKC"],
     awards: [],
     allStar: false,
     champion: false,
@@ -7994,19 +8228,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Old Dominion",
+    college: "North Carolina",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 8.2,
-    rpgCareer: 3.2,
-    apgCareer: 1.8,
-    position: "SG",
-    nbaId: "203145"
+    decades: ["2000s"],
+    ppgCareer: 11.2,
+    rpgCareer: 3,
+    apgCareer: 5.25,
+    position: "PG",
+    nbaId: "101109"
   },
+
   {
-    id: "jamychal-green",
-    name: "JaMychal Green",
-    teams: ["GSW"],
+    id: "reed-sheppard",
+    name: "Reed Sheppard",
+    teams: ["HOU"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8016,41 +8251,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Alabama",
+    college: "Kentucky",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 7.7,
-    rpgCareer: 5.5,
-    apgCareer: 0.9,
-    position: "SF",
-    nbaId: "203210"
+    decades: ["2020s"],
+    ppgCareer: 10,
+    rpgCareer: 2.4,
+    apgCareer: 2.6,
+    position: "SG",
+    nbaId: "1642263"
   },
+
   {
-    id: "gorgui-dieng",
-    name: "Gorgui Dieng",
-    teams: ["SAS"],
-    awards: [],
+    id: "reggie-jackson",
+    name: "Reggie Jackson",
+    teams: ["OKC","DET","LAC","DEN","PHI"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2022"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Louisville",
-    country: "Senegal",
-    decades: ["2010s","2020s"],
-    ppgCareer: 7.3,
-    rpgCareer: 5.6,
-    apgCareer: 1.3,
-    position: "C",
-    nbaId: "203476"
+    college: "Boston College",
+    country: "USA",
+    decades: ["2010s"],
+    ppgCareer: 12.3,
+    rpgCareer: 2.8,
+    apgCareer: 4.1,
+    position: "PG",
+    nbaId: "202704"
   },
+
   {
-    id: "john-henson",
-    name: "John Henson",
-    teams: ["MIL"],
+    id: "reggie-williams",
+    name: "Reggie Williams",
+    teams: ["DEN","GSW"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8060,41 +8297,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "North Carolina",
+    college: "Georgetown",
     country: "USA",
-    decades: ["2010s"],
-    ppgCareer: 7.6,
-    rpgCareer: 5.3,
-    apgCareer: 1.1,
-    position: "SF",
-    nbaId: "203089"
+    decades: ["1980s"],
+    ppgCareer: 12.5,
+    rpgCareer: 4,
+    apgCareer: 2.5,
+    position: "PF-SG",
+    nbaId: "199"
   },
+
   {
-    id: "shawn-long",
-    name: "Shawn Long",
-    teams: ["PHI"],
-    awards: [],
+    id: "richard-jefferson",
+    name: "Richard Jefferson",
+    teams: ["CLE","UTA","DAL","DEN","GSW","MIL","BKN","SAS"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2015"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Louisiana-Lafayette",
+    college: "Arizona",
     country: "USA",
-    decades: ["2010s"],
-    ppgCareer: 8.2,
-    rpgCareer: 4.7,
-    apgCareer: 0.7,
+    decades: ["2000s"],
+    ppgCareer: 12.6,
+    rpgCareer: 4,
+    apgCareer: 2,
     position: "SF",
-    nbaId: "1627848"
+    nbaId: "2210"
   },
+
   {
-    id: "austin-rivers",
-    name: "Austin Rivers",
-    teams: ["MIN"],
+    id: "ricky-rubio",
+    name: "Ricky Rubio",
+    teams: ["MIN","UTA","PHX","CLE"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8104,19 +8343,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Duke",
-    country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 8.5,
-    rpgCareer: 2.0,
-    apgCareer: 2.1,
-    position: "SG",
-    nbaId: "203085"
+    college: "FC Barcelona",
+    country: "Spain",
+    decades: ["2010s"],
+    ppgCareer: 10.8,
+    rpgCareer: 4.1,
+    apgCareer: 7.39,
+    position: "PG",
+    nbaId: "201937"
   },
+
   {
-    id: "ziaire-williams",
-    name: "Ziaire Williams",
-    teams: ["MEM"],
+    id: "robert-williams-iii",
+    name: "Robert Williams III",
+    teams: ["BOS","POR"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8125,20 +8365,21 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     dpoy: false,
     roy: false,
     allNBA: false,
-    allDefensive: false,
-    college: "Stanford",
+    allDefensive: true,
+    college: "Texas A&M",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 8.2,
-    rpgCareer: 3.5,
-    apgCareer: 1.5,
-    position: "SF",
-    nbaId: "1630533"
+    decades: ["2010s"],
+    ppgCareer: 7.1,
+    rpgCareer: 6.9,
+    apgCareer: 1.3,
+    position: "C-F",
+    nbaId: "1629057"
   },
+
   {
-    id: "vasilije-micic",
-    name: "Vasilije Micic",
-    teams: ["CHA"],
+    id: "rodney-hood",
+    name: "Rodney Hood",
+    teams: ["UTA","CLE","POR","TOR","MIL","LAC"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8148,19 +8389,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Serbia",
-    country: "Serbia",
-    decades: ["2020s"],
-    ppgCareer: 7.0,
-    rpgCareer: 1.5,
-    apgCareer: 4.4,
+    college: "Duke",
+    country: "USA",
+    decades: ["2010s"],
+    ppgCareer: 10.4,
+    rpgCareer: 2.6,
+    apgCareer: 1.6,
     position: "SG",
-    nbaId: "203995"
+    nbaId: "203918"
   },
+
   {
-    id: "day-ron-sharpe",
-    name: "Day'Ron Sharpe",
-    teams: ["BKN"],
+    id: "rodney-stuckey",
+    name: "Rodney Stuckey",
+    teams: ["DET"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8170,19 +8412,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "North Carolina",
+    college: "Eastern Washington",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 6.8,
-    rpgCareer: 6.4,
-    apgCareer: 1.4,
-    position: "C",
-    nbaId: "1630549"
+    decades: ["2000s"],
+    ppgCareer: 12.6,
+    rpgCareer: 2.9,
+    apgCareer: 3.6,
+    position: "PG",
+    nbaId: "201155"
   },
+
   {
-    id: "willy-hernangomez",
-    name: "Willy Hernangomez",
-    teams: ["NOP"],
+    id: "rondae-hollis-jefferson",
+    name: "Rondae Hollis-Jefferson",
+    teams: ["BKN","TOR","POR"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8192,41 +8435,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Cajasol Sevilla",
-    country: "Spain",
-    decades: ["2010s","2020s"],
-    ppgCareer: 7.3,
-    rpgCareer: 5.8,
-    apgCareer: 1.1,
+    college: "Arizona",
+    country: "USA",
+    decades: ["2010s"],
+    ppgCareer: 9,
+    rpgCareer: 5.5,
+    apgCareer: 1.9,
     position: "SF",
-    nbaId: "1626195"
+    nbaId: "1626178"
   },
+
   {
-    id: "jaylon-tyson",
-    name: "Jaylon Tyson",
-    teams: ["CLE"],
-    awards: [],
-    allStar: false,
+    id: "roy-hibbert",
+    name: "Roy Hibbert",
+    teams: ["IND","LAL","CHA","DEN"],
+    awards: ["All-Star"],
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
-    allDefensive: false,
-    college: "California",
+    allDefensive: true,
+    college: "Georgetown",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 8.1,
-    rpgCareer: 3.6,
-    apgCareer: 1.5,
-    position: "SG",
-    nbaId: "1642281"
+    decades: ["2000s"],
+    ppgCareer: 10,
+    rpgCareer: 6.3,
+    apgCareer: 1.3,
+    position: "C",
+    nbaId: "201579"
   },
+
   {
-    id: "derrick-jones-jr-",
-    name: "Derrick Jones Jr.",
-    teams: ["DAL"],
+    id: "royce-oneale",
+    name: "Royce O'Neale",
+    teams: ["UTA","BKN","PHX"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8236,19 +8481,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "UNLV",
+    college: "Baylor",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 8.6,
-    rpgCareer: 3.3,
-    apgCareer: 1.0,
-    position: "SF",
-    nbaId: "1627884"
+    decades: ["2010s"],
+    ppgCareer: 7.4,
+    rpgCareer: 4.8,
+    apgCareer: 2.4,
+    position: "PF",
+    nbaId: "1626220"
   },
+
   {
-    id: "walter-clayton-jr-",
-    name: "Walter Clayton Jr.",
-    teams: ["UTA"],
+    id: "rudy-gay",
+    name: "Rudy Gay",
+    teams: ["GSW"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8258,19 +8504,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Florida",
+    college: "Connecticut",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 7.3,
-    rpgCareer: 2.1,
-    apgCareer: 3.5,
-    position: "SG",
-    nbaId: "1642383"
+    decades: ["2000s"],
+    ppgCareer: 15.8,
+    rpgCareer: 5.6,
+    apgCareer: 2,
+    position: "SF",
+    nbaId: "200752"
   },
+
   {
-    id: "nerlens-noel",
-    name: "Nerlens Noel",
-    teams: ["BKN"],
+    id: "rui-hachimura",
+    name: "Rui Hachimura",
+    teams: ["WAS","LAL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8280,19 +8527,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Kentucky",
-    country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 7.1,
-    rpgCareer: 6.1,
-    apgCareer: 1.1,
-    position: "SF",
-    nbaId: "203457"
+    college: "Gonzaga",
+    country: "Japan",
+    decades: ["2010s"],
+    ppgCareer: 12.6,
+    rpgCareer: 4.6,
+    apgCareer: 1.2,
+    position: "PF",
+    nbaId: "1629060"
   },
+
   {
-    id: "marcus-bagley",
-    name: "Marcus Bagley",
-    teams: ["PHI"],
+    id: "ryan-anderson",
+    name: "Ryan Anderson",
+    teams: ["NOP","MIA","HOU","PHX","BKN","ORL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8302,19 +8550,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Arizona State",
+    college: "California",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 6.7,
-    rpgCareer: 7.0,
-    apgCareer: 1.0,
-    position: "SF",
-    nbaId: "1630542"
+    decades: ["2000s"],
+    ppgCareer: 12.3,
+    rpgCareer: 5.3,
+    apgCareer: 0.9,
+    position: "PF",
+    nbaId: "201583"
   },
+
   {
-    id: "quinten-post",
-    name: "Quinten Post",
-    teams: ["GSW"],
+    id: "ryan-kalkbrenner",
+    name: "Ryan Kalkbrenner",
+    teams: ["CHA"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8324,19 +8573,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Boston College",
-    country: "Netherlands",
+    college: "Creighton",
+    country: "USA",
     decades: ["2020s"],
-    ppgCareer: 8.0,
-    rpgCareer: 3.8,
-    apgCareer: 1.4,
+    ppgCareer: 7.6,
+    rpgCareer: 5.5,
+    apgCareer: 0.8,
     position: "C",
-    nbaId: "1642366"
+    nbaId: "1641750"
   },
+
   {
-    id: "isaiah-roby",
-    name: "Isaiah Roby",
-    teams: ["NYK"],
+    id: "ryan-nembhard",
+    name: "Ryan Nembhard",
+    teams: ["DAL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8346,19 +8596,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Nebraska",
-    country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 7.7,
-    rpgCareer: 4.4,
-    apgCareer: 1.4,
-    position: "SF",
-    nbaId: "1629676"
+    college: "Gonzaga",
+    country: "Canada",
+    decades: ["2020s"],
+    ppgCareer: 6.6,
+    rpgCareer: 2.2,
+    apgCareer: 5.3,
+    position: "PG",
+    nbaId: "1642948"
   },
+
   {
-    id: "ky-bowman",
-    name: "Ky Bowman",
-    teams: ["GSW"],
+    id: "saddiq-bey",
+    name: "Saddiq Bey",
+    teams: ["DET","ATL","NOP"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8368,63 +8619,66 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Boston College",
+    college: "Villanova",
     country: "USA",
-    decades: ["2010s"],
-    ppgCareer: 7.4,
-    rpgCareer: 2.7,
-    apgCareer: 2.9,
-    position: "SG",
-    nbaId: "1629065"
+    decades: ["2020s"],
+    ppgCareer: 14.8,
+    rpgCareer: 5.3,
+    apgCareer: 2,
+    position: "SG-SF",
+    nbaId: "1630180"
   },
+
   {
-    id: "jonathon-simmons",
-    name: "Jonathon Simmons",
-    teams: ["SAS"],
-    awards: [],
+    id: "sam-hauser",
+    name: "Sam Hauser",
+    teams: ["BOS"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2023"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Houston",
+    college: "Virginia",
     country: "USA",
-    decades: ["2010s"],
-    ppgCareer: 8.3,
-    rpgCareer: 2.4,
-    apgCareer: 1.9,
+    decades: ["2020s"],
+    ppgCareer: 7.8,
+    rpgCareer: 3.1,
+    apgCareer: 1,
     position: "SF",
-    nbaId: "203613"
+    nbaId: "1630573"
   },
+
   {
-    id: "ben-mclemore",
-    name: "Ben McLemore",
-    teams: ["POR"],
-    awards: [],
+    id: "sam-merrill",
+    name: "Sam Merrill",
+    teams: ["MIL","MEM","CLE"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2020"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Kansas",
+    college: "Utah State",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 9.0,
-    rpgCareer: 2.3,
-    apgCareer: 1.0,
+    decades: ["2020s"],
+    ppgCareer: 8,
+    rpgCareer: 2,
+    apgCareer: 1.6,
     position: "SG",
-    nbaId: "203463"
+    nbaId: "1630241"
   },
+
   {
-    id: "nickeil-alexander-walker",
-    name: "Nickeil Alexander-Walker",
-    teams: ["MIN"],
+    id: "santi-aldama",
+    name: "Santi Aldama",
+    teams: ["MEM"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8434,19 +8688,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Virginia Tech",
-    country: "Canada",
-    decades: ["2010s","2020s"],
-    ppgCareer: 8.0,
-    rpgCareer: 2.0,
-    apgCareer: 2.5,
-    position: "SG",
-    nbaId: "1629638"
+    college: "Loyola-Maryland",
+    country: "Spain",
+    decades: ["2020s"],
+    ppgCareer: 10.4,
+    rpgCareer: 5.4,
+    apgCareer: 2.1,
+    position: "F-C",
+    nbaId: "1630583"
   },
+
   {
-    id: "kj-simpson",
-    name: "KJ Simpson",
-    teams: ["CHA"],
+    id: "scoot-henderson",
+    name: "Scoot Henderson",
+    teams: ["POR"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8456,41 +8711,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Colorado",
+    college: "NBA G League Ignite",
     country: "USA",
     decades: ["2020s"],
-    ppgCareer: 7.3,
-    rpgCareer: 2.8,
-    apgCareer: 2.9,
-    position: "SG",
-    nbaId: "1642354"
+    ppgCareer: 13.5,
+    rpgCareer: 3,
+    apgCareer: 5,
+    position: "PG",
+    nbaId: "1630703"
   },
+
   {
-    id: "toumani-camara",
-    name: "Toumani Camara",
-    teams: ["POR"],
-    awards: [],
-    allStar: false,
+    id: "scottie-barnes",
+    name: "Scottie Barnes",
+    teams: ["TOR"],
+    awards: ["All-Star","ROY"],
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
     dpoy: false,
-    roy: false,
+    roy: true,
     allNBA: false,
-    allDefensive: false,
-    college: "Dayton",
-    country: "Belgium",
+    allDefensive: true,
+    college: "Florida State",
+    country: "USA",
     decades: ["2020s"],
-    ppgCareer: 7.5,
-    rpgCareer: 4.9,
-    apgCareer: 1.2,
-    position: "SF",
-    nbaId: "1641739"
+    ppgCareer: 17.4,
+    rpgCareer: 7.5,
+    apgCareer: 5.2,
+    position: "PG-SF",
+    nbaId: "1630567"
   },
+
   {
-    id: "henry-sims",
-    name: "Henry Sims",
-    teams: ["PHI"],
+    id: "scotty-pippen-jr",
+    name: "Scotty Pippen Jr.",
+    teams: ["LAL","MEM"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8500,19 +8757,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Georgetown",
+    college: "Vanderbilt",
     country: "USA",
-    decades: ["2010s"],
-    ppgCareer: 7.6,
-    rpgCareer: 5.0,
-    apgCareer: 1.0,
-    position: "SF",
-    nbaId: "203156"
+    decades: ["2020s"],
+    ppgCareer: 10.2,
+    rpgCareer: 3,
+    apgCareer: 4.3,
+    position: "PG",
+    nbaId: "1630590"
   },
+
   {
-    id: "tony-allen",
-    name: "Tony Allen",
-    teams: ["MEM"],
+    id: "sean-kilpatrick",
+    name: "Sean Kilpatrick",
+    teams: ["MIN","DEN","BKN","MIL","LAC","CHI"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8522,41 +8780,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Oklahoma State",
+    college: "Cincinnati",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 8.1,
-    rpgCareer: 3.5,
-    apgCareer: 1.3,
+    decades: ["2010s"],
+    ppgCareer: 10.3,
+    rpgCareer: 2.7,
+    apgCareer: 1.5,
     position: "SG",
-    nbaId: "2754"
+    nbaId: "203930"
   },
+
   {
-    id: "jordan-farmar",
-    name: "Jordan Farmar",
-    teams: ["LAL"],
-    awards: [],
+    id: "serge-ibaka",
+    name: "Serge Ibaka",
+    teams: ["OKC","ORL","TOR","LAC","MIL"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2018"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
-    allDefensive: false,
-    college: "UCLA",
-    country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 7.7,
-    rpgCareer: 1.9,
-    apgCareer: 2.9,
-    position: "SG",
-    nbaId: "200770"
+    allDefensive: true,
+    college: "Ricoh Manresa",
+    country: "Democratic Republic of the Congo",
+    decades: ["2000s"],
+    ppgCareer: 12,
+    rpgCareer: 7.1,
+    apgCareer: 0.8,
+    position: "PF",
+    nbaId: "201586"
   },
+
   {
     id: "shabazz-muhammad",
     name: "Shabazz Muhammad",
-    teams: ["MIN"],
+    teams: ["MIN","MIL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8569,16 +8829,17 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     college: "UCLA",
     country: "USA",
     decades: ["2010s"],
-    ppgCareer: 9.0,
+    ppgCareer: 9,
     rpgCareer: 2.8,
     apgCareer: 0.5,
     position: "SG",
     nbaId: "203498"
   },
+
   {
-    id: "dennis-smith-jr-",
-    name: "Dennis Smith Jr.",
-    teams: ["BKN"],
+    id: "shabazz-napier",
+    name: "Shabazz Napier",
+    teams: ["POR","MIN","ORL","BKN","MIA","WAS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8588,19 +8849,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "North Carolina State",
+    college: "Connecticut",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 6.6,
-    rpgCareer: 2.9,
-    apgCareer: 3.6,
-    position: "SG",
-    nbaId: "1628372"
+    decades: ["2010s"],
+    ppgCareer: 7.1,
+    rpgCareer: 1.9,
+    apgCareer: 2.5,
+    position: "PG",
+    nbaId: "203894"
   },
+
   {
-    id: "tristan-da-silva",
-    name: "Tristan da Silva",
-    teams: ["ORL"],
+    id: "shaedon-sharpe",
+    name: "Shaedon Sharpe",
+    teams: ["POR"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8610,19 +8872,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Colorado",
-    country: "Germany",
+    college: "Kentucky",
+    country: "Canada",
     decades: ["2020s"],
-    ppgCareer: 8.0,
-    rpgCareer: 3.4,
-    apgCareer: 1.4,
-    position: "SF",
-    nbaId: "1641783"
+    ppgCareer: 15.7,
+    rpgCareer: 4,
+    apgCareer: 2.2,
+    position: "PG",
+    nbaId: "1631101"
   },
+
   {
-    id: "omri-casspi",
-    name: "Omri Casspi",
-    teams: ["SAC"],
+    id: "shawn-long",
+    name: "Shawn Long",
+    teams: ["PHI"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8632,19 +8895,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Maccabi Tel Aviv",
-    country: "Israel",
-    decades: ["2000s","2010s"],
-    ppgCareer: 7.9,
-    rpgCareer: 4.0,
-    apgCareer: 1.1,
-    position: "SF",
-    nbaId: "201956"
+    college: "Louisiana-Lafayette",
+    country: "USA",
+    decades: ["2010s"],
+    ppgCareer: 8.2,
+    rpgCareer: 4.7,
+    apgCareer: 0.7,
+    position: "C-F",
+    nbaId: "1627848"
+  },
+
+  {
+    id: "shelvin-mack",
+    name: "Shelvin Mack",
+    teams: ["WAS","PHI","ATL","UTA","ORL","MEM","CHA"],
+    awards: [],
+    allStar: false,
+    champion: false,
+    championYears: [],
+    mvp: false,
+    dpoy: false,
+    roy: false,
+    allNBA: false,
+    allDefensive: false,
+    college: "Butler",
+    country: "USA",
+    decades: ["2010s"],
+    ppgCareer: 6.6,
+    rpgCareer: 2,
+    apgCareer: 3.1,
+    position: "PG",
+    nbaId: "202714"
   },
+
   {
-    id: "jordan-goodwin",
-    name: "Jordan Goodwin",
-    teams: ["MEM"],
+    id: "simone-fontecchio",
+    name: "Simone Fontecchio",
+    teams: ["UTA","DET","MIA"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8654,19 +8941,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "St. Louis",
-    country: "USA",
+    college: "Baskonia",
+    country: "Italy",
     decades: ["2020s"],
-    ppgCareer: 6.5,
-    rpgCareer: 4.4,
-    apgCareer: 2.7,
-    position: "SG",
-    nbaId: "1630692"
+    ppgCareer: 7.8,
+    rpgCareer: 2.9,
+    apgCareer: 1.2,
+    position: "PF",
+    nbaId: "1631323"
   },
+
   {
-    id: "marquese-chriss",
-    name: "Marquese Chriss",
-    teams: ["DAL"],
+    id: "skal-labissiere",
+    name: "Skal Labissiere",
+    teams: ["SAC","POR"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8676,19 +8964,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Washington",
-    country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 7.6,
-    rpgCareer: 4.7,
-    apgCareer: 1.0,
-    position: "SF",
-    nbaId: "1627737"
+    college: "Kentucky",
+    country: "Haiti",
+    decades: ["2010s"],
+    ppgCareer: 7,
+    rpgCareer: 4.3,
+    apgCareer: 1,
+    position: "PF",
+    nbaId: "1627746"
   },
+
   {
-    id: "zaza-pachulia",
-    name: "Zaza Pachulia",
-    teams: ["ATL"],
+    id: "spencer-dinwiddie",
+    name: "Spencer Dinwiddie",
+    teams: ["DET","BKN","WAS","DAL","LAL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8698,19 +8987,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Ulkerspor",
-    country: "Georgia",
-    decades: ["2000s","2010s"],
-    ppgCareer: 6.8,
-    rpgCareer: 5.8,
-    apgCareer: 1.3,
-    position: "C",
-    nbaId: "2585"
+    college: "Colorado",
+    country: "USA",
+    decades: ["2010s"],
+    ppgCareer: 13,
+    rpgCareer: 3,
+    apgCareer: 5.1,
+    position: "PG",
+    nbaId: "203915"
   },
+
   {
-    id: "reed-sheppard",
-    name: "Reed Sheppard",
-    teams: ["HOU"],
+    id: "spencer-hawes",
+    name: "Spencer Hawes",
+    teams: ["SAC","PHI","CLE","LAC","CHA","MIL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8720,41 +9010,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Kentucky",
+    college: "Washington",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 8.0,
-    rpgCareer: 2.0,
-    apgCareer: 2.2,
-    position: "SG",
-    nbaId: "1642263"
+    decades: ["2000s"],
+    ppgCareer: 8.7,
+    rpgCareer: 5.7,
+    apgCareer: 1.9,
+    position: "C-F",
+    nbaId: "201150"
   },
+
   {
-    id: "amir-johnson",
-    name: "Amir Johnson",
-    teams: ["TOR"],
-    awards: [],
+    id: "stephon-castle",
+    name: "Stephon Castle",
+    teams: ["SAS"],
+    awards: ["ROY"],
     allStar: false,
     champion: false,
     championYears: [],
     mvp: false,
     dpoy: false,
-    roy: false,
+    roy: true,
     allNBA: false,
     allDefensive: false,
-    college: "Westchester HS (CA)",
+    college: "Connecticut",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 7.0,
-    rpgCareer: 5.4,
-    apgCareer: 1.2,
-    position: "SF",
-    nbaId: "101161"
+    decades: ["2020s"],
+    ppgCareer: 15.6,
+    rpgCareer: 4.4,
+    apgCareer: 5.6,
+    position: "PG",
+    nbaId: "1642264"
   },
+
   {
     id: "steve-blake",
     name: "Steve Blake",
-    teams: ["POR"],
+    teams: ["WAS","POR","MIL","DEN","LAC","LAL","GSW","DET"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8766,17 +9058,18 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     allDefensive: false,
     college: "Maryland",
     country: "USA",
-    decades: ["2000s","2010s"],
+    decades: ["2000s"],
     ppgCareer: 6.5,
     rpgCareer: 2.1,
-    apgCareer: 4.0,
-    position: "SG",
+    apgCareer: 3.96,
+    position: "PG",
     nbaId: "2581"
   },
+
   {
-    id: "bryn-forbes",
-    name: "Bryn Forbes",
-    teams: ["MIN"],
+    id: "steven-adams",
+    name: "Steven Adams",
+    teams: ["OKC","NOP","MEM","HOU"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8786,19 +9079,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Michigan State",
-    country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 8.8,
-    rpgCareer: 1.7,
-    apgCareer: 1.2,
-    position: "SG",
-    nbaId: "1627854"
+    college: "Pittsburgh",
+    country: "New Zealand",
+    decades: ["2010s"],
+    ppgCareer: 8.7,
+    rpgCareer: 8,
+    apgCareer: 1.5,
+    position: "C",
+    nbaId: "203500"
   },
+
   {
-    id: "robert-williams-iii",
-    name: "Robert Williams III",
-    teams: ["POR"],
+    id: "tj-mcconnell",
+    name: "T.J. McConnell",
+    teams: ["PHI","IND"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8808,41 +9102,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Texas A&M",
+    college: "Arizona",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 6.8,
-    rpgCareer: 6.3,
-    apgCareer: 0.8,
-    position: "SF",
-    nbaId: "1629057"
+    decades: ["2010s"],
+    ppgCareer: 7.8,
+    rpgCareer: 2.9,
+    apgCareer: 5,
+    position: "PG",
+    nbaId: "204456"
   },
+
   {
-    id: "langston-galloway",
-    name: "Langston Galloway",
-    teams: ["IND"],
-    awards: [],
+    id: "talen-horton-tucker",
+    name: "Talen Horton-Tucker",
+    teams: ["LAL","UTA","CHI"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2019"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "St. Joseph's (PA)",
+    college: "Iowa State",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 8.1,
-    rpgCareer: 2.4,
-    apgCareer: 1.6,
-    position: "SG",
-    nbaId: "204038"
+    decades: ["2010s"],
+    ppgCareer: 9.2,
+    rpgCareer: 2.6,
+    apgCareer: 2.8,
+    position: "PG-SF",
+    nbaId: "1629659"
   },
+
   {
-    id: "trevor-booker",
-    name: "Trevor Booker",
-    teams: ["WAS"],
+    id: "tari-eason",
+    name: "Tari Eason",
+    teams: ["HOU"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8852,19 +9148,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Clemson",
+    college: "Louisiana State",
     country: "USA",
-    decades: ["2010s"],
-    ppgCareer: 6.9,
-    rpgCareer: 5.5,
-    apgCareer: 1.1,
-    position: "SF",
-    nbaId: "202344"
+    decades: ["2020s"],
+    ppgCareer: 10.4,
+    rpgCareer: 6.3,
+    apgCareer: 1.3,
+    position: "PF-C",
+    nbaId: "1631106"
   },
+
   {
-    id: "yogi-ferrell",
-    name: "Yogi Ferrell",
-    teams: ["SAC"],
+    id: "taurean-prince",
+    name: "Taurean Prince",
+    teams: ["ATL","BKN","CLE","MIN","LAL","MIL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8874,19 +9171,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Indiana",
+    college: "Baylor",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 7.7,
-    rpgCareer: 2.1,
-    apgCareer: 2.3,
-    position: "SG",
-    nbaId: "1627812"
+    decades: ["2010s"],
+    ppgCareer: 9.8,
+    rpgCareer: 3.6,
+    apgCareer: 1.7,
+    position: "SF",
+    nbaId: "1627752"
   },
+
   {
-    id: "marreese-speights",
-    name: "Marreese Speights",
-    teams: ["GSW"],
+    id: "taylor-hendricks",
+    name: "Taylor Hendricks",
+    teams: ["UTA","MEM"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8896,41 +9194,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Florida",
+    college: "Central Florida",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 7.9,
+    decades: ["2020s"],
+    ppgCareer: 7.3,
     rpgCareer: 4.1,
-    apgCareer: 0.7,
-    position: "SF",
-    nbaId: "201578"
+    apgCareer: 0.9,
+    position: "PF",
+    nbaId: "1641707"
   },
+
   {
-    id: "isaiah-canaan",
-    name: "Isaiah Canaan",
-    teams: ["PHI"],
-    awards: [],
+    id: "tayshaun-prince",
+    name: "Tayshaun Prince",
+    teams: ["BOS","MEM","DET","MIN"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2003"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
-    allDefensive: false,
-    college: "Murray State",
+    allDefensive: true,
+    college: "Kentucky",
     country: "USA",
-    decades: ["2010s"],
-    ppgCareer: 8.1,
-    rpgCareer: 1.9,
-    apgCareer: 1.9,
-    position: "SG",
-    nbaId: "203477"
+    decades: ["2000s"],
+    ppgCareer: 11.1,
+    rpgCareer: 4.3,
+    apgCareer: 2.4,
+    position: "SF",
+    nbaId: "2419"
   },
+
   {
-    id: "gradey-dick",
-    name: "Gradey Dick",
-    teams: ["TOR"],
+    id: "terance-mann",
+    name: "Terance Mann",
+    teams: ["LAC","ATL","BKN"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8940,19 +9240,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Kansas",
+    college: "Florida State",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 8.5,
-    rpgCareer: 2.2,
-    apgCareer: 1.1,
-    position: "SG",
-    nbaId: "1641711"
+    decades: ["2010s"],
+    ppgCareer: 8,
+    rpgCareer: 3.5,
+    apgCareer: 2.1,
+    position: "SG-SF",
+    nbaId: "1629611"
   },
-  {
-    id: "toney-douglas",
-    name: "Toney Douglas",
-    teams: ["NYK"],
+
+  {
+    id: "terence-davis",
+    name: "Terence Davis",
+    teams: ["TOR","SAC"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8962,19 +9263,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Florida State",
+    college: "Mississippi",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 7.6,
-    rpgCareer: 2.2,
-    apgCareer: 2.3,
+    decades: ["2010s"],
+    ppgCareer: 8,
+    rpgCareer: 2.7,
+    apgCareer: 1.3,
     position: "SG",
-    nbaId: "201962"
+    nbaId: "1629056"
   },
+
   {
-    id: "james-wiseman",
-    name: "James Wiseman",
-    teams: ["DET"],
+    id: "terrence-jones",
+    name: "Terrence Jones",
+    teams: ["HOU","NOP","MIL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -8984,19 +9286,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Memphis",
+    college: "Kentucky",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 7.1,
-    rpgCareer: 5.3,
-    apgCareer: 0.9,
-    position: "C",
-    nbaId: "1630164"
+    decades: ["2010s"],
+    ppgCareer: 10.4,
+    rpgCareer: 5.7,
+    apgCareer: 1,
+    position: "PF",
+    nbaId: "203093"
   },
+
   {
-    id: "damion-lee",
-    name: "Damion Lee",
-    teams: ["PHX"],
+    id: "terrence-ross",
+    name: "Terrence Ross",
+    teams: ["TOR","ORL","PHX"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9006,41 +9309,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Drexel",
+    college: "Washington",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 7.8,
-    rpgCareer: 3.2,
+    decades: ["2010s"],
+    ppgCareer: 11,
+    rpgCareer: 2.8,
     apgCareer: 1.3,
-    position: "SG",
-    nbaId: "1627814"
+    position: "SF",
+    nbaId: "203082"
   },
+
   {
-    id: "brice-sensabaugh",
-    name: "Brice Sensabaugh",
-    teams: ["UTA"],
-    awards: [],
+    id: "tiago-splitter",
+    name: "Tiago Splitter",
+    teams: ["SAS"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2013"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Ohio State",
-    country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 7.5,
-    rpgCareer: 3.2,
-    apgCareer: 1.7,
-    position: "SF",
-    nbaId: "1641729"
+    college: "Bilbao",
+    country: "Brazil",
+    decades: ["2010s"],
+    ppgCareer: 7.9,
+    rpgCareer: 5,
+    apgCareer: 1.2,
+    position: "F-C",
+    nbaId: "201168"
   },
+
   {
-    id: "christian-braun",
-    name: "Christian Braun",
-    teams: ["DEN"],
+    id: "tim-hardaway-jr",
+    name: "Tim Hardaway Jr.",
+    teams: ["NYK","ATL","DAL","DET","DEN"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9050,19 +9355,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Kansas",
+    college: "Michigan",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 7.3,
-    rpgCareer: 3.7,
-    apgCareer: 1.6,
-    position: "SG",
-    nbaId: "1631128"
+    decades: ["2010s"],
+    ppgCareer: 13.7,
+    rpgCareer: 2.8,
+    apgCareer: 1.8,
+    position: "SG-SF",
+    nbaId: "203501"
   },
+
   {
-    id: "raiquan-gray",
-    name: "RaiQuan Gray",
-    teams: ["SAS"],
+    id: "tolu-smith",
+    name: "Tolu Smith",
+    teams: ["DET"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9072,19 +9378,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Florida State",
+    college: "Mississippi State",
     country: "USA",
     decades: ["2020s"],
-    ppgCareer: 7.7,
-    rpgCareer: 2.3,
-    apgCareer: 2.0,
-    position: "SF",
-    nbaId: "1630564"
+    ppgCareer: 4.4,
+    rpgCareer: 3.6,
+    apgCareer: 0.8,
+    position: "PF",
+    nbaId: "1642449"
   },
+
   {
-    id: "sam-merrill",
-    name: "Sam Merrill",
-    teams: ["CLE"],
+    id: "tomas-satoransky",
+    name: "Tomas Satoransky",
+    teams: ["WAS","CHI","NOP","SAS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9094,19 +9401,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Utah State",
-    country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 8.0,
-    rpgCareer: 2.0,
-    apgCareer: 1.8,
+    college: "FC Barcelona",
+    country: "Czech Republic",
+    decades: ["2010s"],
+    ppgCareer: 6.9,
+    rpgCareer: 2.9,
+    apgCareer: 4.1,
     position: "SG",
-    nbaId: "1630241"
+    nbaId: "203107"
   },
+
   {
-    id: "terence-davis",
-    name: "Terence Davis",
-    teams: ["SAC"],
+    id: "toney-douglas",
+    name: "Toney Douglas",
+    teams: ["NYK","HOU","SAC","GSW","MIA","NOP","MEM"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9116,41 +9424,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Mississippi",
+    college: "Florida State",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 8.0,
-    rpgCareer: 2.7,
-    apgCareer: 1.3,
-    position: "SG",
-    nbaId: "1629056"
+    decades: ["2000s"],
+    ppgCareer: 7.6,
+    rpgCareer: 2.2,
+    apgCareer: 2.3,
+    position: "PG",
+    nbaId: "201962"
   },
+
   {
-    id: "trey-jemison-iii",
-    name: "Trey Jemison III",
-    teams: ["MEM"],
-    awards: [],
+    id: "tony-allen",
+    name: "Tony Allen",
+    teams: ["BOS","MEM","NOP"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2007"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
-    allDefensive: false,
-    college: "Alabama-Birmingham",
+    allDefensive: true,
+    college: "Oklahoma State",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 6.8,
-    rpgCareer: 5.4,
-    apgCareer: 1.1,
-    position: "C",
-    nbaId: "1641998"
+    decades: ["2000s"],
+    ppgCareer: 8.1,
+    rpgCareer: 3.5,
+    apgCareer: 1.3,
+    position: "SG",
+    nbaId: "2754"
   },
+
   {
-    id: "isaiah-joe",
-    name: "Isaiah Joe",
-    teams: ["OKC"],
+    id: "tony-wroten",
+    name: "Tony Wroten",
+    teams: ["PHI"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9160,19 +9470,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Arkansas",
+    college: "Washington",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 8.2,
-    rpgCareer: 2.3,
-    apgCareer: 1.3,
-    position: "SG",
-    nbaId: "1630198"
+    decades: ["2010s"],
+    ppgCareer: 11.1,
+    rpgCareer: 2.5,
+    apgCareer: 3,
+    position: "PG",
+    nbaId: "203100"
   },
+
   {
-    id: "naji-marshall",
-    name: "Naji Marshall",
-    teams: ["NOP"],
+    id: "toumani-camara",
+    name: "Toumani Camara",
+    teams: ["POR"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9181,20 +9492,21 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     dpoy: false,
     roy: false,
     allNBA: false,
-    allDefensive: false,
-    college: "Xavier",
-    country: "USA",
+    allDefensive: true,
+    college: "Dayton",
+    country: "Belgium",
     decades: ["2020s"],
-    ppgCareer: 7.1,
-    rpgCareer: 3.6,
-    apgCareer: 1.9,
-    position: "SF",
-    nbaId: "1630230"
+    ppgCareer: 10.9,
+    rpgCareer: 5.3,
+    apgCareer: 2,
+    position: "PF",
+    nbaId: "1641739"
   },
+
   {
-    id: "miles-mcbride",
-    name: "Miles McBride",
-    teams: ["NYK"],
+    id: "trayce-jackson-davis",
+    name: "Trayce Jackson-Davis",
+    teams: ["GSW","TOR"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9204,19 +9516,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "West Virginia",
+    college: "Indiana",
     country: "USA",
     decades: ["2020s"],
-    ppgCareer: 8.3,
-    rpgCareer: 1.5,
-    apgCareer: 1.7,
-    position: "SG",
-    nbaId: "1630540"
+    ppgCareer: 6.2,
+    rpgCareer: 4.4,
+    apgCareer: 1.2,
+    position: "PF",
+    nbaId: "1631218"
   },
+
   {
-    id: "chase-budinger",
-    name: "Chase Budinger",
-    teams: ["HOU"],
+    id: "tre-johnson",
+    name: "Tre Johnson",
+    teams: ["WAS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9226,19 +9539,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Arizona",
+    college: "Texas",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 7.9,
-    rpgCareer: 3.0,
-    apgCareer: 1.2,
-    position: "SF",
-    nbaId: "201978"
+    decades: ["2020s"],
+    ppgCareer: 12.2,
+    rpgCareer: 2.8,
+    apgCareer: 2,
+    position: "SG",
+    nbaId: "1642848"
   },
+
   {
-    id: "trey-lyles",
-    name: "Trey Lyles",
-    teams: ["SAC"],
+    id: "tre-jones",
+    name: "Tre Jones",
+    teams: ["SAS","CHI"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9248,19 +9562,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Kentucky",
-    country: "Canada",
-    decades: ["2010s","2020s"],
-    ppgCareer: 7.2,
-    rpgCareer: 4.4,
-    apgCareer: 1.2,
-    position: "SF",
-    nbaId: "1626168"
+    college: "Duke",
+    country: "USA",
+    decades: ["2020s"],
+    ppgCareer: 9.4,
+    rpgCareer: 2.8,
+    apgCareer: 4.8,
+    position: "PG",
+    nbaId: "1630200"
   },
+
   {
-    id: "mitchell-robinson",
-    name: "Mitchell Robinson",
-    teams: ["NYK"],
+    id: "tre-mann",
+    name: "Tre Mann",
+    teams: ["OKC","CHA"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9270,41 +9585,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Western Kentucky",
+    college: "Florida",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 5.6,
-    rpgCareer: 8.5,
-    apgCareer: 0.6,
-    position: "SF",
-    nbaId: "1629011"
+    decades: ["2020s"],
+    ppgCareer: 8.5,
+    rpgCareer: 2.6,
+    apgCareer: 2.1,
+    position: "PG",
+    nbaId: "1630544"
   },
+
   {
-    id: "mirza-teletovic",
-    name: "Mirza Teletovic",
-    teams: ["BKN"],
-    awards: [],
+    id: "trevor-ariza",
+    name: "Trevor Ariza",
+    teams: ["NYK","ORL","LAL","HOU","NOH","WAS","PHX","SAC","POR","MIA"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2008"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Baskonia",
-    country: "Bosnia and Herzegovina",
-    decades: ["2010s"],
-    ppgCareer: 8.1,
-    rpgCareer: 3.2,
-    apgCareer: 0.8,
+    college: "UCLA",
+    country: "USA",
+    decades: ["2000s"],
+    ppgCareer: 10.4,
+    rpgCareer: 4.8,
+    apgCareer: 2.1,
     position: "SF",
-    nbaId: "203141"
+    nbaId: "2772"
   },
+
   {
-    id: "moses-moody",
-    name: "Moses Moody",
-    teams: ["GSW"],
+    id: "trevor-booker",
+    name: "Trevor Booker",
+    teams: ["WAS","UTA","BKN","PHI","IND"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9314,19 +9631,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Arkansas",
+    college: "Clemson",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 8.1,
-    rpgCareer: 3.0,
-    apgCareer: 0.9,
-    position: "SG",
-    nbaId: "1630541"
+    decades: ["2010s"],
+    ppgCareer: 6.9,
+    rpgCareer: 5.5,
+    apgCareer: 1.1,
+    position: "PF",
+    nbaId: "202344"
   },
+
   {
-    id: "justin-edwards",
-    name: "Justin Edwards",
-    teams: ["PHI"],
+    id: "trey-burke",
+    name: "Trey Burke",
+    teams: ["UTA","WAS","NYK","DAL","PHI"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9336,41 +9654,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Kentucky",
+    college: "Michigan",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 7.9,
-    rpgCareer: 2.6,
-    apgCareer: 1.4,
-    position: "SF",
-    nbaId: "1642348"
+    decades: ["2010s"],
+    ppgCareer: 9.6,
+    rpgCareer: 1.8,
+    apgCareer: 3.1,
+    position: "PG",
+    nbaId: "203504"
   },
+
   {
-    id: "aaron-jackson",
-    name: "Aaron Jackson",
-    teams: ["HOU"],
+    id: "trey-jemison-iii",
+    name: "Trey Jemison III",
+    teams: ["WAS","MEM","NOP","LAL","NYK"],
     awards: [],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2025"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Duquesne",
+    college: "Alabama-Birmingham",
     country: "USA",
-    decades: ["2010s"],
-    ppgCareer: 8.0,
-    rpgCareer: 3.0,
-    apgCareer: 1.0,
-    position: "SG",
-    nbaId: "1628935"
+    decades: ["2020s"],
+    ppgCareer: 3.7,
+    rpgCareer: 3.4,
+    apgCareer: 0.6,
+    position: "C",
+    nbaId: "1641998"
   },
+
   {
-    id: "tyrese-martin",
-    name: "Tyrese Martin",
-    teams: ["BKN"],
+    id: "trey-lyles",
+    name: "Trey Lyles",
+    teams: ["UTA","DEN","SAS","DET","SAC"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9380,19 +9700,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Connecticut",
-    country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 7.4,
-    rpgCareer: 3.0,
-    apgCareer: 1.8,
-    position: "SF",
-    nbaId: "1631213"
+    college: "Kentucky",
+    country: "Canada",
+    decades: ["2010s"],
+    ppgCareer: 7.6,
+    rpgCareer: 4.3,
+    apgCareer: 1.1,
+    position: "PF",
+    nbaId: "1626168"
   },
+
   {
-    id: "e-twaun-moore",
-    name: "E'Twaun Moore",
-    teams: ["ORL"],
+    id: "trey-murphy-iii",
+    name: "Trey Murphy III",
+    teams: ["NOP"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9402,19 +9723,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Purdue",
+    college: "Virginia",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 7.9,
-    rpgCareer: 2.0,
-    apgCareer: 1.8,
-    position: "SG",
-    nbaId: "202734"
+    decades: ["2020s"],
+    ppgCareer: 15.4,
+    rpgCareer: 4.3,
+    apgCareer: 2.2,
+    position: "PF",
+    nbaId: "1630530"
   },
+
   {
-    id: "tolu-smith",
-    name: "Tolu Smith",
-    teams: ["DET"],
+    id: "tristan-vukcevic",
+    name: "Tristan Vukcevic",
+    teams: ["WAS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9424,19 +9746,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Mississippi State",
-    country: "USA",
+    college: "Real Madrid",
+    country: "Italy",
     decades: ["2020s"],
-    ppgCareer: 6.7,
-    rpgCareer: 6.0,
-    apgCareer: 0.7,
-    position: "SF",
-    nbaId: "1642449"
+    ppgCareer: 9.1,
+    rpgCareer: 3.3,
+    apgCareer: 1.1,
+    position: "F-C",
+    nbaId: "1641774"
   },
+
   {
-    id: "taylor-hendricks",
-    name: "Taylor Hendricks",
-    teams: ["UTA"],
+    id: "tristan-da-silva",
+    name: "Tristan da Silva",
+    teams: ["ORL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9446,19 +9769,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Central Florida",
-    country: "USA",
+    college: "Colorado",
+    country: "Germany",
     decades: ["2020s"],
-    ppgCareer: 7.3,
-    rpgCareer: 4.6,
-    apgCareer: 0.8,
+    ppgCareer: 8.6,
+    rpgCareer: 3.5,
+    apgCareer: 1.6,
     position: "SF",
-    nbaId: "1641707"
+    nbaId: "1641783"
   },
+
   {
-    id: "iman-shumpert",
-    name: "Iman Shumpert",
-    teams: ["NYK"],
+    id: "ty-lawson",
+    name: "Ty Lawson",
+    teams: ["HOU","SAC","DEN","IND"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9468,21 +9792,22 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Georgia Tech",
+    college: "North Carolina",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 7.2,
-    rpgCareer: 3.3,
-    apgCareer: 1.8,
-    position: "SG",
-    nbaId: "202697"
+    decades: ["2000s"],
+    ppgCareer: 12.7,
+    rpgCareer: 2.7,
+    apgCareer: 6.02,
+    position: "PG",
+    nbaId: "201951"
   },
+
   {
-    id: "isaiah-whitehead",
-    name: "Isaiah Whitehead",
-    teams: ["BKN"],
-    awards: [],
-    allStar: false,
+    id: "tyler-herro",
+    name: "Tyler Herro",
+    teams: ["MIA"],
+    awards: ["All-Star"],
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
@@ -9490,19 +9815,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Seton Hall",
+    college: "Kentucky",
     country: "USA",
     decades: ["2010s"],
-    ppgCareer: 7.2,
-    rpgCareer: 2.4,
-    apgCareer: 2.4,
-    position: "SG",
-    nbaId: "1627785"
+    ppgCareer: 19.5,
+    rpgCareer: 5,
+    apgCareer: 4.1,
+    position: "PG",
+    nbaId: "1629639"
   },
+
   {
-    id: "frank-jackson",
-    name: "Frank Jackson",
-    teams: ["PHX"],
+    id: "tyler-johnson",
+    name: "Tyler Johnson",
+    teams: ["MIA","PHX","BKN","PHI","SAS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9512,19 +9838,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Duke",
+    college: "Fresno State",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 8.5,
-    rpgCareer: 1.8,
-    apgCareer: 1.0,
+    decades: ["2010s"],
+    ppgCareer: 9.8,
+    rpgCareer: 3,
+    apgCareer: 2.3,
     position: "SG",
-    nbaId: "1628402"
+    nbaId: "204020"
   },
+
   {
-    id: "zavier-simpson",
-    name: "Zavier Simpson",
-    teams: ["DET"],
+    id: "tyler-ulis",
+    name: "Tyler Ulis",
+    teams: ["PHX"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9534,19 +9861,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Michigan",
+    college: "Kentucky",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 6.0,
-    rpgCareer: 2.9,
-    apgCareer: 3.6,
-    position: "SG",
-    nbaId: "1630285"
+    decades: ["2010s"],
+    ppgCareer: 7.5,
+    rpgCareer: 1.7,
+    apgCareer: 4,
+    position: "PG",
+    nbaId: "1627755"
   },
+
   {
-    id: "reggie-williams",
-    name: "Reggie Williams",
-    teams: ["GSW"],
+    id: "tyler-zeller",
+    name: "Tyler Zeller",
+    teams: ["BOS"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9556,63 +9884,66 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Virginia Military Institute",
+    college: "North Carolina",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 7.8,
-    rpgCareer: 2.4,
-    apgCareer: 1.5,
-    position: "SF",
-    nbaId: "202130"
+    decades: ["2010s"],
+    ppgCareer: 6.9,
+    rpgCareer: 4.4,
+    apgCareer: 0.9,
+    position: "F-C",
+    nbaId: "203092"
   },
+
   {
-    id: "marshon-brooks",
-    name: "MarShon Brooks",
-    teams: ["BKN"],
-    awards: [],
+    id: "tyreke-evans",
+    name: "Tyreke Evans",
+    teams: ["SAC","NOP","MEM","IND"],
+    awards: ["ROY"],
     allStar: false,
     champion: false,
     championYears: [],
     mvp: false,
     dpoy: false,
-    roy: false,
+    roy: true,
     allNBA: false,
     allDefensive: false,
-    college: "Providence",
+    college: "Memphis",
     country: "USA",
-    decades: ["2010s"],
-    ppgCareer: 8.0,
-    rpgCareer: 2.1,
-    apgCareer: 1.4,
+    decades: ["2000s"],
+    ppgCareer: 15.7,
+    rpgCareer: 4.6,
+    apgCareer: 4.8,
     position: "SG",
-    nbaId: "202705"
+    nbaId: "201936"
   },
+
   {
-    id: "andrew-harrison",
-    name: "Andrew Harrison",
-    teams: ["MEM"],
-    awards: [],
-    allStar: false,
+    id: "tyrese-haliburton",
+    name: "Tyrese Haliburton",
+    teams: ["SAC","IND"],
+    awards: ["All-Star"],
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
     dpoy: false,
     roy: false,
-    allNBA: false,
+    allNBA: true,
     allDefensive: false,
-    college: "Kentucky",
+    college: "Iowa State",
     country: "USA",
-    decades: ["2010s"],
-    ppgCareer: 7.0,
-    rpgCareer: 2.0,
-    apgCareer: 2.8,
-    position: "SG",
-    nbaId: "1626150"
+    decades: ["2020s"],
+    ppgCareer: 17.5,
+    rpgCareer: 3.7,
+    apgCareer: 8.8,
+    position: "PG",
+    nbaId: "1630169"
   },
+
   {
-    id: "cameron-payne",
-    name: "Cameron Payne",
-    teams: ["PHI"],
+    id: "tyrese-martin",
+    name: "Tyrese Martin",
+    teams: ["ATL","BKN"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9622,41 +9953,66 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Murray State",
+    college: "Connecticut",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 7.4,
-    rpgCareer: 1.5,
-    apgCareer: 2.6,
-    position: "SG",
-    nbaId: "1626166"
+    decades: ["2020s"],
+    ppgCareer: 6.8,
+    rpgCareer: 2.8,
+    apgCareer: 1.7,
+    position: "SF",
+    nbaId: "1631213"
   },
+
   {
-    id: "hollis-thompson",
-    name: "Hollis Thompson",
+    id: "tyrese-maxey",
+    name: "Tyrese Maxey",
     teams: ["PHI"],
-    awards: [],
-    allStar: false,
+    awards: ["All-Star"],
+    allStar: true,
     champion: false,
     championYears: [],
     mvp: false,
     dpoy: false,
     roy: false,
-    allNBA: false,
+    allNBA: true,
     allDefensive: false,
-    college: "Georgetown",
+    college: "Kentucky",
     country: "USA",
-    decades: ["2010s"],
-    ppgCareer: 7.7,
-    rpgCareer: 3.1,
-    apgCareer: 1.1,
-    position: "SG",
-    nbaId: "203138"
+    decades: ["2020s"],
+    ppgCareer: 21.1,
+    rpgCareer: 3.2,
+    apgCareer: 4.8,
+    position: "PG",
+    nbaId: "1630178"
   },
+
   {
-    id: "skal-labissiere",
-    name: "Skal Labissiere",
-    teams: ["SAC"],
+    id: "tyson-chandler",
+    name: "Tyson Chandler",
+    teams: ["NYK","DAL","NOP","CHA","CHI","PHX","LAL","HOU"],
+    awards: ["DPOY","All-Star","Champion"],
+    allStar: true,
+    champion: true,
+    championYears: ["2010"],
+    mvp: false,
+    dpoy: true,
+    roy: false,
+    allNBA: true,
+    allDefensive: true,
+    college: "Dominguez HS (CA)",
+    country: "USA",
+    decades: ["2000s"],
+    ppgCareer: 8.2,
+    rpgCareer: 9.02,
+    apgCareer: 0.8,
+    position: "C",
+    nbaId: "2199"
+  },
+
+  {
+    id: "tyus-jones",
+    name: "Tyus Jones",
+    teams: ["MIN","MEM","WAS","PHX","ORL","DAL","CHA","DAL","CHA","DAL","CHA","DAL","CHA","DAL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9666,41 +10022,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Kentucky",
-    country: "Haiti",
-    decades: ["2010s","2020s"],
-    ppgCareer: 7.1,
-    rpgCareer: 4.4,
-    apgCareer: 1.0,
-    position: "SF",
-    nbaId: "1627746"
+    college: "Duke",
+    country: "USA",
+    decades: ["2010s"],
+    ppgCareer: 7.3,
+    rpgCareer: 1.9,
+    apgCareer: 4.2,
+    position: "PG",
+    nbaId: "1626145"
   },
+
   {
-    id: "patrick-beverley",
-    name: "Patrick Beverley",
-    teams: ["MIL"],
-    awards: [],
+    id: "udonis-haslem",
+    name: "Udonis Haslem",
+    teams: ["MIA"],
+    awards: ["Champion"],
     allStar: false,
-    champion: false,
-    championYears: [],
+    champion: true,
+    championYears: ["2005","2011","2012"],
     mvp: false,
     dpoy: false,
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Arkansas",
+    college: "Florida",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 6.2,
-    rpgCareer: 3.3,
-    apgCareer: 2.9,
-    position: "SG",
-    nbaId: "201976"
+    decades: ["2000s"],
+    ppgCareer: 7.5,
+    rpgCareer: 6.6,
+    apgCareer: 0.8,
+    position: "PF",
+    nbaId: "2617"
   },
+
   {
-    id: "norris-cole",
-    name: "Norris Cole",
-    teams: ["MIA"],
+    id: "vj-edgecombe",
+    name: "VJ Edgecombe",
+    teams: ["PHI"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9710,19 +10068,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Cleveland State",
-    country: "USA",
-    decades: ["2010s"],
-    ppgCareer: 7.0,
-    rpgCareer: 2.0,
-    apgCareer: 2.7,
-    position: "SG",
-    nbaId: "202708"
+    college: "Baylor",
+    country: "Bahamas",
+    decades: ["2020s"],
+    ppgCareer: 16,
+    rpgCareer: 5.6,
+    apgCareer: 4.2,
+    position: "PG-SF",
+    nbaId: "1642845"
   },
+
   {
-    id: "jared-dudley",
-    name: "Jared Dudley",
-    teams: ["PHX"],
+    id: "vasilije-micic",
+    name: "Vasilije Micic",
+    teams: ["OKC","CHA","PHX"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9732,19 +10091,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Boston College",
-    country: "USA",
-    decades: ["2000s","2010s","2020s"],
-    ppgCareer: 7.3,
-    rpgCareer: 3.2,
-    apgCareer: 1.5,
-    position: "SF",
-    nbaId: "201162"
+    college: "Serbia",
+    country: "Serbia",
+    decades: ["2020s"],
+    ppgCareer: 6.8,
+    rpgCareer: 1.8,
+    apgCareer: 3.9,
+    position: "PG",
+    nbaId: "203995"
   },
+
   {
-    id: "donatas-motiejunas",
-    name: "Donatas Motiejunas",
-    teams: ["HOU"],
+    id: "vince-williams-jr",
+    name: "Vince Williams Jr.",
+    teams: ["MEM","UTA"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9754,19 +10114,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Lithuania",
-    country: "Lithuania",
-    decades: ["2010s"],
-    ppgCareer: 7.3,
-    rpgCareer: 3.8,
-    apgCareer: 1.1,
-    position: "SF",
-    nbaId: "202700"
+    college: "Virginia Commonwealth",
+    country: "USA",
+    decades: ["2020s"],
+    ppgCareer: 7.7,
+    rpgCareer: 4.2,
+    apgCareer: 3,
+    position: "PG",
+    nbaId: "1631246"
   },
+
   {
-    id: "c-j-watson",
-    name: "C.J. Watson",
-    teams: ["GSW"],
+    id: "walker-kessler",
+    name: "Walker Kessler",
+    teams: ["UTA"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9776,19 +10137,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Tennessee",
+    college: "Auburn",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 7.2,
-    rpgCareer: 1.9,
-    apgCareer: 2.5,
-    position: "SG",
-    nbaId: "201228"
+    decades: ["2020s"],
+    ppgCareer: 9.5,
+    rpgCareer: 9.3,
+    apgCareer: 1.2,
+    position: "C",
+    nbaId: "1631117"
   },
+
   {
-    id: "denzel-valentine",
-    name: "Denzel Valentine",
-    teams: ["UTA"],
+    id: "walt-lemon-jr",
+    name: "Walt Lemon Jr.",
+    teams: ["NOP","CHI"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9798,19 +10160,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Michigan State",
+    college: "Bradley",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 7.0,
-    rpgCareer: 3.3,
-    apgCareer: 1.8,
-    position: "SG",
-    nbaId: "1627756"
+    decades: ["2010s"],
+    ppgCareer: 9.4,
+    rpgCareer: 2.6,
+    apgCareer: 3.2,
+    position: "PG",
+    nbaId: "1627215"
   },
+
   {
-    id: "dejuan-blair",
-    name: "DeJuan Blair",
-    teams: ["SAS"],
+    id: "walter-clayton-jr",
+    name: "Walter Clayton Jr.",
+    teams: ["UTA","MEM"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9820,19 +10183,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Pittsburgh",
+    college: "Florida",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 6.8,
-    rpgCareer: 5.1,
-    apgCareer: 0.8,
-    position: "SF",
-    nbaId: "201971"
+    decades: ["2020s"],
+    ppgCareer: 7.8,
+    rpgCareer: 2,
+    apgCareer: 4,
+    position: "PG",
+    nbaId: "1642383"
   },
+
   {
-    id: "javon-freeman-liberty",
-    name: "Javon Freeman-Liberty",
-    teams: ["TOR"],
+    id: "wayne-ellington",
+    name: "Wayne Ellington",
+    teams: ["MIN","MEM","CLE","DAL","LAL","BKN","MIA","DET","NYK"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9842,19 +10206,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "DePaul",
+    college: "North Carolina",
     country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 7.0,
-    rpgCareer: 3.2,
-    apgCareer: 1.8,
+    decades: ["2000s"],
+    ppgCareer: 8,
+    rpgCareer: 2.1,
+    apgCareer: 1.1,
     position: "SG",
-    nbaId: "1631241"
+    nbaId: "201961"
   },
+
   {
-    id: "kris-humphries",
-    name: "Kris Humphries",
-    teams: ["BKN"],
+    id: "wendell-carter-jr",
+    name: "Wendell Carter Jr.",
+    teams: ["CHI","ORL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9864,19 +10229,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Minnesota",
+    college: "Duke",
     country: "USA",
-    decades: ["2000s","2010s"],
-    ppgCareer: 6.7,
-    rpgCareer: 5.4,
-    apgCareer: 0.7,
-    position: "SF",
-    nbaId: "2743"
+    decades: ["2010s"],
+    ppgCareer: 11.9,
+    rpgCareer: 8.1,
+    apgCareer: 2,
+    position: "C",
+    nbaId: "1628976"
   },
+
   {
-    id: "shelvin-mack",
-    name: "Shelvin Mack",
-    teams: ["ATL"],
+    id: "will-barton",
+    name: "Will Barton",
+    teams: ["POR","DEN","WAS","TOR"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9886,19 +10252,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Butler",
+    college: "Memphis",
     country: "USA",
     decades: ["2010s"],
-    ppgCareer: 6.6,
-    rpgCareer: 2.0,
-    apgCareer: 3.1,
+    ppgCareer: 11.2,
+    rpgCareer: 4.1,
+    apgCareer: 2.7,
     position: "SG",
-    nbaId: "202714"
+    nbaId: "203115"
   },
+
   {
-    id: "shabazz-napier",
-    name: "Shabazz Napier",
-    teams: ["POR"],
+    id: "willie-cauley-stein",
+    name: "Willie Cauley-Stein",
+    teams: ["SAC","GSW","DAL","PHI"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9908,19 +10275,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Connecticut",
+    college: "Kentucky",
     country: "USA",
     decades: ["2010s"],
-    ppgCareer: 7.1,
-    rpgCareer: 1.9,
-    apgCareer: 2.5,
-    position: "SG",
-    nbaId: "203894"
+    ppgCareer: 8.7,
+    rpgCareer: 5.9,
+    apgCareer: 1.4,
+    position: "F-C",
+    nbaId: "1626161"
   },
+
   {
-    id: "ja-kobe-walter",
-    name: "Ja'Kobe Walter",
-    teams: ["TOR"],
+    id: "willy-hernangomez",
+    name: "Willy Hernangomez",
+    teams: ["NYK","CHA","NOP"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9930,19 +10298,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Baylor",
-    country: "USA",
-    decades: ["2020s"],
-    ppgCareer: 7.6,
-    rpgCareer: 2.7,
-    apgCareer: 1.3,
-    position: "SG",
-    nbaId: "1642266"
+    college: "Cajasol Sevilla",
+    country: "Spain",
+    decades: ["2010s"],
+    ppgCareer: 7.3,
+    rpgCareer: 5.8,
+    apgCareer: 1.1,
+    position: "C",
+    nbaId: "1626195"
   },
+
   {
-    id: "damyean-dotson",
-    name: "Damyean Dotson",
-    teams: ["NYK"],
+    id: "wilson-chandler",
+    name: "Wilson Chandler",
+    teams: ["NYK","DEN","PHI","LAC","BKN"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9952,19 +10321,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Houston",
+    college: "DePaul",
     country: "USA",
-    decades: ["2010s","2020s"],
-    ppgCareer: 7.5,
-    rpgCareer: 2.5,
-    apgCareer: 1.5,
-    position: "SG",
-    nbaId: "1628422"
+    decades: ["2000s"],
+    ppgCareer: 12.5,
+    rpgCareer: 5.3,
+    apgCareer: 1.8,
+    position: "SF",
+    nbaId: "201163"
   },
+
   {
-    id: "wayne-ellington",
-    name: "Wayne Ellington",
-    teams: ["LAL"],
+    id: "yogi-ferrell",
+    name: "Yogi Ferrell",
+    teams: ["BKN","DAL","SAC","CLE","LAC"],
     awards: [],
     allStar: false,
     champion: false,
@@ -9974,18 +10344,19 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "North Carolina",
+    college: "Indiana",
     country: "USA",
-    decades: ["2000s","2010s","2020s"],
-    ppgCareer: 8.0,
+    decades: ["2010s"],
+    ppgCareer: 7.7,
     rpgCareer: 2.1,
-    apgCareer: 1.1,
-    position: "SG",
-    nbaId: "201961"
+    apgCareer: 2.3,
+    position: "PG",
+    nbaId: "1627812"
   },
+
   {
-    id: "jose-alvarado",
-    name: "Jose Alvarado",
+    id: "yves-missi",
+    name: "Yves Missi",
     teams: ["NOP"],
     awards: [],
     allStar: false,
@@ -9996,19 +10367,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Georgia Tech",
-    country: "USA",
+    college: "Baylor",
+    country: "Cameroon",
     decades: ["2020s"],
-    ppgCareer: 7.1,
-    rpgCareer: 2.3,
-    apgCareer: 2.1,
-    position: "SG",
-    nbaId: "1630631"
+    ppgCareer: 7.5,
+    rpgCareer: 7.1,
+    apgCareer: 1.3,
+    position: "C",
+    nbaId: "1642274"
   },
+
   {
-    id: "jaylen-hoard",
-    name: "Jaylen Hoard",
-    teams: ["OKC"],
+    id: "zaccharie-risacher",
+    name: "Zaccharie Risacher",
+    teams: ["ATL"],
     awards: [],
     allStar: false,
     champion: false,
@@ -10018,19 +10390,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Wake Forest",
+    college: "JL Bourg-en-Bresse",
     country: "France",
-    decades: ["2010s","2020s"],
-    ppgCareer: 6.6,
-    rpgCareer: 4.6,
+    decades: ["2020s"],
+    ppgCareer: 11.1,
+    rpgCareer: 3.7,
     apgCareer: 1.2,
     position: "SF",
-    nbaId: "1629658"
+    nbaId: "1642258"
   },
+
   {
-    id: "tyler-zeller",
-    name: "Tyler Zeller",
-    teams: ["BOS"],
+    id: "zach-collins",
+    name: "Zach Collins",
+    teams: ["POR","SAS","CHI"],
     awards: [],
     allStar: false,
     champion: false,
@@ -10040,19 +10413,20 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "North Carolina",
+    college: "Gonzaga",
     country: "USA",
     decades: ["2010s"],
-    ppgCareer: 6.9,
-    rpgCareer: 4.4,
-    apgCareer: 0.9,
-    position: "SF",
-    nbaId: "203092"
+    ppgCareer: 8,
+    rpgCareer: 4.9,
+    apgCareer: 1.8,
+    position: "C-F",
+    nbaId: "1628380"
   },
+
   {
-    id: "dyson-daniels",
-    name: "Dyson Daniels",
-    teams: ["NOP"],
+    id: "zach-edey",
+    name: "Zach Edey",
+    teams: ["MEM"],
     awards: [],
     allStar: false,
     champion: false,
@@ -10062,19 +10436,66 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "NBA G League Ignite",
-    country: "Australia",
+    college: "Purdue",
+    country: "Canada",
     decades: ["2020s"],
-    ppgCareer: 5.8,
-    rpgCareer: 3.9,
-    apgCareer: 2.7,
+    ppgCareer: 9.9,
+    rpgCareer: 8.7,
+    apgCareer: 1,
+    position: "C",
+    nbaId: "1641744"
+  },
+
+  {
+    id: "zach-lavine",
+    name: "Zach LaVine",
+    teams: ["MIN","CHI","SAC"],
+    awards: ["All-Star"],
+    allStar: true,
+    champion: false,
+    championYears: [],
+    mvp: false,
+    dpoy: false,
+    roy: false,
+    allNBA: false,
+    allDefensive: false,
+    college: "UCLA",
+    country: "USA",
+    decades: ["2010s"],
+    ppgCareer: 20.7,
+    rpgCareer: 4,
+    apgCareer: 3.9,
     position: "SG",
-    nbaId: "1630700"
+    nbaId: "203897"
   },
+
   {
-    id: "maozinha-pereira",
-    name: "Maozinha Pereira",
-    teams: ["MEM"],
+    id: "zach-randolph",
+    name: "Zach Randolph",
+    teams: ["POR","NYK","LAC","MEM","SAC"],
+    awards: ["All-Star"],
+    allStar: true,
+    champion: false,
+    championYears: [],
+    mvp: false,
+    dpoy: false,
+    roy: false,
+    allNBA: true,
+    allDefensive: false,
+    college: "Michigan State",
+    country: "USA",
+    decades: ["2000s"],
+    ppgCareer: 16.65,
+    rpgCareer: 9.15,
+    apgCareer: 1.8,
+    position: "PF",
+    nbaId: "2216"
+  },
+
+  {
+    id: "zavier-simpson",
+    name: "Zavier Simpson",
+    teams: ["DET"],
     awards: [],
     allStar: false,
     champion: false,
@@ -10084,19 +10505,43 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Corinthians (Brazil)",
-    country: "Brazil",
+    college: "Michigan",
+    country: "USA",
     decades: ["2020s"],
-    ppgCareer: 6.9,
-    rpgCareer: 5.3,
-    apgCareer: 0.3,
-    position: "SF",
-    nbaId: "1641970"
+    ppgCareer: 6,
+    rpgCareer: 2.9,
+    apgCareer: 3.6,
+    position: "PG",
+    nbaId: "1630285"
   },
+
   {
-    id: "larry-sanders",
-    name: "Larry Sanders",
-    teams: ["MIL"],
+    id: "zaza-pachulia",
+    name: "Zaza Pachulia",
+    teams: ["ORL","MIL","ATL","DAL","GSW","DET"],
+    awards: ["Champion"],
+    allStar: false,
+    champion: true,
+    championYears: ["2016","2017"],
+    mvp: false,
+    dpoy: false,
+    roy: false,
+    allNBA: false,
+    allDefensive: false,
+    college: "Ulkerspor",
+    country: "Georgia",
+    decades: ["2000s"],
+    ppgCareer: 6.8,
+    rpgCareer: 5.8,
+    apgCareer: 1.3,
+    position: "C",
+    nbaId: "2585"
+  },
+
+  {
+    id: "ziaire-williams",
+    name: "Ziaire Williams",
+    teams: ["MEM","BKN"],
     awards: [],
     allStar: false,
     champion: false,
@@ -10106,13 +10551,13 @@ export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [
     roy: false,
     allNBA: false,
     allDefensive: false,
-    college: "Va Commonwealth",
+    college: "Stanford",
     country: "USA",
-    decades: ["2010s"],
-    ppgCareer: 6.4,
-    rpgCareer: 5.7,
-    apgCareer: 0.7,
-    position: "C",
-    nbaId: "202336"
+    decades: ["2020s"],
+    ppgCareer: 8.7,
+    rpgCareer: 3,
+    apgCareer: 1.2,
+    position: "SF",
+    nbaId: "1630533"
   }
 ];
@@ -0,0 +1,92 @@
+// Decoder for lib/players.compact.json (built by scripts/build_compact_payload.py)
+import type { NBAPlayer } from './nba-data'
+
+export interface CompactPlayers {
+  version: number
+  count: number
+  digest: string // hash of the ids in order (id_digest in scripts/players_db.py)
+  dicts: {
+    teams: string[]
+    countries: string[]
+    positions: string[]
+    colleges: string[]
+    awards: string[]
+    decades: string[]
+  }
+  columns: {
+    id: string[]
+    name: string[]
+    teams: number[][]
+    franchises: number[][]
+    awards: number[][]
+    championYears: number[][]
+    decades: number[]
+    college: number[]
+    country: number[]
+    position: number[]
+    ppgCareer: number[]
+    rpgCareer: number[]
+    apgCareer: number[]
+    nbaId: number[]
+    draftYear: number[] // -1 when unknown, like draftRound and draftPick
+    draftRound: number[]
+    draftPick: number[]
+    flags: number[]
+  }
+}
+
+// Bit i of `flags` is set when the field is true; keep in sync with the Python builder
+const FLAG_FIELDS = ["allStar", "champion", "mvp", "dpoy", "roy", "allNBA", "allDefensive", "active"] as const
+const NO_PHOTO_BIT = 1 << FLAG_FIELDS.length
+// Set when the record has no `active` at all, so it stays undefined rather than false
+const NO_ACTIVE_BIT = NO_PHOTO_BIT << 1
+
+export function decodeCompactPlayers(payload: CompactPlayers): {
+  players: NBAPlayer[]
+  franchises: Map<string, Set<string>> // player id -> modern franchise codes
+} {
+  const { dicts, columns: c } = payload
+  const players: NBAPlayer[] = new Array(payload.count)
+  const franchises = new Map<string, Set<string>>()
+
+  for (let i = 0; i < payload.count; i++) {
+    const flags = c.flags[i]
+    const decades: string[] = []
+    for (let d = 0; d < dicts.decades.length; d++) {
+      if (c.decades[i] & (1 << d)) decades.push(dicts.decades[d])
+    }
+
+    const player: NBAPlayer = {
+      id: c.id[i],
+      name: c.name[i],
+      teams: c.teams[i].map(t => dicts.teams[t]),
+      awards: c.awards[i].map(a => dicts.awards[a]),
+      allStar: (flags & 1) !== 0,
+      champion: (flags & 2) !== 0,
+      championYears: c.championYears[i].map(String),
+      mvp: (flags & 4) !== 0,
+      dpoy: (flags & 8) !== 0,
+      roy: (flags & 16) !== 0,
+      allNBA: (flags & 32) !== 0,
+      allDefensive: (flags & 64) !== 0,
+      college: dicts.colleges[c.college[i]],
+      country: dicts.countries[c.country[i]],
+      decades,
+      ppgCareer: c.ppgCareer[i],
+      rpgCareer: c.rpgCareer[i],
+      apgCareer: c.apgCareer[i],
+      position: dicts.positions[c.position[i]],
+    }
+    if (!(flags & NO_ACTIVE_BIT)) player.active = (flags & 128) !== 0
+    if (c.nbaId[i]) player.nbaId = String(c.nbaId[i])
+    if (c.draftYear[i] >= 0) player.draftYear = c.draftYear[i]
+    if (c.draftRound[i] >= 0) player.draftRound = c.draftRound[i]
+    if (c.draftPick[i] >= 0) player.draftPick = c.draftPick[i]
+    if (flags & NO_PHOTO_BIT) player.hasPhoto = false
+
+    players[i] = player
+    franchises.set(player.id, new Set(c.franchises[i].map(t => dicts.teams[t])))
+  }
+
+  return { players, franchises }
+}
@@ -21,6 +21,11 @@ export interface NBAPlayer {
   position: string
   nbaId?: string // Added for headshots
   active?: boolean
+  hasPhoto?: boolean // Set by scripts/probe_headshots.py, false when the CDN has no image
+  // Set by scripts/ingest_draft.py; round and pick are 0 for territorial picks and undrafted players
+  draftYear?: number
+  draftRound?: number
+  draftPick?: number
 }
 
 // Helper to map historical/legacy teams to modern franchises
@@ -92,27 +97,52 @@ export function getTeamLogoUrl(abbreviation: string): string {
 
 
 export function getPlayerPhotoUrl(player: NBAPlayer): string | null {
-  if (player.nbaId) {
+  if (player.nbaId && player.hasPhoto !== false) {
     return `https://cdn.nba.com/headshots/nba/latest/1040x760/${player.nbaId}.png`
   }
   return null
 }
 
-import importedPlayers from './players.json'
+import compactPlayers from './players.compact.json'
+import { decodeCompactPlayers, type CompactPlayers } from './compact-players'
+import { foldName, searchPlayerPositions, SEARCH_INDEX_DIGEST } from './player-search'
+import { guessCloseness, guessRank, NEIGHBOR_INDEX_DIGEST } from './player-similarity'
 
-export const ALL_NBA_PLAYERS = importedPlayers as unknown as NBAPlayer[];
+// Columnar payload built by scripts/build_compact_payload.py (several times smaller than players.json)
+const compactPayload = compactPlayers as unknown as CompactPlayers;
+const decodedPlayers = decodeCompactPlayers(compactPayload);
+
+export const ALL_NBA_PLAYERS: NBAPlayer[] = decodedPlayers.players;
+
+// Precomputed modern franchise codes per player id, so team checks skip getModernTeam
+const PLAYER_FRANCHISES = decodedPlayers.franchises;
 
 // Optimization: Create Maps for O(1) access
 export const PLAYER_MAP = new Map<string, NBAPlayer>();
 export const PLAYER_NAME_MAP = new Map<string, NBAPlayer>();
+// Lowercase name -> first player with that name, for typed-in names
+const PLAYER_LOWER_NAME_MAP = new Map<string, NBAPlayer>();
+// Player id -> position in ALL_NBA_PLAYERS (how the precomputed indexes refer to players)
+const PLAYER_POSITION_MAP = new Map<string, number>();
 
-ALL_NBA_PLAYERS.forEach(p => {
+ALL_NBA_PLAYERS.forEach((p, position) => {
   PLAYER_MAP.set(p.id, p);
+  PLAYER_POSITION_MAP.set(p.id, position);
   PLAYER_NAME_MAP.set(p.name, p);
-  // Also map lowercase name for case-insensitive lookup if needed, 
-  // but strictly we usually use exact name or ID.
-  // We can add a normalized map if needed for search.
+  const lowerName = p.name.toLowerCase();
+  if (!PLAYER_LOWER_NAME_MAP.has(lowerName)) PLAYER_LOWER_NAME_MAP.set(lowerName, p);
 });
+
+// The search index and the neighbour table refer to players by position, so they are only used
+// when they were built from the same id list as the compact payload; otherwise the lookups fall back
+const SEARCH_INDEX_CURRENT = SEARCH_INDEX_DIGEST === compactPayload.digest;
+const NEIGHBOR_INDEX_CURRENT = NEIGHBOR_INDEX_DIGEST === compactPayload.digest;
+if (!SEARCH_INDEX_CURRENT) {
+  console.warn("players.search.json is out of date, run scripts/export_artifacts.py (using a linear search)");
+}
+if (!NEIGHBOR_INDEX_CURRENT) {
+  console.warn("players.neighbors.json is out of date, run scripts/export_artifacts.py (no closeness hints)");
+}
 export const NBA_PLAYERS = ALL_NBA_PLAYERS // Backward compatibility
 
 // Team info for display
@@ -254,16 +284,18 @@ export const POSITION_CRITERIA: Criteria[] = [
   { type: "position", value: "C", label: "Pivot" },
 ]
 
+// Draft lists used before players had draftPick; draftPickOf falls back to them for records
+// scripts/ingest_draft.py has not filled in yet
 // List of First Overall Picks (User Provided)
 // Note: Includes "Akeem Olajuwon" which acts as "Hakeem Olajuwon" alias if needed, 
 // but we should probably support both or just normalize.
 // For now, simple includes check.
-const DRAFT_NUMBER_ONES = [
+const DRAFT_NUMBER_ONES = new Set([
   "Clifton McNeely", "Andy Tonkovich", "Howie Shannon", "Charlie Share", "Gene Melchiorre", "Mark Workman", "Ray Felix", "Frank Selvy", "Dick Ricketts", "Sihugo Green", "Rod Hundley", "Elgin Baylor", "Bob Boozer", "Oscar Robertson", "Walt Bellamy", "Bill McGill", "Art Heyman", "Jim Barnes", "Fred Hetzel", "Cazzie Russell", "Jimmy Walker", "Elvin Hayes", "Lew Alcindor", "Bob Lanier", "Austin Carr", "LaRue Martin", "Doug Collins", "Bill Walton", "David Thompson", "John Lucas", "Kent Benson", "Mychal Thompson", "Magic Johnson", "Joe Barry Carroll", "Mark Aguirre", "James Worthy", "Ralph Sampson", "Akeem Olajuwon", "Hakeem Olajuwon", "Patrick Ewing", "Brad Daugherty", "David Robinson", "Danny Manning", "Pervis Ellison", "Derrick Coleman", "Larry Johnson", "Shaquille O'Neal", "Chris Webber", "Glenn Robinson", "Joe Smith", "Allen Iverson", "Tim Duncan", "Michael Olowokandi", "Elton Brand", "Kenyon Martin", "Kwame Brown", "Yao Ming", "LeBron James", "Dwight Howard", "Andrew Bogut", "Andrea Bargnani", "Greg Oden", "Derrick Rose", "Blake Griffin", "John Wall", "Kyrie Irving", "Anthony Davis", "Anthony Bennett", "Andrew Wiggins", "Karl-Anthony Towns", "Ben Simmons", "Markelle Fultz", "Deandre Ayton", "Zion Williamson", "Anthony Edwards", "Cade Cunningham", "Paolo Banchero", "Victor Wembanyama", "Zaccharie Risacher", "Cooper Flagg" // Added Hakeem explicitly to safe
-].map(n => n.toLowerCase());
+].map(n => n.toLowerCase()));
 
 // List of Second Overall Picks (User Provided)
-const DRAFT_NUMBER_TWOS = [
+const DRAFT_NUMBER_TWOS = new Set([
     // 2021-2025
     "Jalen Green", "Chet Holmgren", "Brandon Miller", "Alex Sarr", "Dylan Harper",
     // 2000-2020
@@ -277,10 +309,10 @@ const DRAFT_NUMBER_TWOS = [
     "Neal Walk", "Wes Unseld", "Earl Monroe", "Dave Bing", "Rick Barry", "Joe Caldwell", "Rod Thorn", "Paul Hogue", "Tom Stith", "Jerry West",
     // 1950-1959
     "Bailey Howell", "Archie Dees", "Charles Tyra", "Bill Russell", "Maurice Stokes", "Bob Pettit", "Bob Houbregs", "Jim Baechtold", "Mel Hutchins", "Don Rehfeldt"
-].map(n => n.toLowerCase());
+].map(n => n.toLowerCase()));
 
 // List of Third Overall Picks (User Provided)
-const DRAFT_NUMBER_THREES = [
+const DRAFT_NUMBER_THREES = new Set([
     // 2020s
     "V.J. Edgecombe", "Reed Sheppard", "Scoot Henderson", "Jabari Smith Jr.", "Evan Mobley", "LaMelo Ball",
     // 2010s
@@ -297,7 +329,22 @@ const DRAFT_NUMBER_THREES = [
     "Lucius Allen", "Bob Kauffman", "Clem Haskins", "Clyde Lee", "Dave Stallworth", "Gary Bradds", "Nate Thurmond", "Zelmo Beaty", "Larry Siegfried", "Darrall Imhoff",
     // 1950s & Pre
     "Wilt Chamberlain", "Mike Farmer", "Jim Krebs", "Jim Paxson Sr.", "Jim Loscutoff", "Gene Shue", "Jack Molinas", "Dick Groat", "Marc Freiberger", "Bob Cousy", "Fred Schaus", "George Hauptfuhrer", "Bulbs Ehlers"
-].map(n => n.toLowerCase());
+].map(n => n.toLowerCase()));
+
+// Overall pick from the ingested draft fields, else from the name lists (1-3 or undefined).
+// A territorial pick is stored as draftPick 0 with a draftYear and has no overall number,
+// so it falls through to the lists too (Oscar Robertson is a first pick there)
+function draftPickOf(player: NBAPlayer): number | undefined {
+  const territorial = player.draftPick === 0 && player.draftYear !== undefined;
+  if (player.draftPick !== undefined && !territorial) return player.draftPick;
+  const name = player.name.toLowerCase();
+  if (DRAFT_NUMBER_ONES.has(name) ||
+      (name === "hakeem olajuwon" && DRAFT_NUMBER_ONES.has("akeem olajuwon")) ||
+      (name === "kareem abdul-jabbar" && DRAFT_NUMBER_ONES.has("lew alcindor"))) return 1;
+  if (DRAFT_NUMBER_TWOS.has(name)) return 2;
+  if (DRAFT_NUMBER_THREES.has(name)) return 3;
+  return undefined;
+}
 
 // Check if player matches a criteria
 export function matchesCriteria(player: NBAPlayer, criteria: Criteria): boolean {
@@ -311,6 +358,8 @@ export function matchesCriteria(player: NBAPlayer, criteria: Criteria): boolean
     case "team":
       // Consolidate both player's teams and the criteria team
       const modernCriteriaTeam = getModernTeam(criteria.value);
+      const franchises = PLAYER_FRANCHISES.get(player.id);
+      if (franchises) return franchises.has(modernCriteriaTeam);
       return player.teams.some(t => getModernTeam(t) === modernCriteriaTeam);
 
     case "mvp":
@@ -328,16 +377,11 @@ export function matchesCriteria(player: NBAPlayer, criteria: Criteria): boolean
     case "allDefensive":
       return player.allDefensive
     case "draft_pick_1":
-      return DRAFT_NUMBER_ONES.includes(player.name.toLowerCase()) || 
-             (player.name === "Hakeem Olajuwon" && DRAFT_NUMBER_ONES.includes("akeem olajuwon")) || 
-             (player.name === "Kareem Abdul-Jabbar" && DRAFT_NUMBER_ONES.includes("lew alcindor"));
-    case "draft_top_3":
-      const name = player.name.toLowerCase();
-      return DRAFT_NUMBER_ONES.includes(name) || 
-             DRAFT_NUMBER_TWOS.includes(name) || 
-             DRAFT_NUMBER_THREES.includes(name) ||
-        	   (name === "hakeem olajuwon" && DRAFT_NUMBER_ONES.includes("akeem olajuwon")) || 
-             (name === "kareem abdul-jabbar" && DRAFT_NUMBER_ONES.includes("lew alcindor"));
+      return draftPickOf(player) === 1
+    case "draft_top_3": {
+      const pick = draftPickOf(player);
+      return pick !== undefined && pick >= 1 && pick <= 3
+    }
     case "decade":
       return player.decades.includes(criteria.value)
     case "country":
@@ -368,10 +412,7 @@ export function validatePlayerForCell(
   let player: NBAPlayer | undefined
 
   if (typeof playerOrName === "string") {
-    const normalizedName = playerOrName.toLowerCase().trim()
-    player = ALL_NBA_PLAYERS.find(
-      (p) => p.name.toLowerCase() === normalizedName
-    )
+    player = PLAYER_LOWER_NAME_MAP.get(playerOrName.toLowerCase().trim())
   } else {
     player = playerOrName
   }
@@ -435,6 +476,7 @@ export const FAMOUS_PLAYER_IDS = [
   "vince-carter", "tracy-mcgrady", "grant-hill", "jason-kidd", "gary-payton", "dikembe-mutombo",
   "alonzo-mourning", "chris-bosh", "klay-thompson", "draymond-green"
 ];
+const FAMOUS_PLAYER_ID_SET = new Set(FAMOUS_PLAYER_IDS);
 
 export function generateGrid(
   difficulty: "easy" | "medium" | "hard" = "medium",
@@ -523,7 +565,7 @@ export function generateGrid(
               for (const col of cols) {
                   const validPlayers = findValidPlayersForCell(row, col);
                   // Check if any valid player is in the FAMOUS list
-                  const hasFamous = validPlayers.some(p => FAMOUS_PLAYER_IDS.includes(p.id));
+                  const hasFamous = validPlayers.some(p => FAMOUS_PLAYER_ID_SET.has(p.id));
                   if (!hasFamous) {
                       allCellsHaveFamousSolution = false;
                       break; 
@@ -571,63 +613,50 @@ export function findValidPlayersForCell(
 }
 
 // Get player suggestions based on partial name with Smart Ranking
+// Prefix, typo and fame ranking all come from the prebuilt index (lib/player-search.ts)
 export function getPlayerSuggestions(query: string, limit = 5): NBAPlayer[] {
   if (!query || query.length < 2) return []
-  
-  const normalizedQuery = query.toLowerCase().trim()
-  
-  // 1. Filter candidates (must match at least loosely)
-  const candidates = ALL_NBA_PLAYERS.filter(p => 
-      p.name.toLowerCase().includes(normalizedQuery)
-  );
-
-  // 2. Score candidates
-  const scoredCandidates = candidates.map(player => {
-      let score = 0;
-      const normalizedName = player.name.toLowerCase();
-      
-      // A. Relevance Matches
-      if (normalizedName === normalizedQuery) {
-          score += 100; // Perfect match
-      } else if (normalizedName.startsWith(normalizedQuery)) {
-          score += 75; // Prefix match (e.g. "Leb" -> "LeBron")
-      } else if (normalizedName.includes(" " + normalizedQuery)) {
-          score += 60; // Start of last name (e.g. "Jam" -> "LeBron James")
-      } else {
-          score += 10; // Simple substring match (e.g. "ron" -> "LeBron")
-      }
-      
-      // B. Fame / Quality Boosts
-      if (FAMOUS_PLAYER_IDS.includes(player.id)) {
-          score += 50; // Huge boost for superstars
-      }
-      
-      // Active player small boost (current players are often searched more)
-      if (player.active) {
-          score += 5;
-      }
-      
-      // All-Star boost (if data available, currently boolean)
-      if (player.allStar) {
-          score += 20;
-      }
-      
-      // MVP boost
-      if (player.mvp) {
-          score += 30;
-      }
+  if (!SEARCH_INDEX_CURRENT) return scanPlayerSuggestions(query, limit)
 
-      // Tie-breaker: Short names often strictly clearer or Alphabetical
-      // Handled by sort stability or secondary sort
-
-      return { player, score };
-  });
+  return searchPlayerPositions(query, limit)
+    .map(pos => ALL_NBA_PLAYERS[pos])
+    .filter(Boolean)
+}
 
-  // 3. Sort by Score Descending
-  scoredCandidates.sort((a, b) => b.score - a.score);
+// Fallback for a stale index: prefix matches on the name or a later name part, ranked by fame
+function scanPlayerSuggestions(query: string, limit: number): NBAPlayer[] {
+  const q = foldName(query)
+  if (q.length < 2) return []
+
+  const scored: { player: NBAPlayer; score: number }[] = []
+  for (const player of ALL_NBA_PLAYERS) {
+    const name = foldName(player.name)
+    let score = name === q ? 100 : name.startsWith(q) ? 75 : name.includes(" " + q) ? 60 : 0
+    if (!score) continue
+    if (FAMOUS_PLAYER_ID_SET.has(player.id)) score += 50
+    if (player.mvp) score += 30
+    if (player.allStar) score += 20
+    if (player.active) score += 5
+    scored.push({ player, score })
+  }
+  return scored
+    .sort((a, b) => b.score - a.score)
+    .slice(0, limit)
+    .map(sc => sc.player)
+}
 
-  // 4. Return top N
-  return scoredCandidates.slice(0, limit).map(sc => sc.player);
+// How close a wrong guess is to the target of the "Guessing Game" (scripts/build_similarity_index.py):
+// closeness is 0-100 and rank 1 is the most similar player, both 0/null beyond the nearest players
+export function getGuessCloseness(target: NBAPlayer, guess: NBAPlayer): { closeness: number; rank: number | null } {
+  const targetPosition = PLAYER_POSITION_MAP.get(target.id);
+  const guessPosition = PLAYER_POSITION_MAP.get(guess.id);
+  if (!NEIGHBOR_INDEX_CURRENT || targetPosition === undefined || guessPosition === undefined) {
+    return { closeness: 0, rank: null };
+  }
+  return {
+    closeness: guessCloseness(targetPosition, guessPosition),
+    rank: guessRank(targetPosition, guessPosition),
+  };
 }
 
 // Get a random notable player for the "Guessing Game"
@@ -0,0 +1,126 @@
+// Player name search over lib/players.search.json (built by scripts/build_search_index.py)
+import searchIndex from './players.search.json'
+
+interface SearchIndex {
+  version: number
+  count: number
+  digest: string
+  fame: number[]
+  keys: string[]
+  keyPlayers: number[]
+  keyKinds: number[]
+  top: Record<string, number[]>
+  tokens: string[]
+  tokenPlayers: number[][]
+  deletes: Record<string, number | number[]>
+}
+
+const index = searchIndex as unknown as SearchIndex
+
+const KIND_FULL = 0
+const MIN_TYPO_LENGTH = 4
+const TYPO_SCORE = 40
+
+// Hash of the player ids the positions refer to (must match the compact payload's)
+export const SEARCH_INDEX_DIGEST = index.digest
+
+// Same folding as fold_name in scripts/players_db.py ("Nikola Jokić" -> "nikola jokic")
+export function foldName(name: string): string {
+  return name
+    .normalize("NFD")
+    .replace(/[\u0300-\u036f]/g, "")
+    .toLowerCase()
+    .replace(/[.'\u2019]/g, "")
+    .replace(/-/g, " ")
+    .replace(/\s+/g, " ")
+    .trim()
+}
+
+// First position in the sorted array whose value is >= target
+function lowerBound(sorted: string[], target: string): number {
+  let lo = 0
+  let hi = sorted.length
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1
+    if (sorted[mid] < target) lo = mid + 1
+    else hi = mid
+  }
+  return lo
+}
+
+function matchScore(pos: number, query: string): number {
+  if (index.keyKinds[pos] !== KIND_FULL) return 60 // Start of a later name part (e.g. "Jam" -> "LeBron James")
+  return index.keys[pos] === query ? 100 : 75
+}
+
+// Name parts within one edit of `word` (SymSpell: compare deletion neighbourhoods)
+function typoTokens(word: string): Set<number> {
+  const found = new Set<number>()
+  const variants = [word]
+  for (let i = 0; i < word.length; i++) variants.push(word.slice(0, i) + word.slice(i + 1))
+
+  for (const variant of variants) {
+    const exact = lowerBound(index.tokens, variant)
+    if (index.tokens[exact] === variant) found.add(exact)
+    const hits = index.deletes[variant]
+    if (hits === undefined) continue
+    if (typeof hits === "number") found.add(hits)
+    else hits.forEach(t => found.add(t))
+  }
+  return found
+}
+
+// Players with a name part that starts with `word`, or is one edit from it
+function wordPlayers(word: string): Set<number> {
+  const players = new Set<number>()
+  for (let pos = lowerBound(index.keys, word); pos < index.keys.length && index.keys[pos].startsWith(word); pos++) {
+    players.add(index.keyPlayers[pos])
+  }
+  if (word.length >= MIN_TYPO_LENGTH - 1) {
+    typoTokens(word).forEach(t => index.tokenPlayers[t].forEach(p => players.add(p)))
+  }
+  return players
+}
+
+// Positions of the best matching players (in players.json order), best first.
+// Cost grows with the query length and the number of matches, not the number of players.
+export function searchPlayerPositions(query: string, limit = 5): number[] {
+  const q = foldName(query)
+  if (q.length < 2) return []
+
+  const relevance = new Map<number, number>()
+  const add = (player: number, score: number) => {
+    if ((relevance.get(player) ?? -1) < score) relevance.set(player, score)
+  }
+
+  // 1. Prefix matches: precomputed for 2-3 letters, a binary-searched range otherwise
+  const top = index.top[q]
+  if (top) {
+    top.forEach(pos => add(index.keyPlayers[pos], matchScore(pos, q)))
+  } else {
+    for (let pos = lowerBound(index.keys, q); pos < index.keys.length && index.keys[pos].startsWith(q); pos++) {
+      add(index.keyPlayers[pos], matchScore(pos, q))
+    }
+  }
+
+  // 2. Typo-tolerant matches on the last word typed, when prefixes are not enough.
+  // They must also match every earlier word ("stephen cury" is a Stephen, not Seth Curry or Cory Joseph).
+  const words = q.split(" ")
+  const lastWord = words[words.length - 1]
+  if (relevance.size < limit && lastWord.length >= MIN_TYPO_LENGTH - 1) {
+    let allowed: Set<number> | null = null
+    for (const word of words.slice(0, -1)) {
+      const players = wordPlayers(word)
+      allowed = allowed ? new Set([...allowed].filter(p => players.has(p))) : players
+    }
+    typoTokens(lastWord).forEach(t => index.tokenPlayers[t].forEach(p => {
+      if (!allowed || allowed.has(p)) add(p, TYPO_SCORE)
+    }))
+  }
+
+  return [...relevance.entries()]
+    .map(([player, score]) => ({ player, score: score + index.fame[player] }))
+    .sort((a, b) => b.score - a.score)
+    .slice(0, limit)
+    .map(sc => sc.player)
+}
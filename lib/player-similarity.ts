@@ -0,0 +1,62 @@
+// Guess-game closeness over lib/players.neighbors.json (built by scripts/build_similarity_index.py)
+import neighborIndex from './players.neighbors.json'
+
+interface NeighborIndex {
+  version: number
+  count: number
+  digest: string
+  k: number
+  targets: number[]
+  neighbors: number[]
+  scores: number[]
+}
+
+const index = neighborIndex as unknown as NeighborIndex
+
+// Hash of the player ids the positions refer to (must match the compact payload's)
+export const NEIGHBOR_INDEX_DIGEST = index.digest
+
+// Player position -> row of the table, for the players that can be a target
+const TARGET_ROWS = new Map<number, number>()
+index.targets.forEach((position, row) => TARGET_ROWS.set(position, row))
+
+// Row -> (neighbour position -> score), built the first time a target is asked about
+const rowScores = new Map<number, Map<number, number>>()
+
+function scoresFor(row: number): Map<number, number> {
+  let scores = rowScores.get(row)
+  if (!scores) {
+    scores = new Map()
+    for (let i = row * index.k; i < (row + 1) * index.k; i++) {
+      scores.set(index.neighbors[i], index.scores[i])
+    }
+    rowScores.set(row, scores)
+  }
+  return scores
+}
+
+// Similarity (0-100) of a guess to the target, 0 when it is not among the target's nearest players
+export function guessCloseness(targetPosition: number, guessPosition: number): number {
+  const row = TARGET_ROWS.get(targetPosition)
+  if (row === undefined) return 0
+  return scoresFor(row).get(guessPosition) ?? 0
+}
+
+// Rank (1 = closest) of a guess among the target's nearest players, or null
+export function guessRank(targetPosition: number, guessPosition: number): number | null {
+  const row = TARGET_ROWS.get(targetPosition)
+  if (row === undefined) return null
+  const start = row * index.k
+  for (let i = 0; i < index.k; i++) {
+    if (index.neighbors[start + i] === guessPosition) return i + 1
+  }
+  return null
+}
+
+// Positions of the target's nearest players, closest first
+export function nearestPlayerPositions(targetPosition: number, limit = index.k): number[] {
+  const row = TARGET_ROWS.get(targetPosition)
+  if (row === undefined) return []
+  const start = row * index.k
+  return index.neighbors.slice(start, start + Math.min(limit, index.k))
+}
@@ -106,7 +106,11 @@ export const translations = {
       was: "The player was",
       next: "Next Player",
       loading: "LOADING DATA...",
-      error_incorrect: "❌ No, that's not {name}. Try again!"
+      error_incorrect: "❌ No, that's not {name}. Try again!",
+      hint_hot: "🔥 Very close!",
+      hint_warmer: "🌡️ Warmer",
+      hint_colder: "🧊 Colder",
+      hint_cold: "❄️ Cold"
     },
     players: {
       title: "PLAYER DATABASE",
@@ -316,7 +320,11 @@ export const translations = {
       was: "Le joueur était",
       next: "Joueur Suivant",
       loading: "CHARGEMENT...",
-      error_incorrect: "❌ Non, ce n'est pas {name}. Réessaie !"
+      error_incorrect: "❌ Non, ce n'est pas {name}. Réessaie !",
+      hint_hot: "🔥 Tout proche !",
+      hint_warmer: "🌡️ Tu chauffes",
+      hint_colder: "🧊 Tu refroidis",
+      hint_cold: "❄️ Froid"
     },
     players: {
       title: "BASE DE DONNÉES",
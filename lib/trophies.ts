@@ -440,6 +440,9 @@ export function buildTrophyContext(
         xp: number
         rankData: { current: { id: string } }
         rawHistory: GameHistoryItem[]
+        // Career totals from user_summaries, when the history below is only a recent window
+        maxStreak?: number
+        ratedWins?: number
     }
 ): TrophyContext {
     const rawHistory = stats.rawHistory || []
@@ -476,10 +479,10 @@ export function buildTrophyContext(
 
     return {
         gamesPlayed: stats.gamesPlayed,
-        wins,
+        wins: stats.ratedWins ?? wins,
         accuracy: stats.accuracy,
         currentStreak: stats.currentStreak,
-        maxStreak,
+        maxStreak: stats.maxStreak ?? maxStreak,
         bestScore: stats.bestScore,
         avgScore: stats.avgScore,
         xp: stats.xp,
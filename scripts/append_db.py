@@ -1,7 +1,9 @@
 import json
 
-main_path = 'lib/players.json'
-enriched_path = 'lib/players_enriched.json'
+from players_db import DATA_FILE, LIB_DIR, save_players
+
+main_path = DATA_FILE
+enriched_path = LIB_DIR / 'players_enriched.json'
 
 try:
     with open(main_path, 'r') as f:
@@ -13,10 +15,9 @@ try:
     # Append enriched data to main data
     combined_data = main_data + enriched_data
     
-    with open(main_path, 'w') as f:
-        json.dump(combined_data, f, indent=2, ensure_ascii=False)
+    save_players(combined_data, main_path)
         
-    print(f"Successfully appended {len(enriched_data)} records from {enriched_path} to {main_path}")
+    print(f"Successfully appended {len(enriched_data)} records from {enriched_path.name} to {main_path.name}")
 
 except FileNotFoundError:
     print("One of the files was not found. Skipping append.")
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Apply a batch of manual player updates (scripts/player-updates.json) to players.json.
+
+Each update names a player and the fields to overwrite, e.g.
+{ "name": "D'Moi Hodge", "teams": ["DAL"], "active": true }. As in
+update-players-batch.ts, an empty teams list leaves the teams alone.
+"""
+
+import argparse
+from pathlib import Path
+
+from players_db import SCRIPTS_DIR, load_json, load_players, save_players
+
+UPDATES_FILE = SCRIPTS_DIR / "player-updates.json"
+KEY_FIELDS = {"id", "name"}
+
+
+def apply_updates(players: list[dict], updates: list[dict]) -> tuple[list[str], list[str]]:
+    """Apply updates in place; returns (changed names, names not found)."""
+    by_name = {}
+    for player in players:
+        by_name.setdefault(player["name"], player)
+
+    changed, missing = [], []
+    for update in updates:
+        player = by_name.get(update["name"])
+        if player is None:
+            missing.append(update["name"])
+            continue
+        fields = {k: v for k, v in update.items() if k not in KEY_FIELDS and not (k == "teams" and not v)}
+        if any(player.get(k) != v for k, v in fields.items()):
+            player.update(fields)
+            changed.append(player["name"])
+    return changed, missing
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--file", type=Path, default=UPDATES_FILE, help="JSON list of updates")
+    parser.add_argument("--dry-run", action="store_true", help="report the changes without saving")
+    args = parser.parse_args(argv)
+
+    players = load_players()
+    changed, missing = apply_updates(players, load_json(args.file))
+    for name in changed:
+        print(f"   ✏️  {name}")
+    for name in missing:
+        print(f"   ⚠️ Player not found: {name}")
+    print(f"✅ {len(changed)} players changed, {len(missing)} not found")
+
+    if changed and not args.dry_run:
+        save_players(players)
+        print("💾 Saved players.json")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+Simulate battle mode to measure grid balance and round length.
+
+Ports the rules the app plays by:
+  - generateGrid and matchesCriteria (lib/nba-data.ts); the criteria pools,
+    draft-pick lists and famous players are read from nba-data.ts itself
+  - checkBattleWinner (lib/battle-logic.ts)
+  - the move / next-round / vote-skip routes (app/api/battle/): a wrong
+    answer loses the turn, players may be reused, the round winner starts
+    the next round (after a draw the turn is stuck on "draw" until the
+    timeout route hands it to the host), a skip deals a fresh *medium* grid
+    and swaps the turn, and a battle is 5 rounds
+  - next-round excludes the previous grid's criteria *values*; every award
+    has the value "true", so one award on a grid bars all of them next round
+
+Agents are skill models: the chance of naming a valid player for a cell
+grows with how many famous (and, much less, obscure) players fit it, and
+the cell they pick depends on the strategy. A round stalls, and is skipped,
+when every empty cell is dead (no player fits) or after MAX_TURNS turns.
+
+    python scripts/battle_sim.py --battles 100000
+    python scripts/battle_sim.py --difficulty hard --size 3 4 5 --host expert --guest novice
+
+Battles run in chunks on a process pool; each worker gets the criteria
+bitmasks once.
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import cmp_to_key
+from pathlib import Path
+
+from players_db import LIB_DIR, LOGS_DIR, load_players, modern_team
+
+NBA_DATA_TS = LIB_DIR / "nba-data.ts"
+ROUNDS = 5
+MAX_TURNS = 40          # 60s each: a round nobody can finish gets skipped long before this
+CHUNK = 250             # battles per task
+HOST, GUEST = "host", "guest"
+OBSCURE_WEIGHT = 0.05   # an obscure fitting player is this much as recallable as a famous one
+MAJOR_AWARD_TYPES = ("mvp", "champion", "allStar")  # majorAwards in generateGrid
+
+
+# -- rules, read from lib/nba-data.ts ---------------------------------------
+
+def _ts_array(source: str, pattern: str) -> list[str]:
+    match = re.search(pattern, source, re.S)
+    if match is None:
+        raise ValueError(f"{NBA_DATA_TS.name}: cannot find {pattern!r}")
+    body = "\n".join(line.split("//")[0] for line in match.group(1).splitlines())
+    return re.findall(r'"([^"]*)"', body)
+
+
+def load_rules(path: Path = NBA_DATA_TS) -> dict:
+    """Criteria pools, draft lists, popular teams and famous ids as nba-data.ts defines them."""
+    source = path.read_text(encoding="utf-8")
+    pools = {}
+    for name, body in re.findall(r"export const (\w+_CRITERIA): Criteria\[\] = \[(.*?)\n\]", source, re.S):
+        pools[name] = [{"type": t, "value": v, "label": label}
+                       for t, v, label in re.findall(r'type: "(\w+)", value: "([^"]*)", label: "([^"]*)"', body)]
+    return {
+        "pools": pools,
+        "draft": {n: {name.lower() for name in _ts_array(source, rf"const DRAFT_NUMBER_{n} = new Set\(\[(.*?)\]\.map")}
+                  for n in ("ONES", "TWOS", "THREES")},
+        "popular_teams": set(_ts_array(source, r"const POPULAR_TEAMS = TEAM_CRITERIA\.filter\(t =>\s*\[(.*?)\]")),
+        "famous_ids": set(_ts_array(source, r"export const FAMOUS_PLAYER_IDS = \[(.*?)\];")),
+    }
+
+
+def draft_pick_of(player: dict, draft: dict) -> int | None:
+    """draftPickOf: the ingested overall pick, else 1-3 from the name lists (territorial picks too)."""
+    territorial = player.get("draftPick") == 0 and "draftYear" in player
+    if "draftPick" in player and not territorial:
+        return player["draftPick"]
+    name = player["name"].lower()
+    if name in draft["ONES"] or (name == "hakeem olajuwon" and "akeem olajuwon" in draft["ONES"]) \
+            or (name == "kareem abdul-jabbar" and "lew alcindor" in draft["ONES"]):
+        return 1
+    if name in draft["TWOS"]:
+        return 2
+    if name in draft["THREES"]:
+        return 3
+    return None
+
+
+def matches(player: dict, franchises: set[str], criteria: dict, draft: dict) -> bool:
+    """matchesCriteria."""
+    kind, value = criteria["type"], criteria["value"]
+    if kind == "team":
+        return modern_team(value) in franchises
+    if kind in ("mvp", "dpoy", "roy", "champion", "allStar", "allNBA", "allDefensive"):
+        return bool(player.get(kind))
+    if kind == "draft_pick_1":
+        return draft_pick_of(player, draft) == 1
+    if kind == "draft_top_3":
+        return 1 <= (draft_pick_of(player, draft) or 0) <= 3
+    if kind == "decade":
+        return value in player["decades"]
+    if kind == "country":
+        return player["country"] != "USA" if value == "international" else player["country"] == value
+    if kind in ("ppg", "rpg", "apg"):
+        return player[f"{kind}Career"] >= float(value)
+    if kind == "position":
+        return player["position"] == value
+    return False
+
+
+def build_tables(players: list[dict], rules: dict) -> dict:
+    """Everything a worker needs: difficulty pools and one player bitmask per criteria."""
+    pools = rules["pools"]
+    awards = pools["AWARD_CRITERIA"]
+    major = [c for c in awards if c["type"] in MAJOR_AWARD_TYPES]
+    specialist = [c for c in awards if c["type"] not in MAJOR_AWARD_TYPES]
+    popular = [c for c in pools["TEAM_CRITERIA"] if c["value"] in rules["popular_teams"]]
+    difficulty_pools = {
+        "easy": popular + major,
+        "medium": pools["TEAM_CRITERIA"] + major + pools["POSITION_CRITERIA"] + pools["STAT_CRITERIA"],
+        "hard": pools["TEAM_CRITERIA"] + major + specialist + pools["POSITION_CRITERIA"]
+                + pools["STAT_CRITERIA"] + pools["DECADE_CRITERIA"] + pools["COUNTRY_CRITERIA"],
+    }
+    franchises = [{modern_team(team) for team in player["teams"]} for player in players]
+    masks = {}
+    for pool in difficulty_pools.values():
+        for criteria in pool:
+            key = (criteria["type"], criteria["value"])
+            if key not in masks:
+                bits = "".join("1" if matches(p, f, criteria, rules["draft"]) else "0"
+                               for p, f in zip(reversed(players), reversed(franchises)))
+                masks[key] = int(bits, 2)
+    famous = int("".join("1" if p["id"] in rules["famous_ids"] else "0" for p in reversed(players)), 2)
+    pools = {name: [(c["type"], c["value"]) for c in pool] for name, pool in difficulty_pools.items()}
+    return {"pools": pools, "masks": masks, "famous": famous}
+
+
+# -- grid generation -----------------------------------------------------------
+
+def js_random_sort(items: list, rng: random.Random) -> list:
+    """[...items].sort(() => Math.random() - 0.5): V8's TimSort is CPython's, so this keeps its bias."""
+    return sorted(items, key=cmp_to_key(lambda a, b: rng.random() - 0.5))
+
+
+def generate_grid(tables: dict, difficulty: str, size: int, exclude: tuple, rng: random.Random):
+    """generateGrid: (rows, cols) criteria keys."""
+    pool = tables["pools"][difficulty]
+    masks, famous = tables["masks"], tables["famous"]
+    for _ in range(50):
+        shuffled = js_random_sort([c for c in pool if c[1] not in exclude] if exclude else pool, rng)
+        used, rows, cols = set(), [], []
+        for picked in (rows, cols):
+            for criteria in shuffled:
+                if len(picked) >= size:
+                    break
+                if criteria not in used:
+                    picked.append(criteria)
+                    used.add(criteria)
+        if difficulty == "easy" and not all(masks[r] & masks[c] & famous for r in rows for c in cols):
+            continue
+        if len(rows) == size and len(cols) == size:
+            return rows, cols
+    fallback = js_random_sort(pool, rng)
+    return fallback[:size], fallback[size:size * 2]
+
+
+def winning_lines(size: int) -> list[list[int]]:
+    """Rows, columns, then both diagonals: the order checkBattleWinner scans them in."""
+    rows = [[r * size + c for c in range(size)] for r in range(size)]
+    cols = [[r * size + c for r in range(size)] for c in range(size)]
+    return rows + cols + [[i * size + i for i in range(size)], [i * size + size - 1 - i for i in range(size)]]
+
+
+def check_winner(owners: list, lines: list[list[int]]):
+    """checkBattleWinner, on the cell owners (None for empty: cells are never marked incorrect)."""
+    for line in lines:
+        first = owners[line[0]]
+        if first is not None and all(owners[i] == first for i in line):
+            return first
+    return "draw" if None not in owners else None
+
+
+# -- agents --------------------------------------------------------------------
+
+class Agent:
+    """Knows a fitting player with probability 1 - (1 - skill)^(famous + 0.05 x obscure); picks cells at random."""
+
+    def __init__(self, skill: float):
+        self.skill = skill
+
+    def chances(self, famous_counts: list[int], totals: list[int]) -> list[float]:
+        miss = 1.0 - self.skill
+        return [1.0 - miss ** (f + OBSCURE_WEIGHT * (t - f)) for f, t in zip(famous_counts, totals)]
+
+    def pick(self, empty: list[int], chances: list[float], owners: list, me: str, lines, rng) -> int:
+        return rng.choice(empty)
+
+
+class GreedyAgent(Agent):
+    """Plays the cell it is most likely to answer."""
+
+    def pick(self, empty, chances, owners, me, lines, rng):
+        best = max(chances[i] for i in empty)
+        return rng.choice([i for i in empty if chances[i] == best])
+
+
+class TacticalAgent(GreedyAgent):
+    """Completes its own line, else blocks the opponent's, else plays greedy."""
+
+    def pick(self, empty, chances, owners, me, lines, rng):
+        for owner in (me, GUEST if me == HOST else HOST):
+            for line in lines:
+                open_cells = [i for i in line if owners[i] is None]
+                if len(open_cells) == 1 and chances[open_cells[0]] > 0 \
+                        and all(owners[i] == owner for i in line if i != open_cells[0]):
+                    return open_cells[0]
+        return super().pick(empty, chances, owners, me, lines, rng)
+
+
+AGENTS = {
+    "novice": lambda: Agent(0.25),
+    "casual": lambda: GreedyAgent(0.45),
+    "expert": lambda: TacticalAgent(0.75),
+}
+
+
+# -- simulation ----------------------------------------------------------------
+
+def play_round(rows, cols, size, first: str, agents: dict, tables: dict, stats: Counter, moves: Counter, rng):
+    """One grid; returns (outcome, player to move) where outcome is host, guest, draw or stalled."""
+    masks, famous = tables["masks"], tables["famous"]
+    cells = [masks[r] & masks[c] for r in rows for c in cols]
+    totals = [cell.bit_count() for cell in cells]
+    famous_counts = [(cell & famous).bit_count() for cell in cells]
+    chances = {role: agent.chances(famous_counts, totals) for role, agent in agents.items()}
+    dead = totals.count(0)
+    stats["grids"] += 1
+    stats["cells"] += len(cells)
+    stats["dead_cells"] += dead
+    stats["grids_with_dead_cells"] += dead > 0
+
+    lines = winning_lines(size)
+    owners = [None] * len(cells)
+    turn = first
+    for turns in range(1, MAX_TURNS + 1):
+        empty = [i for i, owner in enumerate(owners) if owner is None]
+        if all(totals[i] == 0 for i in empty):
+            break
+        cell = agents[turn].pick(empty, chances[turn], owners, turn, lines, rng)
+        if rng.random() < chances[turn][cell]:
+            owners[cell] = turn
+            winner = check_winner(owners, lines)
+            if winner:
+                moves[turns] += 1
+                stats["turns"] += turns
+                if winner == "draw":
+                    stats["draws"] += 1
+                else:
+                    stats["starter_wins" if winner == first else "second_wins"] += 1
+                return winner, turn
+        else:
+            stats["wrong_answers"] += 1
+        turn = GUEST if turn == HOST else HOST
+    stats["stalled"] += 1
+    return "stalled", turn
+
+
+def play_battles(task: tuple) -> dict:
+    """Worker entry point: play `count` battles and return their counters."""
+    count, seed, difficulty, size, host, guest = task
+    tables = _TABLES
+    rng = random.Random(seed)
+    agents = {HOST: AGENTS[host](), GUEST: AGENTS[guest]()}
+    by_grid: dict[str, Counter] = {}
+    moves: dict[str, Counter] = {}
+    battle = Counter()
+    for _ in range(count):
+        scores = Counter()
+        turn, exclude = HOST, ()
+        for _ in range(ROUNDS):
+            grid_difficulty = difficulty
+            rows, cols = generate_grid(tables, difficulty, size, exclude, rng)
+            while True:
+                outcome, turn = play_round(rows, cols, size, turn, agents, tables,
+                                           by_grid.setdefault(grid_difficulty, Counter()),
+                                           moves.setdefault(grid_difficulty, Counter()), rng)
+                if outcome != "stalled":
+                    break
+                # Both vote to skip: vote-skip deals a medium grid whatever the battle's difficulty
+                battle["skips"] += 1
+                grid_difficulty = "medium"
+                rows, cols = generate_grid(tables, "medium", size, (), rng)
+                turn = GUEST if turn == HOST else HOST
+            if outcome == "draw":
+                # next-round sets current_turn to the winner, "draw": nobody can move until the timeout
+                battle["turns_stuck_after_draw"] += 1
+                turn = HOST
+            else:
+                scores[outcome] += 1
+                turn = outcome
+            exclude = tuple(value for _, value in rows + cols)
+        battle["battles"] += 1
+        if scores[HOST] == scores[GUEST]:
+            battle["drawn_battles"] += 1
+        else:
+            battle["host_wins" if scores[HOST] > scores[GUEST] else "guest_wins"] += 1
+    return {"by_grid": by_grid, "moves": moves, "battle": battle}
+
+
+_TABLES = None
+
+
+def _init_worker(tables):
+    global _TABLES
+    _TABLES = tables
+
+
+def simulate(tables: dict, battles: int, difficulty: str, size: int, host: str, guest: str,
+             workers: int, seed: int) -> dict:
+    tasks = []
+    for i, start in enumerate(range(0, battles, CHUNK)):
+        tasks.append((min(CHUNK, battles - start), seed * 1_000_003 + i, difficulty, size, host, guest))
+    merged = {"by_grid": {}, "moves": {}, "battle": Counter()}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(tables,)) as executor:
+        for result in executor.map(play_battles, tasks):
+            for key in ("by_grid", "moves"):
+                for grid_difficulty, counter in result[key].items():
+                    merged[key].setdefault(grid_difficulty, Counter()).update(counter)
+            merged["battle"].update(result["battle"])
+    return merged
+
+
+def percentile(histogram: Counter, fraction: float) -> int:
+    total, seen = sum(histogram.values()), 0
+    for value in sorted(histogram):
+        seen += histogram[value]
+        if seen >= fraction * total:
+            return value
+    return 0
+
+
+def summarize(result: dict) -> dict:
+    """Rates per grid difficulty plus battle-level outcomes."""
+    summary = {}
+    for grid_difficulty, stats in sorted(result["by_grid"].items()):
+        grids = stats["grids"] or 1
+        finished = grids - stats["stalled"]
+        decided = stats["starter_wins"] + stats["second_wins"]
+        summary[grid_difficulty] = {
+            "grids": stats["grids"],
+            "dead_cell_rate": stats["dead_cells"] / (stats["cells"] or 1),
+            "grids_with_dead_cells": stats["grids_with_dead_cells"] / grids,
+            "draw_rate": stats["draws"] / grids,
+            "stall_rate": stats["stalled"] / grids,
+            "starter_win_rate": stats["starter_wins"] / (decided or 1),
+            "first_mover_advantage": (stats["starter_wins"] - stats["second_wins"]) / (decided or 1),
+            "mean_turns": stats["turns"] / (finished or 1),
+            "p95_turns": percentile(result["moves"][grid_difficulty], 0.95),
+        }
+    battle = result["battle"]
+    battles = battle["battles"] or 1
+    summary["battles"] = {key: battle[key] / battles for key in
+                          ("host_wins", "guest_wins", "drawn_battles", "skips", "turns_stuck_after_draw")}
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--battles", type=int, default=20_000, help="battles per difficulty and size")
+    parser.add_argument("--difficulty", nargs="+", default=["easy", "medium", "hard"],
+                        choices=["easy", "medium", "hard"])
+    parser.add_argument("--size", nargs="+", type=int, default=[3], help="grid sizes (the app deals 3x3)")
+    parser.add_argument("--host", choices=list(AGENTS), default="casual")
+    parser.add_argument("--guest", choices=list(AGENTS), default="casual")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", type=Path, default=LOGS_DIR / "battle_sim.json", help="where to write the report")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    tables = build_tables(load_players(), load_rules())
+    print(f"🧮 {len(tables['masks'])} criteria bitmasks in {time.perf_counter() - started:.1f}s "
+          f"({args.host} host vs {args.guest} guest, {args.workers} workers)")
+
+    report = {}
+    for difficulty in args.difficulty:
+        for size in args.size:
+            started = time.perf_counter()
+            summary = summarize(simulate(tables, args.battles, difficulty, size, args.host, args.guest,
+                                         args.workers, args.seed))
+            elapsed = time.perf_counter() - started
+            report[f"{difficulty}/{size}x{size}"] = summary
+            b = summary["battles"]
+            print(f"\n⚔️  {difficulty} {size}x{size}: {args.battles} battles in {elapsed:.1f}s "
+                  f"({args.battles / elapsed:,.0f}/s) - host {b['host_wins']:.1%}, guest {b['guest_wins']:.1%}, "
+                  f"drawn {b['drawn_battles']:.1%}, {b['skips']:.2f} skips and "
+                  f"{b['turns_stuck_after_draw']:.2f} post-draw timeouts per battle")
+            print(f"   {'grid':<8} {'grids':>8} {'dead cells':>10} {'w/ dead':>8} {'draw':>6} {'stall':>6} "
+                  f"{'starter':>8} {'1st adv':>8} {'turns':>6} {'p95':>4}")
+            for grid_difficulty, s in summary.items():
+                if grid_difficulty == "battles":
+                    continue
+                print(f"   {grid_difficulty:<8} {s['grids']:>8} {s['dead_cell_rate']:>10.1%} "
+                      f"{s['grids_with_dead_cells']:>8.1%} {s['draw_rate']:>6.1%} {s['stall_rate']:>6.1%} "
+                      f"{s['starter_win_rate']:>8.1%} {s['first_mover_advantage']:>+8.1%} "
+                      f"{s['mean_turns']:>6.1f} {s['p95_turns']:>4}")
+
+    args.json.parent.mkdir(parents=True, exist_ok=True)
+    args.json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"\n📄 Report written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
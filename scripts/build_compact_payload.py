@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Build the compact player payload the web app imports (lib/players.compact.json).
+
+Instead of one object per player the payload stores one array per field:
+teams, countries, positions, colleges, awards and decades are dictionary
+encoded, award booleans are packed into a bit field and every player's
+franchise-normalized team set is precomputed so matchesCriteria does not have
+to call getModernTeam on each check. lib/compact-players.ts decodes it back
+into NBAPlayer objects.
+
+Gzip (and brotli, when the `brotli` package is installed) variants are written
+next to the JSON for static hosting.
+"""
+
+import gzip
+import json
+import time
+
+import canonical_json
+from players_db import LIB_DIR, id_digest, load_players, modern_team
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+OUTPUT_FILE = LIB_DIR / "players.compact.json"
+PAYLOAD_VERSION = 3
+
+# Bit i of `flags` is set when the field is true; keep in sync with lib/compact-players.ts
+FLAG_FIELDS = ["allStar", "champion", "mvp", "dpoy", "roy", "allNBA", "allDefensive", "active"]
+NO_PHOTO_BIT = 1 << len(FLAG_FIELDS)
+# Set when the record has no `active` at all, so it decodes as missing rather than false
+NO_ACTIVE_BIT = NO_PHOTO_BIT << 1
+STAT_FIELDS = ["ppgCareer", "rpgCareer", "apgCareer"]
+# Optional ints, stored as -1 when the record does not have them
+DRAFT_FIELDS = ["draftYear", "draftRound", "draftPick"]
+
+
+class Dictionary:
+    """Assigns a stable small integer to each distinct value, in order of first use."""
+
+    def __init__(self):
+        self.values: list = []
+        self._index: dict = {}
+
+    def encode(self, value) -> int:
+        index = self._index.get(value)
+        if index is None:
+            index = self._index[value] = len(self.values)
+            self.values.append(value)
+        return index
+
+
+def build_payload(players: list[dict]) -> dict:
+    """Encode players column by column."""
+    teams, countries, positions = Dictionary(), Dictionary(), Dictionary()
+    colleges, awards, decades = Dictionary(), Dictionary(), Dictionary()
+    for decade in sorted({d for p in players for d in p.get("decades", [])}):
+        decades.encode(decade)
+
+    columns = {name: [] for name in [
+        "id", "name", "teams", "franchises", "awards", "championYears", "decades",
+        "college", "country", "position", *STAT_FIELDS, "nbaId", *DRAFT_FIELDS, "flags",
+    ]}
+    for p in players:
+        columns["id"].append(p["id"])
+        columns["name"].append(p["name"].strip())
+        columns["teams"].append([teams.encode(t) for t in p.get("teams", [])])
+        columns["franchises"].append(sorted({teams.encode(modern_team(t)) for t in p.get("teams", [])}))
+        columns["awards"].append([awards.encode(a) for a in p.get("awards", [])])
+        columns["championYears"].append([int(y) for y in p.get("championYears", [])])
+        mask = 0
+        for d in p.get("decades", []):
+            mask |= 1 << decades.encode(d)
+        columns["decades"].append(mask)
+        columns["college"].append(colleges.encode(p.get("college", "")))
+        columns["country"].append(countries.encode(p.get("country", "")))
+        columns["position"].append(positions.encode(p.get("position", "")))
+        for field in STAT_FIELDS:
+            columns[field].append(p.get(field, 0))
+        columns["nbaId"].append(int(p["nbaId"]) if p.get("nbaId") else 0)
+        for field in DRAFT_FIELDS:
+            columns[field].append(p.get(field, -1))
+
+        flags = 0
+        for bit, field in enumerate(FLAG_FIELDS):
+            if p.get(field):
+                flags |= 1 << bit
+        if p.get("hasPhoto") is False:
+            flags |= NO_PHOTO_BIT
+        if "active" not in p:
+            flags |= NO_ACTIVE_BIT
+        columns["flags"].append(flags)
+
+    return {
+        "version": PAYLOAD_VERSION,
+        "count": len(players),
+        "digest": id_digest(players),
+        "dicts": {
+            "teams": teams.values,
+            "countries": countries.values,
+            "positions": positions.values,
+            "colleges": colleges.values,
+            "awards": awards.values,
+            "decades": decades.values,
+        },
+        "columns": columns,
+    }
+
+
+def write_payload(players: list[dict], path=OUTPUT_FILE) -> dict[str, int]:
+    """Write the payload and its precompressed variants; returns {filename: bytes}."""
+    raw = canonical_json.dumps(build_payload(players), indent=False).encode("utf-8")
+    outputs = {path: raw, path.with_name(path.name + ".gz"): gzip.compress(raw, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        outputs[path.with_name(path.name + ".br")] = brotli.compress(raw, quality=11)
+    for out_path, data in outputs.items():
+        out_path.write_bytes(data)
+    return {p.name: len(data) for p, data in outputs.items()}
+
+
+def main():
+    print("📦 Building compact player payload...")
+    started = time.perf_counter()
+    players = load_players()
+    sizes = write_payload(players)
+    full = len(json.dumps(players, ensure_ascii=False, indent=2).encode("utf-8"))
+    print(f"📚 Encoded {len(players)} players (pretty-printed JSON: {full / 1024:.0f} KB)")
+    for name, size in sizes.items():
+        print(f"   {name}: {size / 1024:.0f} KB ({full / size:.1f}x smaller)")
+    if brotli is None:
+        print("   ⚠️ brotli not installed, skipped the .br variant")
+    print(f"✅ Done in {(time.perf_counter() - started) * 1000:.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Build the serialized player search index (lib/players.search.json).
+
+    keys/keyPlayers/keyKinds  sorted table of folded names: the full name plus
+                              every trailing part ("karl anthony towns",
+                              "anthony towns", "towns"), so a prefix is one
+                              contiguous range found by binary search
+    top                       best players for every 2-3 letter prefix, where
+                              the range would otherwise be large
+    tokens/deletes            SymSpell-style deletion neighbourhood of each
+                              name part, so one-letter typos still match
+    fame                      precomputed ranking boost per player
+
+Players are referred to by their position in players.json, which is also the
+order of ALL_NBA_PLAYERS; `digest` (id_digest) lets the app check that the
+compact payload was built from the same list. lib/player-search.ts reads it in
+getPlayerSuggestions.
+"""
+
+import re
+import time
+from collections import defaultdict
+
+import canonical_json
+from players_db import LIB_DIR, fold_name, id_digest, load_players
+
+OUTPUT_FILE = LIB_DIR / "players.search.json"
+NBA_DATA_FILE = LIB_DIR / "nba-data.ts"
+INDEX_VERSION = 1
+
+KIND_FULL = 0
+KIND_PART = 1
+# Prefixes this short match too many keys to rank at query time
+TOP_PREFIX_LENGTHS = (2, 3)
+TOP_K = 10
+# Shorter name parts get no typo tolerance (one edit on "li" is a different name)
+MIN_TYPO_LENGTH = 4
+
+FAMOUS_RE = re.compile(r"export const FAMOUS_PLAYER_IDS = \[(.*?)\];", re.DOTALL)
+
+
+def load_famous_ids() -> set[str]:
+    """Read FAMOUS_PLAYER_IDS from nba-data.ts so both sides agree on who is famous."""
+    match = FAMOUS_RE.search(NBA_DATA_FILE.read_text(encoding="utf-8"))
+    if not match:
+        return set()
+    body = re.sub(r"//.*", "", match.group(1))
+    return set(re.findall(r'"([^"]+)"', body))
+
+
+def fame_score(player: dict, famous_ids: set[str]) -> int:
+    """Same boosts getPlayerSuggestions used to apply per keystroke."""
+    score = 0
+    if player["id"] in famous_ids:
+        score += 50
+    if player.get("active"):
+        score += 5
+    if player.get("allStar"):
+        score += 20
+    if player.get("mvp"):
+        score += 30
+    return score
+
+
+def match_score(key: str, query: str, kind: int) -> int:
+    """Relevance of a key for a query it prefixes (mirrors lib/player-search.ts)."""
+    if kind != KIND_FULL:
+        return 60
+    return 100 if key == query else 75
+
+
+def deletes(word: str) -> set[str]:
+    """Every string one deletion away from `word`."""
+    return {word[:i] + word[i + 1:] for i in range(len(word))}
+
+
+def build_index(players: list[dict], famous_ids: set[str]) -> dict:
+    fame = [fame_score(p, famous_ids) for p in players]
+
+    entries = set()
+    token_players = defaultdict(set)
+    for i, player in enumerate(players):
+        parts = fold_name(player["name"]).split()
+        for start in range(len(parts)):
+            entries.add((" ".join(parts[start:]), i, KIND_FULL if start == 0 else KIND_PART))
+        for part in parts:
+            token_players[part].add(i)
+    entries = sorted(entries)
+
+    top = defaultdict(list)
+    for pos, (key, i, _) in enumerate(entries):
+        for length in TOP_PREFIX_LENGTHS:
+            if len(key) >= length:
+                top[key[:length]].append(pos)
+    for prefix, positions in top.items():
+        # Rank exactly like the query does, and keep one entry per player
+        def score(pos):
+            key, i, kind = entries[pos]
+            return match_score(key, prefix, kind) + fame[i]
+        positions.sort(key=lambda pos: (-score(pos), entries[pos][0]))
+        seen, kept = set(), []
+        for pos in positions:
+            if entries[pos][1] not in seen:
+                seen.add(entries[pos][1])
+                kept.append(pos)
+            if len(kept) == TOP_K:
+                break
+        top[prefix] = kept
+
+    tokens = sorted(t for t in token_players if len(t) >= MIN_TYPO_LENGTH)
+    delete_map = defaultdict(list)
+    for t, token in enumerate(tokens):
+        for variant in deletes(token):
+            delete_map[variant].append(t)
+    # Most variants lead to a single part; store those as a bare number
+    delete_map = {v: ts[0] if len(ts) == 1 else ts for v, ts in sorted(delete_map.items())}
+
+    return {
+        "version": INDEX_VERSION,
+        "count": len(players),
+        "digest": id_digest(players),
+        "fame": fame,
+        "keys": [key for key, _, _ in entries],
+        "keyPlayers": [i for _, i, _ in entries],
+        "keyKinds": [kind for _, _, kind in entries],
+        "top": dict(sorted(top.items())),
+        "tokens": tokens,
+        "tokenPlayers": [sorted(token_players[t]) for t in tokens],
+        "deletes": delete_map,
+    }
+
+
+def write_index(players: list[dict], path=OUTPUT_FILE) -> dict:
+    index = build_index(players, load_famous_ids())
+    path.write_text(canonical_json.dumps(index, indent=False), encoding="utf-8")
+    return index
+
+
+def main():
+    print("🔎 Building player search index...")
+    started = time.perf_counter()
+    index = write_index(load_players())
+    print(f"📚 {len(index['keys'])} name keys, {len(index['top'])} short prefixes, "
+          f"{len(index['tokens'])} typo-tolerant parts ({len(index['deletes'])} deletion variants)")
+    print(f"💾 Saved {OUTPUT_FILE.stat().st_size / 1024:.0f} KB to {OUTPUT_FILE} in {(time.perf_counter() - started) * 1000:.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Build the guess-game neighbour table (lib/players.neighbors.json).
+
+Every player becomes a feature vector of blocks, each scaled to unit length
+and then weighted:
+
+    franchises   modern franchises played for (multi-hot)
+    decades      decades played in (multi-hot)
+    awards       award flags, plus Finals MVP
+    position     PG..C slots, spilling half onto the neighbouring slots
+    country      one-hot
+    stats        career ppg/rpg/apg as clipped z-scores
+
+For every notable player (the pool getRandomNotablePlayer draws the target
+from) the K most cosine-similar players are found with blocked matrix
+products and stored best first:
+
+    digest       id_digest of the list the positions refer to
+    targets      positions of the notable players in players.json
+    neighbors    K positions per target, flattened
+    scores       matching similarities, 0-100
+
+lib/player-similarity.ts turns that into "how close is this guess" for the
+guess game without any work at play time.
+"""
+
+import time
+
+import canonical_json
+from players_db import LIB_DIR, id_digest, load_players, modern_team
+
+OUTPUT_FILE = LIB_DIR / "players.neighbors.json"
+INDEX_VERSION = 1
+K = 20
+BLOCK = 256  # targets per matrix product
+
+WEIGHTS = {"franchises": 1.0, "decades": 0.8, "awards": 0.8, "position": 0.6, "country": 0.5, "stats": 1.0}
+AWARD_FLAGS = ("allStar", "champion", "mvp", "dpoy", "roy", "allNBA", "allDefensive")
+POSITION_SLOTS = ("PG", "SG", "SF", "PF", "C")
+POSITION_ALIASES = {"G": ("PG", "SG"), "F": ("SF", "PF")}
+STAT_FIELDS = ("ppgCareer", "rpgCareer", "apgCareer")
+RECENT_DECADES = {"2000s", "2010s", "2020s"}
+
+
+def notable_positions(players: list[dict]) -> list[int]:
+    """Positions of the players getRandomNotablePlayer can pick (same filters, same fallback)."""
+    def recent(p):
+        return p.get("nbaId") and any(d in RECENT_DECADES for d in p["decades"])
+
+    def notable(p):
+        awards = p.get("awards") or []
+        return (p.get("mvp") or "Finals MVP" in awards or p["ppgCareer"] >= 22.0
+                or (p.get("active") and p["ppgCareer"] >= 20.0) or len(awards) >= 3)
+
+    candidates = [i for i, p in enumerate(players) if recent(p) and notable(p)]
+    if len(candidates) < 50:
+        backup = [i for i, p in enumerate(players) if recent(p) and p.get("allStar") and p["ppgCareer"] > 18.0]
+        if backup:
+            return backup
+    return candidates
+
+
+def position_slots(position: str) -> set[str]:
+    slots = set()
+    for part in position.split("-"):
+        slots.update(POSITION_ALIASES.get(part, (part,)))
+    return slots & set(POSITION_SLOTS)
+
+
+def feature_matrix(players: list[dict]):
+    """One L2-normalized row per player (float32), so a dot product is a cosine similarity."""
+    import numpy as np
+
+    franchises = sorted({modern_team(team) for p in players for team in p["teams"]})
+    decades = sorted({decade for p in players for decade in p["decades"]})
+    countries = sorted({p["country"] for p in players})
+    columns = {name: i for i, name in enumerate(franchises)}
+
+    n = len(players)
+    blocks = {
+        "franchises": np.zeros((n, len(franchises)), np.float32),
+        "decades": np.zeros((n, len(decades)), np.float32),
+        "awards": np.zeros((n, len(AWARD_FLAGS) + 1), np.float32),
+        "position": np.zeros((n, len(POSITION_SLOTS)), np.float32),
+        "country": np.zeros((n, len(countries)), np.float32),
+    }
+    decade_columns = {name: i for i, name in enumerate(decades)}
+    country_columns = {name: i for i, name in enumerate(countries)}
+    for row, p in enumerate(players):
+        for team in p["teams"]:
+            blocks["franchises"][row, columns[modern_team(team)]] = 1.0
+        for decade in p["decades"]:
+            blocks["decades"][row, decade_columns[decade]] = 1.0
+        for col, flag in enumerate(AWARD_FLAGS):
+            blocks["awards"][row, col] = bool(p.get(flag))
+        blocks["awards"][row, -1] = "Finals MVP" in (p.get("awards") or [])
+        for slot in position_slots(p["position"]):
+            col = POSITION_SLOTS.index(slot)
+            for near in (col - 1, col + 1):
+                if 0 <= near < len(POSITION_SLOTS):
+                    blocks["position"][row, near] = max(blocks["position"][row, near], 0.5)
+            blocks["position"][row, col] = 1.0
+        blocks["country"][row, country_columns[p["country"]]] = 1.0
+
+    stats = np.array([[p[field] for field in STAT_FIELDS] for p in players], np.float32)
+    std = stats.std(axis=0)
+    blocks["stats"] = np.clip((stats - stats.mean(axis=0)) / np.where(std > 0, std, 1.0), -3.0, 3.0)
+
+    scaled = []
+    for name, block in blocks.items():
+        norms = np.linalg.norm(block, axis=1, keepdims=True)
+        scaled.append(block / np.where(norms > 0, norms, 1.0) * WEIGHTS[name])
+    matrix = np.hstack(scaled).astype(np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms > 0, norms, 1.0)
+
+
+def nearest_neighbors(matrix, targets: list[int], k: int = K, block: int = BLOCK):
+    """Top-k neighbours (positions, similarities) of each target, best first, never the target itself."""
+    import numpy as np
+
+    k = min(k, len(matrix) - 1)
+    targets = np.asarray(targets, dtype=np.int64)
+    neighbors = np.empty((len(targets), k), np.int64)
+    scores = np.empty((len(targets), k), np.float32)
+    for start in range(0, len(targets), block):
+        rows = targets[start:start + block]
+        sims = matrix[rows] @ matrix.T
+        sims[np.arange(len(rows)), rows] = -np.inf
+        top = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+        top_sims = np.take_along_axis(sims, top, axis=1)
+        for i in range(len(rows)):
+            # Best first; equal scores in players.json order, so the output is stable
+            order = np.lexsort((top[i], -top_sims[i]))
+            neighbors[start + i] = top[i][order]
+            scores[start + i] = top_sims[i][order]
+    return neighbors, scores
+
+
+def build_index(players: list[dict], k: int = K) -> dict:
+    import numpy as np
+
+    targets = notable_positions(players)
+    neighbors, scores = nearest_neighbors(feature_matrix(players), targets, k)
+    return {
+        "version": INDEX_VERSION,
+        "count": len(players),
+        "digest": id_digest(players),
+        "k": neighbors.shape[1],
+        "targets": targets,
+        "neighbors": neighbors.ravel().tolist(),
+        "scores": np.rint(np.clip(scores, 0.0, 1.0) * 100).astype(np.int64).ravel().tolist(),
+    }
+
+
+def write_index(players: list[dict], path=OUTPUT_FILE) -> dict:
+    index = build_index(players)
+    path.write_text(canonical_json.dumps(index, indent=False), encoding="utf-8")
+    return index
+
+
+def main():
+    print("🧭 Building player neighbour table...")
+    started = time.perf_counter()
+    players = load_players()
+    index = write_index(players)
+    print(f"🎯 {len(index['targets'])} notable players x {index['k']} neighbours")
+    for target in index["targets"][:3]:
+        row = index["targets"].index(target)
+        near = index["neighbors"][row * index["k"]:row * index["k"] + 3]
+        print(f"   {players[target]['name']}: " + ", ".join(
+            f"{players[i]['name']} ({index['scores'][row * index['k'] + j]})" for j, i in enumerate(near)))
+    print(f"💾 Saved {OUTPUT_FILE.stat().st_size / 1024:.0f} KB to {OUTPUT_FILE} in {(time.perf_counter() - started) * 1000:.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
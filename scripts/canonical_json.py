@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+The canonical JSON encoding every data file is written in: same data, same bytes.
+
+    dumps(data)                          two-space indent
+    dumps(data, indent=False)            minified
+    dumps_records(players, key_order)    one minified record per line (players.json)
+
+Whatever order a script built its dicts in, the output is the same:
+
+    keys          the ones in `key_order` first, in that order, then the rest sorted
+    numbers       integral floats are written as integers (6.0 -> 6, as JSON.stringify
+                  does) and -0.0 as 0; NaN and infinities raise ValueError
+    strings       UTF-8, nothing escaped beyond what JSON requires
+
+orjson encodes when it is installed, the json module otherwise; both write the
+same bytes (apart from floats below 1e-4, which each spells in its own exponent
+form, and which no data file holds).
+"""
+
+import json
+import math
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+RECORDS_HEADER, RECORDS_SEPARATOR, RECORDS_FOOTER = "[\n", ",\n", "\n]\n"
+
+
+def canonical(value, key_order=()):
+    """A copy of `value` with keys ordered and numbers normalized."""
+    rank = {key: i for i, key in enumerate(key_order)}
+    orders = {}  # key tuple -> its canonical order; most records share a handful of shapes
+
+    def normalize(value):
+        kind = type(value)
+        if kind is str or kind is bool or kind is int or value is None:
+            return value
+        if kind is float:
+            if not math.isfinite(value):
+                raise ValueError(f"{value} has no JSON form")
+            return int(value) if value.is_integer() else value
+        if isinstance(value, dict):
+            shape = tuple(value)
+            order = orders.get(shape)
+            if order is None:
+                for key in shape:
+                    if not isinstance(key, str):
+                        raise TypeError(f"keys must be strings, not {type(key).__name__}: {key!r}")
+                order = orders[shape] = sorted(shape, key=lambda key: (rank.get(key, len(rank)), key))
+            return {key: normalize(value[key]) for key in order}
+        if isinstance(value, (list, tuple)):
+            # Lists of strings (teams, awards, decades) are most lists in the data
+            if all(type(item) is str for item in value):
+                return list(value)
+            return [normalize(item) for item in value]
+        if isinstance(value, float):
+            return normalize(float(value))
+        return value
+
+    return normalize(value)
+
+
+def _encode(value, indent: bool) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_INDENT_2 if indent else 0).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass  # e.g. an integer beyond 64 bits; the json module writes the same bytes
+    if indent:
+        return json.dumps(value, ensure_ascii=False, indent=2)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def dumps(value, indent: bool = True, key_order=()) -> str:
+    return _encode(canonical(value, key_order), indent)
+
+
+def dumps_records(records: list, key_order=()) -> str:
+    """A list of records with each one minified on its own line, so a diff shows the records that changed."""
+    lines = [_encode(record, False) for record in canonical(records, key_order)]
+    return RECORDS_HEADER + RECORDS_SEPARATOR.join(lines) + RECORDS_FOOTER
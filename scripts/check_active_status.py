@@ -4,11 +4,9 @@ Check which players are marked as retired (active: false) in players.json
 Focus on well-known active players who might be incorrectly marked
 """
 
-import json
+from collections import Counter
 
-# Read players.json
-with open('lib/players.json', 'r') as f:
-    players = json.load(f)
+from players_db import iter_players
 
 # Known active players (as of 2025-26 season)
 KNOWN_ACTIVE_PLAYERS = [
@@ -33,10 +31,13 @@ KNOWN_ACTIVE_PLAYERS = [
 # Find players marked as retired who might still be active
 incorrectly_retired = []
 missing_active_field = []
+# None (no field) / True / False -> number of players
+active_counts = Counter()
 
-for player in players:
+for player in iter_players(fields=('id', 'name', 'active', 'teams')):
     name = player.get('name', '')
     active = player.get('active')
+    active_counts[active] += 1
     
     # Check if active field is missing
     if active is None:
@@ -71,12 +72,11 @@ if not incorrectly_retired and not missing_active_field:
     print("✅ All known active players are correctly marked!")
 
 # Also check: how many players total have active field
-players_with_active = sum(1 for p in players if 'active' in p)
-players_without_active = len(players) - players_with_active
+total_players = sum(active_counts.values())
 
 print(f"\n📊 Statistics:")
-print(f"   Total players: {len(players)}")
-print(f"   With 'active' field: {players_with_active}")
-print(f"   Without 'active' field: {players_without_active}")
-print(f"   Marked as active: {sum(1 for p in players if p.get('active') == True)}")
-print(f"   Marked as retired: {sum(1 for p in players if p.get('active') == False)}")
+print(f"   Total players: {total_players}")
+print(f"   With 'active' field: {total_players - active_counts[None]}")
+print(f"   Without 'active' field: {active_counts[None]}")
+print(f"   Marked as active: {active_counts[True]}")
+print(f"   Marked as retired: {active_counts[False]}")
@@ -1,7 +1,9 @@
 import json
 
-main_path = 'lib/players.json'
-enriched_path = 'lib/players_enriched.json'
+from players_db import DATA_FILE, LIB_DIR
+
+main_path = DATA_FILE
+enriched_path = LIB_DIR / 'players_enriched.json'
 
 with open(main_path, 'r') as f:
     main_data = json.load(f)
@@ -4,15 +4,19 @@ Check internal consistency in players.json
 Verify that awards array matches boolean fields
 """
 
-import json
+from players_db import iter_players
 
-# Read players.json
-with open('lib/players.json', 'r') as f:
-    players = json.load(f)
+FIELDS = ('id', 'name', 'awards', 'champion', 'mvp', 'dpoy', 'roy', 'allStar')
+SHOWN = 20
 
+print(f"\n🔍 Checking players.json\n")
+
+# Stream the records: issues print as they are found
 inconsistencies = []
+checked = 0
 
-for player in players:
+for player in iter_players(fields=FIELDS):
+    checked += 1
     issues = []
     name = player.get('name', 'Unknown')
     player_id = player.get('id', 'unknown')
@@ -53,25 +57,18 @@ for player in players:
         issues.append(f"'All-Star' in awards={has_allstar_award} but allStar={allstar_bool}")
     
     if issues:
-        inconsistencies.append({
-            'id': player_id,
-            'name': name,
-            'issues': issues,
-            'awards': awards
-        })
-
-print(f"\n🔍 Checked {len(players)} players in players.json\n")
-print(f"Found {len(inconsistencies)} player(s) with inconsistent data:\n")
+        inconsistencies.append(player_id)
+        if len(inconsistencies) <= SHOWN:  # Show first 20
+            print(f"❌ {name} ({player_id})")
+            print(f"   awards: {awards}")
+            for issue in issues:
+                print(f"   - {issue}")
+            print()
 
-for inc in inconsistencies[:20]:  # Show first 20
-    print(f"❌ {inc['name']} ({inc['id']})")
-    print(f"   awards: {inc['awards']}")
-    for issue in inc['issues']:
-        print(f"   - {issue}")
-    print()
+if len(inconsistencies) > SHOWN:
+    print(f"... and {len(inconsistencies) - SHOWN} more players with issues\n")
 
-if len(inconsistencies) > 20:
-    print(f"... and {len(inconsistencies) - 20} more players with issues\n")
+print(f"Checked {checked} players, found {len(inconsistencies)} player(s) with inconsistent data")
 
 if not inconsistencies:
     print("✅ All players have consistent award data!")
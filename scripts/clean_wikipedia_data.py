@@ -5,11 +5,13 @@ Cross-references with existing players.json database.
 """
 
 import json
-from pathlib import Path
+from pipeline_profile import Profiler
+from players_db import DATA_FILE, LIB_DIR, save_json
+from transactions import CLEAN_FILE, Move, TransactionGraph
 
 def load_existing_players():
     """Load existing player names from players.json."""
-    players_path = Path("lib/players.json")
+    players_path = DATA_FILE
     if players_path.exists():
         with open(players_path) as f:
             data = json.load(f)
@@ -58,63 +60,39 @@ def is_likely_player_name(name: str, existing_players: set) -> bool:
     
     return False
 
-def extract_team_changes_from_trades(trades: list) -> list[dict]:
-    """Extract team change information from trade data."""
-    team_changes = []
-    
-    nba_teams = {
-        "Atlanta Hawks": "ATL", "Boston Celtics": "BOS", "Brooklyn Nets": "BKN",
-        "Charlotte Hornets": "CHA", "Chicago Bulls": "CHI", "Cleveland Cavaliers": "CLE",
-        "Dallas Mavericks": "DAL", "Denver Nuggets": "DEN", "Detroit Pistons": "DET",
-        "Golden State Warriors": "GSW", "Houston Rockets": "HOU", "Indiana Pacers": "IND",
-        "Los Angeles Clippers": "LAC", "Los Angeles Lakers": "LAL", "Memphis Grizzlies": "MEM",
-        "Miami Heat": "MIA", "Milwaukee Bucks": "MIL", "Minnesota Timberwolves": "MIN",
-        "New Orleans Pelicans": "NOP", "New York Knicks": "NYK", "Oklahoma City Thunder": "OKC",
-        "Orlando Magic": "ORL", "Philadelphia 76ers": "PHI", "Phoenix Suns": "PHX",
-        "Portland Trail Blazers": "POR", "Sacramento Kings": "SAC", "San Antonio Spurs": "SAS",
-        "Toronto Raptors": "TOR", "Utah Jazz": "UTA", "Washington Wizards": "WAS"
-    }
-    
+def extract_moves_from_trades(trades: list, existing_players: set) -> list[Move]:
+    """One Move per player leg of each scraped trade."""
+    moves = []
     for trade in trades:
-        raw = trade.get("raw", "")
-        year = trade.get("year", 0)
-        players = trade.get("players", [])
-        
-        # Try to find team mentions
-        teams_mentioned = []
-        for team_name, abbrev in nba_teams.items():
-            if team_name in raw or abbrev in raw:
-                teams_mentioned.append(abbrev)
-        
-        if teams_mentioned and players:
-            team_changes.append({
-                "year": year,
-                "players": [p for p in players if is_likely_player_name(p, set())],
-                "teams": teams_mentioned,
-                "raw": raw[:200]
-            })
-    
-    return team_changes
+        for leg in trade.get("moves", []):
+            if not is_likely_player_name(leg["player"], existing_players):
+                continue
+            moves.append(Move(trade["date"], leg["player"], leg["from"] or "", leg["to"],
+                              "draft-rights" if leg["rights"] else trade["type"]))
+    return moves
 
 def main():
     print("🧹 Cleaning Wikipedia NBA transactions data...")
+    profiler = Profiler.from_argv("clean_wikipedia_data")
     
     # Load raw Wikipedia data
-    wiki_path = Path("lib/wikipedia_nba_transactions.json")
+    wiki_path = LIB_DIR / "wikipedia_nba_transactions.json"
     if not wiki_path.exists():
         print("❌ No Wikipedia data found. Run scrape_wikipedia_transfers.py first.")
         return
     
-    with open(wiki_path) as f:
-        wiki_data = json.load(f)
-    
-    # Load existing players
-    existing_players = load_existing_players()
+    with profiler.stage("load"):
+        with open(wiki_path) as f:
+            wiki_data = json.load(f)
+        
+        # Load existing players
+        existing_players = load_existing_players()
     print(f"📚 Loaded {len(existing_players)} existing players from database")
     
     # Clean player list
     raw_players = wiki_data.get("players", [])
-    clean_players = [p for p in raw_players if is_likely_player_name(p, existing_players)]
+    with profiler.stage("filter_players"):
+        clean_players = [p for p in raw_players if is_likely_player_name(p, existing_players)]
     
     print(f"✅ Filtered {len(raw_players)} -> {len(clean_players)} likely players")
     
@@ -122,28 +100,32 @@ def main():
     new_players = [p for p in clean_players if p not in existing_players]
     print(f"🆕 Found {len(new_players)} potential new players not in database")
     
-    # Extract team changes from trades
+    # Turn the trades into player moves between teams
     trades = wiki_data.get("trades", [])
-    team_changes = extract_team_changes_from_trades(trades)
-    print(f"🔄 Found {len(team_changes)} trades with team information")
+    unstructured = sum(1 for trade in trades if "moves" not in trade)
+    if unstructured:
+        print(f"⚠️ {unstructured} trades were scraped before moves were recorded; run scrape_wikipedia_transfers.py again")
+    with profiler.stage("extract_moves"):
+        graph = TransactionGraph(extract_moves_from_trades(trades, existing_players))
+    print(f"🔄 Found {len(graph)} moves of {len(graph.players())} players")
     
     # Save cleaned data
     output = {
         "clean_players": clean_players,
         "new_players_not_in_db": new_players[:500],  # Limit to avoid too large file
-        "team_changes": team_changes,
+        "transactions": graph.to_rows(),
         "stats": {
             "raw_players": len(raw_players),
             "clean_players": len(clean_players),
             "new_players": len(new_players),
             "total_trades": len(trades),
-            "trades_with_teams": len(team_changes)
+            "moves": len(graph)
         }
     }
     
-    output_path = Path("lib/wikipedia_nba_clean.json")
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    output_path = CLEAN_FILE
+    with profiler.stage("save"):
+        save_json(output_path, output)
     print(f"\n💾 Saved cleaned data to {output_path}")
     
     # Show some samples
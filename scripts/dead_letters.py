@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Dead-letter store for API fetches that can never succeed as-is.
+
+A failure is permanent when the API answered and the answer is the problem:
+a 4xx status (other than 429), or a valid JSON payload without the
+resultSet(s) nba_api expects (e.g. "Cui Cui", "Timmy Allen"). Timeouts,
+connection errors, 429/5xx and unparseable bodies are transient and keep
+their retry budget.
+
+Permanent failures are parked in scripts/cache/dead_letters.json with the
+raw response, and skipped until their re-check date (7 days, doubling on
+each repeat failure, capped at 90 days).
+
+    python scripts/dead_letters.py                  # list parked fetches
+    python scripts/dead_letters.py --release 1630548  # re-check on the next run
+"""
+
+import argparse
+import json
+import threading
+import time
+
+from players_db import CACHE_DIR, load_json, save_json
+
+STORE_FILE = CACHE_DIR / "dead_letters.json"
+RECHECK_DAYS = 7
+MAX_RECHECK_DAYS = 90
+MAX_RAW_CHARS = 20_000
+
+TRANSIENT = "transient"
+PERMANENT = "permanent"
+
+
+class PermanentFailure(Exception):
+    """A fetch that will fail the same way on retry; carries the raw response."""
+
+    def __init__(self, endpoint: str, reason: str, raw: str | None = None, status: int | None = None):
+        super().__init__(f"{endpoint}: {reason}")
+        self.endpoint = endpoint
+        self.reason = reason
+        self.raw = raw
+        self.status = status
+
+
+def classify(error: Exception, status: int | None, raw: str | None) -> str:
+    """Transient or permanent, from the exception and what the server sent back."""
+    if status is not None:
+        if status == 429 or status >= 500:
+            return TRANSIENT
+        if 400 <= status < 500:
+            return PERMANENT
+    if raw is None:
+        return TRANSIENT  # no answer at all: timeout, connection reset, DNS...
+    try:
+        payload = json.loads(raw)
+    except ValueError:
+        return TRANSIENT  # HTML error page or truncated body from a throttled request
+    if isinstance(error, (KeyError, IndexError)) and isinstance(payload, dict) \
+            and "resultSet" not in payload and "resultSets" not in payload:
+        return PERMANENT
+    return TRANSIENT
+
+
+class DeadLetterStore:
+    """Thread-safe map of parked fetch keys (player ids) to their last permanent failure."""
+
+    def __init__(self, path=STORE_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self.entries: dict[str, dict] = load_json(path) if path.exists() else {}
+
+    def is_parked(self, key: str, now: float | None = None) -> bool:
+        entry = self.entries.get(key)
+        return entry is not None and entry["recheckAfter"] > (now or time.time())
+
+    def park(self, key: str, name: str, failure: PermanentFailure):
+        now = time.time()
+        with self._lock:
+            failures = self.entries.get(key, {}).get("failures", 0) + 1
+            days = min(RECHECK_DAYS * 2 ** (failures - 1), MAX_RECHECK_DAYS)
+            self.entries[key] = {
+                "name": name,
+                "endpoint": failure.endpoint,
+                "reason": failure.reason,
+                "status": failure.status,
+                "raw": (failure.raw or "")[:MAX_RAW_CHARS],
+                "failures": failures,
+                "lastFailedAt": now,
+                "recheckAfter": now + days * 86400,
+            }
+
+    def release(self, key: str) -> bool:
+        """Re-check a parked key on the next run; False if it is not parked."""
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                entry["recheckAfter"] = 0
+            return entry is not None
+
+    def resolve(self, key: str) -> bool:
+        """Forget a key that fetched fine on its re-check."""
+        with self._lock:
+            return self.entries.pop(key, None) is not None
+
+    def save(self):
+        with self._lock:
+            CACHE_DIR.mkdir(exist_ok=True)
+            save_json(self.path, self.entries)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--release", nargs="+", metavar="KEY", help="re-check these on the next run")
+    args = parser.parse_args(argv)
+
+    store = DeadLetterStore()
+    if args.release:
+        for key in args.release:
+            if store.release(key):
+                print(f"🔓 Released {key} ({store.entries[key]['name']})")
+            else:
+                print(f"❓ {key} is not parked")
+        store.save()
+        return
+
+    if not store.entries:
+        print("✅ No dead letters")
+        return
+    now = time.time()
+    print(f"📪 {len(store.entries)} parked fetches:")
+    for key, entry in sorted(store.entries.items(), key=lambda kv: kv[1]["recheckAfter"]):
+        due = "due now" if entry["recheckAfter"] <= now else \
+            "re-check " + time.strftime("%Y-%m-%d", time.localtime(entry["recheckAfter"]))
+        print(f"   {key:<10} {entry['name']:<28} {entry['endpoint']:<18} {entry['reason']} "
+              f"(x{entry['failures']}, {due})")
+
+
+if __name__ == "__main__":
+    main()
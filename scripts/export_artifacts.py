@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Render every derived player artifact from the canonical players.json.
+
+    lib/players.json               one minified record per line, by name (see canonical_json.py)
+    lib/players.md                 pretty-printed dump of every record
+    lib/players_enriched.json      id/name/teams/nbaId/active for its listed players
+    lib/additional-nba-data.ts     ADDITIONAL_NBA_PLAYERS literal for its listed players
+    lib/players.compact.json       columnar payload (see build_compact_payload.py)
+    lib/players.search.json        name search index (see build_search_index.py)
+    lib/players.neighbors.json     guess-game neighbour table (see build_similarity_index.py)
+
+Each record is hashed, and the rendered fragment for that hash is cached in
+scripts/cache/export_fragments.json, so only changed records are re-rendered
+and unchanged files are never rewritten. When neither the source nor any
+output changed on disk since the last export, nothing is even loaded.
+"""
+
+import argparse
+import hashlib
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+import build_compact_payload
+import build_search_index
+import build_similarity_index
+import canonical_json
+from pipeline_profile import Profiler, add_profile_argument
+from player_schema import SchemaError, validate_players
+from players_db import CACHE_DIR, DATA_FILE, LIB_DIR, PLAYER_KEY_ORDER, build_name_index, fold_name, load_json, player_sort_key, save_json, write_atomic
+from ts_literals import TsLiteral
+
+MANIFEST_FILE = CACHE_DIR / "export_manifest.json"
+FRAGMENTS_FILE = CACHE_DIR / "export_fragments.json"
+# Bump when a renderer changes so cached fragments are thrown away
+RENDER_VERSION = 5
+
+TS_FIELDS = [
+    "id", "name", "teams", "awards", "allStar", "champion", "championYears",
+    "mvp", "dpoy", "roy", "allNBA", "allDefensive", "college", "country",
+    "decades", "ppgCareer", "rpgCareer", "apgCareer", "position", "nbaId",
+    "draftYear", "draftRound", "draftPick",
+]
+ENRICHED_FIELDS = ["id", "name", "teams", "nbaId", "active"]
+TS_LITERAL = "ADDITIONAL_NBA_PLAYERS"
+
+
+def normalize_record(player: dict) -> dict:
+    """Fix drift that should never reach an artifact (e.g. the "  Nene" name)."""
+    name = player.get("name")
+    if isinstance(name, str) and name != name.strip():
+        player = {**player, "name": name.strip()}
+    return player
+
+
+def record_hash(player: dict) -> str:
+    encoded = canonical_json.dumps(player, indent=False)
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def render_minified(player: dict) -> str:
+    return canonical_json.dumps(player, indent=False, key_order=PLAYER_KEY_ORDER)
+
+
+def render_pretty(player: dict, key_order=PLAYER_KEY_ORDER) -> str:
+    return "  " + canonical_json.dumps(player, key_order=key_order).replace("\n", "\n  ")
+
+
+def render_enriched(player: dict) -> str:
+    return render_pretty({k: player[k] for k in ENRICHED_FIELDS if k in player}, ENRICHED_FIELDS)
+
+
+def render_ts(player: dict) -> str:
+    lines = [
+        f"    {field}: {canonical_json.dumps(player[field], indent=False)}"
+        for field in TS_FIELDS if field in player
+    ]
+    return "  {\n" + ",\n".join(lines) + "\n  }"
+
+
+def ts_header(count: int) -> str:
+    return (
+        "// Additional NBA Players (Auto-generated)\n"
+        f"// Total: {count} players\n\n"
+        "import type { NBAPlayer } from './nba-data'\n\n"
+        f"export const {TS_LITERAL}: NBAPlayer[] = [\n"
+    )
+
+
+def json_members(path: Path) -> dict[str, str]:
+    return {p["id"]: p.get("name", "") for p in load_json(path)}
+
+
+def ts_members(path: Path) -> dict[str, str]:
+    return {player_id: node.value.get("name", "") for player_id, node in TsLiteral.load(path, TS_LITERAL).index.items()}
+
+
+def resolve_members(members: dict[str, str], players: list[dict]) -> tuple[dict[str, str], dict[str, str], list[str]]:
+    """Members under the ids players.json uses now.
+
+    A member id players.json does not have is drift from an older way of
+    slugging names ("amar-e-stoudemire" for "amare-stoudemire"): it maps to
+    the one player whose folded name matches. Members matching no player, or
+    several, are dropped rather than rendered from stale text.
+
+    Returns (id -> name, {old id: new id}, dropped ids).
+    """
+    by_id = {p["id"]: p for p in players}
+    by_name = None
+    resolved, remapped, dropped = {}, {}, []
+    for member_id, name in members.items():
+        player = by_id.get(member_id)
+        if player is None:
+            by_name = by_name if by_name is not None else build_name_index(players)
+            matches = by_name.get(fold_name(name), [])
+            if len(matches) != 1:
+                dropped.append(member_id)
+                continue
+            player = matches[0]
+            remapped[member_id] = player["id"]
+        resolved[player["id"]] = player["name"]
+    return resolved, remapped, dropped
+
+
+@dataclass(frozen=True)
+class Artifact:
+    name: str
+    path: Path
+    render: Callable[[dict], str]
+    header: Callable[[int], str]
+    separator: str
+    footer: str
+    # None renders every record; otherwise reads the members from the existing file once, as id -> name
+    members_from: Callable[[Path], dict[str, str]] | None = None
+
+
+ARTIFACTS = [
+    # Same bytes as players_db.save_players
+    Artifact("players.json", LIB_DIR / "players.json", render_minified, lambda n: canonical_json.RECORDS_HEADER,
+             canonical_json.RECORDS_SEPARATOR, canonical_json.RECORDS_FOOTER),
+    Artifact("players.md", LIB_DIR / "players.md", render_pretty, lambda n: "[\n", ",\n", "\n]"),
+    Artifact("players_enriched.json", LIB_DIR / "players_enriched.json", render_enriched,
+             lambda n: "[\n", ",\n", "\n]", json_members),
+    Artifact("additional-nba-data.ts", LIB_DIR / "additional-nba-data.ts", render_ts,
+             ts_header, ",\n\n", "\n];\n", ts_members),
+]
+
+# Whole-file outputs rebuilt from scratch whenever the players.json content changes
+DERIVED = [
+    (build_compact_payload.OUTPUT_FILE, build_compact_payload.write_payload),
+    (build_search_index.OUTPUT_FILE, build_search_index.write_index),
+    (build_similarity_index.OUTPUT_FILE, build_similarity_index.write_index),
+]
+
+
+def file_stamp(path: Path) -> list[int] | None:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def load_manifest() -> dict:
+    if MANIFEST_FILE.exists():
+        manifest = load_json(MANIFEST_FILE)
+        if manifest.get("version") == RENDER_VERSION:
+            return manifest
+    return {"version": RENDER_VERSION, "artifacts": {}}
+
+
+def load_fragments() -> dict:
+    if FRAGMENTS_FILE.exists():
+        fragments = load_json(FRAGMENTS_FILE)
+        if fragments.get("version") == RENDER_VERSION:
+            return fragments
+    return {"version": RENDER_VERSION}
+
+
+def text_digest(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def is_up_to_date(manifest: dict, source: Path) -> bool:
+    """True when neither the source nor any output changed since the last export."""
+    if manifest.get("source") != file_stamp(source):
+        return False
+    for path, _ in DERIVED:
+        if manifest.get("derived", {}).get(path.name) != file_stamp(path):
+            return False
+    for artifact in ARTIFACTS:
+        entry = manifest["artifacts"].get(artifact.name)
+        if not entry or entry.get("stamp") != file_stamp(artifact.path):
+            return False
+    return True
+
+
+def export_artifact(artifact: Artifact, players: list[dict], hashes: list[str], entry: dict,
+                    old_fragments: dict) -> tuple[dict, dict, int, bool]:
+    """Render one artifact, reusing cached fragments.
+
+    Returns (manifest entry, fragments, re-rendered count, written). The entry
+    lists members that were remapped or dropped this run under "remapped" and
+    "dropped".
+    """
+    remapped, dropped = {}, []
+    if artifact.members_from is not None:
+        members = entry.get("members")
+        if members is None:
+            members = artifact.members_from(artifact.path) if artifact.path.exists() else {}
+        members, remapped, dropped = resolve_members(members, players)
+        selected = [(p, h) for p, h in zip(players, hashes) if p["id"] in members]
+    else:
+        members = None
+        selected = list(zip(players, hashes))
+
+    fragments = {}
+    parts = []
+    rendered = 0
+    for player, digest in selected:
+        fragment = old_fragments.get(digest)
+        if fragment is None:
+            fragment = artifact.render(player)
+            rendered += 1
+        fragments[digest] = fragment
+        parts.append(fragment)
+
+    text = artifact.header(len(parts)) + artifact.separator.join(parts) + artifact.footer
+    digest = text_digest(text)
+    on_disk = entry.get("digest") if file_stamp(artifact.path) == entry.get("stamp") else None
+    if on_disk is None and artifact.path.exists():
+        # Touched or edited by hand since the last export: compare the actual bytes
+        on_disk = text_digest(artifact.path.read_text(encoding="utf-8"))
+    written = digest != on_disk
+    if written:
+        write_atomic(artifact.path, text)
+
+    new_entry = {"digest": digest, "stamp": file_stamp(artifact.path)}
+    if members is not None:
+        new_entry["members"] = members
+    if remapped:
+        new_entry["remapped"] = remapped
+    if dropped:
+        new_entry["dropped"] = dropped
+    return new_entry, fragments, rendered, written
+
+
+def export_all(source: Path = DATA_FILE, force: bool = False, profiler: Profiler | None = None) -> bool:
+    """Export every artifact; returns False when everything was already up to date."""
+    profiler = profiler or Profiler("export_artifacts")
+    manifest = {"version": RENDER_VERSION, "artifacts": {}} if force else load_manifest()
+    if not force and is_up_to_date(manifest, source):
+        return False
+
+    with profiler.stage("load"):
+        records = load_json(source)
+        problems = validate_players(records)
+        if problems:
+            raise SchemaError(problems, source.name)
+        players = sorted((normalize_record(p) for p in records), key=player_sort_key)
+        hashes = [record_hash(p) for p in players]
+    print(f"📚 Loaded {len(players)} players from {source.name}")
+
+    fragments = {"version": RENDER_VERSION} if force else load_fragments()
+    for artifact in ARTIFACTS:
+        with profiler.stage(f"render:{artifact.name}"):
+            entry, fragments[artifact.name], rendered, written = export_artifact(
+                artifact, players, hashes, manifest["artifacts"].get(artifact.name, {}), fragments.get(artifact.name, {})
+            )
+        manifest["artifacts"][artifact.name] = entry
+        status = "💾 written" if written else "⏩ unchanged"
+        print(f"   {artifact.name}: {rendered} records re-rendered, {status}")
+        if entry.get("remapped"):
+            print(f"   🔁 {len(entry['remapped'])} member ids drifted, now: "
+                  + ", ".join(f"{old} -> {new}" for old, new in entry["remapped"].items()))
+        if entry.get("dropped"):
+            print(f"   ⚠️ {len(entry['dropped'])} members are not in {source.name}, dropped: " + ", ".join(entry["dropped"]))
+
+    players_digest = manifest["artifacts"]["players.json"]["digest"]
+    derived = manifest.setdefault("derived", {})
+    for path, write in DERIVED:
+        if players_digest != manifest.get("derivedDigest") or derived.get(path.name) != file_stamp(path):
+            with profiler.stage(f"derive:{path.name}"):
+                write(players, path)
+            print(f"   {path.name}: 💾 written")
+        derived[path.name] = file_stamp(path)
+    manifest["derivedDigest"] = players_digest
+
+    # players.json may just have been rewritten, so take the source stamp last
+    manifest["source"] = file_stamp(source)
+    CACHE_DIR.mkdir(exist_ok=True)
+    save_json(MANIFEST_FILE, manifest)
+    save_json(FRAGMENTS_FILE, fragments)
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--force", action="store_true", help="ignore the manifest and re-render everything")
+    add_profile_argument(parser)
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    if export_all(force=args.force, profiler=Profiler("export_artifacts", enabled=args.profile)):
+        print(f"✅ Export finished in {(time.perf_counter() - started) * 1000:.0f}ms")
+    else:
+        print(f"✅ Nothing changed, skipped in {(time.perf_counter() - started) * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,15 @@
 
 import json
 import time
-import os
 from nba_api.stats.static import players
 from nba_api.stats.endpoints import playercareerstats, commonallplayers
 
-# Output file (we will update this file)
-DATA_FILE = 'lib/players.json'
+from players_db import DATA_FILE, save_players
+from result_sets import result_sets
 
 def fetch_data():
     print("Reading existing database...")
-    if os.path.exists(DATA_FILE):
+    if DATA_FILE.exists():
         with open(DATA_FILE, 'r') as f:
             existing_data = json.load(f)
     else:
@@ -28,17 +27,14 @@ def fetch_data():
         print("Attempting to fetch COMPLETE player list from NBA Server (CommonAllPlayers)...")
         # is_only_current_season=0 gets ALL players in history
         board = commonallplayers.CommonAllPlayers(is_only_current_season=0, timeout=30)
-        df_players = board.get_data_frames()[0]
+        rows = result_sets(board)[0].tuples('PERSON_ID', 'DISPLAY_FIRST_LAST', 'ROSTERSTATUS')
         
         # Convert to list of dicts compatible with static format
-        # API columns: PERSON_ID, DISPLAY_FIRST_LAST, ROSTERSTATUS, etc.
-        nba_players = []
-        for _, row in df_players.iterrows():
-            nba_players.append({
-                'id': row['PERSON_ID'],
-                'full_name': row['DISPLAY_FIRST_LAST'],
-                'is_active': row['ROSTERSTATUS'] == 1 # Usually 1=Active
-            })
+        nba_players = [{
+            'id': person_id,
+            'full_name': name,
+            'is_active': roster_status == 1 # Usually 1=Active
+        } for person_id, name, roster_status in rows]
             
         print(f"SUCCESS: Retrieved {len(nba_players)} players from LIVE API.")
         
@@ -96,9 +92,8 @@ def fetch_data():
             # Fetch Career Stats
             try:
                 career = playercareerstats.PlayerCareerStats(player_id=p_id, timeout=10) # Add timeout
-                df = career.get_data_frames()[0]
-                teams = df['TEAM_ABBREVIATION'].unique().tolist()
-                teams = [t for t in teams if t != 'TOT']
+                teams = result_sets(career)[0].column('TEAM_ABBREVIATION')
+                teams = [t for t in dict.fromkeys(teams) if t != 'TOT']
                 
                 # If existing player, update
                 if target_player:
@@ -144,8 +139,7 @@ def fetch_data():
                 # BATCH SAVE
                 if updates_count % BATCH_SIZE == 0:
                     print(f"--- Saving Batch ({updates_count} updated) ---")
-                    with open(DATA_FILE, 'w') as f:
-                        json.dump(existing_data, f, indent=2)
+                    save_players(existing_data)
 
             except Exception as api_err:
                  print(f"API Error for {name}: {api_err}")
@@ -158,8 +152,7 @@ def fetch_data():
             print(f"Error processing {player['full_name']}: {e}")
 
     # Final Save
-    with open(DATA_FILE, 'w') as f:
-        json.dump(existing_data, f, indent=2)
+    save_players(existing_data)
     
     print(f"Updated {updates_count} players in {DATA_FILE}")
 if __name__ == "__main__":
@@ -4,11 +4,7 @@ Find all players who should be active but are showing as retired
 Check both players.json and the final merged data
 """
 
-import json
-
-# Read players.json
-with open('lib/players.json', 'r') as f:
-    all_players = json.load(f)
+from players_db import iter_players
 
 # Extended list of known active players (2025-26 season)
 KNOWN_ACTIVE_2025 = {
@@ -49,12 +45,17 @@ KNOWN_ACTIVE_2025 = {
     "Josh Giddey", "Jalen Johnson", "AJ Griffin", "Ousmane Dieng",
 }
 
-# Find players who should be active but aren't marked as such
+# Find players who should be active but aren't marked as such (streaming: only 3 fields are read)
 issues = []
+total_players = 0
+missing_active_total = 0
 
-for player in all_players:
+for player in iter_players(fields=('id', 'name', 'active')):
+    total_players += 1
     name = player.get('name', '')
     active = player.get('active')
+    if 'active' not in player:
+        missing_active_total += 1
     
     if name in KNOWN_ACTIVE_2025:
         if active is None:
@@ -72,7 +73,7 @@ for player in all_players:
                 'current_value': 'false'
             })
 
-print(f"\n🔍 Checking {len(all_players)} players in players.json\n")
+print(f"\n🔍 Checked {total_players} players in players.json\n")
 print(f"Known active players to check: {len(KNOWN_ACTIVE_2025)}\n")
 
 if issues:
@@ -97,9 +98,7 @@ if issues:
 else:
     print("✅ All known active players have correct status!")
 
-# Also check: how many total players are missing the active field
-missing_active_total = sum(1 for p in all_players if 'active' not in p)
 print(f"\n📊 Overall Statistics:")
-print(f"   Total players: {len(all_players)}")
+print(f"   Total players: {total_players}")
 print(f"   Missing 'active' field: {missing_active_total}")
-print(f"   With 'active' field: {len(all_players) - missing_active_total}")
+print(f"   With 'active' field: {total_players - missing_active_total}")
@@ -1,6 +1,8 @@
 import json
 import os
 
+from players_db import save_players
+
 PLAYERS_DB_PATH = os.path.join(os.path.dirname(__file__), '..', 'lib', 'players.json')
 
 def fix_okc_champions():
@@ -51,8 +53,7 @@ def fix_okc_champions():
                 confirmed_champions.append(player['name'])
 
     # Save changes
-    with open(PLAYERS_DB_PATH, 'w', encoding='utf-8') as f:
-        json.dump(players, f, indent=2, ensure_ascii=False)
+    save_players(players, PLAYERS_DB_PATH)
 
     print(f"\nReverted {reverted_count} incorrect updates.")
     print(f"\n🏆 OFFICIAL OKC 2025 CHAMPIONS ({len(confirmed_champions)} players):")
@@ -1,275 +1,320 @@
-import json
-import time
-import os
+import argparse
 import random
-from datetime import datetime
-from nba_api.stats.endpoints import commonallplayers, playercareerstats, playerawards
+
+from dead_letters import PERMANENT, DeadLetterStore, PermanentFailure, classify
+from pipeline_metrics import METRICS, RunProgress
+from pipeline_profile import Profiler, add_profile_argument
+from players_db import LOGS_DIR, load_players, save_players
+from refresh_scheduler import FIELD_GROUPS, RefreshState, describe, plan_refreshes, recently_traded_names
+from result_sets import result_sets
 
 # Configuration
-DATA_FILE = 'lib/players.json'
-TARGET_COUNT = 550 # Aim for a bit more than 500 to be safe
+API_BUDGET = 1100 # API calls per run (one per field group of a player)
 BATCH_SAVE = 10
+METRICS_FILE = LOGS_DIR / "god_mode_metrics.prom"
+
+def get_player_list():
+    """Fetch every player the API knows; the refresh scheduler decides which ones to update."""
+    from nba_api.stats.endpoints import commonallplayers
 
-def get_recent_players_list():
-    """Fetch all players and filter for the most recent ~500."""
     print("📋 Fetching complete player list from NBA API...")
     try:
-        # Fetch all players
         board = commonallplayers.CommonAllPlayers(is_only_current_season=0, timeout=60)
-        df = board.get_data_frames()[0]
-        
-        # Ensure numeric columns for sorting
-        df['TO_YEAR'] = df['TO_YEAR'].astype(int)
-        df['FROM_YEAR'] = df['FROM_YEAR'].astype(int)
-        
-        # Sort by TO_YEAR desc (most recent), then FROM_YEAR desc (youngest among same exit year)
-        # This prioritizes Active players (TO_YEAR=current) and recently retired.
-        df_sorted = df.sort_values(by=['TO_YEAR', 'FROM_YEAR'], ascending=[False, False])
-        
-        # Take next batch (550 to 1100)
-        top_players = df_sorted.iloc[550:1100]
-        
-        players_list = []
-        for _, row in top_players.iterrows():
-            players_list.append({
-                'id': str(row['PERSON_ID']),
-                'name': row['DISPLAY_FIRST_LAST'],
-                'active': row['ROSTERSTATUS'] == 1,
-                'from_year': row['FROM_YEAR'],
-                'to_year': row['TO_YEAR']
-            })
-            
-        print(f"✅ Selected {len(players_list)} players (From {players_list[-1]['to_year']} to {players_list[0]['to_year']})")
+        rows = result_sets(board)[0].tuples('PERSON_ID', 'DISPLAY_FIRST_LAST', 'ROSTERSTATUS', 'FROM_YEAR', 'TO_YEAR')
+        players_list = [{
+            'id': str(person_id),
+            'name': name,
+            'active': roster_status == 1,
+            'from_year': int(from_year),
+            'to_year': int(to_year)
+        } for person_id, name, roster_status, from_year, to_year in rows]
+        print(f"✅ {len(players_list)} players in the API list")
         return players_list
 
     except Exception as e:
         print(f"❌ Error fetching player list: {e}")
         return []
 
+def player_slug(name):
+    return name.lower().replace(" ", "-").replace(".", "").replace("'", "")
+
+# Map API award descriptions to our schema, one rule per column scan:
+# (boolean field, label for 'awards', description must contain one of, must contain none of)
+AWARD_RULES = [
+    ('champion', 'Champion', ('Champion',), ('Cup', 'Tournament')),
+    ('mvp', 'MVP', ('Most Valuable Player',), ('Finals', 'All-Star', 'Conference', 'Tournament', 'Cup')),
+    ('dpoy', 'DPOY', ('Defensive Player of the Year',), ()),
+    ('roy', 'ROY', ('Rookie of the Year',), ()),
+    ('allStar', 'All-Star', ('All-Star',), ()),
+    ('allNBA', None, ('All-NBA',), ()),
+    ('allDefensive', None, ('All-Defensive',), ()),
+    (None, 'Finals MVP', ('Finals Most Valuable Player', 'Finals MVP'), ()),
+]
+
+def classify_awards(descriptions, seasons):
+    """Award flags, labels and championship years from the DESCRIPTION and SEASON columns."""
+    data = {'awards': [], 'championYears': []}
+    for field, label, include, exclude in AWARD_RULES:
+        hits = [i for i, desc in enumerate(descriptions)
+                if any(p in desc for p in include) and not any(p in desc for p in exclude)]
+        if field:
+            data[field] = bool(hits)
+        if hits and label:
+            data['awards'].append(label)
+        if field == 'champion':
+            # "1997-98" -> "1998"
+            data['championYears'] = sorted({str(int(seasons[i][:4]) + 1) for i in hits if seasons[i][:4].isdigit()})
+    return data
+
+def response_size(endpoint) -> int:
+    """Bytes of the raw JSON behind an nba_api endpoint object."""
+    response = getattr(endpoint, 'nba_response', None)
+    if response is None:
+        return 0
+    return len(response.get_response().encode('utf-8'))
+
+def response_details(endpoint):
+    """(HTTP status, raw body) of the last request, or Nones if nothing came back."""
+    response = getattr(endpoint, 'nba_response', None)
+    if response is None:
+        return None, None
+    return getattr(response, '_status_code', None), response.get_response()
+
 def fetch_with_retry(endpoint_class, player_name="Unknown", **kwargs):
-    """Helper to fetch data with retries."""
+    """Helper to fetch data with retries; raises PermanentFailure without retrying when retrying cannot help."""
+    endpoint = endpoint_class.__name__
     last_error = None
     for attempt in range(3):
+        result = None
         try:
-            return endpoint_class(**kwargs, timeout=25)
+            with METRICS.timer("swish_api_request_seconds", endpoint=endpoint):
+                # Build first and request separately, so the raw response survives a parse error
+                result = endpoint_class(**kwargs, timeout=25, get_request=False)
+                result.get_request()
+            METRICS.inc("swish_bytes_read_total", response_size(result), source=endpoint)
+            return result
         except Exception as e:
             last_error = e
+            METRICS.inc("swish_api_errors_total", endpoint=endpoint, error=type(e).__name__)
+            status, raw = response_details(result)
+            if classify(e, status, raw) == PERMANENT:
+                METRICS.inc("swish_api_permanent_failures_total", endpoint=endpoint)
+                print(f"   🪦 Permanent failure for {player_name} ({type(e).__name__}: {e}), not retrying")
+                raise PermanentFailure(endpoint, f"{type(e).__name__}: {e}", raw, status) from e
+            if attempt < 2:
+                METRICS.inc("swish_api_retries_total", endpoint=endpoint)
             print(f"   ⚠️ Timeout/Error for {player_name}, retrying ({attempt+1}/3)...")
-            time.sleep(2 * (attempt + 1))
+            METRICS.sleep(2 * (attempt + 1), reason="backoff")
     raise last_error
 
-def fetch_player_details(player_id, player_name):
-    """Fetch Teams and Awards for a specific player."""
-    data = {
-        'teams': [],
-        'awards': [],
-        'championYears': [],
-        'allStar': False,
-        'champion': False,
-        'mvp': False,
-        'dpoy': False,
-        'roy': False,
-        'allNBA': False,
-        'allDefensive': False
-    }
+def fetch_player_details(player_id, player_name, groups=tuple(FIELD_GROUPS)):
+    """Fetch the field groups (Teams and/or Awards) for a specific player.
+
+    Returns (fields, {group: response fingerprint}), or None on a transient error.
+    """
+    with METRICS.timer("swish_player_fetch_seconds"):
+        return _fetch_player_details(player_id, player_name, groups)
+
+def _fetch_player_details(player_id, player_name, groups):
+    from nba_api.stats.endpoints import playerawards, playercareerstats
+
+    data = {}
+    fingerprints = {}
     
     try:
-        # 1. Fetch Career Stats (Teams)
         # Random sleep to de-sync threads and respect rate limits
-        time.sleep(random.uniform(3.0, 6.0))
-        
-        career = fetch_with_retry(playercareerstats.PlayerCareerStats, player_name=player_name, player_id=player_id)
-        df_career = career.get_data_frames()[0]
-        teams = df_career['TEAM_ABBREVIATION'].unique().tolist()
-        data['teams'] = [t for t in teams if t != 'TOT' and t != '']
+        METRICS.sleep(random.uniform(3.0, 6.0), reason="rate_limit")
 
-        # 2. Fetch Awards
-        time.sleep(0.5)
-        aw = fetch_with_retry(playerawards.PlayerAwards, player_name=player_name, player_id=player_id)
-        df_awards = aw.get_data_frames()[0]
-        
-        for _, row in df_awards.iterrows():
-            desc = row['DESCRIPTION']
-            # award_type = row['AWARD'] # Caused KeyError
-            
-            # Map API Award names to our Schema
-            
-            if 'Champion' in desc:
-                data['champion'] = True
-                season = row['SEASON'] # e.g. "2023-24"
-                if '-' in season:
-                    year = "20" + season.split('-')[1]
-                    if year not in data['championYears']:
-                        data['championYears'].append(year)
-            
-            if 'Most Valuable Player' in desc:
-                data['mvp'] = True
-                if 'MVP' not in data['awards']: data['awards'].append('MVP')
-            
-            if 'Defensive Player of the Year' in desc:
-                data['dpoy'] = True
-                if 'DPOY' not in data['awards']: data['awards'].append('DPOY')
-                
-            if 'Rookie of the Year' in desc:
-                data['roy'] = True
-                if 'ROY' not in data['awards']: data['awards'].append('ROY')
-                
-            if 'All-Star' in desc:
-                data['allStar'] = True
-                if 'All-Star' not in data['awards']: data['awards'].append('All-Star')
-                
-            if 'All-NBA' in desc:
-                data['allNBA'] = True
-            
-            if 'All-Defensive' in desc:
-                 data['allDefensive'] = True
-            
-            if 'Finals MVP' in desc:
-                if 'Finals MVP' not in data['awards']: data['awards'].append('Finals MVP')
+        # 1. Fetch Career Stats (Teams)
+        if 'career' in groups:
+            career = fetch_with_retry(playercareerstats.PlayerCareerStats, player_name=player_name, player_id=player_id)
+            seasons = result_sets(career)[0]
+            fingerprints['career'] = seasons.fingerprint()
+            teams = seasons.column('TEAM_ABBREVIATION')
+            data['teams'] = [t for t in dict.fromkeys(teams) if t != 'TOT' and t != '']
 
-        # Clean lists
-        data['championYears'].sort()
-        if data['champion']: 
-            if 'Champion' not in data['awards']: data['awards'].insert(0, 'Champion')
-            
-        return data
+        # 2. Fetch Awards
+        if 'awards' in groups:
+            METRICS.sleep(0.5, reason="rate_limit")
+            aw = fetch_with_retry(playerawards.PlayerAwards, player_name=player_name, player_id=player_id)
+            award_rows = result_sets(aw)[0]
+            fingerprints['awards'] = award_rows.fingerprint()
+            awards = award_rows.columns('DESCRIPTION', 'SEASON')
+            data.update(classify_awards(awards['DESCRIPTION'], awards['SEASON']))
+        return data, fingerprints
 
+    except PermanentFailure:
+        raise
     except Exception as e:
         print(f"⚠️ Error fetching details for {player_name}: {e}")
         return None
 
-def load_existing_db():
-    if os.path.exists(DATA_FILE):
-        with open(DATA_FILE, 'r') as f:
-            return json.load(f)
-    return []
+def new_player_record(p_info):
+    """Placeholder record for a player the API knows and players.json does not."""
+    decades = {f"{(y // 10) * 10}s" for y in range(p_info['from_year'], p_info['to_year'] + 1)}
+    return {
+        "id": player_slug(p_info['name']),
+        "name": p_info['name'],
+        "teams": [],
+        "awards": [],
+        "allStar": False,
+        "champion": False,
+        "championYears": [],
+        "mvp": False,
+        "dpoy": False,
+        "roy": False,
+        "allNBA": False,
+        "allDefensive": False,
+        "college": "",
+        "country": "USA",
+        "decades": sorted(decades),
+        "ppgCareer": 0,
+        "rpgCareer": 0,
+        "apgCareer": 0,
+        "position": "G-F",
+        "nbaId": p_info['id'],
+        "active": p_info['active']
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Refresh teams and awards from the NBA API, most valuable first.")
+    parser.add_argument("--budget", type=int, default=API_BUDGET,
+                        help=f"API calls for this run (default: {API_BUDGET})")
+    parser.add_argument("--plan", action="store_true", help="print the refresh plan and stop")
+    add_profile_argument(parser)
+    args = parser.parse_args(argv)
 
-def main():
-    print("🚀 Starting GOD MODE Data Update (Top 500 Recent)...")
+    print(f"🚀 Starting GOD MODE Data Update (budget: {args.budget} API calls)...")
+    # Fetches run on worker threads; their latencies are in the metrics, not the profile
+    profiler = Profiler("god_mode_update", enabled=args.profile)
     
     # 1. Get List
-    target_players = get_recent_players_list()
-    if not target_players:
+    with profiler.stage("player_list"):
+        api_players = get_player_list()
+    if not api_players:
         print("Stopping due to empty list.")
         return
 
     # 2. Load DB
-    existing_db = load_existing_db()
+    with profiler.stage("load"):
+        existing_db = load_players()
     existing_map_nba_id = {str(p.get('nbaId')): p for p in existing_db if p.get('nbaId')}
     existing_map_slug = {p['id']: p for p in existing_db}
+
+    def find_db_player(p_info):
+        return existing_map_nba_id.get(p_info['id']) or existing_map_slug.get(player_slug(p_info['name']))
+
+    # 3. Plan: the most overdue, most important field groups that fit the budget
+    refresh_state = RefreshState()
+    dead_letters = DeadLetterStore()
+    api_by_id = {p['id']: p for p in api_players}
+    candidates = []
+    parked = 0
+    for p in api_players:
+        if dead_letters.is_parked(p['id']):
+            parked += 1
+            continue
+        candidates.append({**p, 'record': find_db_player(p)})
+    with profiler.stage("plan"):
+        plan = plan_refreshes(candidates, refresh_state, args.budget, recently_traded_names())
+    if parked:
+        print(f"📪 Skipping {parked} players parked in the dead-letter store (python scripts/dead_letters.py)")
+    print(describe(plan))
+    if args.plan or not plan:
+        return
     
     # Multi-threading for speed (Max 5 workers to respect rate limits)
     from concurrent.futures import ThreadPoolExecutor, as_completed
     
     updates_count = 0
+    unsaved = False
     MAX_WORKERS = 1
     
-    today_date = datetime.now().strftime("%Y-%m-%d")
-    
     with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        future_to_player = {}
-        for p in target_players:
-            pid = p['id']
-            if os.path.exists("god_mode_progress.txt"):
-                with open("god_mode_progress.txt", "r") as f:
-                    done_ids = f.read().splitlines()
-                if pid in done_ids:
-                    # Silent skip to reduce noise, or just print a summary later
-                    # print(f"⏩ Skipping {p['name']} (Already processed)")
-                    continue
-
-            # Submit processing
-            print(f"⏳ Queuing {p['name']}...")
-            future_to_player[executor.submit(fetch_player_details, pid, p['name'])] = p
+        future_to_refresh = {}
+        for refresh in plan:
+            future_to_refresh[executor.submit(fetch_player_details, refresh.player_id, refresh.name,
+                                              tuple(refresh.groups))] = refresh
 
-        for future in as_completed(future_to_player):
-            p_info = future_to_player[future]
+        progress = RunProgress(len(future_to_refresh))
+        for future in as_completed(future_to_refresh):
+            progress.tick()
+            refresh = future_to_refresh[future]
+            p_info = api_by_id[refresh.player_id]
             pid = p_info['id']
             name = p_info['name']
             
             try:
-                details = future.result()
-                if details:
-                    # Update Progress Log immediately
-                    with open("god_mode_progress.txt", "a") as log:
-                        log.write(f"{pid}\n")
-                if details:
-                    # Find in DB (Refresh map or use thread-safe lock if modifying shared dict? 
-                    # Python dicts are thread-safe for single ops, but logic here is complex.
-                    # Better to collect results and apply them sequentially or just trust the serialized loop here.)
+                result = future.result()
+                if result:
+                    details, fingerprints = result
+                    dead_letters.resolve(pid)
                     # Note: 'as_completed' yields results as they finish, so this loop IS sequential.
-                    
-                    db_player = existing_map_nba_id.get(pid)
-                    if not db_player:
-                        slug = name.lower().replace(" ", "-").replace(".", "").replace("'", "")
-                        db_player = existing_map_slug.get(slug)
-                    
+                    db_player = find_db_player(p_info)
+                    identity_same = db_player is not None and db_player.get('nbaId') == pid \
+                        and db_player.get('active') == p_info['active']
+                    if identity_same and refresh_state.unchanged(pid, fingerprints):
+                        # Same responses as last time: nothing to merge, write or re-audit
+                        refresh_state.record(pid, name, details, fingerprints=fingerprints)
+                        METRICS.inc("swish_players_total", outcome="unchanged")
+                        continue
                     if db_player:
-                        db_player['teams'] = details['teams']
-                        db_player['awards'] = details['awards']
-                        db_player['championYears'] = details['championYears']
-                        db_player['allStar'] = details['allStar']
-                        db_player['champion'] = details['champion']
-                        db_player['mvp'] = details['mvp']
-                        db_player['dpoy'] = details['dpoy']
-                        db_player['roy'] = details['roy']
-                        db_player['allNBA'] = details['allNBA']
-                        db_player['allDefensive'] = details['allDefensive']
+                        changed = [field for field, value in details.items() if db_player.get(field) != value]
+                        if identity_same and not changed:
+                            # New response (e.g. another game played), same fields
+                            refresh_state.record(pid, name, details, fingerprints=fingerprints)
+                            METRICS.inc("swish_players_total", outcome="unchanged")
+                            continue
+                        db_player.update(details)
                         db_player['nbaId'] = pid
                         db_player['active'] = p_info['active']
-                        print(f"   ✅ Updated {name}")
+                        METRICS.inc("swish_players_total", outcome="changed")
+                        print(f"   ✅ Updated {name} ({', '.join(changed) or 'id/active'})")
                     else:
-                        slug = name.lower().replace(" ", "-").replace(".", "").replace("'", "")
-                        new_player = {
-                            "id": slug,
-                            "name": name,
-                            "teams": details['teams'],
-                            "awards": details['awards'],
-                            "allStar": details['allStar'],
-                            "champion": details['champion'],
-                            "championYears": details['championYears'],
-                            "mvp": details['mvp'],
-                            "dpoy": details['dpoy'],
-                            "roy": details['roy'],
-                            "allNBA": details['allNBA'],
-                            "allDefensive": details['allDefensive'],
-                            "college": "",
-                            "country": "USA",
-                            "decades": [],
-                            "ppgCareer": 0,
-                            "rpgCareer": 0,
-                            "apgCareer": 0,
-                            "position": "G-F",
-                            "nbaId": pid,
-                            "active": p_info['active']
-                        }
-                        
-                        start_year = p_info['from_year']
-                        end_year = p_info['to_year']
-                        decades = set()
-                        for y in range(start_year, end_year + 1):
-                            dec = (y // 10) * 10
-                            decades.add(f"{dec}s")
-                        new_player['decades'] = sorted(list(decades))
-                        
+                        new_player = new_player_record(p_info)
+                        new_player.update(details)
+                        changed = list(details)
                         existing_db.append(new_player)
                         existing_map_nba_id[pid] = new_player
+                        METRICS.inc("swish_players_total", outcome="created")
                         print(f"   ✨ Created {name}")
+                    refresh_state.record(pid, name, details, changed, fingerprints)
 
                     updates_count += 1
+                    unsaved = True
                     
                     if updates_count % BATCH_SAVE == 0:
-                        with open(DATA_FILE, 'w') as f:
-                            json.dump(existing_db, f, indent=2)
-                        print(f"   💾 Saved batch {updates_count}")
+                        with profiler.stage("save"):
+                            save_players(existing_db)
+                        unsaved = False
+                        print(f"   💾 Saved batch {updates_count} ({progress.line()})")
+                        METRICS.write_prometheus(METRICS_FILE)
+                        dead_letters.save()
+                        refresh_state.save()
+                else:
+                    METRICS.inc("swish_players_total", outcome="failed")
                         
+            except PermanentFailure as e:
+                METRICS.inc("swish_players_total", outcome="dead_letter")
+                dead_letters.park(pid, name, e)
+                print(f"   📪 Parked {name}: {e}")
             except Exception as e:
+                METRICS.inc("swish_players_total", outcome="error")
                 print(f"   ❌ Error processing {name}: {e}")
 
-    # Final Save
-    with open(DATA_FILE, 'w') as f:
-        json.dump(existing_db, f, indent=2)
+    # Final Save (players.json is left untouched when nothing changed, so downstream stages stay up to date)
+    if unsaved:
+        with profiler.stage("save"):
+            save_players(existing_db)
+    dead_letters.save()
+    refresh_state.save()
+    METRICS.write_prometheus(METRICS_FILE)
     print("🏁 God Mode Update Complete!")
+    unchanged = METRICS.total("swish_players_total", outcome="unchanged")
+    print(f"   {updates_count} players changed or created, {unchanged:.0f} confirmed unchanged")
+    print(f"📈 Run summary ({progress.line()}):")
+    print(METRICS.summary())
+    print(f"   Metrics written to {METRICS_FILE}")
 
 if __name__ == "__main__":
     main()
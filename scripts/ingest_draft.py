@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Ingest the NBA draft history and give every player draftYear/draftRound/draftPick.
+
+One DraftHistory request returns every pick since 1947. The response is cached
+in scripts/cache/draft_history.json (refetched after 30 days or with
+--refresh) and joined to players.json by nbaId; records without an nbaId are
+matched on a folded name that is unique on both sides.
+
+    draftYear, draftRound, draftPick   the draft, its round and the overall pick
+    draftRound 0, draftPick 0          a territorial pick (draftYear set), or an
+                                       NBA player who was never drafted (no draftYear)
+
+so the draft_pick_1 and draft_top_3 criteria compare draftPick instead of
+scanning the name lists in lib/nba-data.ts.
+
+Run with --apply to write the fields into players.json.
+"""
+
+import argparse
+import time
+
+from pipeline_profile import Profiler, add_profile_argument
+from players_db import CACHE_DIR, LOGS_DIR, build_name_index, fold_name, load_json, load_players, save_json, save_players
+from result_sets import ResultSet, decode
+
+CACHE_FILE = CACHE_DIR / "draft_history.json"
+REPORT_FILE = LOGS_DIR / "draft_history_report.json"
+CACHE_DAYS = 30
+# Every draft since 1947 is well over this; fewer rows means a truncated answer,
+# and marking players as undrafted from it would be wrong
+MIN_PICKS = 5000
+DRAFT_FIELDS = ("draftYear", "draftRound", "draftPick")
+
+
+def load_draft_history(refresh: bool = False, now: float | None = None) -> ResultSet:
+    """The DraftHistory table, from the cache when it is fresh enough."""
+    now = now or time.time()
+    if not refresh and CACHE_FILE.exists():
+        cached = load_json(CACHE_FILE)
+        if now - cached["fetchedAt"] < CACHE_DAYS * 86400:
+            return decode(cached["response"])[0]
+
+    from nba_api.stats.endpoints import drafthistory
+
+    from god_mode_update import fetch_with_retry
+
+    print("📡 Fetching the full draft history from the NBA API...")
+    endpoint = fetch_with_retry(drafthistory.DraftHistory, "draft history", league_id="00")
+    response = endpoint.nba_response.get_dict()
+    CACHE_DIR.mkdir(exist_ok=True)
+    save_json(CACHE_FILE, {"fetchedAt": now, "response": response})
+    return decode(response)[0]
+
+
+def parse_picks(table: ResultSet) -> dict[str, dict]:
+    """nbaId -> {name, draftYear, draftRound, draftPick}; a player drafted twice keeps the later draft."""
+    picks = {}
+    rows = table.tuples("PERSON_ID", "PLAYER_NAME", "SEASON", "ROUND_NUMBER", "OVERALL_PICK", "DRAFT_TYPE")
+    for person_id, name, season, round_number, overall, draft_type in rows:
+        territorial = draft_type == "Territorial" or not overall
+        pick = {
+            "name": name,
+            "draftYear": int(season),
+            "draftRound": 0 if territorial else int(round_number),
+            "draftPick": 0 if territorial else int(overall),
+        }
+        key = str(person_id)
+        if key not in picks or pick["draftYear"] >= picks[key]["draftYear"]:
+            picks[key] = pick
+    return picks
+
+
+def match_picks(players: list[dict], picks: dict[str, dict]) -> tuple[dict[str, dict], dict]:
+    """Player id -> draft fields for every player the draft history can speak for."""
+    report = {"byNbaId": 0, "byName": 0, "undrafted": 0, "unmatched": [], "changed": []}
+    fields = {}
+    claimed = {p["nbaId"] for p in players if p.get("nbaId")}
+    names = {}
+    for nba_id, pick in picks.items():
+        if nba_id not in claimed:
+            names.setdefault(fold_name(pick["name"]), []).append(pick)
+    name_index = build_name_index(players)
+
+    for player in players:
+        nba_id = player.get("nbaId")
+        if nba_id:
+            pick = picks.get(nba_id)
+            if pick:
+                report["byNbaId"] += 1
+            else:
+                report["undrafted"] += 1
+                fields[player["id"]] = {"draftRound": 0, "draftPick": 0}
+                continue
+        else:
+            folded = fold_name(player["name"])
+            candidates = names.get(folded, [])
+            if len(candidates) != 1 or len(name_index.get(folded, [])) != 1:
+                report["unmatched"].append(player["name"])
+                continue
+            pick = candidates[0]
+            report["byName"] += 1
+        fields[player["id"]] = {field: pick[field] for field in DRAFT_FIELDS}
+
+    for player in players:
+        new = fields.get(player["id"])
+        if new is None:
+            continue
+        old = {field: player[field] for field in DRAFT_FIELDS if field in player}
+        if old and old != {field: new[field] for field in old if field in new}:
+            report["changed"].append({"name": player["name"], "before": old, "after": new})
+    return fields, report
+
+
+def apply_draft(players: list[dict], fields: dict[str, dict]) -> int:
+    """Write the draft fields; returns the number of records changed."""
+    changed = 0
+    for player in players:
+        new = fields.get(player["id"])
+        if new is None:
+            continue
+        before = {field: player.get(field) for field in DRAFT_FIELDS}
+        for field in DRAFT_FIELDS:
+            if field in new:
+                player[field] = new[field]
+            else:
+                player.pop(field, None)
+        changed += before != {field: player.get(field) for field in DRAFT_FIELDS}
+    return changed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--refresh", action="store_true", help=f"refetch even if the cache is under {CACHE_DAYS} days old")
+    parser.add_argument("--apply", action="store_true", help="write the draft fields into players.json")
+    add_profile_argument(parser)
+    args = parser.parse_args(argv)
+    profiler = Profiler("ingest_draft", enabled=args.profile)
+
+    print("🎓 Ingesting the NBA draft history...")
+    started = time.perf_counter()
+    with profiler.stage("fetch"):
+        table = load_draft_history(args.refresh)
+    picks = parse_picks(table)
+    print(f"📋 {len(table)} picks, {len(picks)} players")
+    if len(table) < MIN_PICKS:
+        print(f"❌ Expected at least {MIN_PICKS} picks, the response looks truncated; nothing written")
+        return
+
+    with profiler.stage("load"):
+        players = load_players()
+    with profiler.stage("match"):
+        fields, report = match_picks(players, picks)
+    print(f"✅ {report['byNbaId']} drafted players matched by nbaId, {report['byName']} by name, "
+          f"{report['undrafted']} never drafted, {len(report['unmatched'])} without a match")
+    for change in report["changed"][:10]:
+        print(f"   ✏️  {change['name']}: {change['before']} -> {change['after']}")
+
+    LOGS_DIR.mkdir(exist_ok=True)
+    save_json(REPORT_FILE, report)
+    print(f"💾 Saved the match report to {REPORT_FILE}")
+
+    if args.apply:
+        with profiler.stage("apply"):
+            changed = apply_draft(players, fields)
+            save_players(players)
+        print(f"💾 Updated the draft fields of {changed} players in players.json")
+
+    print(f"⏱️  Done in {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
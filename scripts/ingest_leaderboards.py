@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Ingest the saved Basketball-Reference pages in temp/ into one stats table.
+Parses every leaderboard (active_*, career_*, all_time_*) and players_*.html
+index page in parallel with a single table extractor, resolves each name to a
+players.json record and writes lib/leaderboard_stats.json.
+
+Run with --apply to bulk-fill ppgCareer/rpgCareer/apgCareer/spgCareer/bpgCareer.
+"""
+
+import argparse
+import re
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from html.parser import HTMLParser
+from pathlib import Path
+
+from pipeline_profile import Profiler, add_profile_argument
+from players_db import LIB_DIR, ROOT_DIR, build_name_index, fold_name, load_players, save_json, save_players
+
+TEMP_DIR = ROOT_DIR / "temp"
+OUTPUT_FILE = LIB_DIR / "leaderboard_stats.json"
+
+LEADERBOARD_RE = re.compile(r"^(active|career|all_time)_(ppg|rpg|apg|spg|bpg)\.html$")
+INDEX_RE = re.compile(r"^players_[a-z]\.html$")
+PLAYER_HREF_RE = re.compile(r"/players/[a-z]/([a-z0-9]+)\.html")
+
+STAT_FIELDS = {
+    "ppg": ("ppgCareer", "pts_per_g"),
+    "rpg": ("rpgCareer", "trb_per_g"),
+    "apg": ("apgCareer", "ast_per_g"),
+    "spg": ("spgCareer", "stl_per_g"),
+    "bpg": ("bpgCareer", "blk_per_g"),
+}
+# Anything outside these bounds is a parsing error, not a real career average
+STAT_LIMITS = {
+    "ppgCareer": 55.0,
+    "rpgCareer": 30.0,
+    "apgCareer": 15.0,
+    "spgCareer": 5.0,
+    "bpgCareer": 6.0,
+}
+# Sources agreeing within this tolerance are treated as the same value
+TOLERANCE = 0.05
+NAME_SUFFIXES = {"jr", "sr", "ii", "iii", "iv"}
+
+
+class TableExtractor(HTMLParser):
+    """Collect the rows of the <table> elements whose id is in `table_ids`."""
+
+    def __init__(self, table_ids):
+        super().__init__(convert_charrefs=True)
+        self.table_ids = set(table_ids)
+        self.tables: dict[str, list[dict]] = {}
+        self._table = None
+        self._row = None
+        self._cell = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "table":
+            table_id = dict(attrs).get("id")
+            if table_id in self.table_ids and table_id not in self.tables:
+                self._table = table_id
+                self.tables[table_id] = []
+            return
+        if self._table is None:
+            return
+        if tag == "tr":
+            self._row = {"cells": [], "bbrefId": None, "bold": False}
+        elif self._row is None:
+            return
+        elif tag in ("td", "th"):
+            self._cell = []
+        elif tag == "a" and self._row["bbrefId"] is None:
+            match = PLAYER_HREF_RE.search(dict(attrs).get("href") or "")
+            if match:
+                self._row["bbrefId"] = match.group(1)
+        elif tag == "strong":
+            self._row["bold"] = True
+
+    def handle_endtag(self, tag):
+        if self._table is None:
+            return
+        if tag in ("td", "th") and self._cell is not None and self._row is not None:
+            self._row["cells"].append("".join(self._cell).strip())
+            self._cell = None
+        elif tag == "tr" and self._row is not None:
+            if self._row["bbrefId"]:
+                self.tables[self._table].append(self._row)
+            self._row = None
+        elif tag == "table":
+            self._table = None
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._cell.append(data)
+
+
+def extract_tables(path: Path, table_ids) -> dict[str, list[dict]]:
+    """Run the extractor over one saved page."""
+    html = path.read_text(encoding="utf-8")
+    # Basketball-Reference ships secondary tables inside HTML comments
+    html = html.replace("<!--", "").replace("-->", "")
+    extractor = TableExtractor(table_ids)
+    extractor.feed(html)
+    extractor.close()
+    return extractor.tables
+
+
+def parse_page(path: Path) -> dict:
+    """Parse one saved page into plain rows (runs in a worker process)."""
+    match = LEADERBOARD_RE.match(path.name)
+    if match:
+        scope, stat = match.groups()
+        field, id_part = STAT_FIELDS[stat]
+        table_ids = [f"stats_active_{id_part}"] if scope == "active" else ["nba", "tot"]
+        tables = extract_tables(path, table_ids)
+        rows = next((tables[t] for t in table_ids if tables.get(t)), [])
+        entries = []
+        for row in rows:
+            cells = row["cells"]
+            if len(cells) < 3:
+                continue
+            try:
+                value = float(cells[-1])
+            except ValueError:
+                continue
+            entries.append({
+                "bbrefId": row["bbrefId"],
+                "name": cells[1].rstrip("*").strip(),
+                "value": value,
+                "active": row["bold"],
+            })
+        return {"file": path.name, "kind": "leaderboard", "field": field, "mtime": path.stat().st_mtime, "rows": entries}
+
+    tables = extract_tables(path, ["players"])
+    entries = []
+    for row in tables.get("players", []):
+        cells = row["cells"]
+        if len(cells) < 4:
+            continue
+        entries.append({
+            "bbrefId": row["bbrefId"],
+            "name": cells[0].rstrip("*").strip(),
+            "from": int(cells[1]) if cells[1].isdigit() else None,
+            "to": int(cells[2]) if cells[2].isdigit() else None,
+            "position": cells[3],
+            "active": row["bold"],
+        })
+    return {"file": path.name, "kind": "index", "rows": entries}
+
+
+def find_pages(temp_dir: Path) -> list[Path]:
+    return sorted(p for p in temp_dir.glob("*.html") if LEADERBOARD_RE.match(p.name) or INDEX_RE.match(p.name))
+
+
+def strip_suffix(folded: str) -> str:
+    parts = folded.split()
+    if len(parts) > 2 and parts[-1] in NAME_SUFFIXES:
+        return " ".join(parts[:-1])
+    return folded
+
+
+def decades_between(start: int | None, end: int | None) -> set[str]:
+    if not start or not end:
+        return set()
+    return {f"{(y // 10) * 10}s" for y in range(start, end + 1)}
+
+
+def resolve_player(name: str, bio: dict | None, name_index: dict, suffixless_index: dict,
+                   wrong_era: list | None = None) -> dict | None:
+    """Resolve a page name to exactly one DB record, checked against the index page years.
+
+    The DB `decades` field holds only the start (draft) decade, and the index
+    page's `from` is the season the player first played, so a candidate is
+    kept when one of its decades falls between decade(from - 1) and
+    decade(to). One that does not is dropped even when it is the only one: a
+    namesake from another era is not the same player. Dropped candidates are
+    added to `wrong_era`.
+    """
+    folded = fold_name(name)
+    candidates = name_index.get(folded) or suffixless_index.get(strip_suffix(folded), [])
+    start = bio.get("from") if bio else None
+    decades = decades_between(start - 1, bio.get("to")) if start else set()
+    if decades:
+        matching = [p for p in candidates if decades & set(p.get("decades", []))]
+        if wrong_era is not None:
+            wrong_era.extend(p for p in candidates if p not in matching)
+        candidates = matching
+    return candidates[0] if len(candidates) == 1 else None
+
+
+def build_stats_table(pages: list[dict], players: list[dict]) -> tuple[list[dict], dict]:
+    """Merge parsed pages into one verified row per DB player."""
+    name_index = build_name_index(players)
+    suffixless_index = defaultdict(list)
+    for folded, records in name_index.items():
+        suffixless_index[strip_suffix(folded)].extend(records)
+
+    bios = {row["bbrefId"]: row for page in pages if page["kind"] == "index" for row in page["rows"]}
+
+    # bbrefId -> field -> [(mtime, value, file)]
+    observations = defaultdict(lambda: defaultdict(list))
+    names = {}
+    for page in pages:
+        if page["kind"] != "leaderboard":
+            continue
+        for row in page["rows"]:
+            observations[row["bbrefId"]][page["field"]].append((page["mtime"], row["value"], page["file"]))
+            names[row["bbrefId"]] = row["name"]
+
+    report = {"unmatched": [], "rejected": [], "conflicts": []}
+    table = []
+    for bbref_id, fields in observations.items():
+        name = names[bbref_id]
+        wrong_era = []
+        player = resolve_player(name, bios.get(bbref_id), name_index, suffixless_index, wrong_era)
+        if player is None:
+            unmatched = {"bbrefId": bbref_id, "name": name}
+            if wrong_era:
+                bio = bios[bbref_id]
+                unmatched.update(years=[bio.get("from"), bio.get("to")], wrongEra=[p["id"] for p in wrong_era])
+            report["unmatched"].append(unmatched)
+            continue
+
+        entry = {"id": player["id"], "name": player["name"], "bbrefId": bbref_id}
+        for field, seen in fields.items():
+            seen.sort(reverse=True)
+            value = seen[0][1]
+            if not 0 <= value <= STAT_LIMITS[field]:
+                report["rejected"].append({"id": player["id"], "field": field, "value": value})
+                continue
+            if max(v for _, v, _ in seen) - min(v for _, v, _ in seen) > TOLERANCE:
+                # Keep the most recently saved page, but say so
+                report["conflicts"].append({"id": player["id"], "field": field, "values": {f: v for _, v, f in seen}})
+            entry[field] = value
+        table.append(entry)
+
+    table.sort(key=lambda e: e["id"])
+    return table, report
+
+
+def apply_stats(players: list[dict], table: list[dict]) -> int:
+    """Bulk-fill the career fields; returns the number of values changed."""
+    by_id = {p["id"]: p for p in players}
+    changed = 0
+    for entry in table:
+        player = by_id[entry["id"]]
+        written = [field for field in STAT_LIMITS if field in entry]
+        for field in written:
+            if player.get(field) != entry[field]:
+                player[field] = entry[field]
+                changed += 1
+        if written:  # every value rejected: nothing was verified
+            player["careerStatsVerified"] = True
+    return changed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--temp-dir", type=Path, default=TEMP_DIR)
+    parser.add_argument("--output", type=Path, default=OUTPUT_FILE)
+    parser.add_argument("--workers", type=int, default=None, help="parser processes (default: one per CPU)")
+    parser.add_argument("--apply", action="store_true", help="write the verified stats into players.json")
+    add_profile_argument(parser)
+    args = parser.parse_args(argv)
+    profiler = Profiler("ingest_leaderboards", enabled=args.profile)
+
+    print("📊 Ingesting saved leaderboard pages...")
+    started = time.perf_counter()
+    paths = find_pages(args.temp_dir)
+    if not paths:
+        print(f"❌ No leaderboard or index pages found in {args.temp_dir}")
+        return
+
+    with profiler.stage("parse"), ProcessPoolExecutor(max_workers=args.workers) as executor:
+        pages = list(executor.map(parse_page, paths))
+    for page in pages:
+        print(f"   📄 {page['file']}: {len(page['rows'])} rows")
+
+    with profiler.stage("load"):
+        players = load_players()
+    with profiler.stage("resolve"):
+        table, report = build_stats_table(pages, players)
+    wrong_era = sum(1 for entry in report["unmatched"] if entry.get("wrongEra"))
+    print(f"✅ {len(table)} players resolved, {len(report['unmatched'])} unmatched "
+          f"({wrong_era} only a namesake from another era), "
+          f"{len(report['rejected'])} rejected values, {len(report['conflicts'])} conflicts")
+
+    with profiler.stage("save"):
+        save_json(args.output, {"players": table, "report": report})
+    print(f"💾 Saved to {args.output}")
+
+    if args.apply:
+        with profiler.stage("apply"):
+            changed = apply_stats(players, table)
+            save_players(players)
+        print(f"💾 Updated {changed} stat values in players.json")
+
+    print(f"⏱️  Done in {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
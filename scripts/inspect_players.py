@@ -1,19 +1,74 @@
-import json
-import os
-
-PLAYERS_DB_PATH = os.path.join(os.path.dirname(__file__), '..', 'lib', 'players.json')
-
-def inspect():
-    with open(PLAYERS_DB_PATH, 'r') as f:
-        players = json.load(f)
-    
-    targets = ["Shai Gilgeous-Alexander", "Kevin Durant", "Russell Westbrook"]
-    for p in players:
-        if p['name'] in targets:
-            print(f"Name: {p['name']}")
-            print(f"Teams: {p['teams']}")
-            print(f"Active: {p['active']}")
-            print("-" * 20)
+#!/usr/bin/env python3
+"""
+Ask players.json a question with a filter expression (see player_index.py).
+
+    python scripts/inspect_players.py 'team:OKC active champion:2025'
+    python scripts/inspect_players.py 'franchise:SEA or franchise:OKC' --sort ppg --limit 10
+    python scripts/inspect_players.py 'name:"Kevin Durant"' --fields teams,active,nbaId
+    python scripts/inspect_players.py 'award:MVP -active' --count
+
+The first query after players.json changes builds the indexes (and saves
+them in scripts/cache/); the rest only read them.
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from player_index import INDEX_FILE, PlayerIndex, QueryError, query, resolve
+from players_db import DATA_FILE
+
+DEFAULT_FIELDS = ["teams", "active"]
+SHOWN_AS = {"franchise": "teams", "name": None, "id": None}  # fields a query names but the table shows otherwise
+
+
+def show(value) -> str:
+    if isinstance(value, list):
+        return ",".join(str(item) for item in value) or "-"
+    if isinstance(value, bool):
+        return "yes" if value else "no"
+    return "-" if value is None or value == "" else str(value)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("query", nargs="*", help="filter expression (all players when empty)")
+    parser.add_argument("--sort", help="number field to order by, highest first (e.g. ppg)")
+    parser.add_argument("--asc", action="store_true", help="with --sort, lowest first")
+    parser.add_argument("--limit", type=int, default=25, help="players to print (default: 25; 0 for all)")
+    parser.add_argument("--fields", help="comma-separated fields to print (default: teams, active and the queried ones)")
+    parser.add_argument("--count", action="store_true", help="print only how many players match")
+    parser.add_argument("--rebuild", action="store_true", help="rebuild the indexes even if they are current")
+    parser.add_argument("--data", type=Path, default=DATA_FILE, help=f"players file (default: {DATA_FILE})")
+    parser.add_argument("--index", type=Path, default=INDEX_FILE, help=f"saved indexes (default: {INDEX_FILE})")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    index, reused = PlayerIndex.load(args.data, args.index, rebuild=args.rebuild)
+    loaded = time.perf_counter()
+    try:
+        mask, named = query(index, " ".join(args.query))
+        sort = resolve(args.sort) if args.sort else None
+        fields = [resolve(f.strip()) for f in args.fields.split(",")] if args.fields else None
+    except QueryError as e:
+        parser.error(str(e))
+    matched = mask.bit_count()
+    if args.count:
+        print(matched)
+        return
+
+    if fields is None:
+        fields = DEFAULT_FIELDS + [SHOWN_AS.get(f, f) for f in named + ([sort] if sort else [])]
+        fields = [f for f in dict.fromkeys(fields) if f]
+    rows = index.rows(mask, sort, descending=not args.asc, limit=args.limit or None)
+    for player in index.fetch(rows):
+        values = "  ".join(f"{field}={show(player.get(field))}" for field in fields)
+        print(f"{player.get('name')} ({player.get('id')})  {values}")
+    elapsed = time.perf_counter() - started
+    source = "saved indexes" if reused else f"indexes built in {loaded - started:.2f}s"
+    shown = f", showing {len(rows)}" if len(rows) < matched else ""
+    print(f"\n🔎 {matched} of {index.count} players{shown} ({source}; {elapsed * 1000:.0f} ms)")
+
 
 if __name__ == "__main__":
-    inspect()
+    main()
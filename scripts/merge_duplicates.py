@@ -5,16 +5,13 @@ Combines teams, awards, and stats for players with the exact same name.
 """
 
 import json
-from pathlib import Path
+from pipeline_profile import Profiler
+from players_db import DATA_FILE, save_players
 
 def load_json(path):
     with open(path, encoding="utf-8") as f:
         return json.load(f)
 
-def save_json(path, data):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-
 def merge_player_data(players):
     """Merge a list of player dicts into one."""
     if not players:
@@ -72,19 +69,22 @@ def merge_player_data(players):
 
 def main():
     print("🔄 Merging duplicate players...")
+    profiler = Profiler.from_argv("merge_duplicates")
     
-    path = Path("lib/players.json")
-    players = load_json(path)
+    path = DATA_FILE
+    with profiler.stage("load"):
+        players = load_json(path)
     
     print(f"📚 Total players before: {len(players)}")
     
     # Group by name
-    by_name = {}
-    for p in players:
-        name = p.get("name").strip()
-        if name not in by_name:
-            by_name[name] = []
-        by_name[name].append(p)
+    with profiler.stage("group"):
+        by_name = {}
+        for p in players:
+            name = p.get("name").strip()
+            if name not in by_name:
+                by_name[name] = []
+            by_name[name].append(p)
     
     unique_names = len(by_name)
     print(f"👥 Unique names: {unique_names}")
@@ -92,23 +92,22 @@ def main():
     merged_list = []
     duplicates_count = 0
     
-    for name, p_list in by_name.items():
-        if len(p_list) > 1:
-            duplicates_count += 1
-            merged = merge_player_data(p_list)
-            merged_list.append(merged)
-            print(f"  🔹 Merged {len(p_list)} entries for '{name}'")
-        else:
-            merged_list.append(p_list[0])
-    
-    # Sort alphabetically by name
-    merged_list.sort(key=lambda x: x["name"])
+    with profiler.stage("merge"):
+        for name, p_list in by_name.items():
+            if len(p_list) > 1:
+                duplicates_count += 1
+                merged = merge_player_data(p_list)
+                merged_list.append(merged)
+                print(f"  🔹 Merged {len(p_list)} entries for '{name}'")
+            else:
+                merged_list.append(p_list[0])
     
     print(f"📉 Reduced from {len(players)} to {len(merged_list)} players")
     print(f"✅ Merged {duplicates_count} duplicate groups")
     
-    # Save
-    save_json(path, merged_list)
+    # Save (save_players writes the records alphabetically by name)
+    with profiler.stage("save"):
+        save_players(merged_list, path)
     print(f"💾 Saved to {path}")
 
 if __name__ == "__main__":
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+In-process metrics for the ingestion scripts.
+
+Counters and latency histograms are kept in one thread-safe registry
+(METRICS), exported as a Prometheus text file at the end of a run and
+summarised on stdout together with throughput and an ETA:
+
+    with METRICS.timer("swish_api_request_seconds", endpoint="PlayerAwards"):
+        ...
+    METRICS.inc("swish_api_retries_total", endpoint="PlayerAwards")
+    METRICS.write_prometheus(LOGS_DIR / "god_mode_metrics.prom")
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from pathlib import Path
+
+# Seconds; covers fast cache hits up to the 25s API timeouts
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 60.0)
+
+HELP = {
+    "swish_api_request_seconds": "Latency of one NBA API request attempt",
+    "swish_api_retries_total": "NBA API attempts that were retried",
+    "swish_api_errors_total": "NBA API attempt failures by exception type",
+    "swish_api_permanent_failures_total": "NBA API failures classified as permanent (not retried)",
+    "swish_player_fetch_seconds": "Time to fetch teams and awards for one player, sleeps included",
+    "swish_players_total": "Players processed by outcome",
+    "swish_sleep_seconds_total": "Time spent sleeping, by reason",
+    "swish_http_request_seconds": "Latency of one scraper page request",
+    "swish_http_errors_total": "Scraper request failures by exception type",
+    "swish_bytes_read_total": "Response bytes read, by source",
+    "swish_bytes_written_total": "Bytes written to data files",
+    "swish_save_seconds": "Time to write a data file",
+}
+
+
+def _label_key(labels: dict) -> tuple:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(key: tuple, extra: tuple = ()) -> str:
+    pairs = key + extra
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+class Histogram:
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th observation."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for bound, n in zip(self.buckets, self.counts):
+            seen += n
+            if seen >= target:
+                return bound
+        return float("inf")
+
+
+class Metrics:
+    """Thread-safe registry of counters and histograms keyed by name and labels."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters: dict[str, dict[tuple, float]] = {}
+        self.histograms: dict[str, dict[tuple, Histogram]] = {}
+
+    def inc(self, name: str, amount: float = 1, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            series = self.counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def observe(self, name: str, value: float, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            series = self.histograms.setdefault(name, {})
+            if key not in series:
+                series[key] = Histogram()
+            series[key].observe(value)
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        """Observe how long the block took, whether or not it raised."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def sleep(self, seconds: float, reason: str):
+        """time.sleep that is accounted for in swish_sleep_seconds_total."""
+        time.sleep(seconds)
+        self.inc("swish_sleep_seconds_total", seconds, reason=reason)
+
+    def total(self, name: str, **labels) -> float:
+        """Sum of a counter over every series matching `labels`."""
+        wanted = set(_label_key(labels))
+        with self._lock:
+            return sum(v for k, v in self.counters.get(name, {}).items() if wanted <= set(k))
+
+    def to_prometheus(self) -> str:
+        lines = []
+        with self._lock:
+            for name in sorted(self.counters):
+                lines.append(f"# HELP {name} {HELP.get(name, name)}")
+                lines.append(f"# TYPE {name} counter")
+                for key, value in sorted(self.counters[name].items()):
+                    lines.append(f"{name}{_format_labels(key)} {value:g}")
+            for name in sorted(self.histograms):
+                lines.append(f"# HELP {name} {HELP.get(name, name)}")
+                lines.append(f"# TYPE {name} histogram")
+                for key, hist in sorted(self.histograms[name].items()):
+                    cumulative = 0
+                    for bound, n in zip(hist.buckets, hist.counts):
+                        cumulative += n
+                        lines.append(f"{name}_bucket{_format_labels(key, (('le', f'{bound:g}'),))} {cumulative}")
+                    lines.append(f"{name}_bucket{_format_labels(key, (('le', '+Inf'),))} {hist.count}")
+                    lines.append(f"{name}_sum{_format_labels(key)} {hist.sum:.6f}")
+                    lines.append(f"{name}_count{_format_labels(key)} {hist.count}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: Path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(self.to_prometheus(), encoding="utf-8")
+        tmp.replace(path)
+
+    def summary(self) -> str:
+        """Human-readable end-of-run report: where the time went."""
+        lines = []
+        with self._lock:
+            for name in sorted(self.histograms):
+                for key, hist in sorted(self.histograms[name].items()):
+                    avg = hist.sum / hist.count if hist.count else 0
+                    lines.append(
+                        f"   {name}{_format_labels(key)}: n={hist.count} avg={avg:.2f}s "
+                        f"p50<={hist.quantile(0.5):g}s p95<={hist.quantile(0.95):g}s total={hist.sum:.1f}s"
+                    )
+            for name in sorted(self.counters):
+                for key, value in sorted(self.counters[name].items()):
+                    lines.append(f"   {name}{_format_labels(key)}: {value:g}")
+        return "\n".join(lines)
+
+
+class RunProgress:
+    """Throughput and ETA for a run over a known number of items."""
+
+    def __init__(self, total: int, unit: str = "players"):
+        self.total = total
+        self.unit = unit
+        self.done = 0
+        self.started = time.time()
+
+    def tick(self, n: int = 1):
+        self.done += n
+
+    def rate_per_minute(self) -> float:
+        elapsed = time.time() - self.started
+        return self.done / elapsed * 60 if elapsed > 0 else 0.0
+
+    def eta_seconds(self) -> float | None:
+        rate = self.rate_per_minute()
+        if not rate:
+            return None
+        return (self.total - self.done) / rate * 60
+
+    def line(self) -> str:
+        eta = self.eta_seconds()
+        eta_text = time.strftime("%H:%M:%S", time.gmtime(eta)) if eta is not None else "?"
+        return f"{self.done}/{self.total} {self.unit}, {self.rate_per_minute():.1f} {self.unit}/min, ETA {eta_text}"
+
+
+METRICS = Metrics()
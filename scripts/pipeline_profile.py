@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Opt-in profiling for the pipeline scripts.
+
+Scripts mark their stages and get a shared `--profile` flag:
+
+    profiler = Profiler.from_argv("merge_duplicates")
+    with profiler.stage("load"):
+        players = load_players()
+
+Without the flag a stage is a no-op. With it, every stage writes to
+scripts/logs/profiles/<script>/:
+
+    <stage>.pstats        cProfile output (snakeviz, flameprof, gprof2dot)
+    <stage>.alloc.txt     tracemalloc top allocations made during the stage
+    profile.json          seconds, peak RSS and peak traced memory per stage
+
+Profiles are keyed by stage name, so a run before and after a change can be
+compared stage by stage:
+
+    cp scripts/logs/profiles/merge_duplicates/profile.json /tmp/before.json
+    python scripts/pipeline_profile.py compare /tmp/before.json scripts/logs/profiles/merge_duplicates/profile.json
+
+Scripts without stage hooks can be profiled as a whole:
+
+    python scripts/pipeline_profile.py run scripts/check_diff.py [args...]
+
+cProfile only sees the calling thread: worker threads and processes show up
+as time spent waiting on the pool (their latencies are in pipeline_metrics).
+"""
+
+import argparse
+import atexit
+import cProfile
+import json
+import resource
+import runpy
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+from players_db import LOGS_DIR
+
+PROFILES_DIR = LOGS_DIR / "profiles"
+TOP_ALLOCATIONS = 25
+PROFILE_FLAG = "--profile"
+
+
+def _read_peak_rss_kb() -> int:
+    """High-water RSS in KB (VmHWM on Linux, ru_maxrss elsewhere)."""
+    try:
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1])
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _reset_peak_rss() -> bool:
+    """Reset the RSS high-water mark so it covers one stage (Linux only)."""
+    try:
+        Path("/proc/self/clear_refs").write_text("5")
+        return True
+    except OSError:
+        return False
+
+
+def add_profile_argument(parser: argparse.ArgumentParser):
+    parser.add_argument(PROFILE_FLAG, action="store_true",
+                        help="profile each stage into scripts/logs/profiles/<script>/")
+
+
+class Profiler:
+    """Per-stage cProfile, tracemalloc and peak RSS; a no-op unless enabled."""
+
+    def __init__(self, script: str, enabled: bool = False, output_dir: Path | None = None):
+        self.script = script
+        self.enabled = enabled
+        self.output_dir = Path(output_dir or PROFILES_DIR / script)
+        self.stages: dict[str, dict] = {}
+        self._profiles: dict[str, cProfile.Profile] = {}
+        self._active = None
+        if enabled:
+            atexit.register(self.finish)
+
+    @classmethod
+    def from_argv(cls, script: str) -> "Profiler":
+        """For scripts without argparse: take `--profile` out of sys.argv."""
+        enabled = PROFILE_FLAG in sys.argv
+        if enabled:
+            sys.argv = [arg for arg in sys.argv if arg != PROFILE_FLAG]
+        return cls(script, enabled=enabled)
+
+    @contextmanager
+    def stage(self, name: str):
+        if not self.enabled:
+            yield
+            return
+        if self._active is not None:
+            # cProfile cannot nest; the outer stage already covers this one
+            yield
+            return
+
+        self._active = name
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+        rss_scope = "stage" if _reset_peak_rss() else "process"
+        # Re-entering a stage (e.g. once per year in a loop) accumulates into one profile
+        profile = self._profiles.setdefault(name, cProfile.Profile())
+        started = time.perf_counter()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            seconds = time.perf_counter() - started
+            _, traced_peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            if started_tracing:
+                tracemalloc.stop()
+            self._active = None
+            self._record(name, seconds, profile, before, after, traced_peak, rss_scope)
+
+    def _record(self, name, seconds, profile, before, after, traced_peak, rss_scope):
+        pstats_path = self.output_dir / f"{name}.pstats"
+        profile.dump_stats(pstats_path)
+
+        filters = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+        diff = after.filter_traces(filters).compare_to(before.filter_traces(filters), "lineno")
+        top = [stat for stat in diff if stat.size_diff > 0][:TOP_ALLOCATIONS]
+        alloc_path = self.output_dir / f"{name}.alloc.txt"  # last call only
+        alloc_path.write_text("\n".join(str(stat) for stat in top) + "\n", encoding="utf-8")
+
+        entry = self.stages.setdefault(name, {"calls": 0, "seconds": 0.0, "peakRssKb": 0, "tracedPeakBytes": 0})
+        entry["calls"] += 1
+        entry["seconds"] = round(entry["seconds"] + seconds, 6)
+        entry["peakRssKb"] = max(entry["peakRssKb"], _read_peak_rss_kb())
+        entry["peakRssScope"] = rss_scope
+        entry["tracedPeakBytes"] = max(entry["tracedPeakBytes"], traced_peak)
+        entry["pstats"] = pstats_path.name
+        entry["allocations"] = alloc_path.name
+        entry["topAllocations"] = [
+            {"where": str(stat.traceback[0]), "bytes": stat.size_diff, "blocks": stat.count_diff}
+            for stat in top[:5]
+        ]
+
+    def finish(self):
+        """Write profile.json and print a per-stage table (runs at exit when enabled)."""
+        if not self.enabled or not self.stages:
+            return
+        summary_path = self.output_dir / "profile.json"
+        summary_path.write_text(json.dumps({
+            "script": self.script,
+            "recordedAt": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "stages": self.stages,
+        }, indent=2), encoding="utf-8")
+        print(f"\n🔬 Profile for {self.script}:")
+        width = max(len(name) for name in self.stages)
+        for name, entry in self.stages.items():
+            print(f"   {name:<{width}} {entry['seconds']:>8.3f}s  rss {entry['peakRssKb'] / 1024:>7.1f} MB"
+                  f"  traced {entry['tracedPeakBytes'] / 1048576:>7.1f} MB")
+        print(f"   📁 {self.output_dir}")
+        self.stages = {}
+
+
+def compare(before_path: Path, after_path: Path):
+    before = json.loads(Path(before_path).read_text(encoding="utf-8"))["stages"]
+    after = json.loads(Path(after_path).read_text(encoding="utf-8"))["stages"]
+    print(f"{'stage':<24} {'before':>9} {'after':>9} {'change':>8}   {'traced MB':>17}")
+    for name in list(before) + [n for n in after if n not in before]:
+        old, new = before.get(name), after.get(name)
+        if old is None or new is None:
+            print(f"{name:<24} {'only in ' + ('after' if old is None else 'before'):>28}")
+            continue
+        change = (new["seconds"] - old["seconds"]) / old["seconds"] * 100 if old["seconds"] else 0.0
+        print(f"{name:<24} {old['seconds']:>8.3f}s {new['seconds']:>8.3f}s {change:>+7.1f}%"
+              f"   {old['tracedPeakBytes'] / 1048576:>7.1f} -> {new['tracedPeakBytes'] / 1048576:>6.1f}")
+
+
+def run_script(path: Path, args: list[str]):
+    """Profile a whole script as a single "main" stage."""
+    path = Path(path).resolve()
+    profiler = Profiler(path.stem, enabled=True)
+    sys.argv = [str(path), *args]
+    sys.path.insert(0, str(path.parent))
+    with profiler.stage("main"):
+        runpy.run_path(str(path), run_name="__main__")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+    run = commands.add_parser("run", help="profile a whole script")
+    run.add_argument("script", type=Path)
+    run.add_argument("args", nargs=argparse.REMAINDER)
+    diff = commands.add_parser("compare", help="compare two profile.json files stage by stage")
+    diff.add_argument("before", type=Path)
+    diff.add_argument("after", type=Path)
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        run_script(args.script, args.args)
+    else:
+        compare(args.before, args.after)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+Secondary indexes over players.json and the filter language that queries them.
+
+    team:OKC active champion:2025
+    franchise:BKN and (award:MVP or mvp) and not active
+    ppg>=25 decade:2010s -position:C
+    name:"kevin durant"        pick<=3 draft>=2015
+
+A term is `field:value` (a team, award, decade, title year, position, country,
+college, id or nbaId; name matches folded name words; franchise matches any
+team code of the franchise, NJN and SEA included), a bare field (a flag such
+as active or mvp, or "has a value" for the rest), or a comparison on a number
+(ppg, rpg, apg, spg, bpg, pick, draft, gpSeason, ... with < <= = != >= >).
+Terms next to each other must all hold; `or`, `not` (or a leading -) and
+parentheses combine them. Values are matched without regard to case.
+
+The indexes are built in one pass: a posting list (the rows holding it) for
+every value of every string, list and flag field, and the values of every
+number field sorted with their rows. A term becomes a bitmask of rows from its
+posting list, or from a bisect of the sorted values, and the masks are
+combined with & | ~, so a query never scans the records. The matches are
+read by seeking to their byte spans in the file.
+
+The index is saved in scripts/cache/ with the blake2b digest of the data file
+it was built from; the next query reuses it when the digest still matches.
+"""
+
+import bisect
+import hashlib
+import json
+import re
+from pathlib import Path
+
+from player_schema import SCHEMA
+from players_db import CACHE_DIR, DATA_FILE, _WHITESPACE, fold_name, modern_team
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+INDEX_VERSION = 1
+INDEX_FILE = CACHE_DIR / "players.index.json"
+
+# Derived fields, indexed next to the schema ones
+DERIVED = {"franchise": "str[]", "name": "str[]"}
+# Short names used in queries
+ALIASES = {
+    "team": "teams", "award": "awards", "decade": "decades", "title": "championYears",
+    "ppg": "ppgCareer", "rpg": "rpgCareer", "apg": "apgCareer", "spg": "spgCareer", "bpg": "bpgCareer",
+    "pick": "draftPick", "round": "draftRound", "draft": "draftYear",
+}
+# A flag given a value queries the list behind it: champion:2025 is a 2025 title
+FLAG_VALUES = {"champion": "championYears"}
+TRUE, FALSE = {"true", "yes", "1"}, {"false", "no", "0"}
+COMPARISONS = {"<", "<=", "=", "!=", ">=", ">"}
+
+TOKEN_RE = re.compile(r'\s*(?:(?P<paren>[()])|(?P<op><=|>=|!=|[<>=:-])|"(?P<quoted>[^"]*)"|(?P<word>[^\s()<>=:!"]+))')
+
+
+def _dumps(value) -> str:
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _loads(text):
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
+
+class QueryError(ValueError):
+    pass
+
+
+def file_digest(path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+
+
+def field_kind(field: str) -> str:
+    return DERIVED[field] if field in DERIVED else SCHEMA[field].kind
+
+
+def _keys(field: str, value) -> list[str]:
+    """The posting-list keys a record's value is filed under."""
+    if field == "name":
+        return fold_name(value).split() if isinstance(value, str) else []
+    if isinstance(value, list):
+        return [item.casefold() for item in value if isinstance(item, str)]
+    if isinstance(value, bool):
+        return ["true"] if value else []
+    return [value.casefold()] if isinstance(value, str) else []
+
+
+def scan_records(text: str):
+    """(record, byte start, byte end) of each element of a top-level JSON array."""
+    decoder = json.JSONDecoder()
+    pos = _WHITESPACE.match(text, 0).end()
+    if text[pos:pos + 1] != "[":
+        raise ValueError("expected a top-level array")
+    pos = _WHITESPACE.match(text, pos + 1).end()
+    chars, offset = 0, 0  # char position -> byte offset, advanced as the scan goes
+    while text[pos:pos + 1] != "]":
+        record, end = decoder.raw_decode(text, pos)
+        offset += len(text[chars:pos].encode("utf-8"))
+        length = len(text[pos:end].encode("utf-8"))
+        yield record, offset, offset + length
+        chars, offset = end, offset + length
+        pos = _WHITESPACE.match(text, end).end()
+        if text[pos:pos + 1] == ",":
+            pos = _WHITESPACE.match(text, pos + 1).end()
+        elif text[pos:pos + 1] != "]":
+            raise ValueError(f"expected ',' or ']' at character {pos}")
+
+
+def _mask(rows) -> int:
+    """Bitmask with the bit of each row set."""
+    rows = list(rows)
+    if not rows:
+        return 0
+    bits = bytearray(max(rows) // 8 + 1)
+    for row in rows:
+        bits[row >> 3] |= 1 << (row & 7)
+    return int.from_bytes(bits, "little")
+
+
+def _rows(mask: int):
+    """Rows of a bitmask, in order."""
+    while mask:
+        low = mask & -mask
+        row = low.bit_length() - 1
+        yield row
+        mask ^= low
+
+
+class PlayerIndex:
+    """Posting lists and sorted number columns over one data file's records.
+
+    Each field's section is kept as its own JSON text in the saved index and
+    decoded the first time a query uses it, so loading the index costs little
+    more than reading it.
+    """
+
+    def __init__(self, data: dict, path=DATA_FILE):
+        self.path = Path(path)
+        self.digest = data["digest"]
+        self.count = data["count"]
+        self.all = (1 << self.count) - 1
+        self._spans = data["spans"]  # flat [start0, end0, start1, end1, ...] byte offsets
+        self._sections: dict[str, dict | str] = data["fields"]
+        self._masks: dict[tuple, int] = {}
+
+    @classmethod
+    def build(cls, path=DATA_FILE, digest: str | None = None) -> "PlayerIndex":
+        path = Path(path)
+        raw = path.read_bytes()
+        fields = list(dict.fromkeys([*SCHEMA, *DERIVED]))
+        sections = {field: {} for field in fields}
+        present = {field: [] for field in fields}
+        spans = []
+        for row, (record, start, end) in enumerate(scan_records(raw.decode("utf-8"))):
+            spans += (start, end)
+            teams = record.get("teams")
+            if isinstance(teams, list):
+                record = {**record, "franchise": [modern_team(t) for t in teams if isinstance(t, str)]}
+            for field in fields:
+                value = record.get(field)
+                if value is None:
+                    continue
+                present[field].append(row)
+                if field_kind(field) in ("float", "int"):
+                    if isinstance(value, (int, float)) and not isinstance(value, bool):
+                        sections[field].setdefault("pairs", []).append((value, row))
+                    continue
+                postings = sections[field].setdefault("postings", {})
+                for key in dict.fromkeys(_keys(field, value)):
+                    postings.setdefault(key, []).append(row)
+        count = len(spans) // 2
+        for field, section in sections.items():
+            if "pairs" in section:
+                pairs = sorted(section.pop("pairs"))
+                section["values"], section["rows"] = [v for v, _ in pairs], [r for _, r in pairs]
+            elif len(present[field]) < count:  # "present" is left out when every record has the field
+                section["present"] = present[field]
+        digest = digest or hashlib.blake2b(raw, digest_size=16).hexdigest()
+        return cls({"digest": digest, "count": count, "spans": spans,
+                    "fields": {field: section for field, section in sections.items() if section}}, path)
+
+    @classmethod
+    def load(cls, path=DATA_FILE, index_path=INDEX_FILE, rebuild: bool = False) -> tuple["PlayerIndex", bool]:
+        """The saved index when it was built from this content, else a fresh one (saved); and whether it was reused."""
+        path, index_path = Path(path), Path(index_path)
+        digest = file_digest(path)
+        if not rebuild and index_path.exists():
+            data = _loads(index_path.read_bytes())
+            if data.get("version") == INDEX_VERSION and data.get("digest") == digest:
+                return cls(data, path), True
+        index = cls.build(path, digest)
+        index.save(index_path)
+        return index, False
+
+    def save(self, index_path=INDEX_FILE):
+        index_path = Path(index_path)
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        fields = {field: section if isinstance(section, str) else _dumps(section)
+                  for field, section in self._sections.items()}
+        data = {"version": INDEX_VERSION, "digest": self.digest, "count": self.count,
+                "spans": self._spans if isinstance(self._spans, str) else _dumps(self._spans), "fields": fields}
+        tmp = index_path.with_name(index_path.name + ".tmp")
+        tmp.write_text(_dumps(data), encoding="utf-8")
+        tmp.replace(index_path)
+
+    def section(self, field: str) -> dict:
+        section = self._sections.get(field, {})
+        if isinstance(section, str):
+            section = self._sections[field] = _loads(section)
+        return section
+
+    @property
+    def spans(self) -> list[int]:
+        if isinstance(self._spans, str):
+            self._spans = _loads(self._spans)
+        return self._spans
+
+    # -- terms -----------------------------------------------------------
+
+    def _cached(self, key: tuple, rows) -> int:
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = self._masks[key] = _mask(rows() if callable(rows) else rows)
+        return mask
+
+    def equals(self, field: str, value: str) -> int:
+        postings = self.section(field).get("postings", {})
+        if field == "name":
+            mask = self.all
+            for word in fold_name(value).split():
+                mask &= self._cached(("name", word), postings.get(word, ()))
+            return mask
+        key = modern_team(value.upper()).casefold() if field == "franchise" else value.casefold()
+        return self._cached((field, key), postings.get(key, ()))
+
+    def has(self, field: str) -> int:
+        if field_kind(field) == "bool":
+            return self.equals(field, "true")
+        if field not in self._sections:
+            return 0
+        section = self.section(field)
+        if "rows" in section:
+            return self._cached(("present", field), section["rows"])
+        return self._cached(("present", field), section["present"]) if "present" in section else self.all
+
+    def compare(self, field: str, op: str, number: float) -> int:
+        section = self.section(field)
+        values, rows = section.get("values", []), section.get("rows", [])
+        if op == "!=":
+            return self.has(field) & ~self.compare(field, "=", number)
+        low, high = {
+            "<": (0, bisect.bisect_left(values, number)),
+            "<=": (0, bisect.bisect_right(values, number)),
+            "=": (bisect.bisect_left(values, number), bisect.bisect_right(values, number)),
+            ">=": (bisect.bisect_left(values, number), len(values)),
+            ">": (bisect.bisect_right(values, number), len(values)),
+        }[op]
+        return self._cached((field, op, number), lambda: rows[low:high])
+
+    # -- results ---------------------------------------------------------
+
+    def rows(self, mask: int, sort: str | None = None, descending: bool = True, limit: int | None = None) -> list[int]:
+        """Rows of a mask, in file order or by a number field (rows without it last)."""
+        if sort is None:
+            found = []
+            for row in _rows(mask):
+                if limit is not None and len(found) >= limit:
+                    break
+                found.append(row)
+            return found
+        column = self.section(sort).get("rows", [])
+        members = set(_rows(mask))
+        ordered = [row for row in (reversed(column) if descending else column) if row in members]
+        if limit is None or len(ordered) < limit:
+            ordered += self.rows(mask & ~self.has(sort), limit=None if limit is None else limit - len(ordered))
+        return ordered[:limit]
+
+    def fetch(self, rows: list[int]) -> list[dict]:
+        """The records of some rows, read from their spans in the data file."""
+        records = []
+        with open(self.path, "rb") as f:
+            for row in rows:
+                start, end = self.spans[2 * row], self.spans[2 * row + 1]
+                f.seek(start)
+                records.append(json.loads(f.read(end - start)))
+        return records
+
+
+# -- the filter language ----------------------------------------------------
+
+def resolve(field: str) -> str:
+    """Schema (or derived) field behind a query name; matching is case-insensitive."""
+    field = ALIASES.get(field.lower(), field)
+    if field in SCHEMA or field in DERIVED:
+        return field
+    for name in list(SCHEMA) + list(DERIVED):
+        if name.lower() == field.lower():
+            return name
+    raise QueryError(f"unknown field {field!r}; fields: {', '.join(sorted(set(ALIASES) | set(SCHEMA) | set(DERIVED)))}")
+
+
+def tokenize(query: str) -> list[tuple[str, str]]:
+    tokens, pos = [], 0
+    query = query.rstrip()
+    while pos < len(query):
+        match = TOKEN_RE.match(query, pos)
+        if match is None or match.end() == pos:
+            raise QueryError(f"cannot read {query[pos:].strip()!r}")
+        kind = match.lastgroup
+        tokens.append(("word" if kind == "quoted" else kind, match[kind]))
+        pos = match.end()
+    return tokens
+
+
+class _Query:
+    """Recursive descent over the tokens, evaluating to a row bitmask as it goes."""
+
+    def __init__(self, index: PlayerIndex, tokens: list[tuple[str, str]]):
+        self.index = index
+        self.tokens = tokens
+        self.pos = 0
+        self.fields: list[str] = []  # in the order the query names them
+
+    def peek(self, offset: int = 0) -> tuple[str, str]:
+        pos = self.pos + offset
+        return self.tokens[pos] if pos < len(self.tokens) else ("end", "")
+
+    def take(self) -> tuple[str, str]:
+        token = self.peek()
+        self.pos += 1
+        return token
+
+    def either(self) -> int:
+        mask = self.both()
+        while self.peek() == ("word", "or"):
+            self.take()
+            mask |= self.both()
+        return mask
+
+    def both(self) -> int:
+        mask = self.negation()
+        while self.peek()[0] != "end" and self.peek() not in (("paren", ")"), ("word", "or")):
+            if self.peek() == ("word", "and"):
+                self.take()
+            mask &= self.negation()
+        return mask
+
+    def negation(self) -> int:
+        if self.peek() in (("word", "not"), ("op", "-")):
+            self.take()
+            return self.index.all & ~self.negation()
+        if self.peek() == ("paren", "("):
+            self.take()
+            mask = self.either()
+            if self.take() != ("paren", ")"):
+                raise QueryError("missing ')'")
+            return mask
+        return self.term()
+
+    def term(self) -> int:
+        kind, name = self.take()
+        if kind != "word":
+            raise QueryError(f"expected a field, got {name or 'the end of the query'!r}")
+        field = resolve(name)
+        self.fields.append(field)
+        kind, op = self.peek()
+        if kind != "op" or op == "-":
+            return self.index.has(field)
+        self.take()
+        value_kind, value = self.take()
+        if value_kind != "word":
+            raise QueryError(f"{name}{op} needs a value")
+        if op == ":":
+            if field_kind(field) == "bool":
+                if value.lower() in TRUE | FALSE:
+                    mask = self.index.has(field)
+                    return mask if value.lower() in TRUE else self.index.all & ~mask
+                if FLAG_VALUES.get(field) is None:
+                    raise QueryError(f"{name} is a flag: {name}, not {name}, or {name}:true")
+                field = self.fields[-1] = FLAG_VALUES[field]
+            elif field_kind(field) in ("float", "int"):
+                op = "="
+            else:
+                return self.index.equals(field, value)
+        if op in COMPARISONS and (op != "=" or field_kind(field) in ("float", "int")):
+            if field_kind(field) not in ("float", "int"):
+                raise QueryError(f"{name} is not a number field")
+            try:
+                number = float(value)
+            except ValueError:
+                raise QueryError(f"{name}{op} needs a number, not {value!r}") from None
+            return self.index.compare(field, op, number)
+        return self.index.equals(field, value)
+
+
+def query(index: PlayerIndex, text: str) -> tuple[int, list[str]]:
+    """Bitmask of the rows matching a filter expression, and the fields it names."""
+    parser = _Query(index, tokenize(text))
+    if parser.peek()[0] == "end":
+        return index.all, []
+    mask = parser.either()
+    if parser.peek()[0] != "end":
+        raise QueryError(f"unexpected {parser.peek()[1]!r}")
+    return mask, parser.fields
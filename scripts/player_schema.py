@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+The players.json record schema and its compiled validator.
+
+SCHEMA is the single definition (it mirrors NBAPlayer in lib/nba-data.ts plus
+the optional fields the scripts add). compile_validator() turns it into one
+generated Python function that chains a type check per field; only a record
+that fails the chain is checked field by field. Stats accept ints as well as
+floats, since JSON does not tell 6 from 6.0.
+
+    problems = validate_players(players)                # reports, changes nothing
+    problems = validate_players(players, coerce=True)   # also fixes what it can
+
+Coercion is opt-in and only lossless: 1629029 -> "1629029" for nbaId, 2016 ->
+"2016" in string lists, 1 -> True for flags, defaults for missing required
+fields, and null entries dropped from string lists. players_db coerces on
+load_players/save_players and prints what it changed.
+"""
+
+import math
+from dataclasses import dataclass
+from functools import partial
+
+MISSING = object()
+
+
+@dataclass(frozen=True)
+class Field:
+    kind: str                 # "str" | "float" | "int" | "bool" | "str[]"
+    required: bool = True
+    default: object = MISSING  # filled in when a required field is missing
+
+
+SCHEMA = {
+    "id": Field("str"),
+    "name": Field("str"),
+    "teams": Field("str[]", default=[]),
+    "awards": Field("str[]", default=[]),
+    "allStar": Field("bool", default=False),
+    "champion": Field("bool", default=False),
+    "championYears": Field("str[]", default=[]),
+    "mvp": Field("bool", default=False),
+    "dpoy": Field("bool", default=False),
+    "roy": Field("bool", default=False),
+    "allNBA": Field("bool", default=False),
+    "allDefensive": Field("bool", default=False),
+    "college": Field("str", default=""),
+    "country": Field("str", default=""),
+    "decades": Field("str[]", default=[]),
+    "ppgCareer": Field("float", default=0.0),
+    "rpgCareer": Field("float", default=0.0),
+    "apgCareer": Field("float", default=0.0),
+    "position": Field("str", default=""),
+    # Optional in NBAPlayer, but every record has it and the game treats a missing flag as retired
+    "active": Field("bool", default=False),
+    "nbaId": Field("str", required=False),
+    "hasPhoto": Field("bool", required=False),
+    "awards_checked": Field("bool", required=False),
+    "careerStatsVerified": Field("bool", required=False),
+    "spgCareer": Field("float", required=False),
+    "bpgCareer": Field("float", required=False),
+    "ppgSeason": Field("float", required=False),
+    "rpgSeason": Field("float", required=False),
+    "apgSeason": Field("float", required=False),
+    "spgSeason": Field("float", required=False),
+    "bpgSeason": Field("float", required=False),
+    "gpSeason": Field("int", required=False),
+    # Written by ingest_draft.py; round and pick are 0 for territorial picks and undrafted players
+    "draftYear": Field("int", required=False),
+    "draftRound": Field("int", required=False),
+    "draftPick": Field("int", required=False),
+}
+
+PYTHON_TYPES = {"str": str, "float": float, "int": int, "bool": bool, "str[]": list}
+
+
+class SchemaError(ValueError):
+    """Raised when records cannot be coerced to the schema."""
+
+    def __init__(self, problems: list[tuple[int, str]], source: str = "players"):
+        self.problems = problems
+        shown = "; ".join(f"#{i}: {message}" for i, message in problems[:5])
+        more = f" (+{len(problems) - 5} more)" if len(problems) > 5 else ""
+        super().__init__(f"{len(problems)} invalid value(s) in {source}: {shown}{more}")
+
+
+def _coerce(kind: str, value):
+    """Lossless conversion of `value` to `kind`, or MISSING when there is none."""
+    if kind == "str":
+        if type(value) is int:
+            return str(value)
+        if type(value) is float and value.is_integer():
+            return str(int(value))
+    elif kind == "float":
+        if type(value) is str:
+            try:
+                number = float(value)
+            except ValueError:
+                return MISSING
+            return number if math.isfinite(number) else MISSING
+    elif kind == "int":
+        if type(value) is float and value.is_integer():
+            return int(value)
+        if type(value) is str and value.strip().lstrip("-").isdigit():
+            return int(value)
+    elif kind == "bool":
+        if type(value) is int and value in (0, 1):
+            return bool(value)
+        if type(value) is str and value.lower() in ("true", "false"):
+            return value.lower() == "true"
+    elif kind == "str[]" and type(value) is list:
+        items = []
+        for item in value:
+            if item is None:
+                continue
+            if type(item) is not str:
+                item = _coerce("str", item)
+                if item is MISSING:
+                    return MISSING
+            items.append(item)
+        return items
+    return MISSING
+
+
+def _has_type(kind: str, value) -> bool:
+    if kind == "float":
+        # JSON has one number type, so a whole-number stat loads as int (6 is as good as 6.0)
+        return type(value) is float or type(value) is int
+    if kind == "str[]":
+        return type(value) is list and all(type(item) is str for item in value)
+    return type(value) is PYTHON_TYPES[kind]
+
+
+def _fix(record: dict, name: str, value, field: Field):
+    """Coerce a value that failed its type check in place; returns a problem or None."""
+    if value is MISSING:
+        if field.default is MISSING:
+            return f"missing {name}"
+        record[name] = list(field.default) if type(field.default) is list else field.default
+        return None
+    fixed = _coerce(field.kind, value)
+    if fixed is MISSING:
+        return f"{name}={value!r} is not {field.kind}"
+    record[name] = fixed
+    return None
+
+
+def _report(record: dict, name: str, value, field: Field):
+    """Describe a value that failed its type check, leaving the record alone."""
+    return f"missing {name}" if value is MISSING else f"{name}={value!r} is not {field.kind}"
+
+
+def _slow_path(record: dict, schema: dict[str, Field], fix) -> list[str] | None:
+    """Field by field check of a record the generated fast path rejected."""
+    problems = None
+    for name, field in schema.items():
+        value = record.get(name, MISSING)
+        if value is MISSING and not field.required or value is not MISSING and _has_type(field.kind, value):
+            continue
+        problem = fix(record, name, value, field)
+        if problem:
+            problems = (problems or []) + [problem]
+    return problems
+
+
+def _fast_check(name: str, field: Field, i: int, env: dict) -> str:
+    """Expression that is true when the record's value already has the field's type."""
+    value = f"record[{name!r}]"
+    if field.kind == "float":
+        check = f"(type(v := {value}) is float or type(v) is int)"
+    elif field.kind == "str[]":
+        # "".join raises on the first non-str item, and is far cheaper than a Python-level loop
+        check = f"(type(v := {value}) is list and type(''.join(v)) is str)"
+    else:
+        env[f"T{i}"] = PYTHON_TYPES[field.kind]
+        check = f"type({value}) is T{i}"
+    return check if field.required else f"({name!r} not in record or {check})"
+
+
+def compile_validator(schema: dict[str, Field] = SCHEMA, coerce: bool = True):
+    """Generate validate(record) -> list of problems or None.
+
+    The generated function is one chain of type checks (a missing required
+    field raises KeyError); only a record that fails it is checked field by
+    field. With coerce, failing values are coerced in place when that is
+    lossless, otherwise they are only reported.
+    """
+    env = {"SLOW": partial(_slow_path, schema=schema, fix=_fix if coerce else _report)}
+    checks = [_fast_check(name, field, i, env) for i, (name, field) in enumerate(schema.items())]
+    source = ("def validate(record, type=type):\n"
+              "    try:\n"
+              "        if (" + "\n                and ".join(checks) + "):\n"
+              "            return None\n"
+              "    except (KeyError, TypeError):\n"
+              "        pass\n"
+              "    return SLOW(record)\n")
+    exec(compile(source, "<player_schema>", "exec"), env)
+    validate = env["validate"]
+    validate.source = source
+    return validate
+
+
+validate_record = compile_validator()
+check_record = compile_validator(coerce=False)
+
+
+def validate_players(players: list[dict], coerce: bool = False) -> list[tuple[int, str]]:
+    """Check every record, coercing in place only when asked; returns (index, problem) pairs."""
+    problems = []
+    validate = validate_record if coerce else check_record
+    for i, record in enumerate(players):
+        found = validate(record)
+        if found:
+            problems.extend((i, message) for message in found)
+    return problems
+
+
+def validate_fields(fields: dict) -> list[str]:
+    """Check a partial record (e.g. the fields of a point update), coercing in place."""
+    problems = []
+    for name, value in list(fields.items()):
+        field = SCHEMA.get(name)
+        if field is None or _has_type(field.kind, value):
+            continue
+        problem = f"{name}=None is not {field.kind}" if value is None else _fix(fields, name, value, field)
+        if problem:
+            problems.append(problem)
+    return problems
+
+
+def main(argv=None):
+    import argparse
+    import time
+
+    from players_db import DATA_FILE, load_json
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--benchmark", type=int, metavar="N", help="time validation of N copies of the records")
+    args = parser.parse_args(argv)
+
+    players = load_json(DATA_FILE)
+    started = time.perf_counter()
+    problems = validate_players(players)
+    print(f"✅ Checked {len(players)} players in {(time.perf_counter() - started) * 1000:.0f}ms")
+    for index, message in problems:
+        print(f"   ❌ {players[index].get('name', index)}: {message}")
+
+    if args.benchmark:
+        copies = [dict(p) for p in players] * (args.benchmark // len(players) + 1)
+        copies = copies[:args.benchmark]
+        started = time.perf_counter()
+        validate_players(copies)
+        elapsed = time.perf_counter() - started
+        print(f"⏱️  {len(copies)} records in {elapsed:.2f}s ({elapsed / len(copies) * 1e6:.2f}µs per record)")
+
+
+if __name__ == "__main__":
+    main()
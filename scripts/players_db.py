@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for reading and writing the players database.
+Paths are resolved from this file, so scripts work from any directory.
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+import unicodedata
+from collections import defaultdict
+from collections.abc import Iterator
+from pathlib import Path
+
+import canonical_json
+from pipeline_metrics import METRICS
+from player_schema import SCHEMA, SchemaError, validate_players
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+ROOT_DIR = SCRIPTS_DIR.parent
+LIB_DIR = ROOT_DIR / "lib"
+DATA_FILE = LIB_DIR / "players.json"
+CACHE_DIR = SCRIPTS_DIR / "cache"
+LOGS_DIR = SCRIPTS_DIR / "logs"
+# Fields in NBAPlayer order, then any others alphabetically (see canonical_json.py)
+PLAYER_KEY_ORDER = tuple(SCHEMA)
+
+
+def load_json(path):
+    """Load a JSON file."""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_text(path, text: str, started: float):
+    data = text.encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(data)
+    name = Path(path).name
+    METRICS.observe("swish_save_seconds", time.perf_counter() - started, file=name)
+    METRICS.inc("swish_bytes_written_total", len(data), file=name)
+
+
+def save_json(path, data):
+    """Save a JSON file in the canonical two-space form (sorted keys, normalized numbers)."""
+    started = time.perf_counter()
+    _write_text(path, canonical_json.dumps(data), started)
+
+
+def write_atomic(path: Path, text: str):
+    """Write text next to path and rename it over, so readers never see a half-written file."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _coerce_players(players: list[dict], source: str) -> list[tuple[int, str]]:
+    """Coerce players to the schema in place, printing what changed; returns what could not be coerced."""
+    problems = validate_players(players)
+    if not problems:
+        return []
+    remaining = validate_players(players, coerce=True)
+    coerced = [problem for problem in problems if problem not in remaining]
+    if coerced:
+        shown = "; ".join(f"#{i}: {message}" for i, message in coerced[:5])
+        more = f" (+{len(coerced) - 5} more)" if len(coerced) > 5 else ""
+        print(f"🔧 Coerced {len(coerced)} value(s) in {source} to the player schema: {shown}{more}")
+    return remaining
+
+
+def load_players(path=DATA_FILE) -> list[dict]:
+    """Load players.json (or [] if it does not exist yet), coerced to the player schema."""
+    path = Path(path)
+    if not path.exists():
+        return []
+    players = load_json(path)
+    problems = _coerce_players(players, path.name)
+    if problems:
+        # Still usable for reading; save_players refuses to write these back
+        print(f"⚠️ {SchemaError(problems, path.name)}")
+    return players
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def iter_players(path=DATA_FILE, fields=None, chunk_size: int = 1 << 16) -> Iterator[dict]:
+    """Yield the records of players.json one at a time, reading it in chunks.
+
+    Only the current chunk and record are held, so memory stays flat however
+    large the file is and the first record arrives before the rest is read.
+    With `fields`, each record is cut down to those keys (absent ones are left
+    out). Records are not checked against the schema: read with load_players
+    when they will be written back.
+    """
+    decoder = json.JSONDecoder()
+    keep = tuple(fields) if fields is not None else None
+    name = Path(path).name
+    with open(path, encoding="utf-8") as f:
+        buffer, pos, eof = "", 0, False
+        state = "start"  # -> "first" after "[", "next" after a record, "value" after ","
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos == len(buffer):
+                if eof:
+                    raise ValueError(f"{name}: unexpected end of file")
+                chunk = f.read(chunk_size)
+                buffer, pos, eof = chunk, 0, not chunk
+                continue
+            char = buffer[pos]
+            if state == "start":
+                if char != "[":
+                    raise ValueError(f"{name}: expected a top-level array")
+                state, pos = "first", pos + 1
+            elif state == "next":
+                if char == "]":
+                    return
+                if char != ",":
+                    raise ValueError(f"{name}: expected ',' or ']' between records, got {char!r}")
+                state, pos = "value", pos + 1
+            elif char == "]" and state == "first":
+                return
+            else:
+                try:
+                    record, pos = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    # The record runs past the buffer: keep it and read on
+                    chunk = f.read(chunk_size)
+                    buffer, pos, eof = buffer[pos:] + chunk, 0, not chunk
+                    continue
+                if not isinstance(record, dict):
+                    raise ValueError(f"{name}: expected player objects, got {type(record).__name__}")
+                yield record if keep is None else {field: record[field] for field in keep if field in record}
+                state = "next"
+
+
+def player_sort_key(player: dict) -> tuple[str, str]:
+    return player.get("name", ""), player.get("id", "")
+
+
+def render_players(players: list[dict]) -> str:
+    """players.json text: records by name, one per line in the canonical encoding.
+
+    export_artifacts.py writes the same bytes, and a diff shows only the
+    players that changed.
+    """
+    return canonical_json.dumps_records(sorted(players, key=player_sort_key), PLAYER_KEY_ORDER)
+
+
+def save_players(players: list[dict], path=DATA_FILE):
+    """Write players back to players.json; raises SchemaError on values that cannot be coerced."""
+    problems = _coerce_players(players, Path(path).name)
+    if problems:
+        raise SchemaError(problems, Path(path).name)
+    started = time.perf_counter()
+    _write_text(path, render_players(players), started)
+
+
+def id_digest(players: list[dict]) -> str:
+    """Hash of the player ids in order. The payloads that refer to players by position
+    carry it, so the app can tell they were built from the same list."""
+    return hashlib.blake2b("\n".join(p["id"] for p in players).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def fold_name(name: str) -> str:
+    """Fold a name for matching: no accents, case or punctuation ("Nikola Jokić" -> "nikola jokic")."""
+    name = unicodedata.normalize("NFKD", name)
+    name = "".join(c for c in name if not unicodedata.combining(c))
+    name = name.lower().replace(".", "").replace("'", "").replace("\u2019", "").replace("-", " ")
+    return " ".join(name.split())
+
+
+def build_name_index(players: list[dict]) -> dict[str, list[dict]]:
+    """Map folded name -> player records (usually one, several for namesakes)."""
+    index = defaultdict(list)
+    for player in players:
+        index[fold_name(player.get("name", ""))].append(player)
+    return index
+
+
+# Historical/legacy team codes -> modern franchise (mirrors getModernTeam in lib/nba-data.ts)
+MODERN_TEAMS = {
+    "SEA": "OKC",
+    "NJN": "BKN", "NYN": "BKN",
+    "SDC": "LAC", "BUF": "LAC",
+    "KCK": "SAC", "KCO": "SAC", "CIN": "SAC", "ROC": "SAC",
+    "SYR": "PHI",
+    "SFW": "GSW", "PHL": "GSW",
+    "STL": "ATL", "MLH": "ATL", "TRI": "ATL",
+    "FTW": "DET",
+    "MNL": "LAL",
+    "NOH": "NOP", "NOK": "NOP",
+    "CHH": "CHA",
+    "WSB": "WAS", "CAP": "WAS", "BAL": "WAS", "CHZ": "WAS", "CHP": "WAS",
+    "SDR": "HOU",
+    "NOJ": "UTA",
+    "VAN": "MEM",
+}
+
+
+def modern_team(abbreviation: str) -> str:
+    return MODERN_TEAMS.get(abbreviation, abbreviation)
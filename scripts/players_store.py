@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Optional SQLite store for the players database, with a players.json exporter.
+
+players.json stays the interchange format the app imports; this store is for
+scripts that look players up or change a few of them. The layout follows
+player_schema.SCHEMA:
+
+    players              one row per record: str/bool fields as columns, plus
+                         file order, folded name, key order and unknown fields
+    player_<list field>  teams, awards, championYears, decades (pk, pos, value)
+    player_stats         float/int fields (pk, stat, value)
+
+with indexes on nbaId, id (slug), folded name, team and decade. The database
+runs in WAL mode, so readers never block on a writer, and a point update
+touches only the rows of the fields it changes.
+
+    python scripts/players_store.py import            # players.json -> SQLite
+    python scripts/players_store.py export            # SQLite -> players.json
+    python scripts/players_store.py get "Nikola Jokic"
+    python scripts/players_store.py benchmark
+"""
+
+import argparse
+import json
+import sqlite3
+import time
+from pathlib import Path
+
+from player_schema import SCHEMA, SchemaError, validate_fields, validate_players, validate_record
+from players_db import CACHE_DIR, DATA_FILE, fold_name, load_players, render_players, write_atomic
+
+STORE_FILE = CACHE_DIR / "players.sqlite"
+
+SCALAR_FIELDS = [name for name, field in SCHEMA.items() if field.kind in ("str", "bool")]
+LIST_FIELDS = [name for name, field in SCHEMA.items() if field.kind == "str[]"]
+STAT_FIELDS = {name: field.kind for name, field in SCHEMA.items() if field.kind in ("float", "int")}
+SQL_TYPES = {"str": "TEXT", "bool": "INTEGER"}
+# Lists that get a value index, for "who played for X" / "who played in the 1990s"
+INDEXED_LISTS = ("teams", "decades")
+
+
+def list_table(name: str) -> str:
+    return f'"player_{name}"'
+
+
+def _quote(name: str) -> str:
+    return f'"{name}"'
+
+
+class PlayersStore:
+    """SQLite-backed players database; records go in and come out as players.json dicts."""
+
+    def __init__(self, path: Path = STORE_FILE):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute("PRAGMA foreign_keys=ON")
+        self._create_tables()
+
+    def _create_tables(self):
+        columns = ", ".join(f"{_quote(name)} {SQL_TYPES[SCHEMA[name].kind]}" for name in SCALAR_FIELDS)
+        self.db.execute(f"CREATE TABLE IF NOT EXISTS players (pk INTEGER PRIMARY KEY, ord INTEGER NOT NULL, "
+                        f"folded_name TEXT NOT NULL, keys TEXT NOT NULL, extra TEXT, {columns})")
+        # Scalar fields added to SCHEMA after the database was created
+        existing = {row[1] for row in self.db.execute("PRAGMA table_info(players)")}
+        for name in SCALAR_FIELDS:
+            if name not in existing:
+                self.db.execute(f"ALTER TABLE players ADD COLUMN {_quote(name)} {SQL_TYPES[SCHEMA[name].kind]}")
+        self.db.execute('CREATE UNIQUE INDEX IF NOT EXISTS players_id ON players ("id")')
+        self.db.execute('CREATE INDEX IF NOT EXISTS players_nba_id ON players ("nbaId")')
+        self.db.execute("CREATE INDEX IF NOT EXISTS players_folded_name ON players (folded_name)")
+        self.db.execute("CREATE INDEX IF NOT EXISTS players_ord ON players (ord)")
+        for name in LIST_FIELDS:
+            self.db.execute(f"CREATE TABLE IF NOT EXISTS {list_table(name)} (pk INTEGER NOT NULL "
+                            f"REFERENCES players(pk) ON DELETE CASCADE, pos INTEGER NOT NULL, value TEXT NOT NULL, "
+                            f"PRIMARY KEY (pk, pos)) WITHOUT ROWID")
+        for name in INDEXED_LISTS:
+            self.db.execute(f"CREATE INDEX IF NOT EXISTS player_{name}_value ON {list_table(name)} (value)")
+        self.db.execute("CREATE TABLE IF NOT EXISTS player_stats (pk INTEGER NOT NULL REFERENCES players(pk) "
+                        "ON DELETE CASCADE, stat TEXT NOT NULL, value REAL NOT NULL, "
+                        "PRIMARY KEY (pk, stat)) WITHOUT ROWID")
+
+    def close(self):
+        self.db.close()
+
+    # -- writing ---------------------------------------------------------
+
+    def replace_all(self, players: list[dict]):
+        """Load a whole players.json worth of records, replacing the current contents."""
+        problems = validate_players(players, coerce=True)
+        if problems:
+            raise SchemaError(problems, "players")
+        with self._transaction():
+            self.db.execute("DELETE FROM players")
+            for ord_, player in enumerate(players):
+                self._write(player, ord_)
+
+    def upsert(self, player: dict) -> int:
+        """Insert a record or replace the one with the same id; returns its pk."""
+        player = dict(player)
+        problems = validate_record(player)
+        if problems:
+            raise SchemaError([(0, problem) for problem in problems], player.get("id", "player"))
+        with self._transaction():
+            row = self.db.execute('SELECT pk, ord FROM players WHERE "id" = ?', (player["id"],)).fetchone()
+            if row is None:
+                ord_ = self.db.execute("SELECT COALESCE(MAX(ord) + 1, 0) FROM players").fetchone()[0]
+                return self._write(player, ord_)
+            return self._write(player, row[1], pk=row[0])
+
+    def update(self, player_id: str, **fields) -> bool:
+        """Change some fields of one record, touching only their rows; False if there is no such id."""
+        row = self.db.execute('SELECT pk, keys, extra FROM players WHERE "id" = ?', (player_id,)).fetchone()
+        if row is None:
+            return False
+        pk, keys, extra = row[0], json.loads(row[1]), json.loads(row[2]) if row[2] else {}
+        fields = dict(fields)
+        problems = validate_fields(fields)
+        if problems:
+            raise SchemaError([(0, problem) for problem in problems], player_id)
+
+        with self._transaction():
+            scalars = {name: value for name, value in fields.items() if name in SCALAR_FIELDS}
+            if "name" in scalars:
+                scalars["folded_name"] = fold_name(scalars["name"])
+            for name, value in fields.items():
+                if name in LIST_FIELDS:
+                    self.db.execute(f"DELETE FROM {list_table(name)} WHERE pk = ?", (pk,))
+                    self.db.executemany(f"INSERT INTO {list_table(name)} VALUES (?, ?, ?)",
+                                        [(pk, pos, item) for pos, item in enumerate(value)])
+                elif name in STAT_FIELDS:
+                    self.db.execute("INSERT OR REPLACE INTO player_stats VALUES (?, ?, ?)", (pk, name, value))
+                elif name not in SCALAR_FIELDS:
+                    extra[name] = value
+            new_keys = [name for name in fields if name not in keys]
+            if new_keys or any(name not in SCHEMA for name in fields):
+                scalars["keys"] = json.dumps(keys + new_keys)
+                scalars["extra"] = json.dumps(extra, ensure_ascii=False) if extra else None
+            if scalars:
+                assignments = ", ".join(f"{_quote(name)} = ?" for name in scalars)
+                self.db.execute(f"UPDATE players SET {assignments} WHERE pk = ?", (*scalars.values(), pk))
+        return True
+
+    def delete(self, player_id: str) -> bool:
+        with self._transaction():
+            return self.db.execute('DELETE FROM players WHERE "id" = ?', (player_id,)).rowcount > 0
+
+    def _write(self, player: dict, ord_: int, pk: int | None = None) -> int:
+        extra = {k: v for k, v in player.items() if k not in SCHEMA}
+        names = ["ord", "folded_name", "keys", "extra", *SCALAR_FIELDS]
+        values = [ord_, fold_name(player["name"]), json.dumps(list(player)),
+                  json.dumps(extra, ensure_ascii=False) if extra else None,
+                  *(player.get(name) for name in SCALAR_FIELDS)]
+        if pk is not None:
+            names.insert(0, "pk")
+            values.insert(0, pk)
+            self.db.execute("DELETE FROM players WHERE pk = ?", (pk,))
+        placeholders = ", ".join("?" * len(names))
+        cursor = self.db.execute(f"INSERT INTO players ({', '.join(map(_quote, names))}) VALUES ({placeholders})",
+                                 values)
+        pk = cursor.lastrowid
+        for name in LIST_FIELDS:
+            if player.get(name):
+                self.db.executemany(f"INSERT INTO {list_table(name)} VALUES (?, ?, ?)",
+                                    [(pk, pos, item) for pos, item in enumerate(player[name])])
+        stats = [(pk, name, player[name]) for name in STAT_FIELDS if player.get(name) is not None]
+        self.db.executemany("INSERT INTO player_stats VALUES (?, ?, ?)", stats)
+        return pk
+
+    def _transaction(self):
+        return _Transaction(self.db)
+
+    # -- reading ---------------------------------------------------------
+
+    def export(self) -> list[dict]:
+        """Every record in file order, exactly as players.json holds it."""
+        return self._records("1 = 1 ORDER BY ord")
+
+    def export_json(self, path: Path = DATA_FILE):
+        """Write the records as players.json (the bytes save_players and export_artifacts write)."""
+        write_atomic(Path(path), render_players(self.export()))
+
+    def get(self, player_id: str) -> dict | None:
+        found = self._records('"id" = ?', (player_id,))
+        return found[0] if found else None
+
+    def by_nba_id(self, nba_id) -> list[dict]:
+        return self._records('"nbaId" = ? ORDER BY ord', (str(nba_id),))
+
+    def by_name(self, name: str) -> list[dict]:
+        """Records whose name folds to the same key (accents, case and punctuation ignored)."""
+        return self._records("folded_name = ? ORDER BY ord", (fold_name(name),))
+
+    def with_team(self, team: str) -> list[dict]:
+        return self._records(f"pk IN (SELECT pk FROM {list_table('teams')} WHERE value = ?) ORDER BY ord", (team,))
+
+    def in_decade(self, decade: str) -> list[dict]:
+        return self._records(f"pk IN (SELECT pk FROM {list_table('decades')} WHERE value = ?) ORDER BY ord",
+                             (decade,))
+
+    def count(self) -> int:
+        return self.db.execute("SELECT COUNT(*) FROM players").fetchone()[0]
+
+    def _records(self, where: str, params: tuple = ()) -> list[dict]:
+        columns = ", ".join(_quote(name) for name in SCALAR_FIELDS)
+        rows = self.db.execute(f"SELECT pk, keys, extra, {columns} FROM players WHERE {where}", params).fetchall()
+        if not rows:
+            return []
+        everything = len(rows) > 100
+        # One pass per table for big reads, pk-filtered queries for small ones
+        if everything:
+            pk_filter, pk_params = "", ()
+        else:
+            pk_filter = f" WHERE pk IN ({', '.join('?' * len(rows))})"
+            pk_params = tuple(row[0] for row in rows)
+
+        lists = {name: {} for name in LIST_FIELDS}
+        for name in LIST_FIELDS:
+            by_pk = lists[name]
+            for pk, value in self.db.execute(f"SELECT pk, value FROM {list_table(name)}{pk_filter} ORDER BY pk, pos",
+                                             pk_params):
+                by_pk.setdefault(pk, []).append(value)
+        stats = {}
+        for pk, stat, value in self.db.execute(f"SELECT pk, stat, value FROM player_stats{pk_filter}", pk_params):
+            stats.setdefault(pk, {})[stat] = int(value) if STAT_FIELDS.get(stat) == "int" else value
+
+        scalar_index = {name: i for i, name in enumerate(SCALAR_FIELDS, start=3)}
+        bools = {name for name in SCALAR_FIELDS if SCHEMA[name].kind == "bool"}
+        records = []
+        for row in rows:
+            pk = row[0]
+            extra = json.loads(row[2]) if row[2] else {}
+            player_stats = stats.get(pk, {})
+            record = {}
+            for name in json.loads(row[1]):
+                if name in scalar_index:
+                    value = row[scalar_index[name]]
+                    record[name] = bool(value) if name in bools and value is not None else value
+                elif name in lists:
+                    record[name] = lists[name].get(pk, [])
+                elif name in STAT_FIELDS:
+                    record[name] = player_stats.get(name)
+                else:
+                    record[name] = extra.get(name)
+            records.append(record)
+        return records
+
+
+class _Transaction:
+    """BEGIN IMMEDIATE ... COMMIT, or ROLLBACK on error (the connection runs in autocommit mode)."""
+
+    def __init__(self, db: sqlite3.Connection):
+        self.db = db
+
+    def __enter__(self):
+        self.db.execute("BEGIN IMMEDIATE")
+
+    def __exit__(self, exc_type, exc, tb):
+        self.db.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
+
+
+def benchmark(store: PlayersStore, source: Path):
+    players = load_players(source)
+    timings = {}
+    started = time.perf_counter()
+    store.replace_all(players)
+    timings["import"] = time.perf_counter() - started
+    started = time.perf_counter()
+    exported = store.export()
+    timings["export"] = time.perf_counter() - started
+    assert exported == players, "export does not match the imported records"
+
+    ids = [player["id"] for player in players[:500]]
+    started = time.perf_counter()
+    for player_id in ids:
+        store.get(player_id)
+    timings["get"] = (time.perf_counter() - started) / len(ids)
+    started = time.perf_counter()
+    for i, player_id in enumerate(ids):
+        store.update(player_id, ppgCareer=float(i))
+    timings["update stat"] = (time.perf_counter() - started) / len(ids)
+    started = time.perf_counter()
+    for player_id in ids:
+        store.update(player_id, teams=["BOS", "OKC"])
+    timings["update teams"] = (time.perf_counter() - started) / len(ids)
+    store.replace_all(players)
+
+    print(f"⏱️  {len(players)} players")
+    for name, seconds in timings.items():
+        unit = f"{seconds * 1e6:.0f}µs per call" if name.startswith(("get", "update")) else f"{seconds * 1000:.0f}ms"
+        print(f"   {name:<14} {unit}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", type=Path, default=STORE_FILE, help=f"SQLite file (default: {STORE_FILE})")
+    commands = parser.add_subparsers(dest="command", required=True)
+    load = commands.add_parser("import", help="replace the store with players.json")
+    load.add_argument("--file", type=Path, default=DATA_FILE)
+    dump = commands.add_parser("export", help="write players.json from the store")
+    dump.add_argument("--output", type=Path, default=DATA_FILE)
+    get = commands.add_parser("get", help="look a player up by id, nbaId or name")
+    get.add_argument("key")
+    commands.add_parser("benchmark", help="time import, export and point updates on a scratch copy")
+    args = parser.parse_args(argv)
+
+    if args.command == "benchmark":
+        scratch = args.db.with_name("players.benchmark.sqlite")
+        store = PlayersStore(scratch)
+        try:
+            benchmark(store, DATA_FILE)
+        finally:
+            store.close()
+            for suffix in ("", "-wal", "-shm"):
+                Path(f"{scratch}{suffix}").unlink(missing_ok=True)
+        return
+
+    store = PlayersStore(args.db)
+    if args.command == "import":
+        started = time.perf_counter()
+        store.replace_all(load_players(args.file))
+        print(f"📥 Imported {store.count()} players into {args.db} in {(time.perf_counter() - started) * 1000:.0f}ms")
+    elif args.command == "export":
+        started = time.perf_counter()
+        store.export_json(args.output)
+        print(f"📤 Exported {store.count()} players to {args.output} in {(time.perf_counter() - started) * 1000:.0f}ms")
+    elif args.command == "get":
+        found = store.by_nba_id(args.key) or store.by_name(args.key)
+        record = store.get(args.key)
+        found = [record] if record else found
+        if not found:
+            parser.exit(1, f"❓ No player matches {args.key!r}\n")
+        for record in found:
+            print(json.dumps(record, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Probe which players actually have a headshot on the NBA CDN.
+Sends concurrent HEAD requests over one pooled session, caches the results
+with a TTL and writes a `hasPhoto` flag into players.json so the app can skip
+images that would 404 and render the fallback straight away.
+
+Point --url-template at a local server to test without hitting the CDN:
+    python scripts/probe_headshots.py --url-template "http://127.0.0.1:8000/{nba_id}.png"
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from pipeline_profile import Profiler, add_profile_argument
+from players_db import CACHE_DIR, load_json, load_players, save_json, save_players
+
+HEADSHOT_URL = "https://cdn.nba.com/headshots/nba/latest/1040x760/{nba_id}.png"
+CACHE_FILE = CACHE_DIR / "headshots.json"
+DEFAULT_WORKERS = 32
+DEFAULT_TTL_DAYS = 14
+TIMEOUT = 10
+
+# The CDN answers 403 (not 404) for headshots that were never uploaded
+MISSING_STATUSES = {403, 404}
+
+
+def make_session(pool_size: int) -> requests.Session:
+    """Build a session whose connection pool is shared by every worker."""
+    session = requests.Session()
+    retry = Retry(
+        total=2,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("HEAD",),
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def probe_headshot(session: requests.Session, url: str) -> bool | None:
+    """Return True/False if the image exists/is missing, None if unknown."""
+    try:
+        response = session.head(url, timeout=TIMEOUT, allow_redirects=True)
+    except requests.RequestException:
+        return None
+    if response.status_code == 200:
+        return True
+    if response.status_code in MISSING_STATUSES:
+        return False
+    return None
+
+
+def load_cache() -> dict:
+    if CACHE_FILE.exists():
+        return load_json(CACHE_FILE)
+    return {}
+
+
+def save_cache(cache: dict):
+    CACHE_DIR.mkdir(exist_ok=True)
+    save_json(CACHE_FILE, cache)
+
+
+def is_fresh(entry: dict | None, ttl_seconds: float, now: float) -> bool:
+    return bool(entry) and now - entry["checkedAt"] < ttl_seconds
+
+
+def probe_all(nba_ids: list[str], url_template: str, workers: int) -> dict[str, bool | None]:
+    """Probe every id concurrently and return {nbaId: hasPhoto}."""
+    results = {}
+    if not nba_ids:
+        return results
+
+    with make_session(workers) as session, ThreadPoolExecutor(max_workers=workers) as executor:
+        future_to_id = {
+            executor.submit(probe_headshot, session, url_template.format(nba_id=nba_id)): nba_id
+            for nba_id in nba_ids
+        }
+        for i, future in enumerate(as_completed(future_to_id), 1):
+            results[future_to_id[future]] = future.result()
+            if i % 500 == 0:
+                print(f"   ⏳ Probed {i}/{len(nba_ids)}")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url-template", default=HEADSHOT_URL, help="headshot URL with an {nba_id} placeholder")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--ttl-days", type=float, default=DEFAULT_TTL_DAYS, help="re-probe cached results older than this")
+    parser.add_argument("--refresh", action="store_true", help="ignore the cache and probe everyone")
+    parser.add_argument("--dry-run", action="store_true", help="probe and cache, but do not write players.json")
+    add_profile_argument(parser)
+    args = parser.parse_args(argv)
+    profiler = Profiler("probe_headshots", enabled=args.profile)
+
+    print("📸 Probing headshot availability...")
+    with profiler.stage("load"):
+        players = load_players()
+        cache = {} if args.refresh else load_cache()
+    now = time.time()
+    ttl_seconds = args.ttl_days * 86400
+
+    nba_ids = sorted({str(p["nbaId"]) for p in players if p.get("nbaId")})
+    stale_ids = [i for i in nba_ids if not is_fresh(cache.get(i), ttl_seconds, now)]
+    print(f"📚 {len(nba_ids)} players with an nbaId, {len(nba_ids) - len(stale_ids)} cached, {len(stale_ids)} to probe")
+
+    started = time.perf_counter()
+    with profiler.stage("probe"):
+        results = probe_all(stale_ids, args.url_template, args.workers)
+    unknown = 0
+    for nba_id, has_photo in results.items():
+        if has_photo is None:
+            unknown += 1
+            continue
+        cache[nba_id] = {"hasPhoto": has_photo, "checkedAt": now}
+    save_cache(cache)
+    if stale_ids:
+        print(f"⚡ Probed {len(stale_ids)} headshots in {time.perf_counter() - started:.1f}s ({unknown} inconclusive)")
+
+    changed = 0
+    for p in players:
+        entry = cache.get(str(p.get("nbaId") or ""))
+        if entry is None:
+            # Never probed successfully: leave the flag alone unless there is no id at all
+            has_photo = False if not p.get("nbaId") else p.get("hasPhoto")
+        else:
+            has_photo = entry["hasPhoto"]
+        if has_photo is not None and p.get("hasPhoto") != has_photo:
+            p["hasPhoto"] = has_photo
+            changed += 1
+
+    missing = sum(1 for p in players if p.get("hasPhoto") is False)
+    print(f"✅ {missing} players without a headshot, {changed} flags changed")
+
+    if changed and not args.dry_run:
+        with profiler.stage("save"):
+            save_players(players)
+        print("💾 Saved players.json")
+
+
+if __name__ == "__main__":
+    main()
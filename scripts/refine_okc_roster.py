@@ -1,6 +1,8 @@
 import json
 import os
 
+from players_db import save_players
+
 PLAYERS_DB_PATH = os.path.join(os.path.dirname(__file__), '..', 'lib', 'players.json')
 
 def refine_okc_roster():
@@ -47,8 +49,7 @@ def refine_okc_roster():
                 print(f"✅ CONFIRMED 2025 title for: {name}")
 
     if updated_count > 0:
-        with open(PLAYERS_DB_PATH, 'w', encoding='utf-8') as f:
-            json.dump(players, f, indent=2, ensure_ascii=False)
+        save_players(players, PLAYERS_DB_PATH)
         print(f"\nSuccessfully updated {updated_count} player records.")
     else:
         print("\nNo changes needed.")
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Decide which players god_mode_update.py refreshes, within an API budget.
+
+Every fetched field records when it was last refreshed (and last changed) in
+scripts/cache/refresh_state.json, next to a fingerprint of each API response
+so that an unchanged answer can be confirmed without touching players.json. A field group is due once its age passes
+the expected time between changes (a week for an active player's teams, a
+year for anything of a retired player). Due groups are ranked by
+
+    overdue (age / interval, capped) x importance
+
+where importance adds weight for active, famous and recently traded players
+and for fields still holding placeholders. Each group costs one API call;
+the budget is filled from the top, so a nightly run stays bounded and stale
+active players always go before retired players from the 1950s.
+
+    python scripts/refresh_scheduler.py --budget 200   # preview from players.json
+"""
+
+import argparse
+import threading
+import time
+from dataclasses import dataclass, field
+
+from players_db import CACHE_DIR, fold_name, load_json, load_players, save_json
+from transactions import CLEAN_FILE, load_graph
+
+STATE_FILE = CACHE_DIR / "refresh_state.json"
+DAY = 86400
+
+# Field group -> the player fields one API call refreshes
+FIELD_GROUPS = {
+    "career": ("teams",),  # PlayerCareerStats
+    "awards": ("awards", "championYears", "allStar", "champion", "mvp", "dpoy", "roy", "allNBA", "allDefensive"),
+}
+# Expected days between changes: (active player, retired player)
+REFRESH_DAYS = {"career": (7, 365), "awards": (30, 365)}
+# A field that was never fetched is as overdue as it gets
+MAX_OVERDUE = NEVER_REFRESHED = 2.0
+# An active player that is due (>= 1 + 12) outranks any retired player who was not
+# traded, however stale (<= (1 + 2 + 2) * 2)
+WEIGHTS = {"active": 12.0, "famous": 2.0, "traded": 2.0, "placeholder": 2.0}
+TRADE_WINDOW_DAYS = 60
+FAMOUS_FLAGS = ("allStar", "mvp", "champion", "allNBA", "dpoy", "roy")
+
+
+@dataclass
+class Refresh:
+    """One player's share of a run: the field groups to fetch and why."""
+    player_id: str
+    name: str
+    groups: list[str] = field(default_factory=list)
+    score: float = 0.0
+    reasons: set[str] = field(default_factory=set)
+
+
+class RefreshState:
+    """Thread-safe map of player id -> per-field refresh and change times."""
+
+    def __init__(self, path=STATE_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self.entries: dict[str, dict] = load_json(path) if path.exists() else {}
+
+    def refreshed_at(self, player_id: str, group: str) -> float | None:
+        """When the group was fully refreshed (its oldest field), or None."""
+        times = self.entries.get(player_id, {}).get("refreshedAt", {})
+        stamps = [times.get(name) for name in FIELD_GROUPS[group]]
+        return None if None in stamps else min(stamps)
+
+    def changed_since(self, player_id: str, name: str, since: float) -> bool:
+        return self.entries.get(player_id, {}).get("changedAt", {}).get(name, 0) >= since
+
+    def unchanged(self, player_id: str, fingerprints: dict[str, str]) -> bool:
+        """The API answered every group exactly as it did on the last refresh."""
+        known = self.entries.get(player_id, {}).get("fingerprints", {})
+        return bool(fingerprints) and all(known.get(group) == digest for group, digest in fingerprints.items())
+
+    def record(self, player_id: str, player_name: str, fields, changed=(), fingerprints=None,
+               now: float | None = None):
+        """Mark fields as refreshed now, those in `changed` as changed, and keep the response fingerprints."""
+        now = now or time.time()
+        with self._lock:
+            entry = self.entries.setdefault(player_id, {"name": player_name, "refreshedAt": {}, "changedAt": {}})
+            entry["name"] = player_name
+            for name in fields:
+                entry["refreshedAt"][name] = now
+            for name in changed:
+                entry["changedAt"][name] = now
+            if fingerprints:
+                entry.setdefault("fingerprints", {}).update(fingerprints)
+
+    def save(self):
+        with self._lock:
+            CACHE_DIR.mkdir(exist_ok=True)
+            save_json(self.path, self.entries)
+
+
+def recently_traded_names(path=CLEAN_FILE, now: float | None = None) -> set[str]:
+    """Folded names of players moved in a Wikipedia trade since the start of last year."""
+    this_year = time.localtime(now).tm_year
+    return {fold_name(move.player) for move in load_graph(path).moves(since=this_year - 1)}
+
+
+def is_placeholder(record: dict | None, group: str) -> bool:
+    """The group's fields were never filled in for this record."""
+    if record is None:
+        return True
+    if group == "career":
+        return not record.get("teams")
+    return not record.get("awards_checked") and not record.get("awards")
+
+
+def importance(candidate: dict, group: str, state: RefreshState, traded: set[str], now: float) -> tuple[float, set]:
+    record = candidate.get("record")
+    reasons = set()
+    if candidate["active"]:
+        reasons.add("active")
+    if record and (record.get("awards") or any(record.get(flag) for flag in FAMOUS_FLAGS)):
+        reasons.add("famous")
+    if fold_name(candidate["name"]) in traded \
+            or state.changed_since(candidate["id"], "teams", now - TRADE_WINDOW_DAYS * DAY):
+        reasons.add("traded")
+    if is_placeholder(record, group):
+        reasons.add("placeholder")
+    return 1.0 + sum(WEIGHTS[reason] for reason in reasons), reasons
+
+
+def overdue(candidate: dict, group: str, state: RefreshState, now: float) -> float:
+    """Age of the group in units of its refresh interval (>= 1 means due)."""
+    refreshed = state.refreshed_at(candidate["id"], group)
+    if refreshed is None:
+        return NEVER_REFRESHED
+    active_days, retired_days = REFRESH_DAYS[group]
+    interval = (active_days if candidate["active"] else retired_days) * DAY
+    return min((now - refreshed) / interval, MAX_OVERDUE)
+
+
+def plan_refreshes(candidates: list[dict], state: RefreshState, budget: int, traded: set[str] = frozenset(),
+                   now: float | None = None) -> list[Refresh]:
+    """Fill `budget` API calls with the highest-value due refreshes, best first.
+
+    Candidates are dicts with "id" (NBA person id), "name", "active" and
+    "record" (the players.json record, or None for a player not in it yet).
+    """
+    now = now or time.time()
+    due = []
+    for candidate in candidates:
+        for group in FIELD_GROUPS:
+            lateness = overdue(candidate, group, state, now)
+            if lateness < 1.0:
+                continue
+            weight, reasons = importance(candidate, group, state, traded, now)
+            due.append((lateness * weight, candidate, group, reasons))
+    due.sort(key=lambda item: item[0], reverse=True)
+
+    refreshes: dict[str, Refresh] = {}
+    for score, candidate, group, reasons in due[:max(budget, 0)]:
+        refresh = refreshes.get(candidate["id"])
+        if refresh is None:
+            refresh = refreshes[candidate["id"]] = Refresh(candidate["id"], candidate["name"])
+        refresh.groups.append(group)
+        refresh.score += score
+        refresh.reasons |= reasons
+    return list(refreshes.values())
+
+
+def describe(plan: list[Refresh], total_due: int | None = None, limit: int = 20) -> str:
+    calls = sum(len(refresh.groups) for refresh in plan)
+    lines = [f"🗓️  {len(plan)} players, {calls} API calls"
+             + (f" ({total_due} players have something due)" if total_due is not None else "")]
+    for refresh in plan[:limit]:
+        why = ", ".join(sorted(refresh.reasons)) or "stale"
+        lines.append(f"   {refresh.score:7.1f}  {refresh.name:<28} {'+'.join(refresh.groups):<13} {why}")
+    if len(plan) > limit:
+        lines.append(f"   ... and {len(plan) - limit} more")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget", type=int, default=200, help="API calls per run (default: 200)")
+    parser.add_argument("--limit", type=int, default=20, help="players to list (default: 20)")
+    args = parser.parse_args(argv)
+
+    # Without the API list, preview from the records that already have an NBA id
+    players = load_players()
+    candidates = [{"id": str(p["nbaId"]), "name": p["name"], "active": bool(p.get("active")), "record": p}
+                  for p in players if p.get("nbaId")]
+    state = RefreshState()
+    traded = recently_traded_names()
+    plan = plan_refreshes(candidates, state, args.budget, traded)
+    total_due = len(plan_refreshes(candidates, state, len(candidates) * len(FIELD_GROUPS), traded))
+    print(describe(plan, total_due, args.limit))
+    skipped = len(players) - len(candidates)
+    if skipped:
+        print(f"   ({skipped} players without an nbaId are only reachable through the API player list)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Decode stats.nba.com responses without pandas.
+
+Every stats endpoint answers with named tables of `headers` plus `rowSet`
+(under "resultSets", or "resultSet" on a few endpoints). get_data_frames()
+turns each into a DataFrame that the scripts then walk with iterrows(); this
+keeps them as the lists they already are:
+
+    awards = result_sets(endpoint)[0]
+    for description, season in awards.tuples("DESCRIPTION", "SEASON"): ...
+    teams = awards.column("TEAM_ABBREVIATION")
+
+pandas is imported only by ResultSet.to_data_frame().
+"""
+
+import hashlib
+import json
+from operator import itemgetter
+
+
+class ResultSet:
+    """One table of a response: column names and row lists, in API order."""
+
+    __slots__ = ("name", "headers", "rows", "_index")
+
+    def __init__(self, name: str, headers: list[str], rows: list[list]):
+        self.name = name
+        self.headers = headers
+        self.rows = rows
+        self._index = {header: i for i, header in enumerate(headers)}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def column(self, header: str) -> list:
+        i = self._index[header]
+        return [row[i] for row in self.rows]
+
+    def columns(self, *headers: str) -> dict[str, list]:
+        """Several columns at once; all of them when no header is given."""
+        return {header: self.column(header) for header in headers or self.headers}
+
+    def tuples(self, *headers: str) -> list[tuple]:
+        """Rows projected onto `headers` (all columns when none is given)."""
+        if not headers:
+            return [tuple(row) for row in self.rows]
+        if len(headers) == 1:
+            i = self._index[headers[0]]
+            return [(row[i],) for row in self.rows]
+        getter = itemgetter(*(self._index[header] for header in headers))
+        return [getter(row) for row in self.rows]
+
+    def fingerprint(self) -> str:
+        """Digest of the headers and rows; equal digests mean the API sent the same table."""
+        encoded = json.dumps([self.headers, self.rows], ensure_ascii=False, separators=(",", ":"))
+        return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+    def to_data_frame(self):
+        import pandas as pd
+
+        return pd.DataFrame(self.rows, columns=self.headers)
+
+
+def decode(payload: dict) -> list[ResultSet]:
+    """Result sets of a raw response, in the order get_data_frames() returns them."""
+    sets = payload["resultSets"] if "resultSets" in payload else payload["resultSet"]
+    if isinstance(sets, dict):
+        sets = [sets]
+    return [ResultSet(s.get("name", ""), s["headers"], s["rowSet"]) for s in sets]
+
+
+def result_sets(endpoint) -> list[ResultSet]:
+    """Decode the response behind an nba_api endpoint object."""
+    return decode(endpoint.nba_response.get_dict())
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Run the data pipeline as a DAG of stages, skipping the ones that are up to date.
+
+Each stage is a script with declared inputs and outputs. A stage depends on
+every earlier stage that writes one of its inputs, so scripts that rewrite
+players.json in place run in the order they are declared here. Before a stage
+runs, its script, arguments and inputs are fingerprinted; when the fingerprint
+matches the last successful run and the outputs are still as that run left
+them, the stage is skipped. Independent stages run in parallel.
+
+    python scripts/run_pipeline.py                    # run what is out of date
+    python scripts/run_pipeline.py --dry-run          # show what would run
+    python scripts/run_pipeline.py --from clean       # force a stage and everything downstream
+    python scripts/run_pipeline.py --resume           # pick up at the stage that failed last time
+
+State is kept in scripts/cache/pipeline_state.json, stage output in
+scripts/logs/pipeline/<stage>.log. A successful run that changed
+players.json ends with a snapshot of it (see snapshots.py).
+"""
+
+import argparse
+import hashlib
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from players_db import CACHE_DIR, DATA_FILE, LOGS_DIR, ROOT_DIR, SCRIPTS_DIR, load_json, save_json
+from snapshots import SnapshotStore
+
+STATE_FILE = CACHE_DIR / "pipeline_state.json"
+STAGE_LOGS_DIR = LOGS_DIR / "pipeline"
+STATE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    script: str
+    inputs: tuple[str, ...] = ()   # paths or globs relative to the repo root
+    outputs: tuple[str, ...] = ()
+    args: tuple[str, ...] = ()
+    deps: frozenset[str] = field(default=frozenset(), compare=False)
+
+
+STAGES = [
+    # No file inputs: reruns only when its output is missing or with --from
+    Stage("scrape", "scrape_wikipedia_transfers.py",
+          outputs=("lib/wikipedia_nba_transactions.json",)),
+    Stage("clean", "clean_wikipedia_data.py",
+          inputs=("lib/wikipedia_nba_transactions.json", "lib/players.json"),
+          outputs=("lib/wikipedia_nba_clean.json",)),
+    Stage("update_teams", "update_teams_from_wikipedia.py",
+          inputs=("lib/players.json", "lib/wikipedia_nba_clean.json"),
+          outputs=("lib/players.json",)),
+    Stage("merge_duplicates", "merge_duplicates.py",
+          inputs=("lib/players.json",),
+          outputs=("lib/players.json",)),
+    # One API request, cached for 30 days in scripts/cache/draft_history.json
+    Stage("draft", "ingest_draft.py",
+          inputs=("lib/players.json",),
+          outputs=("lib/players.json",), args=("--apply",)),
+    Stage("export", "export_artifacts.py",
+          inputs=("lib/players.json", "lib/nba-data.ts"),
+          outputs=("lib/players.json", "lib/players.md", "lib/players_enriched.json", "lib/additional-nba-data.ts",
+                   "lib/players.compact.json", "lib/players.search.json", "lib/players.neighbors.json")),
+    # Resolves names against players.json, so it reads it after the last stage that rewrites it
+    Stage("leaderboards", "ingest_leaderboards.py",
+          inputs=("temp/*.html", "lib/players.json"),
+          outputs=("lib/leaderboard_stats.json",)),
+    Stage("audit_consistency", "check_json_consistency.py", inputs=("lib/players.json",)),
+    Stage("audit_active", "find_all_active_issues.py", inputs=("lib/players.json",)),
+]
+
+
+def link_stages(stages: list[Stage]) -> dict[str, Stage]:
+    """Attach to each stage the closest earlier writer of each of its inputs."""
+    linked = {}
+    for i, stage in enumerate(stages):
+        deps = set()
+        for pattern in stage.inputs:
+            writer = next((s for s in reversed(stages[:i]) if pattern in s.outputs), None)
+            if writer is not None:
+                deps.add(writer.name)
+        linked[stage.name] = Stage(stage.name, stage.script, stage.inputs, stage.outputs, stage.args, frozenset(deps))
+    return linked
+
+
+def downstream(stages: dict[str, Stage], roots: set[str]) -> set[str]:
+    selected = set(roots)
+    for stage in stages.values():  # declaration order is a topological order
+        if stage.deps & selected:
+            selected.add(stage.name)
+    return selected
+
+
+class Fingerprinter:
+    """Content digests of files, re-hashed only when mtime or size changed."""
+
+    def __init__(self, known: dict):
+        self.known = known  # path -> {"stamp": [mtime_ns, size], "digest": str}
+
+    def digest(self, path: Path) -> str | None:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        key = str(path.relative_to(ROOT_DIR))
+        stamp = [st.st_mtime_ns, st.st_size]
+        entry = self.known.get(key)
+        if entry and entry["stamp"] == stamp:
+            return entry["digest"]
+        digest = hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+        self.known[key] = {"stamp": stamp, "digest": digest}
+        return digest
+
+    def files(self, patterns: tuple[str, ...]) -> dict[str, str | None]:
+        found = {}
+        for pattern in patterns:
+            if any(c in pattern for c in "*?["):
+                for path in sorted(ROOT_DIR.glob(pattern)):
+                    found[str(path.relative_to(ROOT_DIR))] = self.digest(path)
+            else:
+                found[pattern] = self.digest(ROOT_DIR / pattern)
+        return found
+
+    def stage(self, stage: Stage) -> str:
+        h = hashlib.blake2b(digest_size=16)
+        h.update(repr((stage.script, stage.args, self.digest(SCRIPTS_DIR / stage.script))).encode())
+        for path, digest in self.files(stage.inputs).items():
+            h.update(f"{path}={digest}\n".encode())
+        return h.hexdigest()
+
+
+def load_state() -> dict:
+    if STATE_FILE.exists():
+        state = load_json(STATE_FILE)
+        if state.get("version") == STATE_VERSION:
+            return state
+    return {"version": STATE_VERSION, "files": {}, "stages": {}, "failed": None}
+
+
+def is_up_to_date(stage: Stage, record: dict | None, fingerprints: Fingerprinter) -> bool:
+    if not record:
+        return False
+    # A stage that rewrites its own input (players.json) is also current against what it
+    # wrote, and against what the rest of the run wrote after it
+    if fingerprints.stage(stage) not in (record["before"], record["after"], record.get("settled")):
+        return False
+    outputs = fingerprints.files(stage.outputs)
+    return all(outputs.values()) and outputs == record["outputs"]
+
+
+def run_stage(stage: Stage) -> tuple[int, float]:
+    STAGE_LOGS_DIR.mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
+    with open(STAGE_LOGS_DIR / f"{stage.name}.log", "w", encoding="utf-8") as log:
+        result = subprocess.run([sys.executable, str(SCRIPTS_DIR / stage.script), *stage.args],
+                                cwd=ROOT_DIR, stdout=log, stderr=subprocess.STDOUT)
+    return result.returncode, time.perf_counter() - started
+
+
+def log_tail(stage: Stage, lines: int = 15) -> str:
+    text = (STAGE_LOGS_DIR / f"{stage.name}.log").read_text(encoding="utf-8", errors="replace")
+    return "\n".join(f"      {line}" for line in text.splitlines()[-lines:])
+
+
+def run_pipeline(stages: dict[str, Stage], forced: set[str], only: set[str] | None,
+                 workers: int, dry_run: bool) -> bool:
+    state = load_state()
+    fingerprints = Fingerprinter(state["files"])
+    pending = {name: stage for name, stage in stages.items() if only is None or name in only}
+    done, failed = set(stages) - set(pending), None
+    rerun = set()  # in a dry run, dependents of these are assumed to change too
+
+    def ready(stage: Stage) -> bool:
+        return stage.deps <= done
+
+    def needs_run(stage: Stage) -> bool:
+        if stage.name in forced or (dry_run and stage.deps & rerun):
+            return True
+        return not is_up_to_date(stage, state["stages"].get(stage.name), fingerprints)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        running = {}
+        while pending or running:
+            for name, stage in list(pending.items()):
+                if failed or not ready(stage):
+                    continue
+                del pending[name]
+                if not needs_run(stage):
+                    print(f"   ⏩ {name} is up to date")
+                    done.add(name)
+                    continue
+                rerun.add(name)
+                if dry_run:
+                    print(f"   ▶️  {name} would run ({stage.script})")
+                    done.add(name)
+                    continue
+                print(f"   ▶️  {name} ({stage.script})")
+                before = fingerprints.stage(stage)
+                running[executor.submit(run_stage, stage)] = (stage, before)
+
+            if not running:
+                break
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage, before = running.pop(future)
+                code, seconds = future.result()
+                if code != 0:
+                    failed = failed or stage.name
+                    state["stages"].pop(stage.name, None)
+                    print(f"   ❌ {stage.name} failed with exit code {code} after {seconds:.1f}s:\n{log_tail(stage)}")
+                    continue
+                state["stages"][stage.name] = {
+                    "before": before,
+                    "after": fingerprints.stage(stage),
+                    "outputs": fingerprints.files(stage.outputs),
+                    "seconds": round(seconds, 3),
+                    "finishedAt": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                }
+                done.add(stage.name)
+                print(f"   ✅ {stage.name} in {seconds:.1f}s")
+
+    if not dry_run and not failed:
+        # Later stages rewrite players.json in place, so what a stage reads next time is
+        # what the whole run left behind: accept that state as current too
+        for name in stages:
+            record = state["stages"].get(name)
+            if record:
+                record["settled"] = fingerprints.stage(stages[name])
+                record["outputs"] = fingerprints.files(stages[name].outputs)
+    if not dry_run:
+        state["failed"] = failed
+        CACHE_DIR.mkdir(exist_ok=True)
+        save_json(STATE_FILE, state)
+    if failed:
+        skipped = sorted(pending)
+        print(f"🛑 Stopped at {failed}" + (f" (not started: {', '.join(skipped)})" if skipped else ""))
+        print("   Fix it and run again with --resume")
+    return failed is None
+
+
+def main(argv=None):
+    stages = link_stages(STAGES)
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--from", dest="from_stage", choices=list(stages), help="force this stage and its dependents")
+    parser.add_argument("--only", nargs="+", choices=list(stages), metavar="STAGE",
+                        help="restrict the run to these stages (their dependencies are assumed current)")
+    parser.add_argument("--resume", action="store_true", help="restart from the stage that failed last time")
+    parser.add_argument("--workers", type=int, default=4, help="stages run at the same time")
+    parser.add_argument("--dry-run", action="store_true", help="print the plan without running anything")
+    parser.add_argument("--list", action="store_true", help="print the stages and their dependencies")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for stage in stages.values():
+            deps = ", ".join(sorted(stage.deps)) or "-"
+            print(f"{stage.name:<18} {stage.script:<34} after: {deps}")
+        return
+
+    forced, only = set(), set(args.only) if args.only else None
+    if args.from_stage:
+        forced = downstream(stages, {args.from_stage})
+    if args.resume:
+        failed = load_state().get("failed")
+        if not failed:
+            print("✅ Last run did not fail, nothing to resume")
+            return
+        print(f"↩️  Resuming at {failed}")
+        forced |= {failed}
+        only = downstream(stages, {failed})
+
+    print("🏗️  Running data pipeline...")
+    started = time.perf_counter()
+    ok = run_pipeline(stages, forced, only, args.workers, args.dry_run)
+    if ok and not args.dry_run and DATA_FILE.exists():
+        snapshot = SnapshotStore().take(DATA_FILE, "run_pipeline")
+        if snapshot:
+            print(f"📸 Snapshot {snapshot['n']}: {snapshot['changed']} changed, {snapshot['added']} added, "
+                  f"{snapshot['removed']} removed (python scripts/snapshots.py log)")
+    print(f"⏱️  Done in {time.perf_counter() - started:.1f}s")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,32 +4,43 @@ Scrape NBA transfers/transactions from Wikipedia for seasons 2010 to 2026.
 Uses pages like:
 - https://en.wikipedia.org/wiki/2023_NBA_free_agency
 - https://en.wikipedia.org/wiki/2023_NBA_draft (for draft picks)
+Trades are saved as dated player moves between teams (see transactions.py).
 """
 
-import json
 import re
-import time
-from pathlib import Path
+from urllib.parse import urlparse
 
 import requests
 from bs4 import BeautifulSoup
 
+from pipeline_metrics import METRICS
+from pipeline_profile import Profiler
+from players_db import LIB_DIR, LOGS_DIR, save_json
+from transactions import team_code
+
+METRICS_FILE = LOGS_DIR / "scrape_wikipedia_metrics.prom"
+
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 }
 
 def get_page(url: str) -> BeautifulSoup | None:
     """Fetch and parse a Wikipedia page."""
+    host = urlparse(url).netloc
     try:
-        response = requests.get(url, headers=HEADERS, timeout=30)
+        with METRICS.timer("swish_http_request_seconds", host=host):
+            response = requests.get(url, headers=HEADERS, timeout=30)
+        METRICS.inc("swish_bytes_read_total", len(response.content), source=host)
         response.raise_for_status()
         return BeautifulSoup(response.text, "html.parser")
     except requests.exceptions.HTTPError as e:
+        METRICS.inc("swish_http_errors_total", host=host, error=f"HTTP {e.response.status_code}")
         if e.response.status_code == 404:
             return None
         print(f"   ⚠️ Error: {e}")
         return None
     except Exception as e:
+        METRICS.inc("swish_http_errors_total", host=host, error=type(e).__name__)
         print(f"   ⚠️ Error: {e}")
         return None
 
@@ -53,33 +64,87 @@ def extract_player_names_from_page(soup: BeautifulSoup) -> set[str]:
     
     return players
 
+MONTHS = {month: i for i, month in enumerate(
+    ["January", "February", "March", "April", "May", "June", "July",
+     "August", "September", "October", "November", "December"], start=1)}
+DATE_CELL = re.compile(r"(%s) (\d{1,2})(?:, (\d{4}))?" % "|".join(MONTHS))
+# Links in a trade cell that are not players
+NOT_PLAYERS = re.compile(r"\d|pick|draft|cash|exception|consideration", re.I)
+
+def parse_date_cell(text: str, year: int) -> str | None:
+    """ISO date of a cell holding only a date; without a year, July-December is `year`, the rest the next one."""
+    match = DATE_CELL.fullmatch(text)
+    if not match:
+        return None
+    month, day = MONTHS[match[1]], int(match[2])
+    date_year = int(match[3]) if match[3] else (year if month >= 7 else year + 1)
+    return f"{date_year:04d}-{month:02d}-{day:02d}"
+
+def receiving_team(text: str) -> str | None:
+    """Team code of a "To <team>:" cell."""
+    if not text.startswith("To "):
+        return None
+    return team_code(text[3:].removeprefix("the "))
+
+def trade_legs(cell, team: str) -> list[dict]:
+    """Players a team receives in one "To <team>:" cell."""
+    text = cell.get_text(" ", strip=True)
+    legs = []
+    for link in cell.find_all("a"):
+        name = link.get_text(" ", strip=True)
+        if len(name.split()) < 2 or team_code(name) or NOT_PLAYERS.search(name):
+            continue
+        origin = re.search(re.escape(name) + r" \(from (?:the )?([^)]+)\)", text)
+        rights = re.search(r"rights to (?:[^,;]+ )?" + re.escape(name), text, re.I)
+        legs.append({"player": name, "from": team_code(origin[1]) if origin else None, "to": team,
+                     "rights": bool(rights)})
+    return legs
+
 def extract_trades_from_page(soup: BeautifulSoup, year: int) -> list[dict]:
-    """Extract trade information from page."""
+    """Extract trades from the wikitables: a date cell, then one "To <team>:" cell per team.
+
+    Each trade lists its moves as {player, from, to, rights}. A player's from-team
+    is the "(from <team>)" note next to them, or the other team of a two-team trade.
+    """
     trades = []
-    
-    # Look for trade tables
-    tables = soup.find_all("table", {"class": re.compile(r"wikitable")})
-    
-    for table in tables:
-        rows = table.find_all("tr")
-        for row in rows[1:]:  # Skip header
+    for table in soup.find_all("table", {"class": re.compile(r"wikitable")}):
+        date = None
+        pending = None  # teams of a "To <team>:" row whose players come in the next row
+        for row in table.find_all("tr"):
             cells = row.find_all(["td", "th"])
-            if len(cells) >= 2:
-                # Extract player names from cells
-                row_players = []
-                for cell in cells:
-                    for link in cell.find_all("a"):
-                        text = link.get_text(strip=True)
-                        if text and len(text) > 3:
-                            row_players.append(text)
-                
-                if row_players:
-                    trades.append({
-                        "year": year,
-                        "type": "trade",
-                        "players": row_players,
-                        "raw": " | ".join(c.get_text(strip=True)[:100] for c in cells[:3])
-                    })
+            teams = []
+            for cell in cells:
+                text = cell.get_text(" ", strip=True)
+                parsed = parse_date_cell(text, year)
+                if parsed:
+                    date = parsed
+                    continue
+                team = receiving_team(text)
+                if team:
+                    teams.append((team, cell))
+            legs = [trade_legs(cell, team) for team, cell in teams]
+            if teams and not any(legs):
+                pending = [team for team, _ in teams]
+                continue
+            if not teams and pending and len(cells) >= len(pending):
+                teams = list(zip(pending, cells[-len(pending):]))
+                legs = [trade_legs(cell, team) for team, cell in teams]
+            pending = None
+            if len(teams) < 2 or date is None or not any(legs):
+                continue
+            codes = {team for team, _ in teams}
+            moves = []
+            for leg in (leg for team_legs in legs for leg in team_legs):
+                if leg["from"] is None and len(codes) == 2:
+                    leg["from"] = next(code for code in codes if code != leg["to"])
+                moves.append(leg)
+            trades.append({
+                "year": year,
+                "date": date,
+                "type": "trade",
+                "moves": moves,
+                "raw": " | ".join(c.get_text(strip=True)[:100] for _, c in teams[:3])
+            })
     
     return trades
 
@@ -138,6 +203,7 @@ def scrape_year(year: int) -> dict:
 def main():
     print("🏀 Scraping NBA transactions from Wikipedia (2010-2026)")
     print("=" * 60)
+    profiler = Profiler.from_argv("scrape_wikipedia_transfers")
     
     all_players = set()
     all_trades = []
@@ -145,14 +211,15 @@ def main():
     
     for year in range(2010, 2027):
         print(f"\n📥 {year}...")
-        data = scrape_year(year)
+        with profiler.stage("scrape"):
+            data = scrape_year(year)
         
         all_players.update(data["players_mentioned"])
         all_trades.extend(data["trades"])
         all_signings.extend(data["signings"])
         
         print(f"   Found: {len(data['players_mentioned'])} players, {len(data['trades'])} trades, {len(data['signings'])} signings")
-        time.sleep(0.5)  # Be nice to Wikipedia
+        METRICS.sleep(0.5, reason="politeness")  # Be nice to Wikipedia
     
     print(f"\n✅ Summary:")
     print(f"   Total unique players mentioned: {len(all_players)}")
@@ -166,10 +233,14 @@ def main():
         "signings": all_signings
     }
     
-    output_path = Path("lib/wikipedia_nba_transactions.json")
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    output_path = LIB_DIR / "wikipedia_nba_transactions.json"
+    with profiler.stage("save"):
+        save_json(output_path, output)
     print(f"\n💾 Saved to {output_path}")
+
+    METRICS.write_prometheus(METRICS_FILE)
+    print("\n📈 Request metrics:")
+    print(METRICS.summary())
     
     # Show sample players
     if all_players:
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Content-addressed snapshot history of players.json.
+
+Each snapshot is a manifest (record order plus id -> record hash) and the
+record versions it references. Records are stored once per distinct
+content, under the blake2b hash of their minified JSON; a new version of a
+record is stored as a field-level delta against its previous version, and
+manifests as deltas against the previous snapshot (with a full keyframe
+every MANIFEST_KEYFRAME snapshots). Taking a snapshot therefore writes
+O(changed records), and the store grows with the amount of change, not
+with the number of snapshots.
+
+Everything lives in scripts/cache/snapshots/: an append-only `objects.pack`
+of zlib-compressed objects, its `objects.idx` (one line per object) and
+`log.json` (one entry per snapshot).
+
+    python scripts/snapshots.py take -m "before OKC fix"
+    python scripts/snapshots.py log
+    python scripts/snapshots.py show shai-gilgeous-alexander --at 12
+    python scripts/snapshots.py history shai-gilgeous-alexander
+    python scripts/snapshots.py diff 11 12
+    python scripts/snapshots.py checkout 11         # rewrites lib/players.json
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import time
+import zlib
+from pathlib import Path
+
+import canonical_json
+from players_db import CACHE_DIR, DATA_FILE, load_json, write_atomic
+
+STORE_DIR = CACHE_DIR / "snapshots"
+MANIFEST_KEYFRAME = 50  # every Nth manifest is stored in full
+MAX_DELTA_CHAIN = 16    # a record version this many deltas deep is stored in full
+FULL, DELTA, MANIFEST = "F", "D", "M"
+
+
+def digest(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def render_record(player: dict) -> str:
+    """A record exactly as it was read (key order and number spelling kept), minified."""
+    return json.dumps(player, ensure_ascii=False, separators=(",", ":"))
+
+
+def _joined(header: str, separator: str, footer: str):
+    return lambda players, rendered: header + separator.join(rendered) + footer
+
+
+# How players.json has laid out its records: one line per record (canonical_json), the single
+# line export_artifacts.py wrote before that, and JSON.stringify(players, null, 2) from the TS scripts.
+# Each snapshot records its layout, and take refuses a file none of them rebuilds byte for byte.
+LAYOUTS = {
+    "records": _joined(canonical_json.RECORDS_HEADER, canonical_json.RECORDS_SEPARATOR, canonical_json.RECORDS_FOOTER),
+    "line": _joined("[", ",", "]"),
+    "indent2": lambda players, rendered: json.dumps(players, indent=2, ensure_ascii=False),
+}
+
+
+def detect_layout(text: str, players: list[dict], rendered: list[str]) -> str | None:
+    """The name of the layout that renders `players` back into exactly `text`."""
+    for name, render in LAYOUTS.items():
+        if render(players, rendered) == text:
+            return name
+    return None
+
+
+def make_delta(base: dict, record: dict) -> dict:
+    """Fields to set and unset to turn `base` into `record` (plus key order, if that moved)."""
+    delta = {"set": {k: v for k, v in record.items() if k not in base or base[k] != v},
+             "unset": [k for k in base if k not in record]}
+    if [k for k in apply_delta(base, delta)] != list(record):
+        delta["order"] = list(record)
+    return delta
+
+
+def apply_delta(base: dict, delta: dict) -> dict:
+    record = {**base, **delta["set"]}
+    for key in delta["unset"]:
+        del record[key]
+    if "order" in delta:
+        record = {key: record[key] for key in delta["order"]}
+    return record
+
+
+class SnapshotStore:
+    """Append-only object pack plus the snapshot log; one writer at a time."""
+
+    def __init__(self, root: Path = STORE_DIR):
+        self.root = Path(root)
+        self.pack_path = self.root / "objects.pack"
+        self.index_path = self.root / "objects.idx"
+        self.log_path = self.root / "log.json"
+        self.log: list[dict] = load_json(self.log_path) if self.log_path.exists() else []
+        # hash -> (offset, length, kind, base hash or None, delta depth)
+        self.index: dict[str, tuple] = {}
+        if self.index_path.exists():
+            for line in self.index_path.read_text(encoding="utf-8").splitlines():
+                key, offset, length, kind, base, depth = line.split()
+                self.index[key] = (int(offset), int(length), kind, None if base == "-" else base, int(depth))
+        self._pack = None
+        self._records: dict[str, dict] = {}
+        self._manifests: dict[int, tuple[list[str], dict[str, str]]] = {}
+
+    # -- objects ---------------------------------------------------------
+
+    def _read(self, key: str) -> bytes:
+        if self._pack is None:
+            with open(self.pack_path, "rb") as f:
+                self._pack = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        offset, length = self.index[key][:2]
+        return zlib.decompress(self._pack[offset:offset + length])
+
+    def _append(self, objects: list[tuple[str, str, str | None, int, bytes]]):
+        """Append (hash, kind, base, depth, payload) objects to the pack and the index."""
+        if not objects:
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        if self._pack is not None:
+            self._pack.close()
+            self._pack = None
+        lines = []
+        with open(self.pack_path, "ab") as pack:
+            offset = pack.tell()
+            for key, kind, base, depth, payload in objects:
+                blob = zlib.compress(payload, 6)
+                pack.write(blob)
+                self.index[key] = (offset, len(blob), kind, base, depth)
+                lines.append(f"{key} {offset} {len(blob)} {kind} {base or '-'} {depth}\n")
+                offset += len(blob)
+        with open(self.index_path, "a", encoding="utf-8") as index:
+            index.writelines(lines)
+
+    def record(self, key: str) -> dict:
+        """The record stored under `key`, resolving its delta chain."""
+        record = self._records.get(key)
+        if record is None:
+            kind, base = self.index[key][2:4]
+            data = json.loads(self._read(key))
+            record = apply_delta(self.record(base), data) if kind == DELTA else data
+            self._records[key] = record
+        return record
+
+    # -- manifests -------------------------------------------------------
+
+    def manifest(self, n: int) -> tuple[list[str], dict[str, str]]:
+        """(record ids in file order, id -> record hash) of snapshot n."""
+        if n in self._manifests:
+            return self._manifests[n]
+        data = json.loads(self._read(self.entry(n)["manifest"]))
+        if "records" in data:
+            order = [record_id for record_id, _ in data["records"]]
+            hashes = dict(data["records"])
+        else:
+            parent_order, parent_hashes = self.manifest(data["parent"])
+            removed = set(data["removed"])
+            hashes = {k: v for k, v in parent_hashes.items() if k not in removed}
+            hashes.update(data["set"])
+            if "order" in data:
+                order = data["order"]
+            else:
+                order = [k for k in parent_order if k not in removed] + data["append"]
+        self._manifests[n] = (order, hashes)
+        return order, hashes
+
+    def entry(self, n: int) -> dict:
+        if not 1 <= n <= len(self.log):
+            raise KeyError(f"no snapshot {n} (have 1-{len(self.log)})")
+        return self.log[n - 1]
+
+    # -- snapshots -------------------------------------------------------
+
+    def take(self, path: Path = DATA_FILE, message: str = "") -> dict | None:
+        """Snapshot the players file; returns the log entry, or None if it matches the latest snapshot.
+
+        Raises ValueError, before storing anything, when the file is not in a layout checkout can rebuild.
+        """
+        text = Path(path).read_text(encoding="utf-8")
+        file_digest = digest(text)
+        if self.log and self.log[-1]["digest"] == file_digest:
+            return None
+        players = json.loads(text)
+        records = [render_record(player) for player in players]
+        layout = detect_layout(text, players, records)
+        if layout is None:
+            raise ValueError(f"{path} is not laid out as any of {', '.join(LAYOUTS)}, so it could not be "
+                             f"checked out again; not snapshotted")
+
+        n = len(self.log) + 1
+        parent_order, parent_hashes = self.manifest(n - 1) if self.log else ([], {})
+        objects, seen = [], set()
+        order, hashes, changed = [], {}, {}
+        for player, rendered in zip(players, records):
+            key = digest(rendered)
+            record_id = player["id"]
+            order.append(record_id)
+            hashes[record_id] = key
+            if parent_hashes.get(record_id) == key:
+                continue
+            changed[record_id] = key
+            if key in self.index or key in seen:
+                continue  # an earlier version came back (e.g. after a rollback)
+            seen.add(key)
+            objects.append(self._record_object(key, player, rendered, parent_hashes.get(record_id)))
+
+        removed = [k for k in parent_hashes if k not in hashes]
+        if not self.log or n % MANIFEST_KEYFRAME == 1:
+            manifest = {"records": [[k, hashes[k]] for k in order]}
+        else:
+            kept = [k for k in parent_order if k in hashes]
+            manifest = {"parent": n - 1, "set": changed, "removed": removed}
+            if order[:len(kept)] == kept:
+                manifest["append"] = order[len(kept):]
+            else:
+                manifest["order"] = order
+        payload = json.dumps(manifest, separators=(",", ":")).encode("utf-8")
+        manifest_key = hashlib.blake2b(payload, digest_size=16).hexdigest()
+        objects.append((manifest_key, MANIFEST, None, 0, payload))
+        self._append(objects)
+
+        added = sum(1 for k in order if k not in parent_hashes)
+        entry = {"n": n, "created": time.strftime("%Y-%m-%dT%H:%M:%S"), "message": message,
+                 "manifest": manifest_key, "digest": file_digest, "layout": layout, "records": len(order),
+                 "changed": len(changed) - added, "added": added, "removed": len(removed)}
+        self.log.append(entry)
+        self._manifests[n] = (order, hashes)
+        write_atomic(self.log_path, json.dumps(self.log, indent=2, ensure_ascii=False))
+        return entry
+
+    def _record_object(self, key: str, player: dict, rendered: str, previous: str | None):
+        """A delta against the record's previous version when that is smaller, else the full record."""
+        full = rendered.encode("utf-8")
+        if previous is not None and self.index[previous][4] < MAX_DELTA_CHAIN:
+            delta = make_delta(self.record(previous), player)
+            payload = json.dumps(delta, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            if len(payload) < len(full):
+                return key, DELTA, previous, self.index[previous][4] + 1, payload
+        return key, FULL, None, 0, full
+
+    # -- reading ---------------------------------------------------------
+
+    def players(self, n: int) -> list[dict]:
+        order, hashes = self.manifest(n)
+        return [self.record(hashes[record_id]) for record_id in order]
+
+    def checkout(self, n: int, path: Path = DATA_FILE):
+        """Write snapshot n back out, byte for byte as it was taken."""
+        entry = self.entry(n)
+        players = self.players(n)
+        rendered = [render_record(player) for player in players]
+        # Snapshots taken before layouts were recorded: try each one
+        layouts = [LAYOUTS[entry["layout"]]] if "layout" in entry else LAYOUTS.values()
+        for render in layouts:
+            text = render(players, rendered)
+            if digest(text) == entry["digest"]:
+                write_atomic(Path(path), text)
+                return
+        raise ValueError(f"snapshot {n} did not round-trip; {path} left untouched")
+
+    def lookup(self, record_id: str, n: int) -> dict | None:
+        key = self.manifest(n)[1].get(record_id)
+        return None if key is None else self.record(key)
+
+    def history(self, record_id: str) -> list[tuple[int, str | None]]:
+        """(snapshot, record hash or None when absent) for each snapshot where the record changed."""
+        versions, last = [], None
+        for entry in self.log:
+            key = self.manifest(entry["n"])[1].get(record_id)
+            if key != last:
+                versions.append((entry["n"], key))
+                last = key
+        return versions
+
+    def size(self) -> int:
+        return sum(p.stat().st_size for p in (self.pack_path, self.index_path, self.log_path) if p.exists())
+
+
+def describe_change(before: dict | None, after: dict | None) -> str:
+    if before is None:
+        return "added"
+    if after is None:
+        return "removed"
+    fields = [k for k in {**before, **after} if before.get(k) != after.get(k)]
+    return ", ".join(f"{k}: {json.dumps(before.get(k), ensure_ascii=False)} -> "
+                     f"{json.dumps(after.get(k), ensure_ascii=False)}" for k in fields)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+    take = commands.add_parser("take", help="snapshot players.json (no-op if unchanged)")
+    take.add_argument("-m", "--message", default="")
+    take.add_argument("--file", type=Path, default=DATA_FILE)
+    log = commands.add_parser("log", help="list snapshots")
+    log.add_argument("--limit", type=int, default=20)
+    show = commands.add_parser("show", help="print a record as of a snapshot")
+    show.add_argument("id")
+    show.add_argument("--at", type=int, help="snapshot number (default: latest)")
+    history = commands.add_parser("history", help="every version of a record")
+    history.add_argument("id")
+    diff = commands.add_parser("diff", help="records that changed between two snapshots")
+    diff.add_argument("a", type=int)
+    diff.add_argument("b", type=int)
+    checkout = commands.add_parser("checkout", help="restore players.json from a snapshot")
+    checkout.add_argument("n", type=int)
+    checkout.add_argument("--output", type=Path, default=DATA_FILE)
+    args = parser.parse_args(argv)
+
+    store = SnapshotStore()
+    if args.command == "take":
+        started = time.perf_counter()
+        try:
+            entry = store.take(args.file, args.message)
+        except ValueError as e:
+            parser.exit(1, f"❌ {e}\n")
+        if entry is None:
+            print("✅ players.json matches the latest snapshot, nothing to do")
+            return
+        print(f"📸 Snapshot {entry['n']}: {entry['changed']} changed, {entry['added']} added, "
+              f"{entry['removed']} removed of {entry['records']} records "
+              f"in {(time.perf_counter() - started) * 1000:.0f}ms (store: {store.size() / 1024:.0f} KB)")
+        return
+
+    if not store.log:
+        parser.exit(1, "📭 No snapshots yet (python scripts/snapshots.py take)\n")
+
+    if args.command == "log":
+        for entry in store.log[-args.limit:]:
+            print(f"   {entry['n']:>4}  {entry['created']}  {entry['records']:>5} records  "
+                  f"~{entry['changed']:<4} +{entry['added']:<4} -{entry['removed']:<4} {entry['message']}")
+        print(f"   {len(store.log)} snapshots, {store.size() / 1024:.0f} KB")
+    elif args.command == "show":
+        n = args.at or len(store.log)
+        record = store.lookup(args.id, n)
+        if record is None:
+            parser.exit(1, f"❓ {args.id} is not in snapshot {n}\n")
+        print(json.dumps(record, indent=2, ensure_ascii=False))
+    elif args.command == "history":
+        previous = None
+        for n, key in store.history(args.id):
+            record = None if key is None else store.record(key)
+            print(f"   {n:>4}  {store.entry(n)['created']}  {describe_change(previous, record)}")
+            previous = record
+    elif args.command == "diff":
+        before, after = store.manifest(args.a)[1], store.manifest(args.b)[1]
+        changed = [k for k in {**before, **after} if before.get(k) != after.get(k)]
+        for record_id in changed:
+            old = before.get(record_id) and store.record(before[record_id])
+            new = after.get(record_id) and store.record(after[record_id])
+            print(f"   {record_id}: {describe_change(old, new)}")
+        print(f"   {len(changed)} records differ")
+    elif args.command == "checkout":
+        started = time.perf_counter()
+        store.checkout(args.n, args.output)
+        print(f"⏪ Restored snapshot {args.n} to {args.output} in {(time.perf_counter() - started) * 1000:.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+swish-data: one entry point for the data scripts.
+
+    python scripts/swish_data.py <command> [target] [options]
+    npm run swish-data -- <command> [target] [options]
+
+Options after the command are passed to the underlying script, e.g.
+`swish-data ingest leaderboards --apply` or `swish-data dedup --profile`.
+
+Each command imports its script only when it runs, so `--help` and the
+read-only audits never load nba_api, pandas, requests or bs4. Scripts
+resolve lib/ from their own location (players_db), so the working
+directory is left alone and relative path arguments mean what they say.
+"""
+
+import argparse
+import ast
+import importlib
+import runpy
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+# command -> (help, {target: (module, function)}); the first target is the default.
+# A function of None runs the module as a script (for scripts without a main()).
+# Scripts listed in PLAIN_SCRIPTS have no argparse: they only understand --profile.
+COMMANDS = {
+    "ingest": ("fetch player data from the NBA API or saved pages", {
+        "api": ("god_mode_update", "main"),
+        "full": ("fetch_nba_data", "fetch_data"),
+        "leaderboards": ("ingest_leaderboards", "main"),
+        "draft": ("ingest_draft", "main"),
+        "headshots": ("probe_headshots", "main"),
+    }),
+    "scrape": ("scrape Wikipedia transactions", {"wikipedia": ("scrape_wikipedia_transfers", "main")}),
+    "clean": ("filter the scraped transactions down to players", {"wikipedia": ("clean_wikipedia_data", "main")}),
+    "reconcile": ("add teams from Wikipedia trades to players.json", {"teams": ("update_teams_from_wikipedia", "main")}),
+    "trades": ("query player moves by player, team pair and date", {"moves": ("transactions", "main")}),
+    "dedup": ("merge players with the same name", {"players": ("merge_duplicates", "main")}),
+    "audit": ("read-only checks of players.json", {
+        "consistency": ("check_json_consistency", None),
+        "active": ("find_all_active_issues", None),
+        "schema": ("player_schema", "main"),
+        "literals": ("check_manual_vs_json", None),
+        "dead-letters": ("dead_letters", "main"),
+        "staleness": ("refresh_scheduler", "main"),
+    }),
+    "patch": ("apply scripts/player-updates.json", {"updates": ("apply_player_updates", "main")}),
+    "sync": ("diff and sync the lib/*.ts player literals, players.json and the store", {"literals": ("ts_sync", "main")}),
+    "export": ("write players.json and its derived artifacts", {"all": ("export_artifacts", "main")}),
+    "inspect": ("query players with a filter expression, e.g. 'team:OKC active champion:2025'",
+                {"players": ("inspect_players", "main")}),
+    "pipeline": ("run the stage DAG (skips up-to-date stages)", {"run": ("run_pipeline", "main")}),
+    "history": ("snapshot, inspect and roll back players.json", {"snapshots": ("snapshots", "main")}),
+    "store": ("mirror players.json in SQLite and export it back", {"sqlite": ("players_store", "main")}),
+    "users": ("fold match history into per-user XP/rank summaries", {"summaries": ("user_summaries", "main")}),
+    "simulate": ("play simulated battles to measure grid balance", {"battles": ("battle_sim", "main")}),
+}
+
+
+PLAIN_SCRIPTS = {
+    "fetch_nba_data", "scrape_wikipedia_transfers", "clean_wikipedia_data", "update_teams_from_wikipedia",
+    "merge_duplicates", "check_json_consistency", "find_all_active_issues", "check_manual_vs_json",
+}
+
+
+def script_help(script: Path) -> str:
+    """Docstring of a script, read without importing it (and its dependencies)."""
+    return ast.get_docstring(ast.parse(script.read_text(encoding="utf-8"))) or f"{script.name} takes no options."
+
+
+def build_parser() -> argparse.ArgumentParser:
+    lines = ["commands (first target is the default):"]
+    for name, (help_text, targets) in COMMANDS.items():
+        lines.append(f"  {name:<10} {help_text}")
+        lines.append(f"  {'':<10}   targets: {', '.join(targets)}")
+    parser = argparse.ArgumentParser(prog="swish-data", description=__doc__, epilog="\n".join(lines),
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=list(COMMANDS), metavar="command")
+    parser.add_argument("target", nargs="?", help="what to run; `swish-data <command> [target] --help` for its options")
+    return parser
+
+
+def run(module_name: str, function: str | None, args: list[str]):
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    script = SCRIPTS_DIR / f"{module_name}.py"
+    if module_name in PLAIN_SCRIPTS:
+        if "-h" in args or "--help" in args:
+            print(script_help(script).strip() + "\n\noptions:\n  --profile   profile each stage (see pipeline_profile.py)")
+            return
+        unknown = [arg for arg in args if arg != "--profile"]
+        if unknown:
+            sys.exit(f"swish-data: {script.name} does not take {' '.join(unknown)}")
+    sys.argv = [str(script), *args]
+    if function is None:
+        runpy.run_path(str(script), run_name="__main__")
+    else:
+        getattr(importlib.import_module(module_name), function)()
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    parser = build_parser()
+    if not argv or argv[0] not in COMMANDS:
+        parser.parse_args(argv)  # prints help or the usage error
+        return
+
+    command, rest = argv[0], argv[1:]
+    targets = COMMANDS[command][1]
+    if rest and rest[0] in targets:
+        target, rest = rest[0], rest[1:]
+    elif rest and not rest[0].startswith("-") and len(targets) > 1:
+        parser.error(f"unknown target {rest[0]!r} for {command} (choose from {', '.join(targets)})")
+    else:
+        # Commands with a single target pass everything on (`history take -m ...`)
+        target = next(iter(targets))
+    module_name, function = targets[target]
+    # Everything after the target belongs to the script, --help included
+    run(module_name, function, rest)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Battle simulator: the ported rules behave like the app's.
+
+    python -m pytest scripts/tests
+"""
+
+import random
+
+import pytest
+
+from battle_sim import GUEST, HOST, build_tables, check_winner, generate_grid, load_rules, play_battles, winning_lines
+import battle_sim
+
+
+@pytest.fixture(scope="module")
+def tables():
+    players = [
+        {"id": "lebron-james", "name": "LeBron James", "teams": ["CLE", "MIA", "LAL"], "mvp": True,
+         "champion": True, "allStar": True, "decades": ["2000s", "2010s", "2020s"], "country": "USA",
+         "ppgCareer": 27.0, "rpgCareer": 7.5, "apgCareer": 7.4, "position": "F"},
+        {"id": "dirk-nowitzki", "name": "Dirk Nowitzki", "teams": ["DAL"], "mvp": True, "champion": True,
+         "allStar": True, "decades": ["1990s", "2000s", "2010s"], "country": "Germany",
+         "ppgCareer": 20.7, "rpgCareer": 7.5, "apgCareer": 2.4, "position": "F"},
+        {"id": "-journeyman", "name": "Journeyman", "teams": ["NJN", "SEA"], "decades": ["1990s"],
+         "country": "USA", "ppgCareer": 4.0, "rpgCareer": 2.0, "apgCareer": 1.0, "position": "G"},
+    ]
+    return build_tables(players, load_rules())
+
+
+def test_rules_are_read_from_nba_data():
+    rules = load_rules()
+    assert {"TEAM_CRITERIA", "AWARD_CRITERIA", "STAT_CRITERIA", "DECADE_CRITERIA"} <= set(rules["pools"])
+    assert "lew alcindor" in rules["draft"]["ONES"]
+    assert "LAL" in rules["popular_teams"] and "lebron-james" in rules["famous_ids"]
+
+
+def test_masks_follow_match_criteria(tables):
+    masks = tables["masks"]
+    assert masks[("team", "BKN")] == 0b100   # NJN is the Nets franchise
+    assert masks[("team", "OKC")] == 0b100   # and SEA the Thunder's
+    assert masks[("country", "international")] == 0b010
+    assert tables["famous"] == 0b011
+
+
+def test_winner_check_scans_every_line():
+    lines = winning_lines(3)
+    owners = [HOST, GUEST, None, GUEST, HOST, None, None, GUEST, HOST]
+    assert check_winner(owners, lines) == HOST
+    assert check_winner([GUEST, HOST, GUEST, GUEST, HOST, HOST, HOST, GUEST, GUEST], lines) == "draw"
+    assert check_winner([None] * 16, winning_lines(4)) is None
+
+
+# Easy mode needs a famous answer in every cell, which three players cannot give: it
+# falls back to an unfiltered shuffle, exactly like generateGrid
+@pytest.mark.parametrize("difficulty", ["medium", "hard"])
+def test_grids_are_distinct_and_skip_excluded_values(tables, difficulty):
+    rng = random.Random(7)
+    rows, cols = generate_grid(tables, difficulty, 3, (), rng)
+    assert len(set(rows + cols)) == 6
+    again = generate_grid(tables, difficulty, 3, tuple(v for _, v in rows + cols), rng)
+    assert not {v for _, v in rows + cols} & {v for _, v in again[0] + again[1]}
+
+
+def test_battles_are_reproducible(tables):
+    battle_sim._init_worker(tables)
+    first = play_battles((20, 3, "medium", 3, "expert", "novice"))
+    assert first == play_battles((20, 3, "medium", 3, "expert", "novice"))
+    assert first["battle"]["battles"] == 20
+
+
+def test_territorial_picks_fall_back_to_the_draft_lists():
+    draft = load_rules()["draft"]
+    oscar = {"name": "Oscar Robertson", "draftYear": 1960, "draftRound": 0, "draftPick": 0}
+    wilt = {"name": "Wilt Chamberlain", "draftYear": 1959, "draftRound": 0, "draftPick": 0}
+    assert battle_sim.draft_pick_of(oscar, draft) == 1
+    assert battle_sim.draft_pick_of(wilt, draft) == 3
+    assert battle_sim.matches(oscar, set(), {"type": "draft_pick_1", "value": "true"}, draft)
+    assert battle_sim.matches(wilt, set(), {"type": "draft_top_3", "value": "true"}, draft)
+    # Undrafted (pick 0, no year) and numbered picks are taken as stored
+    assert battle_sim.draft_pick_of({"name": "Wilt Chamberlain", "draftRound": 0, "draftPick": 0}, draft) == 0
+    assert battle_sim.draft_pick_of({"name": "Oscar Robertson", "draftYear": 1960, "draftPick": 7}, draft) == 7
@@ -0,0 +1,72 @@
+"""
+Canonical JSON: the same data gives the same bytes, whoever built it and whichever encoder runs.
+
+    python -m pytest scripts/tests
+"""
+
+import json
+
+import pytest
+
+import canonical_json
+from export_artifacts import ARTIFACTS, render_minified
+from players_db import PLAYER_KEY_ORDER, load_json, render_players, save_players
+from snapshots import SnapshotStore
+
+PLAYERS = [
+    {"name": "Nikola Jokić", "id": "nikola-jokic", "teams": ["DEN"], "active": True, "ppgCareer": 21.0,
+     "zzExtra": -0.0, "nbaId": "203999", "awards_checked": True},
+    {"id": "alaa-abdelnaby", "name": "Alaa Abdelnaby", "teams": ["POR", "MIL"], "ppgCareer": 5.7, "active": False},
+]
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    if request.param == "orjson" and canonical_json.orjson is None:
+        pytest.skip("orjson is not installed")
+    if request.param == "json":
+        monkeypatch.setattr(canonical_json, "orjson", None)
+    return request.param
+
+
+def test_key_order_and_numbers_are_normalized(backend):
+    text = canonical_json.dumps(PLAYERS[0], indent=False, key_order=PLAYER_KEY_ORDER)
+    assert text == ('{"id":"nikola-jokic","name":"Nikola Jokić","teams":["DEN"],"ppgCareer":21,"active":true,'
+                    '"nbaId":"203999","awards_checked":true,"zzExtra":0}')
+    shuffled = dict(reversed(list(PLAYERS[0].items())))
+    assert canonical_json.dumps(shuffled) == canonical_json.dumps(PLAYERS[0])
+    for bad in (float("nan"), float("inf")):
+        with pytest.raises(ValueError):
+            canonical_json.dumps({"ppgCareer": bad})
+
+
+def test_both_encoders_write_the_same_bytes(backend, monkeypatch):
+    data = {"s": "Zoë \x1f\"\\/</script> ", "n": [1, 2.5, 1e15, 123456789.125, 0.001, 2 ** 70],
+            "empty": [{}, []], "nested": {"b": None, "a": [True, False]}}
+    pretty, minified = canonical_json.dumps(data), canonical_json.dumps(data, indent=False)
+    monkeypatch.setattr(canonical_json, "orjson", None)
+    assert canonical_json.dumps(data) == pretty
+    assert canonical_json.dumps(data, indent=False) == minified
+    assert json.loads(pretty) == json.loads(minified)
+
+
+def test_save_players_and_export_write_the_same_file(backend, tmp_path):
+    path = tmp_path / "players.json"
+    save_players([dict(p) for p in PLAYERS], path)
+    text = path.read_text(encoding="utf-8")
+    assert text.splitlines()[1].startswith('{"id":"alaa-abdelnaby"')  # by name
+    assert render_players(load_json(path)) == text
+
+    artifact = next(a for a in ARTIFACTS if a.name == "players.json")
+    players = sorted(load_json(path), key=lambda p: p["name"])
+    rendered = artifact.header(2) + artifact.separator.join(render_minified(p) for p in players) + artifact.footer
+    assert rendered == text
+
+
+def test_snapshots_round_trip_the_record_per_line_layout(tmp_path):
+    path = tmp_path / "players.json"
+    save_players([dict(p) for p in PLAYERS], path)
+    store = SnapshotStore(tmp_path / "store")
+    store.take(path)
+    store.checkout(1, tmp_path / "out.json")
+    assert (tmp_path / "out.json").read_bytes() == path.read_bytes()
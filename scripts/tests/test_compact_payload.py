@@ -0,0 +1,68 @@
+"""
+Compact payload: decoding the columns gives back the records they were built from.
+
+    python -m pytest scripts/tests
+"""
+
+from build_compact_payload import DRAFT_FIELDS, FLAG_FIELDS, NO_ACTIVE_BIT, NO_PHOTO_BIT, STAT_FIELDS, build_payload
+from players_db import id_digest
+
+
+def decode(payload: dict) -> list[dict]:
+    """Same as decodeCompactPlayers in lib/compact-players.ts."""
+    dicts, c = payload["dicts"], payload["columns"]
+    players = []
+    for i in range(payload["count"]):
+        flags = c["flags"][i]
+        player = {
+            "id": c["id"][i],
+            "name": c["name"][i],
+            "teams": [dicts["teams"][t] for t in c["teams"][i]],
+            "awards": [dicts["awards"][a] for a in c["awards"][i]],
+            "championYears": [str(y) for y in c["championYears"][i]],
+            "college": dicts["colleges"][c["college"][i]],
+            "country": dicts["countries"][c["country"][i]],
+            "decades": [d for bit, d in enumerate(dicts["decades"]) if c["decades"][i] & (1 << bit)],
+            "position": dicts["positions"][c["position"][i]],
+            **{field: c[field][i] for field in STAT_FIELDS},
+        }
+        for bit, field in enumerate(FLAG_FIELDS):
+            if field != "active" or not flags & NO_ACTIVE_BIT:
+                player[field] = bool(flags & (1 << bit))
+        if c["nbaId"][i]:
+            player["nbaId"] = str(c["nbaId"][i])
+        player.update({field: c[field][i] for field in DRAFT_FIELDS if c[field][i] >= 0})
+        if flags & NO_PHOTO_BIT:
+            player["hasPhoto"] = False
+        players.append(player)
+    return players
+
+
+def record(player_id, name, **fields):
+    flags = {field: False for field in FLAG_FIELDS if field != "active"}
+    return {"id": player_id, "name": name, "teams": [], "awards": [], "championYears": [], "college": "",
+            "country": "USA", "decades": [], "position": "G", "ppgCareer": 0, "rpgCareer": 0, "apgCareer": 0,
+            **flags, **fields}
+
+
+PLAYERS = [
+    record("jalen-brunson", "Jalen Brunson", teams=["DAL", "NYK"], college="Villanova", decades=["2010s", "2020s"],
+           ppgCareer=19.4, rpgCareer=3.5, apgCareer=5.6, allStar=True, active=True, nbaId="1628973",
+           draftYear=2018, draftRound=2, draftPick=33),
+    record("bill-russell", "Bill Russell", teams=["BOS"], awards=["MVP", "Champion"], championYears=["1957", "1959"],
+           decades=["1950s"], position="C", rpgCareer=22.5, champion=True, mvp=True, active=False, hasPhoto=False),
+    record("old-timer", "Old Timer", decades=["1950s"]),  # no `active` at all
+]
+
+
+def test_decoding_the_payload_gives_back_the_records():
+    payload = build_payload(PLAYERS)
+    assert payload["count"] == 3 and payload["digest"] == id_digest(PLAYERS)
+    assert decode(payload) == PLAYERS
+    assert "active" not in decode(payload)[2]
+
+
+def test_franchises_use_the_modern_team_codes():
+    payload = build_payload([record("a", "A", teams=["SEA", "OKC", "NJN"])])
+    teams = payload["dicts"]["teams"]
+    assert sorted(teams[t] for t in payload["columns"]["franchises"][0]) == ["BKN", "OKC"]
@@ -0,0 +1,59 @@
+"""
+Dead letters: only answers that will not change are parked, and parked keys can be released or resolved.
+
+    python -m pytest scripts/tests
+"""
+
+import json
+
+import pytest
+
+from dead_letters import MAX_RECHECK_DAYS, PERMANENT, RECHECK_DAYS, TRANSIENT, DeadLetterStore, PermanentFailure, classify
+
+EMPTY_PLAYER = json.dumps({"resource": "commonplayerinfo", "parameters": {"PlayerID": 1630548}})
+RESULT_SETS = json.dumps({"resource": "commonplayerinfo", "resultSets": []})
+
+
+@pytest.mark.parametrize("error, status, raw, expected", [
+    (KeyError("resultSets"), None, EMPTY_PLAYER, PERMANENT),   # answered, but nothing nba_api can read
+    (IndexError("list index out of range"), None, EMPTY_PLAYER, PERMANENT),
+    (Exception("Not Found"), 404, "", PERMANENT),
+    (Exception("Too Many Requests"), 429, "", TRANSIENT),
+    (Exception("Bad Gateway"), 502, "<html>502</html>", TRANSIENT),
+    (TimeoutError("read timed out"), None, None, TRANSIENT),
+    (ValueError("Expecting value"), None, "<html>Access Denied</html>", TRANSIENT),
+    (KeyError("rowSet"), None, RESULT_SETS, TRANSIENT),       # the expected shape: the failure is ours
+    (ValueError("bad row"), None, EMPTY_PLAYER, TRANSIENT),   # only a missing key or index means an empty answer
+])
+def test_classify(error, status, raw, expected):
+    assert classify(error, status, raw) == expected
+
+
+def test_repeat_failures_back_off_and_cap(tmp_path):
+    store = DeadLetterStore(tmp_path / "dead_letters.json")
+    failure = PermanentFailure("commonplayerinfo", "no resultSets", raw=EMPTY_PLAYER)
+    days = []
+    for _ in range(6):
+        store.park("1630548", "Cui Cui", failure)
+        entry = store.entries["1630548"]
+        days.append(round((entry["recheckAfter"] - entry["lastFailedAt"]) / 86400))
+    assert days == [RECHECK_DAYS, 14, 28, 56, MAX_RECHECK_DAYS, MAX_RECHECK_DAYS]
+    assert store.is_parked("1630548") and not store.is_parked("2544")
+    assert store.entries["1630548"]["failures"] == 6 and store.entries["1630548"]["raw"] == EMPTY_PLAYER
+
+
+def test_released_keys_are_rechecked_and_resolved_keys_forgotten(tmp_path):
+    path = tmp_path / "dead_letters.json"
+    store = DeadLetterStore(path)
+    store.park("1630548", "Cui Cui", PermanentFailure("commonplayerinfo", "no resultSets"))
+    store.park("1630193", "Timmy Allen", PermanentFailure("commonplayerinfo", "no resultSets", status=404))
+    store.save()
+
+    store = DeadLetterStore(path)
+    assert store.release("1630548") and not store.release("2544")
+    assert not store.is_parked("1630548") and store.is_parked("1630193")
+    assert store.entries["1630548"]["failures"] == 1  # a failed re-check keeps backing off
+
+    assert store.resolve("1630548") and not store.resolve("1630548")
+    store.save()
+    assert list(DeadLetterStore(path).entries) == ["1630193"]
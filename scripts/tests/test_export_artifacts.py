@@ -0,0 +1,41 @@
+"""
+Export: artifacts that list only some players follow their members' ids in players.json.
+
+    python -m pytest scripts/tests
+"""
+
+import dataclasses
+
+from export_artifacts import ARTIFACTS, export_artifact, record_hash, render_ts, ts_header
+
+DRIFTED = """  {
+    id: "amar-e-stoudemire",
+    name: "Amar'e Stoudemire", // stale
+    teams: ["PHX"]
+  }"""
+UNKNOWN = """  {
+    id: "gone-player",
+    name: "Gone Player",
+    teams: []
+  }"""
+
+
+def test_drifted_members_are_remapped_and_unknown_ones_dropped(tmp_path):
+    artifact = dataclasses.replace(next(a for a in ARTIFACTS if a.name == "additional-nba-data.ts"),
+                                   path=tmp_path / "additional-nba-data.ts")
+    players = [{"id": "amare-stoudemire", "name": "Amar'e Stoudemire", "teams": ["PHX", "NYK", "MIA"]},
+               {"id": "jalen-brunson", "name": "Jalen Brunson", "teams": ["NYK"]},
+               {"id": "not-a-member", "name": "Not A Member", "teams": []}]
+    old = [DRIFTED, UNKNOWN, render_ts(dict(players[1], teams=["DAL"]))]
+    artifact.path.write_text(ts_header(3) + ",\n\n".join(old) + "\n];\n", encoding="utf-8")
+
+    entry, _, rendered, written = export_artifact(artifact, players, [record_hash(p) for p in players], {}, {})
+    assert written and rendered == 2  # the non-member is not rendered
+    assert entry["remapped"] == {"amar-e-stoudemire": "amare-stoudemire"} and entry["dropped"] == ["gone-player"]
+    assert entry["members"] == {"amare-stoudemire": "Amar'e Stoudemire", "jalen-brunson": "Jalen Brunson"}
+    text = artifact.path.read_text(encoding="utf-8")
+    assert text == ts_header(2) + ",\n\n".join([render_ts(players[0]), render_ts(players[1])]) + "\n];\n"
+
+    # The next export reads the current ids from the manifest entry: nothing left to remap
+    entry, _, _, written = export_artifact(artifact, players, [record_hash(p) for p in players], entry, {})
+    assert not written and "remapped" not in entry and "dropped" not in entry
@@ -0,0 +1,50 @@
+"""
+Draft-history ingestion: picks are joined by nbaId, with a unique-name fallback.
+
+    python -m pytest scripts/tests
+"""
+
+from ingest_draft import apply_draft, match_picks, parse_picks
+from result_sets import ResultSet
+
+HEADERS = ["PERSON_ID", "PLAYER_NAME", "SEASON", "ROUND_NUMBER", "ROUND_PICK", "OVERALL_PICK", "DRAFT_TYPE"]
+TABLE = ResultSet("DraftHistory", HEADERS, [
+    [165, "Hakeem Olajuwon", "1984", 1, 1, 1, "Draft"],
+    [76003, "Kareem Abdul-Jabbar", "1969", 1, 1, 1, "Draft"],
+    [600015, "Wilt Chamberlain", "1959", 1, 0, 0, "Territorial"],
+    [77777, "Drafted Twice", "1978", 3, 5, 49, "Draft"],
+    [77777, "Drafted Twice", "1979", 1, 10, 10, "Draft"],
+    [88888, "Old Timer", "1950", 2, 3, 13, "Draft"],
+])
+PLAYERS = [
+    {"id": "hakeem-olajuwon", "name": "Hakeem Olajuwon", "nbaId": "165"},
+    {"id": "kareem-abdul-jabbar", "name": "Kareem Abdul-Jabbar", "nbaId": "76003", "draftPick": 2},
+    {"id": "wilt-chamberlain", "name": "Wilt Chamberlain", "nbaId": "600015"},
+    {"id": "drafted-twice", "name": "Drafted Twice", "nbaId": "77777"},
+    {"id": "ben-wallace", "name": "Ben Wallace", "nbaId": "1112", "draftYear": 1996},
+    {"id": "old-timer", "name": "Old Timer"},
+    {"id": "no-data", "name": "No Data"},
+]
+
+
+def test_parse_picks_keeps_the_later_draft_and_flags_territorial_picks():
+    picks = parse_picks(TABLE)
+    assert picks["77777"] == {"name": "Drafted Twice", "draftYear": 1979, "draftRound": 1, "draftPick": 10}
+    assert picks["600015"]["draftYear"] == 1959 and picks["600015"]["draftPick"] == 0
+
+
+def test_match_and_apply():
+    players = [dict(p) for p in PLAYERS]
+    fields, report = match_picks(players, parse_picks(TABLE))
+    assert report["byNbaId"] == 4 and report["byName"] == 1 and report["undrafted"] == 1
+    assert report["unmatched"] == ["No Data"]
+    assert [change["name"] for change in report["changed"]] == ["Kareem Abdul-Jabbar", "Ben Wallace"]
+
+    assert apply_draft(players, fields) == 6
+    by_id = {p["id"]: p for p in players}
+    assert by_id["kareem-abdul-jabbar"]["draftPick"] == 1
+    assert by_id["old-timer"] == {"id": "old-timer", "name": "Old Timer",
+                                  "draftYear": 1950, "draftRound": 2, "draftPick": 13}
+    assert "draftYear" not in by_id["ben-wallace"] and by_id["ben-wallace"]["draftPick"] == 0
+    assert "draftPick" not in by_id["no-data"]
+    assert apply_draft(players, fields) == 0
@@ -0,0 +1,64 @@
+"""
+Leaderboard ingest: page names resolve to players.json records only when the years agree.
+
+    python -m pytest scripts/tests
+"""
+
+from ingest_leaderboards import apply_stats, build_stats_table
+
+
+def page(field, rows, mtime=1.0):
+    return {"file": f"career_{field}.html", "kind": "leaderboard", "field": f"{field}Career", "mtime": mtime,
+            "rows": [{"bbrefId": b, "name": n, "value": v, "active": False} for b, n, v in rows]}
+
+
+def index_page(rows):
+    return {"file": "players_d.html", "kind": "index",
+            "rows": [{"bbrefId": b, "name": n, "from": start, "to": end, "position": "G", "active": False}
+                     for b, n, start, end in rows]}
+
+
+# Shaped like players.json: `decades` holds only the start (draft) decade
+PLAYERS = [
+    {"id": "johnny-davis", "name": "Johnny Davis", "decades": ["2020s"], "apgCareer": 0.9},
+    {"id": "anthony-davis", "name": "Anthony Davis", "decades": ["2010s"], "apgCareer": 2.4},
+    {"id": "james-harden", "name": "James Harden", "decades": ["2000s"], "apgCareer": 7.0},
+    {"id": "magic-johnson", "name": "Magic Johnson", "decades": ["1970s"], "apgCareer": 11.0},
+    {"id": "larry-bird", "name": "Larry Bird", "decades": ["1970s"], "apgCareer": 6.0},
+]
+BIOS = [("davisjo01", "Johnny Davis", 1977, 1986), ("davisan02", "Anthony Davis", 2013, 2025),
+        ("hardeja01", "James Harden", 2010, 2025), ("johnsma02", "Magic Johnson", 1980, 1996),
+        ("birdla01", "Larry Bird", 1980, 1992)]
+
+
+def test_a_single_namesake_from_another_era_is_not_a_match():
+    pages = [page("apg", [("davisjo01", "Johnny Davis", 4.49), ("davisan02", "Anthony Davis", 2.4),
+                          ("hardeja01", "James Harden", 7.1), ("johnsma02", "Magic Johnson", 11.2),
+                          ("birdla01", "Larry Bird", 6.3)]),
+             index_page(BIOS)]
+    table, report = build_stats_table(pages, PLAYERS)
+    # A draft decade just before the first season (Harden 2009 / 2010, Magic and Bird 1979 / 1980) is the same era
+    assert [entry["id"] for entry in table] == ["anthony-davis", "james-harden", "larry-bird", "magic-johnson"]
+    assert report["unmatched"] == [{"bbrefId": "davisjo01", "name": "Johnny Davis", "years": [1977, 1986],
+                                    "wrongEra": ["johnny-davis"]}]
+
+    players = [dict(p) for p in PLAYERS]
+    apply_stats(players, table)
+    assert players[0]["apgCareer"] == 0.9 and "careerStatsVerified" not in players[0]
+    assert players[2]["apgCareer"] == 7.1 and players[2]["careerStatsVerified"] is True
+
+
+def test_a_single_candidate_without_index_years_still_matches():
+    table, report = build_stats_table([page("apg", [("davisjo01", "Johnny Davis", 4.49)])], PLAYERS)
+    assert [entry["id"] for entry in table] == ["johnny-davis"] and report["unmatched"] == []
+
+
+def test_only_written_stats_mark_a_player_verified():
+    pages = [page("apg", [("hardeja01", "James Harden", 99.0)]), page("ppg", [("birdla01", "Larry Bird", 24.3)]),
+             index_page(BIOS)]
+    table, report = build_stats_table(pages, PLAYERS)
+    assert report["rejected"] == [{"id": "james-harden", "field": "apgCareer", "value": 99.0}]
+    players = [dict(p) for p in PLAYERS]
+    assert apply_stats(players, table) == 1
+    assert "careerStatsVerified" not in players[2] and players[2]["apgCareer"] == 7.0
+    assert players[4]["ppgCareer"] == 24.3 and players[4]["careerStatsVerified"] is True
@@ -0,0 +1,54 @@
+"""
+Streaming players.json reader: same records as json.load, flat memory.
+
+    python -m pytest scripts/tests
+"""
+
+import json
+import tracemalloc
+
+import pytest
+
+from players_db import DATA_FILE, iter_players, load_json
+
+
+@pytest.mark.parametrize("chunk_size", [97, 1 << 16])
+def test_yields_the_same_records_as_a_full_load(chunk_size):
+    assert list(iter_players(DATA_FILE, chunk_size=chunk_size)) == load_json(DATA_FILE)
+
+
+def test_projects_fields_and_leaves_absent_ones_out(tmp_path):
+    path = tmp_path / "players.json"
+    path.write_text('[\n  {"id": "a", "name": "A", "active": true, "teams": ["BOS"]},\n  {"id": "b", "name": "B"}\n]')
+    for chunk_size in (1, 1 << 16):
+        assert list(iter_players(path, fields=("name", "active"), chunk_size=chunk_size)) == \
+            [{"name": "A", "active": True}, {"name": "B"}]
+    path.write_text(" [ ] ")
+    assert list(iter_players(path)) == []
+
+
+@pytest.mark.parametrize("text", ["[", '[{"id": "a"}', '[{"id": "a"},]', '{"id": "a"}', "[1]", '[{"id": "a"} {}]'])
+def test_rejects_malformed_files(tmp_path, text):
+    path = tmp_path / "players.json"
+    path.write_text(text)
+    with pytest.raises(ValueError):
+        list(iter_players(path, chunk_size=4))
+
+
+def test_memory_does_not_grow_with_the_file(tmp_path):
+    record = load_json(DATA_FILE)[0]
+    path = tmp_path / "big.json"
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[")
+        f.write(",".join(json.dumps({**record, "id": f"p{i}"}) for i in range(40_000)))
+        f.write("]")
+    assert path.stat().st_size > 10_000_000
+
+    tracemalloc.start()
+    try:
+        count = sum(1 for _ in iter_players(path, fields=("id", "active")))
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert count == 40_000
+    assert peak < 1_000_000
@@ -0,0 +1,53 @@
+"""
+Pipeline metrics: counters and histograms add up and export as Prometheus text.
+
+    python -m pytest scripts/tests
+"""
+
+import pytest
+
+from pipeline_metrics import Histogram, Metrics
+
+
+def test_counters_total_over_matching_series():
+    metrics = Metrics()
+    metrics.inc("swish_players_total", outcome="updated")
+    metrics.inc("swish_players_total", 2, outcome="updated")
+    metrics.inc("swish_players_total", outcome="failed")
+    metrics.inc("swish_api_errors_total", endpoint="PlayerAwards", error="Timeout")
+    assert metrics.total("swish_players_total") == 4
+    assert metrics.total("swish_players_total", outcome="updated") == 3
+    assert metrics.total("swish_api_errors_total", endpoint="PlayerAwards") == 1
+    assert metrics.total("swish_api_retries_total") == 0
+
+
+def test_histogram_buckets_are_upper_bounds():
+    hist = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        hist.observe(value)
+    assert hist.counts == [2, 1, 1] and hist.count == 4 and hist.sum == pytest.approx(2.65)
+    assert hist.quantile(0.5) == 0.1 and hist.quantile(0.75) == 1.0 and hist.quantile(1.0) == float("inf")
+    assert Histogram().quantile(0.5) == 0.0
+
+
+def test_prometheus_export(tmp_path):
+    metrics = Metrics()
+    metrics.inc("swish_api_retries_total", endpoint='Player"Awards')
+    metrics.observe("swish_save_seconds", 0.2, file="players.json")
+    with pytest.raises(RuntimeError):
+        with metrics.timer("swish_api_request_seconds", endpoint="PlayerAwards"):
+            raise RuntimeError("timed out")  # still observed
+
+    path = tmp_path / "metrics" / "run.prom"
+    metrics.write_prometheus(path)
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines[:3] == ["# HELP swish_api_retries_total NBA API attempts that were retried",
+                         "# TYPE swish_api_retries_total counter",
+                         'swish_api_retries_total{endpoint="Player\\"Awards"} 1']
+    assert "# TYPE swish_save_seconds histogram" in lines
+    assert 'swish_save_seconds_bucket{file="players.json",le="0.1"} 0' in lines
+    assert 'swish_save_seconds_bucket{file="players.json",le="0.25"} 1' in lines
+    assert 'swish_save_seconds_bucket{file="players.json",le="+Inf"} 1' in lines
+    assert 'swish_save_seconds_sum{file="players.json"} 0.200000' in lines
+    assert 'swish_api_request_seconds_count{endpoint="PlayerAwards"} 1' in lines
+    assert "swish_save_seconds" in metrics.summary() and "n=1" in metrics.summary()
@@ -0,0 +1,47 @@
+"""
+Pipeline profile: enabled stages write their profiles, disabled ones write nothing.
+
+    python -m pytest scripts/tests
+"""
+
+import json
+import pstats
+
+from pipeline_profile import Profiler, compare
+
+
+def work(n):
+    return sum(i * i for i in range(n))
+
+
+def test_stages_are_recorded_and_summarised(tmp_path, capsys):
+    profiler = Profiler("test_script", enabled=True, output_dir=tmp_path)
+    for _ in range(2):
+        with profiler.stage("load"):
+            with profiler.stage("inner"):  # nested: covered by "load"
+                work(20_000)
+    with profiler.stage("save"):
+        blob = [bytes(1000) for _ in range(100)]
+    assert blob
+
+    assert list(profiler.stages) == ["load", "save"]
+    assert profiler.stages["load"]["calls"] == 2 and profiler.stages["save"]["tracedPeakBytes"] >= 100_000
+    assert "work" in str(pstats.Stats(str(tmp_path / "load.pstats")).stats)
+    assert (tmp_path / "save.alloc.txt").exists()
+
+    profiler.finish()
+    summary = json.loads((tmp_path / "profile.json").read_text(encoding="utf-8"))
+    assert summary["script"] == "test_script" and set(summary["stages"]) == {"load", "save"}
+    assert "🔬 Profile for test_script" in capsys.readouterr().out
+
+    compare(tmp_path / "profile.json", tmp_path / "profile.json")
+    out = capsys.readouterr().out
+    assert out.splitlines()[1].startswith("load") and "+0.0%" in out
+
+
+def test_a_disabled_profiler_writes_nothing(tmp_path):
+    profiler = Profiler("test_script", output_dir=tmp_path / "profiles")
+    with profiler.stage("load"):
+        work(10)
+    profiler.finish()
+    assert profiler.stages == {} and not (tmp_path / "profiles").exists()
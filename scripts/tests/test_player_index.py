@@ -0,0 +1,91 @@
+"""
+Player index: filter expressions answered from saved secondary indexes, checked against a plain scan.
+
+    python -m pytest scripts/tests
+"""
+
+import pytest
+
+from player_index import PlayerIndex, QueryError, query
+from players_db import modern_team, save_players
+
+
+def player(slug, name, teams, **fields):
+    record = {"id": slug, "name": name, "teams": teams, "awards": [], "allStar": False, "champion": False,
+              "championYears": [], "mvp": False, "dpoy": False, "roy": False, "allNBA": False,
+              "allDefensive": False, "college": "", "country": "USA", "decades": ["2010s"], "ppgCareer": 10.0,
+              "rpgCareer": 4.0, "apgCareer": 2.0, "position": "G", "active": False}
+    record.update(fields)
+    return record
+
+
+PLAYERS = [
+    player("shai-gilgeous-alexander", "Shai Gilgeous-Alexander", ["LAC", "OKC"], active=True, champion=True,
+           championYears=["2025"], awards=["MVP", "All-Star"], mvp=True, country="Canada", ppgCareer=25.3,
+           decades=["2010s", "2020s"], draftYear=2018, draftPick=11),
+    player("kevin-durant", "Kevin Durant", ["SEA", "OKC", "GSW", "BKN"], active=True, champion=True,
+           championYears=["2017", "2018"], awards=["MVP"], mvp=True, ppgCareer=27.1, position="F",
+           college="Texas", decades=["2000s", "2010s", "2020s"], draftYear=2007, draftPick=2),
+    player("nikola-jokic", "Nikola Jokić", ["DEN"], active=True, champion=True, championYears=["2023"],
+           awards=["MVP"], mvp=True, country="Serbia", ppgCareer=21.0, position="C", draftYear=2014, draftPick=41),
+    player("jason-kidd", "Jason Kidd", ["DAL", "PHX", "NJN", "NYK"], champion=True, championYears=["2011"],
+           ppgCareer=12.6, decades=["1990s", "2000s", "2010s"]),
+    player("alaa-abdelnaby", "Alaa Abdelnaby", ["POR", "MIL"], ppgCareer=5.7, position="F", decades=["1990s"]),
+]
+
+QUERIES = {
+    "team:OKC active champion:2025": lambda p: "OKC" in p["teams"] and p["active"] and "2025" in p["championYears"],
+    "franchise:okc": lambda p: any(modern_team(t) == "OKC" for t in p["teams"]),
+    "franchise:NJN -active": lambda p: any(modern_team(t) == "BKN" for t in p["teams"]) and not p["active"],
+    "award:mvp and not country:usa": lambda p: "MVP" in p["awards"] and p["country"] != "USA",
+    "ppg>=21 or (decade:1990s position:F)":
+        lambda p: p["ppgCareer"] >= 21 or ("1990s" in p["decades"] and p["position"] == "F"),
+    "ppg<12.6": lambda p: p["ppgCareer"] < 12.6,
+    "ppg:21": lambda p: p["ppgCareer"] == 21,
+    "pick<=11 draft>=2010": lambda p: p.get("draftPick", 99) <= 11 and p.get("draftYear", 0) >= 2010,
+    "draftPick": lambda p: "draftPick" in p,
+    "-draftPick": lambda p: "draftPick" not in p,
+    'name:"nikola jokic"': lambda p: p["id"] == "nikola-jokic",
+    "champion:false": lambda p: not p["champion"],
+    "": lambda p: True,
+}
+
+
+@pytest.fixture
+def data(tmp_path):
+    path = tmp_path / "players.json"
+    save_players([dict(p) for p in PLAYERS], path)
+    return path
+
+
+@pytest.mark.parametrize("text", list(QUERIES))
+def test_queries_match_a_full_scan(data, tmp_path, text):
+    index, reused = PlayerIndex.load(data, tmp_path / "index.json")
+    mask, _ = query(index, text)
+    players = index.fetch(index.rows(mask))
+    assert sorted(p["id"] for p in players) == sorted(p["id"] for p in PLAYERS if QUERIES[text](p))
+
+
+def test_index_is_reused_until_the_data_changes(data, tmp_path):
+    index_path = tmp_path / "index.json"
+    assert PlayerIndex.load(data, index_path)[1] is False
+    index, reused = PlayerIndex.load(data, index_path)
+    assert reused
+    mask, fields = query(index, "team:OKC champion:2025 ppg>20")
+    assert fields == ["teams", "championYears", "ppgCareer"]
+    assert [p["name"] for p in index.fetch(index.rows(mask))] == ["Shai Gilgeous-Alexander"]
+    assert [index.fetch([row])[0]["id"] for row in index.rows(index.all, "ppgCareer", limit=2)] == \
+        ["kevin-durant", "shai-gilgeous-alexander"]
+
+    save_players([dict(p) for p in PLAYERS[:3]], data)
+    index, reused = PlayerIndex.load(data, index_path)
+    assert not reused and index.count == 3
+
+
+def test_bad_queries_say_what_is_wrong(data, tmp_path):
+    index, _ = PlayerIndex.load(data, tmp_path / "index.json")
+    for text, message in [("bogus:1", "unknown field"), ("ppg>=high", "needs a number"),
+                          ("team:", "needs a value"), ("(mvp", "missing"), ("mvp:MVP", "is a flag"),
+                          ("team>3", "not a number")]:
+        with pytest.raises(QueryError, match=message):
+            query(index, text)
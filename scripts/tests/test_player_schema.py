@@ -0,0 +1,50 @@
+"""
+Player schema: valid records pass untouched, invalid ones are reported and only coerced when asked.
+
+    python -m pytest scripts/tests
+"""
+
+import copy
+
+from player_schema import validate_fields, validate_players
+
+VALID = {
+    "id": "jalen-brunson", "name": "Jalen Brunson", "teams": ["DAL", "NYK"], "awards": [], "allStar": True,
+    "champion": False, "championYears": [], "mvp": False, "dpoy": False, "roy": False, "allNBA": True,
+    "allDefensive": False, "college": "Villanova", "country": "USA", "decades": ["2010s"], "ppgCareer": 19.4,
+    "rpgCareer": 3, "apgCareer": 5.6, "position": "PG", "active": True, "nbaId": "1628973", "draftYear": 2018,
+}
+
+
+def test_valid_records_pass_unchanged():
+    players = [copy.deepcopy(VALID), {k: v for k, v in VALID.items() if k not in ("nbaId", "draftYear")}]
+    before = copy.deepcopy(players)
+    assert validate_players(players) == [] and validate_players(players, coerce=True) == []
+    assert players == before and type(players[0]["rpgCareer"]) is int  # a whole-number stat stays as loaded
+
+
+def test_invalid_records_are_reported_without_coerce():
+    record = dict(VALID, nbaId=1628973, teams=["DAL", None], ppgCareer="n/a", allStar=True)
+    del record["college"]
+    players = [record, dict(VALID, apgCareer=True)]
+    before = copy.deepcopy(players)
+    assert validate_players(players) == [
+        (0, "teams=['DAL', None] is not str[]"), (0, "missing college"), (0, "ppgCareer='n/a' is not float"),
+        (0, "nbaId=1628973 is not str"), (1, "apgCareer=True is not float"),
+    ]
+    assert players == before
+
+
+def test_coerce_fixes_lossless_values_and_reports_the_rest():
+    record = dict(VALID, nbaId=1628973, teams=["DAL", None], championYears=[2016], ppgCareer="n/a", mvp=0)
+    del record["college"], record["id"]
+    players = [record]
+    assert validate_players(players, coerce=True) == [(0, "missing id"), (0, "ppgCareer='n/a' is not float")]
+    assert record["nbaId"] == "1628973" and record["teams"] == ["DAL"] and record["championYears"] == ["2016"]
+    assert record["mvp"] is False and record["college"] == ""
+
+
+def test_validate_fields_checks_only_the_given_fields():
+    fields = {"nbaId": 1628973, "teams": ["NYK"], "unknownField": object()}
+    assert validate_fields(fields) == [] and fields["nbaId"] == "1628973"
+    assert validate_fields({"active": None, "rpgCareer": 3}) == ["active=None is not bool"]
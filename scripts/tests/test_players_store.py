@@ -0,0 +1,66 @@
+import pytest
+
+from player_schema import SchemaError
+from players_store import PlayersStore
+
+
+def player(slug, name, teams, decades, **fields):
+    record = {"id": slug, "name": name, "teams": teams, "awards": [], "allStar": False, "champion": False,
+              "championYears": [], "mvp": False, "dpoy": False, "roy": False, "allNBA": False,
+              "allDefensive": False, "college": "", "country": "USA", "decades": decades, "ppgCareer": 10.5,
+              "rpgCareer": 4.0, "apgCareer": 2.25, "position": "G", "active": False}
+    record.update(fields)
+    return record
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = PlayersStore(tmp_path / "players.sqlite")
+    store.replace_all([
+        player("nikola-jokic", "Nikola Jokić", ["DEN"], ["2010s", "2020s"], nbaId="203999", mvp=True,
+               awards=["MVP"], gpSeason=70, hasPhoto=True, active=True),
+        {"note": "unknown fields survive", **player("alaa-abdelnaby", "Alaa Abdelnaby", ["POR", "MIL", "BOS"],
+                                                   ["1990s"])},
+        player("nene", "Nene", ["DEN", "HOU", "WAS"], ["2000s", "2010s"], nbaId="2403"),
+    ])
+    yield store
+    store.close()
+
+
+def test_export_returns_the_records_as_imported(store):
+    players = store.export()
+    assert [p["id"] for p in players] == ["nikola-jokic", "alaa-abdelnaby", "nene"]
+    assert list(players[1]) == ["note", *player("x", "x", [], [])]
+    assert players[0]["gpSeason"] == 70 and type(players[0]["gpSeason"]) is int
+    assert players[0]["hasPhoto"] is True and "hasPhoto" not in players[2]
+
+
+def test_indexed_lookups(store):
+    assert store.by_nba_id(203999)[0]["id"] == "nikola-jokic"
+    assert [p["id"] for p in store.by_name("nikola jokic")] == ["nikola-jokic"]
+    assert [p["id"] for p in store.with_team("DEN")] == ["nikola-jokic", "nene"]
+    assert [p["id"] for p in store.in_decade("1990s")] == ["alaa-abdelnaby"]
+
+
+def test_point_update_changes_only_the_given_fields(store):
+    before = store.get("nene")
+    assert store.update("nene", teams=["DEN", "HOU", "WAS", "DEN"], ppgCareer=11, draftYear=2002)
+    after = store.get("nene")
+    assert after == {**before, "teams": ["DEN", "HOU", "WAS", "DEN"], "ppgCareer": 11.0, "draftYear": 2002}
+    assert [p["id"] for p in store.export()] == ["nikola-jokic", "alaa-abdelnaby", "nene"]
+    assert not store.update("nobody", ppgCareer=1.0)
+
+
+def test_invalid_values_are_rejected(store):
+    with pytest.raises(SchemaError):
+        store.update("nene", ppgCareer="lots")
+    with pytest.raises(SchemaError):
+        store.upsert({"id": "broken", "name": "Broken", "teams": "DEN"})
+    assert store.get("nene")["ppgCareer"] == 10.5 and store.count() == 3
+
+
+def test_upsert_keeps_position_and_appends_new_records(store):
+    store.upsert(player("alaa-abdelnaby", "Alaa Abdelnaby", ["POR"], ["1990s"]))
+    store.upsert(player("new-guy", "New Guy", [], ["2020s"]))
+    assert [p["id"] for p in store.export()] == ["nikola-jokic", "alaa-abdelnaby", "nene", "new-guy"]
+    assert store.get("alaa-abdelnaby")["teams"] == ["POR"]
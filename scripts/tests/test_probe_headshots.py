@@ -0,0 +1,99 @@
+"""
+Headshot probe: HEAD requests against a local server, the TTL cache and the hasPhoto flag in players.json.
+
+    python -m pytest scripts/tests
+"""
+
+import threading
+from collections import Counter
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import probe_headshots
+from players_db import load_json, load_players, save_players
+from probe_headshots import probe_all
+
+PHOTOS = {"201939", "2544"}
+UNKNOWN = "418"  # neither 200 nor 403/404: inconclusive, and not retried
+
+
+def player(slug, name, nba_id=None, **fields):
+    record = {"id": slug, "name": name, "teams": ["GSW"], "awards": [], "allStar": False, "champion": False,
+              "championYears": [], "mvp": False, "dpoy": False, "roy": False, "allNBA": False,
+              "allDefensive": False, "college": "", "country": "USA", "decades": ["2010s"], "ppgCareer": 10.0,
+              "rpgCareer": 4.0, "apgCareer": 2.0, "position": "G"}
+    if nba_id:
+        record["nbaId"] = nba_id
+    record.update(fields)
+    return record
+
+
+@pytest.fixture
+def cdn():
+    """A local headshot CDN: 200 for PHOTOS, 418 for UNKNOWN, 404 otherwise; counts the requests per id."""
+    hits = Counter()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_HEAD(self):
+            nba_id = self.path.strip("/").removesuffix(".png")
+            hits[nba_id] += 1
+            self.send_response(200 if nba_id in PHOTOS else int(UNKNOWN) if nba_id == UNKNOWN else 404)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/{{nba_id}}.png", hits
+    server.shutdown()
+    server.server_close()
+
+
+def test_probe_all_reads_the_status_codes(cdn):
+    template, hits = cdn
+    ids = ["201939", "2544", "1", UNKNOWN]
+    assert probe_all(ids, template, workers=4) == {"201939": True, "2544": True, "1": False, UNKNOWN: None}
+    assert hits == Counter(ids)
+    assert probe_all([], template, workers=4) == {}
+
+
+def test_cache_and_flags(cdn, tmp_path, monkeypatch):
+    template, hits = cdn
+    data = tmp_path / "players.json"
+    cache_file = tmp_path / "cache" / "headshots.json"
+    monkeypatch.setattr(probe_headshots, "CACHE_DIR", cache_file.parent)
+    monkeypatch.setattr(probe_headshots, "CACHE_FILE", cache_file)
+    monkeypatch.setattr(probe_headshots, "load_players", partial(load_players, data))
+    monkeypatch.setattr(probe_headshots, "save_players", partial(save_players, path=data))
+    save_players([player("stephen-curry", "Stephen Curry", "201939"),
+                  player("lebron-james", "LeBron James", "2544", hasPhoto=False),
+                  player("no-photo", "No Photo", "1"),
+                  player("flaky", "Flaky Cdn", UNKNOWN, hasPhoto=True),
+                  player("no-id", "No Id")], data)
+    run = ["--url-template", template, "--workers", "4"]
+
+    probe_headshots.main(run)
+    flags = {p["id"]: p.get("hasPhoto") for p in load_players(data)}
+    # An inconclusive probe leaves the flag alone; no nbaId means no photo
+    assert flags == {"stephen-curry": True, "lebron-james": True, "no-photo": False, "flaky": True, "no-id": False}
+    cache = load_json(cache_file)
+    assert sorted(cache) == ["1", "201939", "2544"] and cache["1"]["hasPhoto"] is False
+    assert hits == Counter({"201939": 1, "2544": 1, "1": 1, UNKNOWN: 1})
+
+    # Fresh cache entries are not probed again; the inconclusive id is
+    probe_headshots.main(run)
+    assert hits == Counter({"201939": 1, "2544": 1, "1": 1, UNKNOWN: 2})
+
+    # Past the TTL everyone is probed again, and --dry-run leaves players.json alone
+    PHOTOS.add("1")
+    try:
+        probe_headshots.main(run + ["--ttl-days", "0", "--dry-run"])
+    finally:
+        PHOTOS.discard("1")
+    assert hits == Counter({"201939": 2, "2544": 2, "1": 2, UNKNOWN: 3})
+    assert load_json(cache_file)["1"]["hasPhoto"] is True
+    assert {p["id"]: p.get("hasPhoto") for p in load_players(data)}["no-photo"] is False
@@ -0,0 +1,55 @@
+from refresh_scheduler import DAY, FIELD_GROUPS, RefreshState, plan_refreshes
+
+NOW = 2_000_000_000.0
+ALL_FIELDS = [name for fields in FIELD_GROUPS.values() for name in fields]
+
+
+def candidate(player_id, active, **record):
+    record = {"name": player_id, "teams": ["BOS"], "awards": [], "awards_checked": True, **record}
+    return {"id": player_id, "name": player_id, "active": active, "record": record}
+
+
+def state_refreshed(tmp_path, ages_in_days: dict[str, float]) -> RefreshState:
+    state = RefreshState(tmp_path / "state.json")
+    for player_id, age in ages_in_days.items():
+        state.record(player_id, player_id, ALL_FIELDS, now=NOW - age * DAY)
+    return state
+
+
+def test_stale_active_player_goes_before_never_fetched_retired_player(tmp_path):
+    state = state_refreshed(tmp_path, {"active": 10})
+    plan = plan_refreshes([candidate("retired-1950s", False), candidate("active", True)], state,
+                          budget=2, now=NOW)
+    assert [(r.player_id, r.groups) for r in plan] == [("active", ["career"]), ("retired-1950s", ["career"])]
+
+
+def test_fresh_fields_are_not_scheduled(tmp_path):
+    state = state_refreshed(tmp_path, {"active": 2, "retired": 100})
+    assert plan_refreshes([candidate("active", True), candidate("retired", False)], state,
+                          budget=10, now=NOW) == []
+
+
+def test_budget_counts_one_call_per_field_group(tmp_path):
+    state = RefreshState(tmp_path / "state.json")
+    plan = plan_refreshes([candidate(f"p{i}", i % 2 == 0) for i in range(10)], state, budget=5, now=NOW)
+    assert sum(len(r.groups) for r in plan) == 5
+    assert all(r.player_id in {"p0", "p2", "p4", "p6", "p8"} for r in plan)
+
+
+def test_placeholder_and_trade_raise_priority(tmp_path):
+    state = state_refreshed(tmp_path, {"a": 400, "b": 400, "c": 400})
+    plan = plan_refreshes([candidate("a", False), candidate("b", False, teams=[]), candidate("c", False)], state,
+                          budget=3, traded={"c"}, now=NOW)
+    by_id = {r.player_id: r for r in plan}
+    assert {player_id: r.groups for player_id, r in by_id.items()} == {"c": ["career", "awards"], "b": ["career"]}
+    assert "traded" in by_id["c"].reasons and "placeholder" in by_id["b"].reasons
+
+
+def test_unchanged_compares_every_fetched_response(tmp_path):
+    state = RefreshState(tmp_path / "state.json")
+    assert not state.unchanged("p", {"career": "a"})
+    state.record("p", "p", ["teams"], fingerprints={"career": "a", "awards": "b"}, now=NOW)
+    assert state.unchanged("p", {"career": "a"})
+    assert state.unchanged("p", {"career": "a", "awards": "b"})
+    assert not state.unchanged("p", {"career": "a", "awards": "c"})
+    assert not state.unchanged("p", {})
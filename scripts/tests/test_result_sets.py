@@ -0,0 +1,51 @@
+"""
+Result sets: raw stats.nba.com payloads decode into the tables get_data_frames() would give.
+
+    python -m pytest scripts/tests
+"""
+
+from result_sets import decode
+
+# Trimmed commonplayerinfo response for Jalen Brunson
+COMMON_PLAYER_INFO = {
+    "resource": "commonplayerinfo",
+    "parameters": [{"PlayerID": 1628973}, {"LeagueID": None}],
+    "resultSets": [
+        {"name": "CommonPlayerInfo",
+         "headers": ["PERSON_ID", "DISPLAY_FIRST_LAST", "SCHOOL", "COUNTRY", "POSITION", "TEAM_ABBREVIATION",
+                     "FROM_YEAR", "TO_YEAR", "DRAFT_YEAR", "DRAFT_ROUND", "DRAFT_NUMBER"],
+         "rowSet": [[1628973, "Jalen Brunson", "Villanova", "USA", "Guard", "NYK", 2018, 2025, "2018", "2", "33"]]},
+        {"name": "PlayerHeadlineStats",
+         "headers": ["PLAYER_ID", "PLAYER_NAME", "TimeFrame", "PTS", "AST", "REB", "PIE"],
+         "rowSet": [[1628973, "Jalen Brunson", "2024-25", 26.0, 7.3, 3.0, 0.15]]},
+        {"name": "AvailableSeasons", "headers": ["SEASON_ID"], "rowSet": [["12018"], ["22018"], ["22019"]]},
+    ],
+}
+
+# A few endpoints send one table as "resultSet" instead of a list under "resultSets"
+SINGLE_RESULT_SET = {
+    "resource": "playerawards",
+    "parameters": {"PlayerID": 1628973},
+    "resultSet": {"name": "PlayerAwards",
+                  "headers": ["PERSON_ID", "DESCRIPTION", "SEASON", "TEAM"],
+                  "rowSet": [[1628973, "NBA All-Star", "2023-24", "New York Knicks"],
+                             [1628973, "All-NBA", "2023-24", "New York Knicks"]]},
+}
+
+
+def test_result_sets_decode_in_response_order():
+    info, headline, seasons = decode(COMMON_PLAYER_INFO)
+    assert [info.name, headline.name, seasons.name] == ["CommonPlayerInfo", "PlayerHeadlineStats", "AvailableSeasons"]
+    assert len(info) == 1 and len(seasons) == 3
+    assert info.tuples("DISPLAY_FIRST_LAST", "DRAFT_YEAR", "DRAFT_NUMBER") == [("Jalen Brunson", "2018", "33")]
+    assert seasons.tuples("SEASON_ID") == [("12018",), ("22018",), ("22019",)]
+    assert headline.columns("PTS", "AST") == {"PTS": [26.0], "AST": [7.3]}
+    assert info.tuples()[0][:2] == (1628973, "Jalen Brunson")
+
+
+def test_a_single_result_set_decodes_as_one_table():
+    [awards] = decode(SINGLE_RESULT_SET)
+    assert awards.name == "PlayerAwards" and awards.headers[1] == "DESCRIPTION"
+    assert awards.column("DESCRIPTION") == ["NBA All-Star", "All-NBA"]
+    assert awards.tuples("DESCRIPTION", "SEASON") == [("NBA All-Star", "2023-24"), ("All-NBA", "2023-24")]
+    assert awards.fingerprint() == decode(SINGLE_RESULT_SET)[0].fingerprint() != decode(COMMON_PLAYER_INFO)[0].fingerprint()
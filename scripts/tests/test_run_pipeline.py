@@ -0,0 +1,86 @@
+"""
+Pipeline: stages run after the stages that write their inputs, skip when fresh and stop at a failure.
+
+    python -m pytest scripts/tests
+"""
+
+import pytest
+
+import run_pipeline
+from run_pipeline import Stage, link_stages
+
+# Appends its stage name to ran.txt, then writes its output from its input (or exits with --fail)
+STAGE_SCRIPT = """
+import sys
+from pathlib import Path
+
+name, output, *rest = sys.argv[1:]
+with open("ran.txt", "a") as log:
+    log.write(name + "\\n")
+if "--fail" in rest:
+    sys.exit(3)
+source = Path(rest[0]).read_text() if rest else ""
+Path(output).write_text(source + name)
+"""
+
+
+@pytest.fixture
+def root(tmp_path, monkeypatch):
+    (tmp_path / "scripts").mkdir()
+    (tmp_path / "scripts" / "stage.py").write_text(STAGE_SCRIPT)
+    monkeypatch.setattr(run_pipeline, "ROOT_DIR", tmp_path)
+    monkeypatch.setattr(run_pipeline, "SCRIPTS_DIR", tmp_path / "scripts")
+    monkeypatch.setattr(run_pipeline, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(run_pipeline, "STATE_FILE", tmp_path / "cache" / "state.json")
+    monkeypatch.setattr(run_pipeline, "STAGE_LOGS_DIR", tmp_path / "logs")
+    return tmp_path
+
+
+def stage(name, output, source=None, fail=False):
+    args = (name, output, *([source] if source else []), *(["--fail"] if fail else []))
+    return Stage(name, "stage.py", inputs=(source,) if source else (), outputs=(output,), args=args)
+
+
+def ran(root):
+    path = root / "ran.txt"
+    return path.read_text().split() if path.exists() else []
+
+
+def run(stages, forced=frozenset(), only=None):
+    return run_pipeline.run_pipeline(stages, set(forced), only, workers=4, dry_run=False)
+
+
+def test_stages_run_after_the_writers_of_their_inputs(root):
+    # Declared out of order on purpose: b is declared last but reads a's output
+    stages = link_stages([stage("a", "a.txt"), stage("c", "c.txt", "b.txt"), stage("b", "b.txt", "a.txt")])
+    assert stages["b"].deps == {"a"} and stages["c"].deps == set()  # only earlier writers count
+    stages = link_stages([stage("a", "a.txt"), stage("b", "b.txt", "a.txt"), stage("c", "c.txt", "b.txt")])
+    assert stages["c"].deps == {"b"}
+    assert run(stages)
+    assert ran(root) == ["a", "b", "c"] and (root / "c.txt").read_text() == "abc"
+
+
+def test_up_to_date_stages_are_skipped(root):
+    stages = link_stages([stage("a", "a.txt"), stage("b", "b.txt", "a.txt"), stage("c", "c.txt", "b.txt")])
+    assert run(stages) and run(stages)
+    assert ran(root) == ["a", "b", "c"]
+
+    (root / "c.txt").unlink()  # a missing output reruns only its stage
+    assert run(stages)
+    assert ran(root)[3:] == ["c"]
+
+    assert run(stages, forced=run_pipeline.downstream(stages, {"b"}))  # --from b
+    assert ran(root)[4:] == ["b", "c"]
+
+
+def test_a_failed_stage_stops_its_dependents(root):
+    stages = link_stages([stage("a", "a.txt"), stage("b", "b.txt", "a.txt", fail=True), stage("c", "c.txt", "b.txt")])
+    assert not run(stages)
+    assert ran(root) == ["a", "b"] and not (root / "c.txt").exists()
+    state = run_pipeline.load_state()
+    assert state["failed"] == "b" and set(state["stages"]) == {"a"}
+
+    # --resume: the failed stage and what depends on it, with the fixed script
+    stages = link_stages([stage("a", "a.txt"), stage("b", "b.txt", "a.txt"), stage("c", "c.txt", "b.txt")])
+    assert run(stages, forced={"b"}, only=run_pipeline.downstream(stages, {"b"}))
+    assert ran(root)[2:] == ["b", "c"] and run_pipeline.load_state()["failed"] is None
@@ -0,0 +1,42 @@
+"""
+Guess-game neighbour table: nearest players are the ones that share the most.
+
+    python -m pytest scripts/tests
+"""
+
+from build_similarity_index import build_index, notable_positions, position_slots
+
+
+def player(name, teams, decades, position, ppg, **extra):
+    return {"id": name.lower().replace(" ", "-"), "name": name, "teams": teams, "decades": decades,
+            "position": position, "country": extra.pop("country", "USA"), "ppgCareer": ppg,
+            "rpgCareer": extra.pop("rpg", 4.0), "apgCareer": extra.pop("apg", 3.0), "nbaId": "1", **extra}
+
+
+PLAYERS = [
+    player("Star Guard", ["GSW"], ["2010s", "2020s"], "PG", 24.0, mvp=True, allStar=True, apg=6.5),
+    player("Backup Guard", ["GSW", "SEA"], ["2010s"], "SG", 8.0, apg=3.5),
+    player("Twin Guard", ["GSW"], ["2010s", "2020s"], "PG", 23.0, allStar=True, apg=6.0),
+    player("Old Center", ["BOS"], ["1960s"], "C", 15.0, rpg=14.0, apg=2.0, country="Canada"),
+    player("Big Man", ["NJN", "BOS"], ["2000s"], "C-F", 12.0, rpg=9.0, apg=1.5),
+]
+
+
+def test_position_aliases_cover_the_slots():
+    assert position_slots("F-C") == {"SF", "PF", "C"}
+    assert position_slots("SG-SF") == {"SG", "SF"}
+
+
+def test_notable_pool_falls_back_like_get_random_notable_player():
+    # Fewer than 50 candidates: the All-Star backup pool (> 18 ppg, 2000s or later) is used
+    assert notable_positions(PLAYERS) == [0, 2]
+
+
+def test_neighbours_are_ranked_and_exclude_the_target():
+    index = build_index(PLAYERS, k=3)
+    assert index["count"] == 5 and index["k"] == 3 and index["targets"] == [0, 2]
+    star, twin = index["neighbors"][:3], index["neighbors"][3:]
+    assert star[0] == 2 and twin[0] == 0
+    assert 0 not in star and 2 not in twin
+    assert index["scores"][:3] == sorted(index["scores"][:3], reverse=True)
+    assert all(0 <= score <= 100 for score in index["scores"])
@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+from snapshots import SnapshotStore
+
+
+def player(i, **fields):
+    return {"id": f"p{i}", "name": f"Player {i}", "teams": ["BOS"], "ppgCareer": float(i), **fields}
+
+
+def write(path, players):
+    path.write_text(json.dumps(players, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+
+
+@pytest.fixture
+def versions(tmp_path):
+    """A store holding three snapshots of a 200-record file, plus the raw bytes of each."""
+    store = SnapshotStore(tmp_path / "store")
+    path = tmp_path / "players.json"
+    players = [player(i) for i in range(200)]
+    texts = []
+    for change in range(3):
+        if change == 1:
+            players[5] = {**players[5], "teams": ["BOS", "OKC"]}
+            players.append(player(999, name="Zoë Ñew"))
+        if change == 2:
+            del players[7]
+            players[5] = {"country": "USA", **players[5]}  # new key first: the key order moves
+        write(path, players)
+        texts.append(path.read_bytes())
+        assert store.take(path, f"v{change + 1}")["n"] == change + 1
+    return store, path, texts
+
+
+def test_unchanged_file_is_not_snapshotted(versions):
+    store, path, _ = versions
+    assert store.take(path) is None
+    assert len(store.log) == 3
+
+
+def test_checkout_restores_every_version_byte_for_byte(versions, tmp_path):
+    store, _, texts = versions
+    reopened = SnapshotStore(store.root)
+    for n, text in enumerate(texts, start=1):
+        reopened.checkout(n, tmp_path / "out.json")
+        assert (tmp_path / "out.json").read_bytes() == text
+
+
+def test_lookup_and_history(versions):
+    store, _, _ = versions
+    assert store.lookup("p5", 1)["teams"] == ["BOS"]
+    assert store.lookup("p5", 2)["teams"] == ["BOS", "OKC"]
+    assert store.lookup("p7", 3) is None
+    assert [n for n, _ in store.history("p5")] == [1, 2, 3]
+    assert [(n, key is None) for n, key in store.history("p7")] == [(1, False), (3, True)]
+    assert store.log[1]["changed"] == 1 and store.log[1]["added"] == 1 and store.log[2]["removed"] == 1
+
+
+def test_store_grows_with_changes_not_snapshots(versions):
+    store, path, _ = versions
+    players = json.loads(path.read_text(encoding="utf-8"))
+    before = store.size()
+    for ppg in range(10):
+        players[0]["ppgCareer"] = ppg + 0.5
+        write(path, players)
+        store.take(path)
+    # Ten one-field changes cost far less than one more copy of the file
+    assert store.size() - before < len(path.read_bytes()) / 2
+
+
+def test_indented_file_is_checked_out_in_its_own_layout(tmp_path):
+    store = SnapshotStore(tmp_path / "store")
+    path = tmp_path / "players.json"
+    players = [player(i, name="Zoë" if i == 1 else f"Player {i}", awards=[]) for i in range(3)]
+    path.write_text(json.dumps(players, indent=2, ensure_ascii=False), encoding="utf-8")  # JSON.stringify(p, null, 2)
+    text = path.read_bytes()
+    assert store.take(path)["layout"] == "indent2"
+
+    write(path, players)
+    assert store.take(path)["layout"] == "line"
+    SnapshotStore(store.root).checkout(1, tmp_path / "out.json")
+    assert (tmp_path / "out.json").read_bytes() == text
+
+
+def test_layout_checkout_cannot_rebuild_is_refused(tmp_path):
+    store = SnapshotStore(tmp_path / "store")
+    path = tmp_path / "players.json"
+    path.write_text(json.dumps([player(1)], indent=4), encoding="utf-8")
+    with pytest.raises(ValueError, match="not snapshotted"):
+        store.take(path)
+    assert store.log == [] and not (tmp_path / "store" / "objects.pack").exists()
@@ -0,0 +1,69 @@
+"""
+Startup budget for the swish-data CLI.
+
+    python -m pytest scripts/tests
+
+The budgets are wall-clock for a fresh interpreter: about 150ms for --help and
+250ms for an audit on a slow CI core, with 2.5x headroom for noisy machines.
+A top-level import of nba_api, pandas or bs4 in the wrong module blows them.
+"""
+
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+CLI = Path(__file__).resolve().parents[1] / "swish_data.py"
+HEAVY_MODULES = ("nba_api", "pandas", "numpy", "requests", "bs4")
+
+HELP_BUDGET_MS = 375
+AUDIT_BUDGET_MS = 625
+
+
+def run_cli(*args, cwd=None) -> tuple[subprocess.CompletedProcess, float]:
+    started = time.perf_counter()
+    result = subprocess.run([sys.executable, str(CLI), *args], capture_output=True, text=True, cwd=cwd)
+    return result, (time.perf_counter() - started) * 1000
+
+
+def best_of(runs: int, *args, cwd=None) -> float:
+    timings = []
+    for _ in range(runs):
+        result, elapsed = run_cli(*args, cwd=cwd)
+        assert result.returncode == 0, result.stderr
+        timings.append(elapsed)
+    return min(timings)
+
+
+def test_help_is_within_budget():
+    assert best_of(3, "--help") < HELP_BUDGET_MS
+
+
+@pytest.mark.parametrize("target", ["consistency", "schema"])
+def test_audit_is_within_budget_from_any_directory(tmp_path, target):
+    assert best_of(3, "audit", target, cwd=tmp_path) < AUDIT_BUDGET_MS
+
+
+@pytest.mark.parametrize("args", [["--help"], ["dedup", "--help"], ["ingest", "api", "--help"]])
+def test_help_does_not_import_heavy_dependencies(args):
+    probe = (
+        "import json, runpy, sys\n"
+        f"sys.argv = [{str(CLI)!r}, *{args!r}]\n"
+        "try:\n"
+        f"    runpy.run_path({str(CLI)!r}, run_name='__main__')\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"print(json.dumps(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules)))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert json.loads(result.stdout.splitlines()[-1]) == []
+
+
+def test_script_without_options_rejects_unknown_arguments():
+    result, _ = run_cli("dedup", "--force")
+    assert result.returncode != 0
+    assert "does not take --force" in result.stderr
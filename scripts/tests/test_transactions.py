@@ -0,0 +1,83 @@
+"""
+Transaction graph: trade tables become dated moves, queried by player, team pair and date.
+
+    python -m pytest scripts/tests
+"""
+
+from bs4 import BeautifulSoup
+
+from clean_wikipedia_data import extract_moves_from_trades
+from scrape_wikipedia_transfers import extract_trades_from_page
+from transactions import Move, TransactionGraph
+from update_teams_from_wikipedia import teams_from_moves
+
+PAGE = """
+<table class="wikitable">
+  <tr><th>Date</th><th colspan="2">Trade</th></tr>
+  <tr><td>July 6, 2019</td>
+      <td>To <a>Los Angeles Lakers</a>:<br><a>Anthony Davis</a></td>
+      <td>To <a>New Orleans Pelicans</a>:<br><a>Lonzo Ball</a><br><a>Brandon Ingram</a><br>
+          <a>2020 first-round pick</a></td></tr>
+  <tr><td>February 6</td>
+      <td>To <a>Houston Rockets</a>:</td><td>To <a>Atlanta Hawks</a>:</td><td>To <a>Minnesota Timberwolves</a>:</td></tr>
+  <tr><td><a>Robert Covington</a> (from Minnesota Timberwolves)</td>
+      <td><a>Clint Capela</a> (from Houston Rockets)</td>
+      <td>Draft rights to <a>Jarred Vanderbilt</a></td></tr>
+  <tr><td>Atlantic</td><td>52</td><td>30</td></tr>
+</table>
+"""
+
+MOVES = [
+    Move("2016-07-04", "Kevin Durant", "OKC", "GSW", "trade"),
+    Move("2019-07-07", "Kevin Durant", "GSW", "BKN", "trade"),
+    Move("2023-02-09", "Kevin Durant", "BKN", "PHX", "trade"),
+    Move("2010-07-09", "LeBron James", "CLE", "MIA", "trade"),
+    Move("2012-07-11", "Ray Allen", "BOS", "MIA", "trade"),
+    Move("2017-08-22", "Kyrie Irving", "CLE", "BOS", "trade"),
+]
+
+
+def test_trade_tables_become_dated_moves():
+    trades = extract_trades_from_page(BeautifulSoup(PAGE, "html.parser"), 2019)
+    assert [trade["date"] for trade in trades] == ["2019-07-06", "2020-02-06"]
+
+    moves = extract_moves_from_trades(trades, set())
+    assert moves[:3] == [
+        Move("2019-07-06", "Anthony Davis", "NOP", "LAL", "trade"),
+        Move("2019-07-06", "Lonzo Ball", "LAL", "NOP", "trade"),
+        Move("2019-07-06", "Brandon Ingram", "LAL", "NOP", "trade"),
+    ]
+    # Three teams: the from-team is only known where the table says so
+    assert moves[3:] == [
+        Move("2020-02-06", "Robert Covington", "MIN", "HOU", "trade"),
+        Move("2020-02-06", "Clint Capela", "HOU", "ATL", "trade"),
+        Move("2020-02-06", "Jarred Vanderbilt", "", "MIN", "draft-rights"),
+    ]
+
+
+def test_queries_by_player_pair_and_date():
+    graph = TransactionGraph(MOVES + MOVES[:1])
+    assert len(graph) == len(MOVES)
+    assert graph.teams("kevin durant", 2017, 2019) == ["GSW", "BKN"]
+    assert graph.teams("Kevin Durant", 2015, 2016) == ["OKC", "GSW"]
+    assert graph.teams("Kevin Durant") == ["OKC", "GSW", "BKN", "PHX"]
+    assert [m.player for m in graph.moves(from_team="BOS", to_team="MIA")] == ["Ray Allen"]
+    assert [m.player for m in graph.moves(to_team="MIA", until=2011)] == ["LeBron James"]
+    assert [m.player for m in graph.moves(from_team="CLE", since="2011-01-01")] == ["Kyrie Irving"]
+    assert [m.to_team for m in graph.moves("Kevin Durant", from_team="GSW")] == ["BKN"]
+    assert len(graph.moves(since=2016, until=2019)) == 3
+    assert TransactionGraph.from_rows(graph.to_rows()).to_rows() == graph.to_rows()
+
+
+def test_team_updates_come_from_moves_of_uniquely_named_players():
+    players = [
+        {"id": "kevin-durant", "name": "Kevin Durant", "teams": ["OKC", "GSW"]},
+        {"id": "ray-allen", "name": "Ray Allen", "teams": ["MIL", "SEA", "BOS", "MIA"]},
+        {"id": "jarred-vanderbilt", "name": "Jarred Vanderbilt", "teams": ["DEN"]},
+        {"id": "kyrie-irving-1", "name": "Kyrie Irving"},
+        {"id": "kyrie-irving-2", "name": "Kyrie Irving"},
+    ]
+    graph = TransactionGraph(MOVES + [Move("2020-02-06", "Jarred Vanderbilt", "DEN", "MIN", "draft-rights")])
+    additions, skipped = teams_from_moves(players, graph)
+    assert additions == {"kevin-durant": ["BKN", "PHX"]}
+    assert skipped == 2  # LeBron James is unknown, Kyrie Irving has a namesake
@@ -0,0 +1,110 @@
+"""
+TS literals: player arrays in lib/*.ts are parsed, edited in place and synced with players.json and the store.
+
+    python -m pytest scripts/tests
+"""
+
+import pytest
+
+from players_store import PlayersStore
+from ts_literals import TsLiteral, TsSyntaxError, parse_value
+from ts_sync import compare, apply_sync
+
+SOURCE = """import type { NBAPlayer } from './types'
+
+// Players the API misses; keep in step with players.json
+const MANUAL_PLAYERS: NBAPlayer[] = [
+  {
+    id: "nikola-jokic",
+    name: "Nikola Jokić",
+    teams: ["DEN"], // [not, a, team]
+    awards: ["MVP", "All-Star"],
+    ppgCareer: 21.0,
+    nbaId: "203999",
+  },
+  { id: 'nene', name: "Nene \\"Hilário\\" [sic] {x}", teams: ["DEN", "HOU"], ppgCareer: 11.2 },
+  /* retired */
+  {
+    id: "alaa-abdelnaby",
+    name: "Alaa Abdelnaby",
+    teams: ["POR", "MIL"],
+    active: false
+  },
+]
+
+export const OTHER = [1, 2, 3]
+"""
+
+
+def player(slug, name, teams, **fields):
+    record = {"id": slug, "name": name, "teams": teams, "awards": [], "allStar": False, "champion": False,
+              "championYears": [], "mvp": False, "dpoy": False, "roy": False, "allNBA": False,
+              "allDefensive": False, "college": "", "country": "USA", "decades": ["2010s"], "ppgCareer": 10.0,
+              "rpgCareer": 4.0, "apgCareer": 2.0, "position": "G", "active": False}
+    record.update(fields)
+    return record
+
+
+def test_parser_reads_what_the_regexes_could_not():
+    literal = TsLiteral(SOURCE, "MANUAL_PLAYERS")
+    assert list(literal.index) == ["nikola-jokic", "nene", "alaa-abdelnaby"]
+    assert literal.index["nene"].value["name"] == 'Nene "Hilário" [sic] {x}'
+    assert literal.index["nikola-jokic"].value["teams"] == ["DEN"]
+    assert literal.index["alaa-abdelnaby"].value["active"] is False
+    assert TsLiteral(SOURCE, "OTHER").values == [1, 2, 3]
+
+    assert parse_value("{ a: [0x1F, -1_000, .5, 1e3], 'b': `t`, c: null, d: undefined, }") == \
+        {"a": [31, -1000, 0.5, 1000.0], "b": "t", "c": None, "d": None}
+    with pytest.raises(TsSyntaxError, match="line 1:7"):
+        parse_value("[1, 2 3]")
+    with pytest.raises(LookupError):
+        TsLiteral(SOURCE, "ADDITIONAL_NBA_PLAYERS")
+
+
+def test_edits_rewrite_only_the_values_they_change():
+    literal = TsLiteral(SOURCE, "MANUAL_PLAYERS")
+    jokic, nene, alaa = (literal.index[i] for i in ("nikola-jokic", "nene", "alaa-abdelnaby"))
+    assert literal.set_field(jokic, "ppgCareer", 21) is False  # 21.0 == 21
+    assert literal.set_field(jokic, "teams", ["DEN", "SRB"])
+    assert literal.set_field(jokic, "active", True)
+    assert literal.set_field(alaa, "college", "Duke")
+    assert literal.remove_field(nene, "ppgCareer")
+    literal.append_record('{ id: "new-player", name: "New Player", teams: [] }')
+    text = literal.render()
+
+    assert '    teams: ["DEN","SRB"], // [not, a, team]\n' in text
+    assert '    nbaId: "203999",\n    active: true,\n  },' in text
+    assert '    active: false,\n    college: "Duke"\n  },' in text
+    assert "teams: [\"DEN\", \"HOU\"] }," in text
+    assert text.endswith('  },\n  { id: "new-player", name: "New Player", teams: [] },\n]\n\nexport const OTHER = [1, 2, 3]\n')
+    edited = TsLiteral(text, "MANUAL_PLAYERS")
+    assert list(edited.index) == ["nikola-jokic", "nene", "alaa-abdelnaby", "new-player"]
+    assert "ppgCareer" not in edited.index["nene"].value
+    assert edited.index["nikola-jokic"].value["active"] is True
+
+
+def test_three_way_sync(tmp_path):
+    literal = TsLiteral(SOURCE, "MANUAL_PLAYERS", tmp_path / "nba-data.ts")
+    json_players = [player("nikola-jokic", "Nikola Jokić", ["DEN"], awards=["MVP", "All-Star"], ppgCareer=21.0,
+                           nbaId="203999", active=True),
+                    player("nene", "Nene \"Hilário\" [sic] {x}", ["DEN", "HOU", "WAS"], ppgCareer=11.2)]
+    store = PlayersStore(tmp_path / "players.sqlite")
+    store.replace_all([dict(json_players[0], teams=["DEN", "SRB"]), dict(json_players[1])])
+
+    differences = compare([literal], json_players, store.export())
+    by_field = {(d.id, d.field): d for d in differences}
+    assert by_field[("nikola-jokic", "college")].odd_one_out == "ts"  # only the literal lacks it
+    assert ("nikola-jokic", "active") not in by_field                  # not a field the literals carry
+    assert by_field[("nikola-jokic", "teams")].odd_one_out == "store"
+    assert by_field[("nene", "teams")].odd_one_out == "ts"
+    assert by_field[("alaa-abdelnaby", "")].json is not None           # not in players.json: reported only
+    assert ("nikola-jokic", "ppgCareer") not in by_field
+
+    counts = apply_sync(differences, [literal], json_players, store, "json")
+    assert counts["ts"] == len(differences) - 2 and counts["store"] == 1 and counts["json"] == 0
+    assert literal.save()
+    synced = TsLiteral.load(tmp_path / "nba-data.ts", "MANUAL_PLAYERS")
+    assert synced.index["nene"].value["teams"] == ["DEN", "HOU", "WAS"]
+    assert synced.index["nikola-jokic"].value["college"] == ""
+    assert compare([synced], json_players, store.export()) == [by_field[("alaa-abdelnaby", "")]]
+    store.close()
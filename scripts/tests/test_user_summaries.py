@@ -0,0 +1,135 @@
+"""
+XP / rank summaries: an incremental fold equals a full rebuild and matches ranking.ts.
+
+    python -m pytest scripts/tests
+"""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from user_summaries import connect, get_rank, load_rules, load_summaries, pull, push, refresh
+
+NOW = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def db(tmp_path):
+    return connect(tmp_path / "supabase.sqlite")
+
+
+def add_match(db, match_id, minute, mode, data, *participants):
+    created = datetime(2026, 3, 1, 10, minute, tzinfo=timezone.utc).isoformat()
+    db.execute("INSERT INTO matches VALUES (?, ?, ?, ?)", (match_id, mode, created, json.dumps(data)))
+    for user_id, result, score in participants:
+        db.execute("INSERT INTO match_participants VALUES (?, ?, ?, ?)", (match_id, user_id, result, score))
+
+
+def summary(db, user_id):
+    return load_summaries(db, [user_id])[user_id]
+
+
+def test_rank_thresholds_come_from_ranking_ts():
+    rules = load_rules()
+    assert rules["ranks"][0] == ("ROOKIE", 0) and rules["ranks"][-1] == ("HOF", 85000)
+    assert rules["modes"] == {"SWISH": 1, "BATTLE": 2.5, "GUESS": 0}
+    assert get_rank(3750, rules["ranks"]) == ("SEMI_PRO", "PRO", 50.0)
+    assert get_rank(90000, rules["ranks"]) == ("HOF", "HOF", 100.0)
+
+
+def test_xp_and_stats_follow_use_user_stats(db):
+    rules = load_rules()
+    add_match(db, "m1", 0, "SWISH", {"difficulty": "hard", "correct": 9, "total": 9}, ("ana", None, 900))
+    add_match(db, "m2", 1, "BATTLE", {"difficulty": "easy", "total_rounds": 5}, ("ana", "DRAW", 0), ("bo", "DRAW", 0))
+    add_match(db, "m3", 2, "GUESS", {"correct": 0, "total": 1}, ("ana", "LOSS", 0))
+    refresh(db, rules, now=NOW)
+
+    ana = summary(db, "ana")
+    # (100 + 5) x 2 x 1  +  (25 + 5) x 0.5 x 2.5  +  0
+    assert ana["xp_raw"] == 247.5 and ana["xp"] == 248 and ana["rank"] == "ROOKIE"
+    assert ana["games"] == 3 and ana["rated_games"] == 2 and ana["rated_wins"] == 1
+    assert ana["current_streak"] == 0 and ana["max_streak"] == 1
+    assert ana["modes"]["BATTLE"] == {"games": 1, "wins": 0, "draws": 1, "losses": 0, "xp": 37.5}
+    assert ana["accuracy"] == 60 and ana["win_rate"] == 50
+    assert summary(db, "bo")["xp"] == 38
+
+
+def test_incremental_runs_match_a_full_rebuild(db):
+    rules = load_rules()
+    add_match(db, "m1", 0, "SWISH", {"difficulty": "medium", "correct": 9, "total": 9}, ("ana", "WIN", 500))
+    assert refresh(db, rules, now=NOW)["matches"] == 1
+    add_match(db, "m2", 5, "SWISH", {"difficulty": "medium", "correct": 9, "total": 9}, ("ana", "WIN", 700))
+    # Too recent: /api/match/record may not have inserted every participant yet
+    assert refresh(db, rules, now=datetime(2026, 3, 1, 10, 5, 30, tzinfo=timezone.utc))["matches"] == 0
+    assert refresh(db, rules, now=NOW)["matches"] == 1
+    assert refresh(db, rules, now=NOW)["matches"] == 0
+
+    incremental = {k: v for k, v in summary(db, "ana").items() if k != "updated_at"}
+    refresh(db, rules, full=True, now=NOW)
+    assert {k: v for k, v in summary(db, "ana").items() if k != "updated_at"} == incremental
+    assert incremental["xp"] == 210 and incremental["current_streak"] == 2 and incremental["best_score"] == 700
+
+
+class FakeResponse:
+    def __init__(self, body=None, status=200):
+        self.body, self.status = body, status
+
+    def json(self):
+        return self.body
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise RuntimeError(f"HTTP {self.status}")
+
+
+class FakeSupabase:
+    """PostgREST stand-in: pages of matches for GET, upsert bodies recorded for POST."""
+
+    def __init__(self, matches, fail_posts=0):
+        self.matches, self.fail_posts, self.gets, self.posts = matches, fail_posts, [], []
+
+    def get(self, url, params, timeout):
+        self.gets.append(params)
+        since = params.get("created_at", "gte.")[4:]
+        rows = [m for m in self.matches if m["created_at"] >= since]
+        return FakeResponse(rows[params["offset"]:params["offset"] + params["limit"]])
+
+    def post(self, url, params, json, headers, timeout):
+        self.posts.append(json)
+        if self.fail_posts:
+            self.fail_posts -= 1
+            return FakeResponse(status=503)
+        return FakeResponse()
+
+
+def remote_match(match_id, minute, *participants):
+    created = datetime(2026, 3, 1, 10, minute, tzinfo=timezone.utc).isoformat()
+    return {"id": match_id, "mode": "SWISH", "created_at": created,
+            "data": {"difficulty": "medium", "correct": 9, "total": 9},
+            "match_participants": [{"user_id": u, "result": "WIN", "score": 500} for u in participants]}
+
+
+def test_pull_fold_and_push_round_trip(db):
+    rules = load_rules()
+    remote = FakeSupabase([remote_match("m1", 0, "ana"), remote_match("m2", 1, "bo"), remote_match("m3", 2, "ana")])
+    assert pull(db, "https://x/rest/v1", remote, page=2) == 3
+    assert [g["offset"] for g in remote.gets] == [0, 2] and "created_at" not in remote.gets[0]
+    refresh(db, rules, now=NOW)
+
+    # The first upload fails: nothing is marked as sent, so the retry sends everyone again
+    remote.fail_posts = 1
+    with pytest.raises(RuntimeError):
+        push(db, "https://x/rest/v1", remote)
+    assert push(db, "https://x/rest/v1", remote) == 2
+    sent = {row["user_id"]: row for row in remote.posts[-1]}
+    assert sent["ana"]["games"] == 2 and sent["ana"]["modes"]["SWISH"]["wins"] == 2
+    assert push(db, "https://x/rest/v1", remote) == 0
+
+    # The next pull starts PULL_OVERLAP before the newest local match, and only bo is re-sent
+    remote.matches.append(remote_match("m4", 20, "bo"))
+    assert pull(db, "https://x/rest/v1", remote) == 4
+    assert remote.gets[-1]["created_at"] == "gte.2026-03-01T09:52:00+00:00"
+    refresh(db, rules, now=datetime(2026, 3, 1, 12, 30, tzinfo=timezone.utc))
+    assert push(db, "https://x/rest/v1", remote) == 1
+    assert remote.posts[-1][0]["user_id"] == "bo" and remote.posts[-1][0]["games"] == 2
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Player moves from the Wikipedia trade tables, as a time-indexed graph.
+
+Every move is an edge (date, player, from-team, to-team, type) between two
+teams. clean_wikipedia_data.py writes them to lib/wikipedia_nba_clean.json
+under "transactions"; TransactionGraph indexes them by player, by team and by
+(from, to) pair, each index kept sorted by date, so a query is a bisection
+into one index and a slice of the matching moves:
+
+    python scripts/transactions.py --player "Kevin Durant" --since 2015 --until 2019
+    python scripts/transactions.py --from-team BOS --to-team MIA
+
+Types: "trade", and "draft-rights" for the rights to a pick who never played
+for the team that sent them. from-team is empty when a trade of three or more
+teams does not say where a player came from.
+"""
+
+import argparse
+from bisect import bisect_left, bisect_right
+from typing import NamedTuple
+
+from players_db import LIB_DIR, fold_name, load_json
+
+CLEAN_FILE = LIB_DIR / "wikipedia_nba_clean.json"
+
+# Full team names on Wikipedia -> the codes used in players.json (historical
+# names keep their historical code, as the NBA API reports them)
+TEAM_CODES = {
+    "Atlanta Hawks": "ATL", "Boston Celtics": "BOS", "Brooklyn Nets": "BKN",
+    "Charlotte Hornets": "CHA", "Chicago Bulls": "CHI", "Cleveland Cavaliers": "CLE",
+    "Dallas Mavericks": "DAL", "Denver Nuggets": "DEN", "Detroit Pistons": "DET",
+    "Golden State Warriors": "GSW", "Houston Rockets": "HOU", "Indiana Pacers": "IND",
+    "Los Angeles Clippers": "LAC", "Los Angeles Lakers": "LAL", "Memphis Grizzlies": "MEM",
+    "Miami Heat": "MIA", "Milwaukee Bucks": "MIL", "Minnesota Timberwolves": "MIN",
+    "New Orleans Pelicans": "NOP", "New York Knicks": "NYK", "Oklahoma City Thunder": "OKC",
+    "Orlando Magic": "ORL", "Philadelphia 76ers": "PHI", "Phoenix Suns": "PHX",
+    "Portland Trail Blazers": "POR", "Sacramento Kings": "SAC", "San Antonio Spurs": "SAS",
+    "Toronto Raptors": "TOR", "Utah Jazz": "UTA", "Washington Wizards": "WAS",
+    "New Jersey Nets": "NJN", "Charlotte Bobcats": "CHA", "New Orleans Hornets": "NOH",
+    "Seattle SuperSonics": "SEA", "Vancouver Grizzlies": "VAN",
+}
+# Longest first, so a name never loses to a shorter one it starts with
+TEAM_NAMES = sorted(TEAM_CODES, key=len, reverse=True)
+
+
+def team_code(text: str) -> str | None:
+    """Code of the team name `text` starts with ("Miami Heat:" -> "MIA")."""
+    text = text.strip()
+    for name in TEAM_NAMES:
+        if text.startswith(name):
+            return TEAM_CODES[name]
+    return None
+
+
+class Move(NamedTuple):
+    date: str  # ISO date, so dates compare as strings
+    player: str
+    from_team: str  # "" when unknown
+    to_team: str
+    type: str
+
+
+def date_bound(value, end: bool = False) -> str | None:
+    """A year or an ISO date as an inclusive bound on ISO dates (2019 -> "2019-12-31" as an end)."""
+    if value is None:
+        return None
+    value = str(value)
+    if len(value) == 4:
+        return f"{value}-12-31" if end else f"{value}-01-01"
+    return value
+
+
+class _Index:
+    """key -> moves in date order, next to their dates for bisection."""
+
+    def __init__(self):
+        self.dates: dict[object, list[str]] = {}
+        self.moves: dict[object, list[Move]] = {}
+
+    def add(self, key, move: Move):
+        self.dates.setdefault(key, []).append(move.date)
+        self.moves.setdefault(key, []).append(move)
+
+    def window(self, key, start: str | None, end: str | None) -> list[Move]:
+        dates = self.dates.get(key)
+        if not dates:
+            return []
+        lo = bisect_left(dates, start) if start else 0
+        hi = bisect_right(dates, end) if end else len(dates)
+        return self.moves[key][lo:hi]
+
+    def last_before(self, key, start: str) -> Move | None:
+        dates = self.dates.get(key)
+        if not dates:
+            return None
+        i = bisect_left(dates, start)
+        return self.moves[key][i - 1] if i else None
+
+
+class TransactionGraph:
+    """Moves between teams, indexed by player, by team and by (from, to) pair."""
+
+    def __init__(self, moves=()):
+        self._all = _Index()
+        self._player = _Index()
+        self._to = _Index()
+        self._from = _Index()
+        self._pair = _Index()
+        # Sorted once, so every index is built in date order
+        for move in sorted(set(moves)):
+            self._all.add(None, move)
+            self._player.add(fold_name(move.player), move)
+            self._to.add(move.to_team, move)
+            if move.from_team:
+                self._from.add(move.from_team, move)
+                self._pair.add((move.from_team, move.to_team), move)
+
+    def __len__(self) -> int:
+        return len(self._all.dates.get(None, []))
+
+    def players(self) -> list[str]:
+        """Every player with a move, as first named."""
+        return [moves[0].player for moves in self._player.moves.values()]
+
+    def moves(self, player: str | None = None, from_team: str | None = None, to_team: str | None = None,
+              since=None, until=None) -> list[Move]:
+        """Moves matching every given filter, in date order; since/until are years or ISO dates."""
+        start, end = date_bound(since), date_bound(until, end=True)
+        # The most selective index answers, the other filters check its few hits
+        if player is not None:
+            found = self._player.window(fold_name(player), start, end)
+        elif from_team and to_team:
+            return self._pair.window((from_team, to_team), start, end)
+        elif to_team:
+            found = self._to.window(to_team, start, end)
+        elif from_team:
+            found = self._from.window(from_team, start, end)
+        else:
+            return self._all.window(None, start, end)
+        return [move for move in found
+                if (from_team is None or move.from_team == from_team) and (to_team is None or move.to_team == to_team)]
+
+    def teams(self, player: str, since=None, until=None) -> list[str]:
+        """Teams the player was on at some point in the window, in order.
+
+        That is the team they were on when it opened (where their last earlier
+        move took them, or where their first move in it came from) and every
+        team they moved to within it.
+        """
+        key, start, end = fold_name(player), date_bound(since), date_bound(until, end=True)
+        window = self._player.window(key, start, end)
+        before = self._player.last_before(key, start) if start else None
+        teams = []
+        if before is not None:
+            teams.append(before.to_team)
+        elif window and window[0].from_team:
+            teams.append(window[0].from_team)
+        for move in window:
+            if move.to_team not in teams:
+                teams.append(move.to_team)
+        return teams
+
+    def to_rows(self) -> list[list[str]]:
+        return [list(move) for move in self._all.moves.get(None, [])]
+
+    @classmethod
+    def from_rows(cls, rows) -> "TransactionGraph":
+        return cls(Move(*row) for row in rows)
+
+
+def load_graph(path=CLEAN_FILE) -> TransactionGraph:
+    """The graph saved by clean_wikipedia_data.py (empty before the first run)."""
+    if not path.exists():
+        return TransactionGraph()
+    return TransactionGraph.from_rows(load_json(path).get("transactions", []))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--player", help="moves (and teams) of one player")
+    parser.add_argument("--from-team", help="team code the player left, e.g. BOS")
+    parser.add_argument("--to-team", help="team code the player joined, e.g. MIA")
+    parser.add_argument("--since", help="first year or ISO date, inclusive")
+    parser.add_argument("--until", help="last year or ISO date, inclusive")
+    args = parser.parse_args(argv)
+
+    graph = load_graph()
+    if not len(graph):
+        print(f"❌ No transactions in {CLEAN_FILE.name}. Run clean_wikipedia_data.py first.")
+        return
+    moves = graph.moves(args.player, args.from_team, args.to_team, args.since, args.until)
+    for move in moves:
+        print(f"   {move.date}  {move.player:<28} {move.from_team or '?':>3} -> {move.to_team}  ({move.type})")
+    print(f"\n🔄 {len(moves)} of {len(graph)} moves")
+    if args.player:
+        print(f"🏀 Teams: {', '.join(graph.teams(args.player, args.since, args.until)) or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Read and edit data literals in TypeScript source, such as
+
+    export const ADDITIONAL_NBA_PLAYERS: NBAPlayer[] = [ { id: "...", ... }, ... ]
+
+A tokenizer and a recursive-descent parser read the literal in one pass:
+strings in either quote (and templates without ${}), numbers, true, false,
+null, undefined, nested arrays and objects, comments and trailing commas.
+Every object keeps the source span of each property, so an edit replaces only
+the bytes of the values it changes; comments, spacing and the order of
+everything else stay as they were.
+
+    literal = TsLiteral.load(LIB_DIR / "additional-nba-data.ts", "ADDITIONAL_NBA_PLAYERS")
+    record = literal.index["jalen-brunson"]
+    record.value["teams"]                          # ["NYK"]
+    literal.set_field(record, "teams", ["DAL", "NYK"])
+    literal.save()                                 # rewrites only that value
+"""
+
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import canonical_json
+
+TOKEN_RE = re.compile(r"""
+    (?P<space>\s+)
+  | (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<string>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*'|`(?:[^`\\$]|\\.|\$(?!\{))*`)
+  | (?P<number>(?:0[xX][0-9a-fA-F_]+|(?:\d[\d_]*(?:\.[\d_]*)?|\.\d[\d_]*)(?:[eE][+-]?\d+)?))
+  | (?P<name>[A-Za-z_$][\w$]*)
+  | (?P<punct>\.\.\.|[\[\]{}(),:;=<>?|&.+\-*/!])
+""", re.VERBOSE | re.DOTALL)
+ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "v": "\v", "0": "\0", "\n": ""}
+ESCAPE_RE = re.compile(r"\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|.)", re.DOTALL)
+IDENTIFIER_RE = re.compile(r"[A-Za-z_$][\w$]*")
+KEYWORDS = {"true": True, "false": False, "null": None, "undefined": None}
+
+
+class TsSyntaxError(ValueError):
+    def __init__(self, message: str, source: str, pos: int, path=None):
+        line = source.count("\n", 0, pos) + 1
+        column = pos - source.rfind("\n", 0, pos)
+        where = f"{Path(path).name}:" if path else "line "
+        super().__init__(f"{where}{line}:{column}: {message}")
+
+
+def _unescape(match: re.Match) -> str:
+    escape = match[1]
+    if escape[0] == "u":
+        return chr(int(escape[1:].strip("{}"), 16))
+    if escape[0] == "x":
+        return chr(int(escape[1:], 16))
+    return ESCAPES.get(escape, escape)
+
+
+def decode_string(token: str) -> str:
+    body = token[1:-1]
+    return ESCAPE_RE.sub(_unescape, body) if "\\" in body else body
+
+
+def decode_number(token: str) -> int | float:
+    token = token.replace("_", "")
+    if token[:2] in ("0x", "0X"):
+        return int(token, 16)
+    if any(c in token for c in ".eE"):
+        return float(token)
+    return int(token)
+
+
+def render_value(value) -> str:
+    """TS source for a value (JSON is valid TS; same encoding as export_artifacts.render_ts)."""
+    return canonical_json.dumps(value, indent=False)
+
+
+@dataclass
+class Property:
+    key: str
+    key_start: int
+    value_start: int
+    value_end: int
+
+
+@dataclass
+class ObjectLiteral:
+    start: int  # at "{"
+    end: int    # after "}"
+    value: dict
+    properties: dict[str, Property] = field(default_factory=dict)
+
+
+class _Parser:
+    def __init__(self, source: str, pos: int, path=None):
+        self.source = source
+        self.path = path
+        self.kind, self.text, self.pos, self.end = "", "", pos, pos
+        self.prev_end = pos
+        self.advance()
+
+    def error(self, message: str, pos: int | None = None):
+        raise TsSyntaxError(message, self.source, self.pos if pos is None else pos, self.path)
+
+    def advance(self):
+        """Move to the next token that is not whitespace or a comment."""
+        source, pos = self.source, self.end
+        self.prev_end = pos
+        while True:
+            match = TOKEN_RE.match(source, pos)
+            if match is None:
+                self.pos = pos
+                if pos >= len(source):
+                    self.kind, self.text, self.end = "eof", "", pos
+                    return
+                self.error(f"unexpected character {source[pos]!r}")
+            kind = match.lastgroup
+            if kind != "space" and kind != "comment":
+                self.kind, self.text, self.pos, self.end = kind, match[0], pos, match.end()
+                return
+            pos = match.end()
+
+    def punct(self, text: str) -> bool:
+        return self.kind == "punct" and self.text == text
+
+    def expect(self, text: str):
+        if not self.punct(text):
+            self.error(f"expected {text!r}, got {self.text or 'end of file'!r}")
+        self.advance()
+
+    def value(self):
+        kind, text = self.kind, self.text
+        if kind == "string":
+            self.advance()
+            return decode_string(text)
+        if kind == "punct":
+            if text == "{":
+                return self.object().value
+            if text == "[":
+                return self.array()[0]
+            if text == "-":
+                self.advance()
+                if self.kind != "number":
+                    self.error("expected a number after '-'")
+                number = decode_number(self.text)
+                self.advance()
+                return -number
+        if kind == "number":
+            self.advance()
+            return decode_number(text)
+        if kind == "name" and text in KEYWORDS:
+            self.advance()
+            return KEYWORDS[text]
+        self.error(f"{text or 'end of file'!r} is not a literal value")
+
+    def array(self) -> tuple[list, list[ObjectLiteral | None]]:
+        """The array's values, and for each element its ObjectLiteral (None when it is not an object)."""
+        self.expect("[")
+        items, nodes = [], []
+        while not self.punct("]"):
+            if self.kind == "eof":
+                self.error("unterminated array")
+            if self.punct("{"):
+                node = self.object()
+                items.append(node.value)
+                nodes.append(node)
+            else:
+                items.append(self.value())
+                nodes.append(None)
+            if self.punct(","):
+                self.advance()
+            elif not self.punct("]"):
+                self.error(f"expected ',' or ']', got {self.text or 'end of file'!r}")
+        self.advance()
+        return items, nodes
+
+    def object(self) -> ObjectLiteral:
+        node = ObjectLiteral(self.pos, self.pos, {})
+        self.expect("{")
+        while not self.punct("}"):
+            key_start = self.pos
+            if self.kind == "name" or self.kind == "number":
+                key = self.text if self.kind == "name" else str(decode_number(self.text))
+            elif self.kind == "string":
+                key = decode_string(self.text)
+            else:
+                self.error(f"expected a property name, got {self.text or 'end of file'!r}")
+            self.advance()
+            self.expect(":")
+            value_start = self.pos
+            node.value[key] = self.value()
+            node.properties[key] = Property(key, key_start, value_start, self.prev_end)
+            if self.punct(","):
+                self.advance()
+            elif not self.punct("}"):
+                self.error(f"expected ',' or '}}', got {self.text or 'end of file'!r}")
+        node.end = self.end
+        self.advance()
+        return node
+
+
+def parse_value(source: str):
+    """Parse one literal (the whole string), e.g. '{ a: [1, 2], b: "x" }'."""
+    parser = _Parser(source, 0)
+    value = parser.value()
+    if parser.kind != "eof":
+        parser.error(f"unexpected {parser.text!r} after the value")
+    return value
+
+
+def _line_indent(source: str, pos: int) -> str:
+    line_start = source.rfind("\n", 0, pos) + 1
+    prefix = source[line_start:pos]
+    return prefix if not prefix.strip() else None
+
+
+class TsLiteral:
+    """The array literal assigned to one declaration, with its object elements indexed by id."""
+
+    def __init__(self, source: str, name: str, path=None, key: str = "id"):
+        self.source = source
+        self.name = name
+        self.path = Path(path) if path else None
+        declaration = re.search(rf"\b(?:const|let|var)\s+{re.escape(name)}\b", source)
+        if declaration is None:
+            raise LookupError(f"no declaration of {name}" + (f" in {self.path.name}" if self.path else ""))
+        parser = _Parser(source, declaration.end(), path)
+        # Skip the type annotation (": NBAPlayer[]", generics and all) up to the "="
+        while not parser.punct("="):
+            if parser.kind == "eof" or parser.punct(";"):
+                parser.error(f"{name} is declared without a value")
+            parser.advance()
+        parser.advance()
+        if not parser.punct("["):
+            parser.error(f"{name} is not an array literal")
+        self.start = parser.pos
+        self.values, nodes = parser.array()
+        self.end = parser.prev_end  # after "]"
+        self.records = [node for node in nodes if node is not None]
+        self.index = {node.value[key]: node for node in self.records if isinstance(node.value.get(key), str)}
+        self._edits: list[tuple[int, int, str]] = []
+
+    @classmethod
+    def load(cls, path, name: str, key: str = "id") -> "TsLiteral":
+        return cls(Path(path).read_text(encoding="utf-8"), name, path, key)
+
+    # -- edits -----------------------------------------------------------
+    # Queued as (start, end, replacement) against the source as loaded and
+    # applied together by render(); one edit per span.
+
+    def set_field(self, record: ObjectLiteral, key: str, value) -> bool:
+        """Set one property, in place when it exists, else as a new last property; False if unchanged."""
+        prop = record.properties.get(key)
+        if prop is not None:
+            if key in record.value and canonical_json.canonical(record.value[key]) == canonical_json.canonical(value):
+                return False
+            self._edits.append((prop.value_start, prop.value_end, render_value(value)))
+            return True
+        text = f"{key if IDENTIFIER_RE.fullmatch(key) else render_value(key)}: {render_value(value)}"
+        if not record.properties:
+            self._edits.append((record.start + 1, record.start + 1, f" {text} "))
+            return True
+        last = list(record.properties.values())[-1]
+        indent = _line_indent(self.source, last.key_start)
+        separator = f"\n{indent}" if indent is not None else " "
+        after = self.source[last.value_end:record.end - 1]
+        if after.lstrip().startswith(","):  # trailing comma: the new property gets one too
+            comma = last.value_end + after.index(",") + 1
+            self._edits.append((comma, comma, f"{separator}{text},"))
+        else:
+            self._edits.append((last.value_end, last.value_end, f",{separator}{text}"))
+        return True
+
+    def remove_field(self, record: ObjectLiteral, key: str) -> bool:
+        """Delete one property with the comma that separates it; False if it is not there."""
+        props = list(record.properties.values())
+        prop = record.properties.get(key)
+        if prop is None:
+            return False
+        i = props.index(prop)
+        if i > 0:
+            self._edits.append((props[i - 1].value_end, prop.value_end, ""))
+        elif len(props) > 1:
+            self._edits.append((prop.key_start, props[1].key_start, ""))
+        else:
+            after = self.source[prop.value_end:record.end - 1]
+            end = prop.value_end + (after.index(",") + 1 if after.lstrip().startswith(",") else 0)
+            self._edits.append((prop.key_start, end, ""))
+        return True
+
+    def append_record(self, text: str):
+        """Add an element (source text, e.g. from export_artifacts.render_ts) after the last one."""
+        text = text.lstrip()
+        if not self.records:
+            self._edits.append((self.end - 1, self.end - 1, f"\n  {text}\n"))
+            return
+        last = self.records[-1]
+        # Separated from the last element the way the last two are
+        separator = self.source[self.records[-2].end:last.start] if len(self.records) > 1 else ""
+        if "," not in separator or "/" in separator:
+            separator = ",\n" + (_line_indent(self.source, last.start) or "")
+        tail = self.source[last.end:self.end - 1]
+        if tail.lstrip().startswith(","):  # trailing comma: the new element gets one too
+            comma = last.end + tail.index(",") + 1
+            self._edits.append((comma, comma, separator.replace(",", "", 1) + text + ","))
+        else:
+            self._edits.append((last.end, last.end, separator + text))
+
+    @property
+    def changed(self) -> bool:
+        return bool(self._edits)
+
+    def render(self) -> str:
+        """The source with every queued edit applied."""
+        parts, pos = [], 0
+        for start, end, replacement in sorted(self._edits, key=lambda edit: (edit[0], edit[1])):
+            if start < pos:
+                raise ValueError(f"overlapping edits to {self.name} at offset {start}")
+            parts.append(self.source[pos:start])
+            parts.append(replacement)
+            pos = end
+        parts.append(self.source[pos:])
+        return "".join(parts)
+
+    def save(self, path=None) -> bool:
+        """Write the edited source back; False (and no write) when nothing changed."""
+        if not self._edits:
+            return False
+        path = Path(path or self.path)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(self.render(), encoding="utf-8")
+        os.replace(tmp, path)
+        return True
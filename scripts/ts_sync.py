@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Three-way diff and sync of the player literals in lib/*.ts, players.json and
+the SQLite store (players_store.py).
+
+Each literal is parsed once (ts_literals.py) and every record in it is looked
+up by id in players.json and in the store, so a full reconciliation is one
+pass over the literal. The fields compared are those the literal's record has
+plus the ones export_artifacts.py writes into it (TS_FIELDS). A difference
+names the copy that disagrees with the other two, when two of them agree.
+
+    python scripts/ts_sync.py                      # report
+    python scripts/ts_sync.py --apply              # make the literals and the store match players.json
+    python scripts/ts_sync.py --apply --source ts  # or make the others match the literals
+
+Literal edits are source-preserving: only the values that change are
+rewritten, and missing properties are added after the record's last one.
+Records missing from a copy are reported, not created.
+"""
+
+import argparse
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+
+import canonical_json
+from export_artifacts import TS_FIELDS
+from players_db import DATA_FILE, LIB_DIR, load_players, save_players
+from players_store import STORE_FILE, PlayersStore
+from ts_literals import TsLiteral
+
+# (file, declaration) of every NBAPlayer[] literal the scripts keep in step with players.json
+PLAYER_LITERALS = [
+    (LIB_DIR / "nba-data.ts", "MANUAL_PLAYERS"),
+    (LIB_DIR / "additional-nba-data.ts", "ADDITIONAL_NBA_PLAYERS"),
+]
+COPIES = ("ts", "json", "store")
+SHOWN = 30
+
+
+class _Missing:
+    def __repr__(self):
+        return "—"
+
+
+MISSING = _Missing()
+
+
+@dataclass(frozen=True)
+class Difference:
+    literal: str
+    id: str
+    name: str
+    field: str  # "" when the whole record is missing from a copy
+    ts: object
+    json: object
+    store: object
+
+    def value(self, copy: str):
+        return getattr(self, copy)
+
+    @property
+    def odd_one_out(self) -> str | None:
+        """The copy that disagrees when the other two agree (None with two copies or three answers)."""
+        copies = [copy for copy in COPIES if self.value(copy) is not None]
+        if len(copies) < 3:
+            return None
+        for copy in copies:
+            others = [_key(self.value(other)) for other in copies if other != copy]
+            if others[0] == others[1] and others[0] != _key(self.value(copy)):
+                return copy
+        return None
+
+
+def _key(value):
+    """Comparable form of a value: 6 == 6.0, and MISSING only equals MISSING."""
+    return ("missing",) if value is MISSING else ("value", canonical_json.dumps(value, indent=False))
+
+
+def load_literals(literals=PLAYER_LITERALS) -> list[TsLiteral]:
+    """The declared literals that exist in the tree."""
+    found = []
+    for path, name in literals:
+        if not Path(path).exists():
+            continue
+        try:
+            found.append(TsLiteral.load(path, name))
+        except LookupError:
+            continue
+    return found
+
+
+def compare(literals: list[TsLiteral], json_players: list[dict], store_players: list[dict] | None = None
+            ) -> list[Difference]:
+    """Every field where the copies of a literal record disagree; store None leaves the store out."""
+    json_by_id = {p["id"]: p for p in json_players}
+    store_by_id = {p["id"]: p for p in store_players} if store_players is not None else None
+    differences = []
+    for literal in literals:
+        for record_id, node in literal.index.items():
+            ts = node.value
+            in_json = json_by_id.get(record_id)
+            in_store = store_by_id.get(record_id, MISSING) if store_by_id is not None else None
+            name = ts.get("name", record_id)
+            if in_json is None or in_store is MISSING:
+                differences.append(Difference(literal.name, record_id, name, "", ts,
+                                              MISSING if in_json is None else in_json, in_store))
+                continue
+            copies = [ts, in_json] + ([in_store] if in_store is not None else [])
+            fields = list(ts) + [f for f in TS_FIELDS if f not in ts and any(f in copy for copy in copies)]
+            for field in fields:
+                values = [copy.get(field, MISSING) for copy in copies]
+                if len({_key(v) for v in values}) > 1:
+                    differences.append(Difference(literal.name, record_id, name, field, values[0], values[1],
+                                                  values[2] if in_store is not None else None))
+    return differences
+
+
+def apply_sync(differences: list[Difference], literals: list[TsLiteral], json_players: list[dict],
+               store: PlayersStore | None, source: str = "json") -> Counter:
+    """Copy the source's value of every differing field into the other copies; returns edits per copy."""
+    by_name = {literal.name: literal for literal in literals}
+    json_by_id = {p["id"]: p for p in json_players}
+    store_updates: dict[str, dict] = {}
+    counts = Counter()
+    for diff in differences:
+        value = diff.value(source)
+        if not diff.field or value is None:
+            counts["skipped"] += 1
+            continue
+        stale = {copy for copy in COPIES if diff.value(copy) is not None and _key(diff.value(copy)) != _key(value)}
+        if "ts" in stale:
+            literal = by_name[diff.literal]
+            node = literal.index[diff.id]
+            changed = (literal.remove_field(node, diff.field) if value is MISSING
+                       else literal.set_field(node, diff.field, value))
+            counts["ts"] += changed
+        if "json" in stale:
+            record = json_by_id[diff.id]
+            if value is MISSING:
+                record.pop(diff.field, None)
+            else:
+                record[diff.field] = value
+            counts["json"] += 1
+        if "store" in stale:
+            if value is MISSING:
+                counts["skipped"] += 1  # the store has no way to drop a schema field from one record
+            else:
+                store_updates.setdefault(diff.id, {})[diff.field] = value
+                counts["store"] += 1
+    for record_id, fields in store_updates.items():
+        store.update(record_id, **fields)
+    return counts
+
+
+def show(value) -> str:
+    return repr(value) if value is MISSING else canonical_json.dumps(value, indent=False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", choices=COPIES, default="json", help="copy the others are synced to (default: json)")
+    parser.add_argument("--apply", action="store_true", help="write the synced values")
+    parser.add_argument("--store", type=Path, default=STORE_FILE, help=f"SQLite store (default: {STORE_FILE})")
+    parser.add_argument("--no-store", action="store_true", help="compare only the literals and players.json")
+    args = parser.parse_args(argv)
+
+    literals = load_literals()
+    if not literals:
+        print("❌ None of the player literals were found: " + ", ".join(name for _, name in PLAYER_LITERALS))
+        return
+    use_store = not args.no_store and args.store.exists()
+    if args.source == "store" and not use_store:
+        parser.error(f"--source store needs the store at {args.store} (python scripts/players_store.py import)")
+    store = PlayersStore(args.store) if use_store else None
+    try:
+        players = load_players()
+        differences = compare(literals, players, store.export() if store else None)
+        print(f"🔍 {', '.join(f'{l.name} ({len(l.index)})' for l in literals)} vs players.json"
+              + (" and the store" if store else " (no store)"))
+        for diff in differences[:SHOWN]:
+            odd = diff.odd_one_out
+            values = "  ".join(f"{copy}={show(diff.value(copy))}" for copy in COPIES
+                               if diff.value(copy) is not None and (diff.field or copy != "ts"))
+            what = diff.field or "record"
+            print(f"   {diff.name} ({diff.id}) {what}: {values}" + (f"  ← {odd} differs" if odd else ""))
+        if len(differences) > SHOWN:
+            print(f"   ... and {len(differences) - SHOWN} more")
+        missing = sum(1 for d in differences if not d.field)
+        print(f"\n📊 {len(differences) - missing} differing fields, {missing} records missing from a copy")
+
+        if args.apply and differences:
+            counts = apply_sync(differences, literals, players, store, args.source)
+            for literal in literals:
+                if literal.save():
+                    print(f"💾 Updated {literal.path.name}")
+            if counts["json"]:
+                save_players(players, DATA_FILE)
+                print(f"💾 Updated {DATA_FILE.name}")
+            print(f"✅ Synced to {args.source}: " + ", ".join(f"{n} {copy}" for copy, n in counts.items() if n))
+    finally:
+        if store:
+            store.close()
+
+
+if __name__ == "__main__":
+    main()
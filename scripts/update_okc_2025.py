@@ -1,6 +1,8 @@
 import json
 import os
 
+from players_db import save_players
+
 # Path to the players database
 PLAYERS_DB_PATH = os.path.join(os.path.dirname(__file__), '..', 'lib', 'players.json')
 
@@ -47,8 +49,7 @@ def update_okc_champions():
         print(f"\nUpdating {updated_count} players...")
         print(f"Players impacted: {', '.join(modified_players)}")
         
-        with open(PLAYERS_DB_PATH, 'w', encoding='utf-8') as f:
-            json.dump(players, f, indent=2, ensure_ascii=False)
+        save_players(players, PLAYERS_DB_PATH)
         print("Database saved successfully! 🏆⚡")
     else:
         print("\nNo players needed updates (maybe already applied?).")
@@ -1,6 +1,8 @@
 import json
 import os
 
+from players_db import save_players
+
 PLAYERS_DB_PATH = os.path.join(os.path.dirname(__file__), '..', 'lib', 'players.json')
 
 def update_sga_fmvp():
@@ -24,8 +26,7 @@ def update_sga_fmvp():
             break
             
     if found:
-        with open(PLAYERS_DB_PATH, 'w', encoding='utf-8') as f:
-            json.dump(players, f, indent=2, ensure_ascii=False)
+        save_players(players, PLAYERS_DB_PATH)
         print("Database saved.")
     else:
         print("Error: SGA not found in database.")
@@ -1,33 +1,48 @@
 #!/usr/bin/env python3
 """
 Update players.json with team information from Wikipedia trades.
-Cross-references trade data to add missing team associations for players.
+A traded player was on both teams of each move in the transaction graph
+(see transactions.py), so those teams are added where they are missing.
 """
 
-import json
-from pathlib import Path
-from collections import defaultdict
+from pipeline_profile import Profiler
+from players_db import DATA_FILE, build_name_index, fold_name, load_json, save_players
+from transactions import CLEAN_FILE, TransactionGraph, load_graph
 
-def load_json(path: str) -> dict | list:
-    """Load JSON file."""
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)
+def teams_from_moves(players: list[dict], graph: TransactionGraph) -> tuple[dict[str, list[str]], int]:
+    """Player id -> teams their trades add, in date order, and the number of traded names left unmatched.
 
-def save_json(path: str, data):
-    """Save JSON file with nice formatting."""
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-
-def normalize_name(name: str) -> str:
-    """Normalize player name for matching."""
-    return name.lower().strip().replace(".", "").replace("'", "").replace("-", " ")
+    Namesakes and names missing from players.json are skipped rather than guessed.
+    """
+    name_index = build_name_index(players)
+    additions = {}
+    skipped = 0
+    for name in graph.players():
+        matches = name_index.get(fold_name(name), [])
+        if len(matches) != 1:
+            skipped += 1
+            continue
+        player = matches[0]
+        current_teams = player.get("teams") or []
+        new_teams = []
+        for move in graph.moves(player=name):
+            # Draft rights change hands before the player has played anywhere
+            if move.type != "trade":
+                continue
+            for team in (move.from_team, move.to_team):
+                if team and team not in current_teams and team not in new_teams:
+                    new_teams.append(team)
+        if new_teams:
+            additions[player["id"]] = new_teams
+    return additions, skipped
 
 def main():
     print("🔄 Updating players.json with Wikipedia trade data...")
+    profiler = Profiler.from_argv("update_teams_from_wikipedia")
     
     # Load data
-    players_path = Path("lib/players.json")
-    wiki_clean_path = Path("lib/wikipedia_nba_clean.json")
+    players_path = DATA_FILE
+    wiki_clean_path = CLEAN_FILE
     
     if not players_path.exists():
         print("❌ players.json not found")
@@ -37,83 +52,38 @@ def main():
         print("❌ wikipedia_nba_clean.json not found. Run clean_wikipedia_data.py first")
         return
     
-    players = load_json(players_path)
-    wiki_data = load_json(wiki_clean_path)
+    with profiler.stage("load"):
+        players = load_json(players_path)
+        graph = load_graph(wiki_clean_path)
     
     print(f"📚 Loaded {len(players)} players from database")
-    print(f"📚 Loaded {len(wiki_data.get('team_changes', []))} trade records from Wikipedia")
-    
-    # Create normalized name -> player index map
-    name_to_indices = defaultdict(list)
-    for i, player in enumerate(players):
-        name = player.get("name", "")
-        normalized = normalize_name(name)
-        name_to_indices[normalized].append(i)
-        
-        # Also add last name only for matching
-        parts = name.split()
-        if len(parts) >= 2:
-            last_name = normalize_name(parts[-1])
-            if len(last_name) > 3:  # Skip very short last names
-                name_to_indices[f"lastname:{last_name}"].append(i)
+    print(f"📚 Loaded {len(graph)} moves of {len(graph.players())} players from Wikipedia")
     
-    # Process each trade record
-    updates_count = 0
-    team_additions = defaultdict(set)  # player_name -> set of teams to add
-    
-    for trade in wiki_data.get("team_changes", []):
-        trade_players = trade.get("players", [])
-        trade_teams = trade.get("teams", [])
-        year = trade.get("year", 0)
-        
-        if not trade_teams:
-            continue
-        
-        for player_name in trade_players:
-            normalized = normalize_name(player_name)
-            
-            # Try exact match first
-            indices = name_to_indices.get(normalized, [])
-            
-            # If no exact match, try last name
-            if not indices:
-                parts = player_name.split()
-                if len(parts) >= 2:
-                    last_name = normalize_name(parts[-1])
-                    indices = name_to_indices.get(f"lastname:{last_name}", [])
-            
-            # Add teams for matched players
-            for idx in indices:
-                player = players[idx]
-                current_teams = set(player.get("teams", []))
-                
-                for team in trade_teams:
-                    if team not in current_teams:
-                        team_additions[player["name"]].add(team)
+    with profiler.stage("match"):
+        additions, skipped = teams_from_moves(players, graph)
     
-    # Apply the updates
-    for player_name, new_teams in team_additions.items():
-        # Find player by name
+    with profiler.stage("apply"):
+        updates_count = 0
+        added = {}
         for player in players:
-            if player.get("name") == player_name:
-                current_teams = player.get("teams", [])
-                for team in new_teams:
-                    if team not in current_teams:
-                        current_teams.append(team)
-                        updates_count += 1
-                player["teams"] = current_teams
-                break
+            new_teams = additions.get(player["id"])
+            if new_teams:
+                player["teams"] = (player.get("teams") or []) + new_teams
+                updates_count += len(new_teams)
+                added[player["name"]] = new_teams
     
-    print(f"\n✅ Added {updates_count} team associations to {len(team_additions)} players")
+    print(f"\n✅ Added {updates_count} team associations to {len(added)} players")
+    print(f"⏭️ Skipped {skipped} traded players with no single match in players.json")
     
     # Save updated data
-    save_json(players_path, players)
+    with profiler.stage("save"):
+        save_players(players, players_path)
     print(f"💾 Saved updated players.json")
     
     # Show some examples of updates
     print("\n📋 Sample updates made:")
-    for player_name, teams in list(team_additions.items())[:20]:
-        print(f"   {player_name}: +{list(teams)}")
+    for player_name, teams in list(added.items())[:20]:
+        print(f"   {player_name}: +{teams}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+Materialize one XP / rank / stats row per user from the match history.
+
+useUserStats (hooks/use-user-stats.ts) replays the last 200 matches through
+calculateXPFromHistory and getRank on every profile view. This job does the
+same fold once, over the whole history, into a `user_summaries` table:
+
+    xp, rank, next_rank, rank_progress      calculateXPFromHistory + getRank
+    games, win_rate, accuracy, ovr, ...     the hook's career metrics
+    current_streak, max_streak              over rated (non-GUESS) games
+    modes                                   JSON {SWISH|BATTLE|GUESS: games/wins/draws/losses/xp}
+
+It reads a local SQLite stand-in for the Supabase tables (`matches`,
+`match_participants`) and is incremental: each run folds only the matches
+after the (created_at, id) watermark of the previous one into the stored
+rows, in one transaction. Matches younger than --settle seconds are left for
+the next run, because /api/match/record inserts the match and its
+participant in two statements. XP, rank thresholds and multipliers are read
+from lib/ranking.ts.
+
+--pull copies new matches and their participants from Supabase into the
+stand-in first, and --push upserts the summaries changed since the last push
+into the Supabase table (supabase/migrations/*_user_summaries.sql), where
+/api/user/stats reads them. Both need NEXT_PUBLIC_SUPABASE_URL and
+SUPABASE_SERVICE_ROLE_KEY.
+
+    python scripts/user_summaries.py                     # fold new matches
+    python scripts/user_summaries.py --pull --push       # the same, against Supabase
+    python scripts/user_summaries.py --full              # rebuild from scratch
+    python scripts/user_summaries.py --show <user_id>
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import sqlite3
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import requests
+
+from players_db import CACHE_DIR, LIB_DIR
+
+DB_FILE = CACHE_DIR / "supabase.sqlite"
+RANKING_TS = LIB_DIR / "ranking.ts"
+SETTLE_SECONDS = 60
+CATEGORIES = ("SWISH", "BATTLE", "GUESS")
+LEGACY_SWISH_MODES = {"CLASSIC", "TIME_ATTACK", "SUDDEN_DEATH", "BLIND"}
+DEFAULT_TOTAL = 9  # useUserStats: details.total || details.total_rounds || 9
+PULL_PAGE = 1000
+PULL_OVERLAP = timedelta(minutes=10)  # re-read recent matches whose participants may have landed later
+PUSH_BATCH = 500
+TIMEOUT = 30
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS matches (
+    id TEXT PRIMARY KEY,
+    mode TEXT,
+    created_at TEXT NOT NULL,
+    data TEXT
+);
+CREATE TABLE IF NOT EXISTS match_participants (
+    match_id TEXT NOT NULL REFERENCES matches(id),
+    user_id TEXT NOT NULL,
+    result TEXT,
+    score INTEGER,
+    PRIMARY KEY (match_id, user_id)
+);
+CREATE INDEX IF NOT EXISTS matches_created_at ON matches (created_at, id);
+CREATE TABLE IF NOT EXISTS user_summaries (
+    user_id TEXT PRIMARY KEY,
+    xp_raw REAL NOT NULL,
+    xp INTEGER NOT NULL,
+    rank TEXT NOT NULL,
+    next_rank TEXT NOT NULL,
+    rank_progress REAL NOT NULL,
+    games INTEGER NOT NULL,
+    rated_games INTEGER NOT NULL,
+    rated_wins INTEGER NOT NULL,
+    total_score INTEGER NOT NULL,
+    best_score INTEGER,
+    total_correct INTEGER NOT NULL,
+    total_possible INTEGER NOT NULL,
+    avg_score INTEGER NOT NULL,
+    accuracy INTEGER NOT NULL,
+    win_rate INTEGER NOT NULL,
+    ovr INTEGER NOT NULL,
+    current_streak INTEGER NOT NULL,
+    max_streak INTEGER NOT NULL,
+    modes TEXT NOT NULL,
+    last_match_at TEXT,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS user_summaries_watermark (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    created_at TEXT NOT NULL,
+    match_id TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS user_summaries_upload (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    updated_at TEXT NOT NULL
+);
+"""
+SUMMARY_COLUMNS = (
+    "user_id", "xp_raw", "xp", "rank", "next_rank", "rank_progress", "games", "rated_games", "rated_wins",
+    "total_score", "best_score", "total_correct", "total_possible", "avg_score", "accuracy", "win_rate", "ovr",
+    "current_streak", "max_streak", "modes", "last_match_at", "updated_at",
+)
+
+
+# -- rules, read from lib/ranking.ts -------------------------------------------
+
+def _ts_object(source: str, name: str) -> dict[str, float]:
+    match = re.search(rf"export const {name}[^=]*= \{{(.*?)\}}", source, re.S)
+    if match is None:
+        raise ValueError(f"{RANKING_TS.name}: cannot find {name}")
+    return {key: float(value) for key, value in re.findall(r"(\w+):\s*([\d.]+)", match.group(1))}
+
+
+def load_rules(path: Path = RANKING_TS) -> dict:
+    """RANKS (by minXP), XP_MULTIPLIERS and DIFFICULTY_MULTIPLIERS as ranking.ts defines them."""
+    source = path.read_text(encoding="utf-8")
+    ranks = [(tier, int(min_xp)) for tier, min_xp in
+             re.findall(r"id: '(\w+)',\s*label: '[^']*',\s*minXP: (\d+)", source)]
+    return {
+        "ranks": sorted(ranks, key=lambda rank: rank[1]),
+        "modes": _ts_object(source, "XP_MULTIPLIERS"),
+        "difficulties": _ts_object(source, "DIFFICULTY_MULTIPLIERS"),
+    }
+
+
+def js_round(value: float) -> int:
+    """Math.round (halves go up, unlike round())."""
+    return math.floor(value + 0.5)
+
+
+def get_rank(xp: int, ranks: list[tuple[str, int]]) -> tuple[str, str, float]:
+    """getRank: (current tier, next tier, progress 0-100)."""
+    current = 0
+    for i, (_, min_xp) in enumerate(ranks):
+        if xp >= min_xp:
+            current = i
+    nxt = min(current + 1, len(ranks) - 1)
+    if nxt == current:
+        return ranks[current][0], ranks[nxt][0], 100.0
+    span = ranks[nxt][1] - ranks[current][1]
+    return ranks[current][0], ranks[nxt][0], min(100.0, max(0.0, (xp - ranks[current][1]) / span * 100))
+
+
+def game_category(mode: str | None, details: dict) -> str:
+    """getGameCategory in useUserStats."""
+    mode = mode.upper() if isinstance(mode, str) else mode
+    if mode in CATEGORIES:
+        return mode
+    if mode in LEGACY_SWISH_MODES:
+        return "SWISH"
+    if not mode:
+        return "SWISH" if details.get("difficulty") or details.get("subMode") else "GUESS"
+    return "SWISH"
+
+
+# -- folding -------------------------------------------------------------------
+
+def empty_summary(user_id: str) -> dict:
+    return {
+        "user_id": user_id, "xp_raw": 0.0, "games": 0, "rated_games": 0, "rated_wins": 0,
+        "total_score": 0, "best_score": None, "total_correct": 0, "total_possible": 0,
+        "current_streak": 0, "max_streak": 0, "last_match_at": None,
+        "modes": {category: {"games": 0, "wins": 0, "draws": 0, "losses": 0, "xp": 0.0} for category in CATEGORIES},
+    }
+
+
+def fold_match(summary: dict, mode: str | None, details: dict, result: str | None, score: int | None,
+               created_at: str, rules: dict):
+    """Add one match, in chronological order, to a user's running summary."""
+    category = game_category(mode, details)
+    correct = details.get("correct") or 0
+    total = details.get("total") or details.get("total_rounds") or DEFAULT_TOTAL
+    win = result == "WIN" or correct == total
+    draw = result == "DRAW"
+
+    xp = 0.0
+    mode_multiplier = rules["modes"].get(category, 0)
+    if mode_multiplier:
+        difficulty = details.get("difficulty")
+        difficulty_multiplier = rules["difficulties"].get(difficulty.lower(), 1) if difficulty else 1
+        xp = ((100 if win else 25 if draw else 10) + 5) * difficulty_multiplier * mode_multiplier
+
+    summary["xp_raw"] += xp
+    stats = summary["modes"][category]
+    stats["games"] += 1
+    stats["wins" if win else "draws" if draw else "losses"] += 1
+    stats["xp"] += xp
+
+    score = score or 0
+    summary["games"] += 1
+    summary["total_score"] += score
+    summary["best_score"] = score if summary["best_score"] is None else max(summary["best_score"], score)
+    summary["total_correct"] += correct
+    summary["total_possible"] += total
+    summary["last_match_at"] = created_at
+    if category != "GUESS":
+        summary["rated_games"] += 1
+        summary["rated_wins"] += win
+        summary["current_streak"] = summary["current_streak"] + 1 if win else 0
+        summary["max_streak"] = max(summary["max_streak"], summary["current_streak"])
+
+
+def finish(summary: dict, rules: dict, now: str) -> dict:
+    """Derived columns (rounded XP, rank, rates, OVR) as useUserStats computes them."""
+    xp = js_round(summary["xp_raw"])
+    rank, next_rank, progress = get_rank(xp, rules["ranks"])
+    games, rated = summary["games"], summary["rated_games"]
+    win_rate = js_round(summary["rated_wins"] / rated * 100) if rated else 0
+    accuracy = js_round(summary["total_correct"] / summary["total_possible"] * 100) if summary["total_possible"] else 0
+    return {
+        **summary,
+        "xp": xp, "rank": rank, "next_rank": next_rank, "rank_progress": progress,
+        "avg_score": js_round(summary["total_score"] / games) if games else 0,
+        "win_rate": win_rate, "accuracy": accuracy,
+        "ovr": min(99, math.floor(win_rate * 0.4 + accuracy * 0.4 + min(games, 100) * 0.2)),
+        "modes": json.dumps(summary["modes"], separators=(",", ":")),
+        "updated_at": now,
+    }
+
+
+# -- job -----------------------------------------------------------------------
+
+def connect(path: Path = DB_FILE) -> sqlite3.Connection:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    db = sqlite3.connect(path, isolation_level=None)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.executescript(SCHEMA)
+    return db
+
+
+def load_summaries(db: sqlite3.Connection, user_ids: list[str]) -> dict[str, dict]:
+    summaries = {}
+    for start in range(0, len(user_ids), 500):
+        chunk = user_ids[start:start + 500]
+        rows = db.execute(f"SELECT {', '.join(SUMMARY_COLUMNS)} FROM user_summaries "
+                          f"WHERE user_id IN ({', '.join('?' * len(chunk))})", chunk)
+        for row in rows:
+            summary = dict(zip(SUMMARY_COLUMNS, row))
+            summary["modes"] = json.loads(summary["modes"])
+            summaries[summary["user_id"]] = summary
+    return summaries
+
+
+def refresh(db: sqlite3.Connection, rules: dict, full: bool = False, settle: float = SETTLE_SECONDS,
+            now: datetime | None = None) -> dict:
+    """Fold the matches since the watermark into user_summaries; returns run counts."""
+    now = now or datetime.now(timezone.utc)
+    cutoff = (now - timedelta(seconds=settle)).isoformat()
+    db.execute("BEGIN IMMEDIATE")
+    try:
+        if full:
+            db.execute("DELETE FROM user_summaries")
+            db.execute("DELETE FROM user_summaries_watermark")
+        mark = db.execute("SELECT created_at, match_id FROM user_summaries_watermark").fetchone() or ("", "")
+        rows = db.execute(
+            "SELECT m.id, m.created_at, m.mode, m.data, p.user_id, p.result, p.score "
+            "FROM matches m JOIN match_participants p ON p.match_id = m.id "
+            "WHERE (m.created_at, m.id) > (?, ?) AND m.created_at <= ? "
+            "ORDER BY m.created_at, m.id, p.user_id", (*mark, cutoff)).fetchall()
+
+        summaries = load_summaries(db, sorted({row[4] for row in rows}))
+        for match_id, created_at, mode, data, user_id, result, score in rows:
+            summary = summaries.get(user_id)
+            if summary is None:
+                summary = summaries[user_id] = empty_summary(user_id)
+            details = json.loads(data) if data else {}
+            fold_match(summary, mode, details if isinstance(details, dict) else {}, result, score, created_at, rules)
+
+        stamp = now.isoformat()
+        db.executemany(
+            f"INSERT OR REPLACE INTO user_summaries ({', '.join(SUMMARY_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(SUMMARY_COLUMNS))})",
+            [tuple(finish(summary, rules, stamp)[column] for column in SUMMARY_COLUMNS)
+             for summary in summaries.values()])
+        if rows:
+            db.execute("INSERT OR REPLACE INTO user_summaries_watermark (id, created_at, match_id) VALUES (1, ?, ?)",
+                       (rows[-1][1], rows[-1][0]))
+        db.execute("COMMIT")
+    except BaseException:
+        db.execute("ROLLBACK")
+        raise
+    return {"matches": len({row[0] for row in rows}), "participations": len(rows), "users": len(summaries)}
+
+
+# -- Supabase ------------------------------------------------------------------
+
+def supabase_session(env=os.environ) -> tuple[str, requests.Session]:
+    """REST base URL and a session authorized with the service role key."""
+    url, key = env.get("NEXT_PUBLIC_SUPABASE_URL"), env.get("SUPABASE_SERVICE_ROLE_KEY")
+    if not url or not key:
+        raise RuntimeError("--pull and --push need NEXT_PUBLIC_SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY")
+    session = requests.Session()
+    session.headers.update({"apikey": key, "Authorization": f"Bearer {key}"})
+    return f"{url.rstrip('/')}/rest/v1", session
+
+
+def pull(db: sqlite3.Connection, rest: str, session: requests.Session, page: int = PULL_PAGE) -> int:
+    """Copy the matches since the newest local one (less PULL_OVERLAP) into the stand-in; returns matches read."""
+    latest = db.execute("SELECT MAX(created_at) FROM matches").fetchone()[0]
+    params = {"select": "id,mode,created_at,data,match_participants(user_id,result,score)",
+              "order": "created_at.asc,id.asc", "limit": page}
+    if latest:
+        params["created_at"] = f"gte.{(datetime.fromisoformat(latest) - PULL_OVERLAP).isoformat()}"
+    read = 0
+    while True:
+        response = session.get(f"{rest}/matches", params={**params, "offset": read}, timeout=TIMEOUT)
+        response.raise_for_status()
+        matches = response.json()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            for match in matches:
+                data = match.get("data")
+                db.execute("INSERT OR REPLACE INTO matches (id, mode, created_at, data) VALUES (?, ?, ?, ?)",
+                           (match["id"], match.get("mode"), match["created_at"],
+                            json.dumps(data) if data is not None else None))
+                db.executemany("INSERT OR REPLACE INTO match_participants (match_id, user_id, result, score) "
+                               "VALUES (?, ?, ?, ?)",
+                               [(match["id"], p["user_id"], p.get("result"), p.get("score"))
+                                for p in match.get("match_participants") or []])
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        read += len(matches)
+        if len(matches) < page:
+            return read
+
+
+def push(db: sqlite3.Connection, rest: str, session: requests.Session, batch: int = PUSH_BATCH) -> int:
+    """Upsert the summaries updated since the last push; the mark only moves once every batch is stored."""
+    mark = db.execute("SELECT updated_at FROM user_summaries_upload").fetchone()
+    rows = db.execute(f"SELECT {', '.join(SUMMARY_COLUMNS)} FROM user_summaries WHERE updated_at > ? "
+                      f"ORDER BY updated_at, user_id", (mark[0] if mark else "",)).fetchall()
+    for start in range(0, len(rows), batch):
+        payload = []
+        for row in rows[start:start + batch]:
+            summary = dict(zip(SUMMARY_COLUMNS, row))
+            summary["modes"] = json.loads(summary["modes"])
+            payload.append(summary)
+        response = session.post(f"{rest}/user_summaries", params={"on_conflict": "user_id"}, json=payload,
+                                headers={"Prefer": "resolution=merge-duplicates,return=minimal"}, timeout=TIMEOUT)
+        response.raise_for_status()
+    if rows:
+        db.execute("INSERT OR REPLACE INTO user_summaries_upload (id, updated_at) VALUES (1, ?)",
+                   (rows[-1][SUMMARY_COLUMNS.index("updated_at")],))
+    return len(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", type=Path, default=DB_FILE, help=f"SQLite stand-in for Supabase (default: {DB_FILE})")
+    parser.add_argument("--full", action="store_true", help="drop the summaries and refold every match")
+    parser.add_argument("--settle", type=float, default=SETTLE_SECONDS,
+                        help=f"leave matches younger than this many seconds for the next run (default: {SETTLE_SECONDS})")
+    parser.add_argument("--show", metavar="USER_ID", help="print one user's summary row")
+    parser.add_argument("--pull", action="store_true", help="copy new matches from Supabase before folding")
+    parser.add_argument("--push", action="store_true",
+                        help="upload the changed summaries to Supabase after folding")
+    args = parser.parse_args(argv)
+
+    db = connect(args.db)
+    if args.show:
+        summary = load_summaries(db, [args.show]).get(args.show)
+        if summary is None:
+            parser.exit(1, f"❓ No summary for {args.show!r}\n")
+        print(json.dumps(summary, indent=2))
+        return
+
+    rest = session = None
+    if args.pull or args.push:
+        try:
+            rest, session = supabase_session()
+        except RuntimeError as e:
+            parser.error(str(e))
+    if args.pull:
+        print(f"⬇️  Pulled {pull(db, rest, session)} matches from Supabase")
+
+    started = time.perf_counter()
+    counts = refresh(db, load_rules(), full=args.full, settle=args.settle)
+    total = db.execute("SELECT COUNT(*) FROM user_summaries").fetchone()[0]
+    print(f"🏅 Folded {counts['matches']} new matches ({counts['participations']} results) into "
+          f"{counts['users']} users' summaries in {(time.perf_counter() - started) * 1000:.0f}ms "
+          f"({total} users in {args.db.name})")
+    if args.push:
+        print(f"⬆️  Pushed {push(db, rest, session)} summaries to Supabase")
+
+
+if __name__ == "__main__":
+    main()
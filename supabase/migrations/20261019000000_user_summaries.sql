@@ -0,0 +1,38 @@
+-- One XP / rank / stats row per user, folded from matches + match_participants
+-- by scripts/user_summaries.py and read by /api/user/stats (useUserStats).
+-- Columns mirror SUMMARY_COLUMNS in the script; modes holds
+-- {SWISH|BATTLE|GUESS: {games, wins, draws, losses, xp}}.
+
+create table if not exists public.user_summaries (
+    user_id uuid primary key references auth.users (id) on delete cascade,
+    xp_raw double precision not null,
+    xp integer not null,
+    rank text not null,
+    next_rank text not null,
+    rank_progress double precision not null,
+    games integer not null,
+    rated_games integer not null,
+    rated_wins integer not null,
+    total_score integer not null,
+    best_score integer,
+    total_correct integer not null,
+    total_possible integer not null,
+    avg_score integer not null,
+    accuracy integer not null,
+    win_rate integer not null,
+    ovr integer not null,
+    current_streak integer not null,
+    max_streak integer not null,
+    modes jsonb not null,
+    last_match_at timestamptz,
+    updated_at timestamptz not null default now()
+);
+
+create index if not exists user_summaries_xp on public.user_summaries (xp desc);
+
+-- Readable by everyone (profiles are public); only the service role (the batch job) writes
+alter table public.user_summaries enable row level security;
+
+drop policy if exists "user_summaries are readable" on public.user_summaries;
+create policy "user_summaries are readable" on public.user_summaries
+    for select using (true);